@@ -0,0 +1,73 @@
+"""
+원격 다운로드 에이전트 (PyQt5 / 디스플레이 없이 실행)
+
+사용법 (src 폴더에서):
+    python -m agent --coordinator 호스트:8766 [--token 비밀값] [--name 이름]
+                    [--settings 프로필.json] [--output 폴더] [--jobs 4] [--engine async]
+
+- 코디네이터(python -m daemon --agents-port ...)에 접속해 작업을 받아 이 노드에서 다운로드
+- 파일은 이 노드의 다운로드 폴더(--output 또는 설정 프로필)에 저장되고 코디네이터에는 경로만 보고
+- --jobs는 이 에이전트가 동시에 받을 작업 수 (코디네이터에 슬롯 수로 알림)
+- 연결이 끊기면 받던 작업을 취소하고 재접속 (코디네이터는 임대가 끊긴 작업을 다른 에이전트에 배정)
+- SIGINT/SIGTERM을 받으면 실행 중인 다운로드를 정리하고 종료
+"""
+import argparse
+import signal
+import sys
+import threading
+
+from cli import add_settings_arguments, settings_from_args
+from core.remote_agent import RemoteAgent
+from utils.logger import log
+from constants import REMOTE_DEFAULT_PORT
+
+
+def parse_address(value):
+    """'호스트:포트' 또는 '호스트' → (호스트, 포트)"""
+    host, sep, port = value.rpartition(':')
+    if not sep:
+        return value, REMOTE_DEFAULT_PORT
+    try:
+        return host.strip('[]'), int(port)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"잘못된 주소: {value}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m agent',
+        description='코디네이터에서 다운로드 작업을 받아 이 노드에서 실행합니다.'
+    )
+    parser.add_argument('--coordinator', type=parse_address, required=True,
+                        help=f'코디네이터 주소 (호스트[:포트], 기본 포트 {REMOTE_DEFAULT_PORT})')
+    parser.add_argument('--token', help='코디네이터의 --token 값')
+    parser.add_argument('--name', help='코디네이터에 표시할 에이전트 이름 (기본: 호스트 이름)')
+    add_settings_arguments(parser)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    settings, jobs = settings_from_args(args)
+    if settings is None:
+        return 2
+
+    host, port = args.coordinator
+    agent = RemoteAgent(host, port, settings, jobs, name=args.name, token=args.token)
+    agent.start()
+
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+    # 메인 스레드는 신호를 받을 수 있도록 짧게 나누어 대기
+    while not stop.wait(0.5) and agent.is_alive():
+        pass
+
+    log.info("에이전트 종료 중...")
+    agent.stop()
+    agent.join()
+    return 1 if agent.error else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""
+헤드리스 배치 다운로드 CLI (PyQt5 / 디스플레이 없이 실행)
+
+사용법 (src 폴더에서):
+    python -m cli urls.txt [--settings 프로필.json] [--output 폴더] [--format mp3]
+                           [--jobs 4] [--engine async] [--limit-rate KB/s] [--autotune]
+                           [--policy fifo|sjf|fair] [--force]
+    python -m cli --simulate [--jobs 4]   # 스케줄링 정책 비교 시뮬레이션 (다운로드 없음)
+
+- URL 목록 파일: 한 줄에 URL 하나, 빈 줄과 '#' 주석은 무시 ('-'면 표준 입력)
+- 설정: 사용자 settings.json 대신 --settings로 서버별 설정 프로필을 지정할 수 있음
+- 중복: GUI와 같은 history.db로 이미 받은 영상(사이트 + ID + 포맷)은 건너뜀 (--force면 무시)
+- 표준 출력: 작업 이벤트를 한 줄에 JSON 하나로 출력, 로그는 표준 에러와 로그 파일로
+    {"event": "started" | "progress" | "finished" | "skipped" | "error", "task_id": ..., ...}
+- 종료 코드: 모든 작업이 성공하거나 건너뛰어졌으면 0, 하나라도 실패하면 1
+- --simulate: 기본 작업 부하를 정책마다 실행한 결과를 정책마다 JSON 한 줄로 출력
+    {"event": "simulation", "policy": ..., "makespan": ..., "mean_completion": ..., "p95_wait": ..., ...}
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+from core import download_handler
+from core.download_service import progress_summary
+from core.scheduler import DownloadScheduler
+from data.managers import HistoryManager
+from utils.logger import log
+from utils.settings import load_settings
+from constants import (
+    KEY_DOWNLOAD_FOLDER, KEY_FORMAT, KEY_MAX_DOWNLOADS, KEY_ENGINE_MODE, KEY_BANDWIDTH_LIMIT,
+    KEY_AUTOTUNE_WORKERS, KEY_SCHEDULING_POLICY,
+    DEFAULT_FORMAT, DEFAULT_MAX_DOWNLOADS, ENGINE_MODES, SCHEDULING_POLICIES,
+    CLI_PROGRESS_INTERVAL_SEC, TASK_PRIORITY_NORMAL
+)
+
+
+def read_urls(path):
+    """URL 목록 파일 읽기 (빈 줄/주석 제외, 순서 유지, 중복 URL 제거)"""
+    if path == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    urls = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith('#') and line not in urls:
+            urls.append(line)
+    return urls
+
+
+class BatchRunner:
+    """
+    URL 목록을 스케줄러에 넣고 모든 작업이 끝날 때까지 이벤트를 JSON 줄로 출력
+    - 스케줄러 이벤트는 워커 스레드에서 호출되므로 출력/집계는 잠금으로 보호
+    """
+
+    def __init__(self, settings, jobs, force=False, out=None):
+        self.settings = settings
+        self.jobs = jobs
+        self.force = force
+        self.out = out or sys.stdout
+        self.history = HistoryManager()
+        self.scheduler = DownloadScheduler()
+        self.tasks = {}  # task_id -> (url, metadata)
+        self.pending = set()
+        self.failed = 0
+        self.done = threading.Event()
+        self._lock = threading.Lock()
+        self._last_progress = {}
+
+    def emit(self, event, **fields):
+        """이벤트 1건을 JSON 한 줄로 출력"""
+        record = {'event': event, 'time': round(time.time(), 3)}
+        record.update(fields)
+        with self._lock:
+            self.out.write(json.dumps(record, ensure_ascii=False) + '\n')
+            self.out.flush()
+
+    def run(self, urls):
+        """작업 실행 후 종료 코드 반환"""
+        fmt = self.settings.get(KEY_FORMAT, DEFAULT_FORMAT)
+        task_id = 0
+        # 메타데이터를 미리 조회해 중복 검사에 사용 (스케줄러는 준비된 메타데이터로 바로 다운로드)
+        resolved = set()
+        for url, meta, success in download_handler.fetch_metadata_many(urls, self.settings):
+            resolved.add(url)
+            task_id += 1
+            if not success:
+                self.failed += 1
+                self.emit('error', task_id=task_id, url=url, message='metadata lookup failed')
+                continue
+            video_id, extractor = meta.get('id'), meta.get('extractor')
+            if not self.force and video_id and self.history.is_downloaded(extractor, video_id, fmt):
+                self.emit('skipped', task_id=task_id, url=url, id=video_id, extractor=extractor,
+                          title=meta.get('title'), reason='already downloaded')
+                continue
+            self.tasks[task_id] = (url, meta)
+        for url in urls:
+            if url not in resolved:
+                task_id += 1
+                self.failed += 1
+                self.emit('error', task_id=task_id, url=url, message='metadata lookup failed')
+
+        if not self.tasks:
+            return 1 if self.failed else 0
+
+        scheduler = self.scheduler
+        scheduler.task_started.connect(self._on_started)
+        scheduler.progress_updated.connect(self._on_progress)
+        scheduler.download_finished.connect(self._on_finished)
+        scheduler.configure(self.settings)
+
+        self.pending = set(self.tasks)
+        for tid, (url, meta) in self.tasks.items():
+            scheduler.add_task(TASK_PRIORITY_NORMAL, tid, url, dict(self.settings), dict(meta))
+        scheduler.initialize(self.jobs)
+
+        try:
+            # Ctrl+C를 받을 수 있도록 짧게 나누어 대기
+            while not self.done.wait(0.5):
+                pass
+        except KeyboardInterrupt:
+            log.info("중단 요청 - 실행 중인 다운로드를 종료합니다.")
+            self.failed += len(self.pending)
+            for tid in sorted(self.pending):
+                self.emit('error', task_id=tid, url=self.tasks[tid][0], message='interrupted')
+        finally:
+            scheduler.shutdown()
+        return 1 if self.failed else 0
+
+    def _on_started(self, task_id):
+        url, meta = self.tasks.get(task_id, ('', {}))
+        self.emit('started', task_id=task_id, url=url, id=meta.get('id'), title=meta.get('title'))
+
+    def _on_progress(self, d, task_id):
+        status = d.get('status')
+        now = time.monotonic()
+        # 다운로드 중 진행률만 간격 제한 (상태 변화는 바로 출력)
+        if status == 'downloading' and now - self._last_progress.get(task_id, 0.0) < CLI_PROGRESS_INTERVAL_SEC:
+            return
+        self._last_progress[task_id] = now
+        self.emit('progress', task_id=task_id, **progress_summary(d))
+
+    def _on_finished(self, success, message, task_id, final_path):
+        url, meta = self.tasks.get(task_id, ('', {}))
+        if success:
+            fmt = self.settings.get(KEY_FORMAT, DEFAULT_FORMAT)
+            if final_path and os.path.exists(final_path):
+                meta['file_size'] = os.path.getsize(final_path)
+            self.history.add_to_history(meta.get('extractor'), meta.get('id'), meta, fmt)
+            self.emit('finished', task_id=task_id, url=url, id=meta.get('id'), path=final_path)
+        else:
+            with self._lock:
+                self.failed += 1
+            self.emit('error', task_id=task_id, url=url, message=str(message))
+        with self._lock:
+            self.pending.discard(task_id)
+            if not self.pending:
+                self.done.set()
+
+
+def add_settings_arguments(parser):
+    """설정 프로필/덮어쓰기 인자 추가 (CLI와 데몬 공용)"""
+    parser.add_argument('--settings', help='설정 프로필 JSON (기본: 사용자 settings.json)')
+    parser.add_argument('--output', help='다운로드 폴더 (설정보다 우선)')
+    parser.add_argument('--format', help='출력 포맷 (예: mp4, mp3)')
+    parser.add_argument('--jobs', type=int, help='동시 다운로드 수')
+    parser.add_argument('--engine', choices=ENGINE_MODES, help='실행 엔진')
+    parser.add_argument('--limit-rate', type=int, metavar='KB/s',
+                        help='전체 다운로드 속도 제한 (동시 다운로드끼리 나누어 씀, 0이면 제한 없음; '
+                             'pool 엔진만 받는 도중 다시 나누고 그 외 엔진은 시작할 때 몫을 고정)')
+    parser.add_argument('--autotune', action='store_true',
+                        help='측정한 처리량/오류에 따라 동시 다운로드 수 자동 조절 (--jobs는 시작값)')
+    parser.add_argument('--policy', choices=SCHEDULING_POLICIES,
+                        help='같은 우선순위 안의 순서 (fifo: 등록 순, sjf: 작은 파일 먼저, fair: 묶음끼리 번갈아)')
+
+
+def settings_from_args(args):
+    """
+    설정 프로필을 읽고 명령줄 인자로 덮어씀
+    
+    Returns:
+        (설정 dict, 동시 다운로드 수) 튜플, 프로필 파일이 없으면 (None, 0)
+    """
+    if args.settings and not os.path.exists(args.settings):
+        log.error(f"설정 프로필을 찾을 수 없습니다: {args.settings}")
+        return None, 0
+    settings = load_settings(args.settings)
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+        settings[KEY_DOWNLOAD_FOLDER] = os.path.abspath(args.output)
+    if args.format:
+        settings[KEY_FORMAT] = args.format
+    if args.engine:
+        settings[KEY_ENGINE_MODE] = args.engine
+    if args.limit_rate is not None:
+        settings[KEY_BANDWIDTH_LIMIT] = max(0, args.limit_rate)
+    if args.autotune:
+        settings[KEY_AUTOTUNE_WORKERS] = True
+    if args.policy:
+        settings[KEY_SCHEDULING_POLICY] = args.policy
+    jobs = args.jobs or int(settings.get(KEY_MAX_DOWNLOADS, DEFAULT_MAX_DOWNLOADS))
+    return settings, max(1, jobs)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m cli',
+        description='URL 목록을 헤드리스로 다운로드하고 진행 상황을 JSON 줄로 출력합니다.'
+    )
+    parser.add_argument('url_file', nargs='?', help="URL 목록 파일 (한 줄에 하나, '-'면 표준 입력)")
+    add_settings_arguments(parser)
+    parser.add_argument('--force', action='store_true', help='다운로드 기록이 있어도 다시 받음')
+    parser.add_argument('--simulate', action='store_true',
+                        help='다운로드 대신 스케줄링 정책별 시뮬레이션 결과 출력 (--jobs 동시 다운로드 수 사용)')
+    return parser
+
+
+def run_simulation(jobs, out=None):
+    """기본 작업 부하를 정책마다 시뮬레이션해 JSON 줄로 출력"""
+    from core.scheduling_sim import compare_policies
+    out = out or sys.stdout
+    for policy, result in compare_policies(workers=jobs).items():
+        out.write(json.dumps({'event': 'simulation', 'policy': policy, 'workers': jobs, **result},
+                             ensure_ascii=False) + '\n')
+    out.flush()
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    settings, jobs = settings_from_args(args)
+    if settings is None:
+        return 2
+    if args.simulate:
+        return run_simulation(jobs)
+    if not args.url_file:
+        build_parser().error('url_file is required (or use --simulate)')
+
+    try:
+        urls = read_urls(args.url_file)
+    except OSError as e:
+        log.error(f"URL 목록을 읽을 수 없습니다: {e}")
+        return 2
+    if not urls:
+        log.warning("다운로드할 URL이 없습니다.")
+        return 0
+
+    return BatchRunner(settings, jobs, force=args.force).run(urls)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -14,6 +14,19 @@ KEY_MAX_DOWNLOADS = 'max_downloads'
 KEY_NORMALIZE_AUDIO = 'normalize_audio'
 KEY_USE_ACCELERATION = 'use_acceleration'
 KEY_LANGUAGE = 'language'
+KEY_ENGINE_MODE = 'engine_mode'
+KEY_METADATA_BACKEND = 'metadata_backend'
+KEY_METADATA_LOOKAHEAD = 'metadata_lookahead'
+KEY_DOWNLOAD_BATCH_SIZE = 'download_batch_size'
+KEY_EXTRACTOR_LIMITS = 'extractor_limits'
+KEY_HOST_LIMITS = 'host_limits'
+KEY_PER_HOST_LIMIT = 'per_host_limit'
+KEY_BANDWIDTH_LIMIT = 'bandwidth_limit'
+KEY_BANDWIDTH_WEIGHTED = 'bandwidth_priority_weights'
+KEY_AUTOTUNE_WORKERS = 'autotune_workers'
+KEY_AUTOTUNE_MIN_WORKERS = 'autotune_min_workers'
+KEY_AUTOTUNE_MAX_WORKERS = 'autotune_max_workers'
+KEY_SCHEDULING_POLICY = 'scheduling_policy'
 
 # 기본값 (Defaults)
 APP_VERSION = 'v2.0.1'  # 앱 버전
@@ -23,6 +36,19 @@ DEFAULT_FORMAT = 'mp4'
 DEFAULT_MAX_DOWNLOADS = 3
 DEFAULT_ACCELERATION = False
 DEFAULT_NORMALIZE = False
+DEFAULT_ENGINE_MODE = 'subprocess'
+DEFAULT_METADATA_BACKEND = 'subprocess'
+DEFAULT_METADATA_LOOKAHEAD = 4  # 다운로드 대기 중 미리 메타데이터를 조회해 둘 작업 수 (0이면 다운로드 슬롯에서 조회)
+DEFAULT_DOWNLOAD_BATCH_SIZE = 1  # yt-dlp 1회 실행으로 묶어 받을 짧은 작업 수 (1이면 묶지 않음)
+DEFAULT_EXTRACTOR_LIMITS = {}  # 추출기별 동시 다운로드 수 (예: {"youtube": 4} - 많이 받으면 429/속도 제한이 걸리는 사이트)
+DEFAULT_HOST_LIMITS = {}  # 호스트별 동시 다운로드 수 (예: {"vimeo.com": 2})
+DEFAULT_PER_HOST_LIMIT = 0  # host_limits에 없는 호스트마다 적용할 동시 다운로드 수 (0이면 제한 없음)
+DEFAULT_BANDWIDTH_LIMIT = 0  # 전체 다운로드 속도 제한 (KB/s, 0이면 제한 없음) - 받는 중인 작업끼리 나누어 씀
+DEFAULT_BANDWIDTH_WEIGHTED = True  # 우선순위가 높은 작업(이어받기 등)에 더 큰 몫
+DEFAULT_AUTOTUNE_WORKERS = False  # 측정한 처리량/오류에 따라 동시 다운로드 수 자동 조절 (max_downloads는 시작값)
+DEFAULT_AUTOTUNE_MIN_WORKERS = 1  # 대기 작업이 있을 때의 하한 (큐가 비면 유휴 워커는 0까지 줄임)
+DEFAULT_AUTOTUNE_MAX_WORKERS = 8  # 상한 (엔진별 최대 동시 다운로드 수를 넘지 않음)
+DEFAULT_SCHEDULING_POLICY = 'fifo'  # 같은 우선순위 안에서의 순서 (fifo / sjf / fair)
 
 # 설정 다이얼로그 옵션
 VIDEO_QUALITY_OPTIONS = ['best', '1080p', '720p', '480p', '360p', 'worst']
@@ -31,11 +57,15 @@ FORMAT_OPTIONS = ['mp4', 'mkv', 'webm', 'mp3', 'm4a', 'wav']
 VIDEO_FORMATS = ['mp4', 'mkv', 'webm']
 AUDIO_FORMATS = ['mp3', 'm4a', 'wav']
 MAX_DOWNLOADS_RANGE = (1, 10)
+ASYNC_MAX_DOWNLOADS_RANGE = (1, 100)  # asyncio 엔진은 작업당 스레드가 없어 더 많이 허용
+BANDWIDTH_LIMIT_RANGE = (0, 1024 * 1024)  # 전체 속도 제한 설정 범위 (KB/s, 0이면 제한 없음)
 
 
 # --- Core Logic Constants (Moved from function) ---
 # Scheduler
-SCHEDULER_PRIORITY_NORMAL = 0
+SCHEDULER_PRIORITY_NORMAL = 0  # 종료 신호 (작업 우선순위보다 앞서 꺼내짐)
+TASK_PRIORITY_RESUME = 1       # 이어받기 작업
+TASK_PRIORITY_NORMAL = 3       # 일반 작업 (숫자가 작을수록 먼저 받음)
 
 # URL URLs and Domains
 DOMAIN_YOUTU_BE = 'youtu.be'
@@ -46,6 +76,8 @@ STATUS_FINISHED = 'finished'
 STATUS_POSTPROCESSING = 'postprocessing'
 STATUS_ERROR = 'error'
 STATUS_STOPPED = 'stopped'
+STATUS_AFTER_MOVE = 'after_move'  # 최종 파일 이동 완료 (filepath 필드에 최종 경로)
+STATUS_FORMAT_SELECTED = 'format_selected'  # 다운로드 직전 포맷 선택 완료 (format_id 필드에 '137+140' 형식)
 
 # Dialog Choices
 DLG_CHOICE_PLAYLIST_IDX = 0
@@ -60,6 +92,124 @@ YTDLP_TIMEOUT = 30
 YTDLP_RETRIES = '10'
 DEFAULT_ENCODING = 'utf-8'
 
+# 실행 엔진 모드
+ENGINE_SUBPROCESS = 'subprocess'  # 작업마다 yt-dlp 실행 파일을 새로 실행 (기본)
+ENGINE_POOL = 'pool'              # yt_dlp 모듈을 로드한 상주 프로세스 풀 사용
+ENGINE_ASYNC = 'async'            # 이벤트 루프 스레드 1개에서 작업마다 코루틴으로 yt-dlp 실행
+ENGINE_MODES = (ENGINE_SUBPROCESS, ENGINE_POOL, ENGINE_ASYNC)
+
+# 헤드리스 CLI (python -m cli)
+CLI_PROGRESS_INTERVAL_SEC = 1.0    # 작업별 진행률 이벤트 출력 최소 간격 (초)
+
+# 로컬 데몬 / JSON-RPC API 서버 (python -m daemon)
+API_DEFAULT_HOST = '127.0.0.1'     # 기본은 로컬에서만 접속 가능
+API_DEFAULT_PORT = 8765
+API_MAX_BODY_BYTES = 16 * 1024 * 1024  # 요청 본문 최대 크기 (대량 등록 배치 포함)
+API_PRIORITY_RANGE = (1, 9)        # API로 지정 가능한 작업 우선순위 (작을수록 먼저)
+API_PROGRESS_INTERVAL_SEC = 0.5    # 작업별 진행률 이벤트 전송 최소 간격 (초)
+API_EVENT_QUEUE_SIZE = 10000       # 스트림 구독자별 미전송 이벤트 한도 (넘으면 오래된 것부터 버림)
+API_SSE_KEEPALIVE_SEC = 15         # 이벤트가 없을 때 연결 유지용 주석 전송 간격 (초)
+DAEMON_TASKS_JSON_FILENAME = 'daemon_tasks.json'  # GUI의 tasks.json과 분리
+DAEMON_SAVE_DEBOUNCE_SEC = 2.0     # 작업 목록 저장을 모아서 처리하는 간격 (초)
+
+# 원격 워커 에이전트 (python -m agent, 코디네이터는 python -m daemon --agents-port)
+REMOTE_DEFAULT_PORT = 8766
+REMOTE_PROTOCOL_VERSION = 1
+REMOTE_HEARTBEAT_SEC = 5.0         # 에이전트 → 코디네이터 하트비트 간격 (초)
+REMOTE_LEASE_SEC = 20.0            # 하트비트/진행률 없이 이 시간이 지나면 작업을 회수해 다시 큐에 넣음 (초)
+REMOTE_MAX_ATTEMPTS = 3            # 에이전트 유실로 다시 배정하는 최대 횟수 (넘으면 실패 처리)
+REMOTE_PROGRESS_INTERVAL_SEC = 0.5 # 작업별 진행률 전송 최소 간격 (초)
+REMOTE_HANDSHAKE_TIMEOUT_SEC = 10.0
+REMOTE_RECONNECT_MIN_SEC = 1.0     # 연결이 끊기면 이 간격부터 두 배씩 늘려 재접속 (초)
+REMOTE_RECONNECT_MAX_SEC = 30.0
+REMOTE_MAX_MESSAGE_BYTES = 4 * 1024 * 1024  # 메시지(JSON 한 줄) 최대 크기
+
+# 상주 프로세스 풀
+POOL_EXTRA_HELPERS = 1             # 다운로드 워커 수 외에 메타데이터 조회용으로 추가할 헬퍼 수
+POOL_PROGRESS_INTERVAL_SEC = 0.1   # 헬퍼 -> 부모 진행률 전송 최소 간격 (초)
+POOL_CANCEL_TIMEOUT_SEC = 10       # 취소 요청 후 헬퍼 응답 대기 시간 (초)
+POOL_ACQUIRE_TIMEOUT_SEC = 600     # 유휴 헬퍼 대기 시간 (초)
+POOL_STOP_TIMEOUT_SEC = 1          # 헬퍼 하나를 정리할 때 정상 종료 대기 시간 (이후 그룹 강제 종료, 초)
+
+# 대역폭 예산
+BANDWIDTH_MIN_RATE = 32 * 1024     # 작업 하나에 배정하는 최소 속도 (바이트/초, 새 작업이 멈추지 않도록)
+
+# 동시 다운로드 수 자동 조절 (autotune_workers)
+AUTOTUNE_INTERVAL_SEC = 5.0        # 처리량 측정 간격 (초)
+AUTOTUNE_SETTLE_SEC = 20.0         # 워커 수를 바꾼 뒤 이 시간 동안은 측정만 하고 판단하지 않음 (초)
+AUTOTUNE_MIN_SAMPLES = 3           # 한 단계의 처리량을 판단하기 전에 모을 측정 수
+AUTOTUNE_GAIN_THRESHOLD = 0.10     # 늘린 뒤 처리량이 이 비율 이상 늘지 않으면 되돌림
+AUTOTUNE_HOLD_SEC = 120.0          # 늘려도 이득이 없었으면 이 시간 동안 다시 늘려 보지 않음 (초, 연속으로 실패하면 두 배씩)
+AUTOTUNE_MAX_HOLD_SEC = 30 * 60    # 다시 늘려 보기까지의 최대 대기 시간 (초)
+AUTOTUNE_THROTTLE_BACKOFF_SEC = 180.0  # 429(요청 과다)를 받으면 절반으로 줄이고 이 시간 동안 늘리지 않음 (초)
+AUTOTUNE_THROTTLE_CEILING_SEC = 30 * 60  # 429를 받은 워커 수 이상으로는 이 시간 동안 늘리지 않음 (초)
+AUTOTUNE_ERROR_RATE = 0.5          # 측정 구간 실패율이 이 이상이면 하나 줄임
+AUTOTUNE_MIN_FINISHED = 2          # 실패율을 판단하기 위한 최소 완료(성공+실패) 수
+AUTOTUNE_IDLE_GRACE_SEC = 10.0     # 대기 작업이 이 시간 동안 없으면 유휴 워커를 퇴장시킴 (초)
+AUTOTUNE_HISTORY_SIZE = 50         # 상태 조회용으로 보관할 최근 판단 수
+AUTOTUNE_THROTTLE_MARKERS = ('429', 'too many requests')  # 실패 메시지에서 요청 과다를 알아보는 문자열 (소문자)
+
+# 대기열 스케줄링 정책 (scheduling_policy)
+SCHEDULING_FIFO = 'fifo'           # 등록 순
+SCHEDULING_SJF = 'sjf'             # 예상 크기가 작은 작업 먼저
+SCHEDULING_FAIR = 'fair'           # 묶음(플레이리스트/일괄 등록)끼리 번갈아
+SCHEDULING_POLICIES = (SCHEDULING_FIFO, SCHEDULING_SJF, SCHEDULING_FAIR)
+SJF_BYTES_PER_SECOND = 256 * 1024  # 크기를 모를 때 재생 시간 1초당 예상 크기 (바이트)
+SJF_UNKNOWN_JOB_BYTES = 64 * 1024 * 1024  # 크기/재생 시간을 모두 모를 때 예상 크기 (바이트)
+SCHEDULING_SIM_THROUGHPUT = 2 * 1024 * 1024  # 시뮬레이션: 다운로드 하나의 속도 (바이트/초)
+
+# 메타데이터 조회 백엔드
+METADATA_BACKEND_SUBPROCESS = 'subprocess'  # 실행 엔진(subprocess/프로세스 풀)과 동일한 경로 사용
+METADATA_BACKEND_INPROCESS = 'inprocess'    # 프로세스 내 스레드 풀에서 yt_dlp API 직접 호출
+METADATA_BACKENDS = (METADATA_BACKEND_SUBPROCESS, METADATA_BACKEND_INPROCESS)
+INPROCESS_METADATA_WORKERS = 4          # 메타데이터 추출 스레드 수
+INPROCESS_MAX_INSTANCES_PER_THREAD = 4  # 스레드당 유지할 YoutubeDL 인스턴스 수 (옵션 조합별)
+INPROCESS_EXTRACT_TIMEOUT_SEC = 60      # 추출 1건 최대 대기 시간 (초)
+
+# 메타데이터 선행 조회 단계 (다운로드 슬롯과 분리)
+METADATA_PIPELINE_WORKERS = 2           # 선행 조회 스레드 수
+METADATA_LOOKUP_FAILED_KEY = '_metadata_lookup_failed'  # 선행 조회 실패를 다운로드 워커에 알리는 메타데이터 키
+
+# 배치 메타데이터 조회 (yt-dlp 1회 실행으로 여러 URL 처리)
+METADATA_BATCH_SIZE = 50                # 배치당 URL 수 (결과는 영상 단위로 즉시 전달)
+
+# 메타데이터 단계의 info JSON 재사용 (다운로드 시 --load-info-json)
+INFO_JSON_DIR_NAME = 'info_json'
+INFO_JSON_MAX_AGE_SEC = 60 * 60         # 이 시간이 지나면 스트림 URL 만료로 간주하고 URL로 다시 추출 (초)
+INFO_JSON_OUTPUT_TEMPLATE = '%(extractor_key)s_%(id)s.%(ext)s'  # yt-dlp -o infojson: 템플릿 (.info.json으로 저장됨)
+# info JSON으로 받다가 이 문자열(소문자)이 들어간 오류가 나면 URL로 다시 추출 (스트림 URL 만료/재추출 필요)
+# 그 외 실패(취소/종료로 프로세스가 죽은 경우, 네트워크 오류 등)는 다시 실행하지 않고 그대로 반환
+INFO_JSON_RETRY_MARKERS = (
+    'http error 403', 'http error 410', '403: forbidden', 'requested format is not available',
+    'unable to extract', 'no video formats found', 'info json', 'info-json', 'infojson',
+)
+
+# 메타데이터 조회 시 yt-dlp에서 받아올 필드 (--print '%(.{...})j'로 전체 JSON 대신 사용)
+METADATA_FIELDS = (
+    'id', 'title', 'uploader', 'channel', 'duration', 'thumbnail',
+    'extractor', 'extractor_key', 'webpage_url', 'original_url', '_type',
+    'requested_formats', 'filesize', 'filesize_approx', 'vcodec', 'acodec',
+)
+
+# flat-playlist 항목에서 받아올 필드 (카드 즉시 표시용 경량 메타데이터)
+FLAT_ENTRY_FIELDS = ('id', 'url', 'title', 'duration', 'uploader', 'channel', 'thumbnails', 'ie_key')
+
+# 일시정지 시 프로세스 일시 중지 (POSIX: SIGSTOP/SIGCONT, 그 외 OS는 종료 후 이어받기)
+SUSPEND_MAX_SEC = 2 * 60                # 이 시간 이상 멈춰 있으면 연결 만료로 보고 프로세스 종료 (초)
+
+# 자식 프로세스 감독 (yt-dlp/ffmpeg 프로세스 그룹)
+PROCESS_SHUTDOWN_TIMEOUT_SEC = 3        # 앱 종료 시 전체 프로세스 정상 종료 대기 시간 (이후 강제 종료, 초)
+PROCESS_KILL_WAIT_SEC = 5               # 강제 종료 후 회수 대기 시간 (초)
+
+# 다운로드 묶음 실행 (짧은 영상/오디오 작업 여러 개를 yt-dlp 1회 실행으로 처리)
+DOWNLOAD_BATCH_MAX_SIZE = 20            # 한 번에 묶을 수 있는 최대 작업 수
+DOWNLOAD_BATCH_MAX_DURATION_SEC = 600   # 영상 작업은 이 길이 이하만 묶음 (오디오 작업은 길이 무관)
+DOWNLOAD_BATCH_PEEK_LIMIT = 50          # 묶을 작업을 찾을 때 큐에서 살펴볼 최대 항목 수
+
+# 플레이리스트 스트리밍 분석
+PLAYLIST_STREAM_CHUNK_SIZE = 50         # 한 번에 UI로 전달할 영상 ID 수
+PLAYLIST_STREAM_FLUSH_SEC = 0.5         # 묶음이 덜 찼어도 이 시간이 지나면 전달 (초)
+
 # --- End Core Logic Constants ---
 
 # 언어 변경 함수
@@ -79,6 +229,8 @@ WORKER_CLEANUP_WAIT_MS = 5000    # 워커 정리 대기 시간 (5초)
 QUEUE_TIMEOUT_SEC = 1.0  # 큐 타임아웃 (초)
 BYTES_PER_KB = 1024  # 킬로바이트
 BYTES_PER_MB = 1024 * 1024  # 메가바이트
+FILE_SCAN_MAX_ENTRIES = 2000  # 최종 경로를 받지 못했을 때 다운로드 폴더에서 확인할 최대 항목 수
+FILE_SCAN_MTIME_SLACK_SEC = 5  # 다운로드 시작 시각보다 이만큼 이전에 수정된 파일까지 후보로 인정 (초)
 
 # 다운로드 관련 메시지 (Logic Only)
 ERROR_INVALID_URL = "Invalid URL"
@@ -88,9 +240,22 @@ MSG_DOWNLOAD_COMPLETE = "완료" # Logic key used in download_handler.py
 # 히스토리 및 작업 관리 관련
 HISTORY_DB_FILENAME = 'history.db'
 TASKS_JSON_FILENAME = 'tasks.json'
+SETTINGS_FILENAME = 'settings.json'
 HISTORY_TABLE_NAME = 'downloads'
 DATE_FORMAT = '%Y-%m-%d %H:%M:%S'  # SQLite 날짜 포맷
 
+# 메타데이터 캐시 (history.db와 같은 폴더의 별도 DB)
+METADATA_CACHE_DB_FILENAME = 'metadata_cache.db'
+METADATA_CACHE_TABLE_NAME = 'metadata'
+METADATA_CACHE_TTL_SEC = 6 * 60 * 60    # 캐시 유효 시간 (초)
+METADATA_CACHE_MAX_ENTRIES = 5000       # 최대 보관 항목 수 (초과 시 오래 사용하지 않은 항목부터 삭제)
+
+# 이어받기용 임시 파일(.part) 기록 (작업별 포맷 ID/임시 파일 경로/받은 바이트)
+PARTIAL_DB_FILENAME = 'partials.db'
+PARTIAL_TABLE_NAME = 'partial_files'
+PARTIAL_SAVE_INTERVAL_SEC = 2.0              # 다운로드 중 진행 위치 기록 간격 (초)
+PARTIAL_ORPHAN_MAX_AGE_SEC = 7 * 24 * 60 * 60  # 어느 작업에도 연결되지 않은 yt-dlp 임시 파일 보관 기간 (초)
+
 # 플레이리스트 관련
 PLAYLIST_VIDEO_URL_TEMPLATE = "https://www.youtube.com/watch?v={video_id}"
 
@@ -182,3 +347,8 @@ PATH_LINUX_APP_DATA = '~/.local/share'
 ORGANIZATION_NAME = "YTDownloader"
 SRC_DIR_NAME = "src"
 REQUIREMENTS_FILENAME = "requirements.txt"
+
+# 단일 인스턴스 (두 번째 실행은 URL을 실행 중인 인스턴스로 넘기고 종료)
+SINGLE_INSTANCE_CONNECT_TIMEOUT_MS = 200   # 실행 중인 인스턴스 연결 대기 (없으면 바로 실패)
+SINGLE_INSTANCE_WRITE_TIMEOUT_MS = 1000    # URL 전송 완료 대기
+SINGLE_INSTANCE_MAX_MESSAGE_BYTES = 1024 * 1024  # 연결당 최대 메시지 크기
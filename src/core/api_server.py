@@ -0,0 +1,313 @@
+"""
+로컬 HTTP API 서버 (JSON-RPC 2.0 + Server-Sent Events, 표준 라이브러리 asyncio만 사용)
+- DownloadService 위에서 동작하며 별도 스레드의 이벤트 루프 하나로 모든 연결을 처리
+- 엔드포인트
+    POST /rpc        JSON-RPC 2.0 요청 (배치 배열 지원)
+                     메서드: enqueue, enqueue_many, pause, resume, cancel, set_priority, move, status
+    GET  /tasks      전체 작업 상태 (?state=waiting 등으로 거르기)
+    GET  /tasks/<id> 작업 하나의 상태
+    GET  /events     작업 이벤트 스트림 (text/event-stream, 이벤트마다 data: JSON)
+- HTTP/1.1 keep-alive를 지원하므로 연결 하나로 초당 수천 건의 등록 요청을 보낼 수 있음
+- token을 지정하면 모든 요청에 'Authorization: Bearer <token>' 헤더가 필요
+"""
+import asyncio
+import json
+import threading
+from collections import deque
+from typing import Any, Dict, Optional, Set
+from urllib.parse import urlsplit, parse_qs
+
+from core.download_service import DownloadService, ServiceError
+from core.events import EngineThread
+from utils.logger import log
+from constants import (
+    API_DEFAULT_HOST, API_DEFAULT_PORT, API_MAX_BODY_BYTES,
+    API_EVENT_QUEUE_SIZE, API_SSE_KEEPALIVE_SEC
+)
+
+# JSON-RPC 2.0 오류 코드
+RPC_PARSE_ERROR = -32700
+RPC_INVALID_REQUEST = -32600
+RPC_METHOD_NOT_FOUND = -32601
+RPC_INVALID_PARAMS = -32602
+RPC_INTERNAL_ERROR = -32603
+
+HTTP_REASONS = {
+    200: 'OK', 204: 'No Content', 400: 'Bad Request', 401: 'Unauthorized', 404: 'Not Found',
+    405: 'Method Not Allowed', 413: 'Payload Too Large', 500: 'Internal Server Error'
+}
+
+
+class _Subscriber:
+    """이벤트 스트림 구독자 하나 (느린 구독자는 오래된 이벤트부터 버림)"""
+
+    def __init__(self):
+        self.events = deque(maxlen=API_EVENT_QUEUE_SIZE)
+        self.ready = asyncio.Event()
+
+    def push(self, record: Dict) -> None:
+        self.events.append(record)
+        self.ready.set()
+
+
+class ApiServer(EngineThread):
+    """
+    DownloadService를 HTTP로 노출하는 서버 스레드
+    - 서비스 메서드는 빠르게 끝나므로(큐에 넣기/플래그 설정) 이벤트 루프에서 바로 호출
+    - 서비스 이벤트는 워커 스레드에서 오므로 call_soon_threadsafe로 루프에 넘겨 구독자에게 분배
+    """
+
+    def __init__(self, service: DownloadService, host: str = API_DEFAULT_HOST,
+                 port: int = API_DEFAULT_PORT, token: Optional[str] = None):
+        super().__init__()
+        self.service = service
+        self.host = host
+        self.port = port
+        self.token = token
+        self.started = threading.Event()
+        self.error: Optional[BaseException] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._shutdown: Optional[asyncio.Event] = None
+        self._subscribers: Set[_Subscriber] = set()
+        self._clients: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+        self._methods = {
+            'enqueue': service.enqueue,
+            'enqueue_many': service.enqueue_many,
+            'pause': service.pause,
+            'resume': service.resume,
+            'cancel': service.cancel,
+            'set_priority': service.set_priority,
+            'move': service.move,
+            'status': service.status,
+        }
+
+    # ============================================================
+    # 스레드 / 수명
+    # ============================================================
+
+    def run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        self.service.task_event.connect(self._publish)
+        try:
+            loop.run_until_complete(self._serve())
+        except Exception as e:
+            self.error = e
+            log.error(f"API 서버 오류: {e}", exc_info=True)
+        finally:
+            self.service.task_event.disconnect(self._publish)
+            self._loop = None
+            self.started.set()
+            loop.close()
+
+    async def _serve(self) -> None:
+        self._shutdown = asyncio.Event()
+        server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        # 포트 0이면 운영체제가 고른 포트를 기록
+        self.port = server.sockets[0].getsockname()[1]
+        log.info(f"API 서버 시작: http://{self.host}:{self.port}")
+        self.started.set()
+        async with server:
+            await self._shutdown.wait()
+            # 스트림 구독자와 keep-alive로 대기 중인 연결을 닫아야 서버가 정리됨
+            for subscriber in list(self._subscribers):
+                subscriber.ready.set()
+            handlers = list(self._clients.values())
+            for writer, handler in list(self._clients.items()):
+                writer.close()
+                handler.cancel()
+            await asyncio.gather(*handlers, return_exceptions=True)
+
+    def stop(self) -> None:
+        """서버 종료 요청 (어느 스레드에서나 호출 가능)"""
+        loop = self._loop
+        if loop is not None and self._shutdown is not None:
+            try:
+                loop.call_soon_threadsafe(self._shutdown.set)
+            except RuntimeError:
+                pass
+
+    # ============================================================
+    # 이벤트 스트림
+    # ============================================================
+
+    def _publish(self, record: Dict) -> None:
+        """서비스 이벤트 수신 (워커 스레드) → 루프로 전달"""
+        loop = self._loop
+        if loop is None or not self._subscribers:
+            return
+        try:
+            loop.call_soon_threadsafe(self._broadcast, record)
+        except RuntimeError:
+            pass
+
+    def _broadcast(self, record: Dict) -> None:
+        for subscriber in self._subscribers:
+            subscriber.push(record)
+
+    async def _stream_events(self, writer: asyncio.StreamWriter) -> None:
+        """SSE 응답 (연결이 끊기거나 서버가 종료될 때까지)"""
+        writer.write(
+            b'HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n'
+            b'Cache-Control: no-cache\r\nConnection: keep-alive\r\n\r\n'
+        )
+        subscriber = _Subscriber()
+        self._subscribers.add(subscriber)
+        try:
+            await writer.drain()
+            while not self._shutdown.is_set():
+                try:
+                    await asyncio.wait_for(subscriber.ready.wait(), API_SSE_KEEPALIVE_SEC)
+                except asyncio.TimeoutError:
+                    writer.write(b': keep-alive\n\n')
+                    await writer.drain()
+                    continue
+                subscriber.ready.clear()
+                chunks = []
+                while subscriber.events:
+                    record = subscriber.events.popleft()
+                    chunks.append(f"event: {record['event']}\ndata: {json.dumps(record, ensure_ascii=False)}\n\n")
+                if chunks:
+                    writer.write(''.join(chunks).encode('utf-8'))
+                    await writer.drain()
+        finally:
+            self._subscribers.discard(subscriber)
+
+    # ============================================================
+    # HTTP 처리
+    # ============================================================
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """연결 하나 처리 (keep-alive로 여러 요청)"""
+        self._clients[writer] = asyncio.current_task()
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, {'error': 'malformed request line'}, keep_alive=False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get('content-length', 0))
+                except ValueError:
+                    length = -1
+                if length < 0 or length > API_MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {'error': 'body too large'}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                keep_alive = headers.get('connection', '').lower() != 'close' and version != 'HTTP/1.0'
+                if self.token and headers.get('authorization') != f'Bearer {self.token}':
+                    await self._respond(writer, 401, {'error': 'unauthorized'}, keep_alive)
+                elif method == 'GET' and urlsplit(target).path == '/events':
+                    await self._stream_events(writer)
+                    break
+                else:
+                    status, payload = self._route(method, target, body)
+                    await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:
+            log.error(f"API 요청 처리 오류: {e}", exc_info=True)
+        finally:
+            self._clients.pop(writer, None)
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool) -> None:
+        body = b'' if payload is None else json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    def _route(self, method: str, target: str, body: bytes):
+        """(HTTP 상태, 응답 JSON) 반환"""
+        parts = urlsplit(target)
+        path = parts.path.rstrip('/') or '/'
+
+        if path == '/rpc':
+            if method != 'POST':
+                return 405, {'error': 'use POST'}
+            return self._handle_rpc(body)
+
+        if path == '/tasks' or path.startswith('/tasks/'):
+            if method != 'GET':
+                return 405, {'error': 'use GET'}
+            try:
+                if path == '/tasks':
+                    state = parse_qs(parts.query).get('state', [None])[0]
+                    return 200, self.service.status(state=state)
+                return 200, self.service.status(path[len('/tasks/'):])
+            except ServiceError as e:
+                return 404, {'error': str(e)}
+
+        return 404, {'error': 'not found'}
+
+    # ============================================================
+    # JSON-RPC
+    # ============================================================
+
+    def _handle_rpc(self, body: bytes):
+        try:
+            request = json.loads(body.decode('utf-8'))
+        except (UnicodeDecodeError, ValueError):
+            return 200, self._rpc_error(None, RPC_PARSE_ERROR, 'parse error')
+
+        if isinstance(request, list):
+            if not request:
+                return 200, self._rpc_error(None, RPC_INVALID_REQUEST, 'empty batch')
+            responses = [r for r in (self._call(item) for item in request) if r is not None]
+            return (200, responses) if responses else (204, None)
+
+        response = self._call(request)
+        return (200, response) if response is not None else (204, None)
+
+    def _call(self, request: Any) -> Optional[Dict]:
+        """요청 하나 실행 (id가 없는 알림이면 None 반환)"""
+        if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+            return self._rpc_error(None, RPC_INVALID_REQUEST, 'invalid request')
+        request_id = request.get('id')
+        is_notification = 'id' not in request
+
+        handler = self._methods.get(request['method'])
+        params = request.get('params', {})
+        if handler is None:
+            response = self._rpc_error(request_id, RPC_METHOD_NOT_FOUND, f"unknown method: {request['method']}")
+        else:
+            try:
+                if isinstance(params, list):
+                    result = handler(*params)
+                elif isinstance(params, dict):
+                    result = handler(**params)
+                else:
+                    raise TypeError('params must be an object or array')
+                response = {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+            except (ServiceError, TypeError) as e:
+                response = self._rpc_error(request_id, RPC_INVALID_PARAMS, str(e))
+            except Exception as e:
+                log.error(f"API 메서드 오류 ({request['method']}): {e}", exc_info=True)
+                response = self._rpc_error(request_id, RPC_INTERNAL_ERROR, str(e))
+        return None if is_notification else response
+
+    @staticmethod
+    def _rpc_error(request_id: Any, code: int, message: str) -> Dict:
+        return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
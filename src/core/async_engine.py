@@ -0,0 +1,272 @@
+"""
+asyncio 기반 다운로드 엔진
+- 백그라운드 스레드 1개에서 이벤트 루프를 돌리고 작업마다 코루틴으로 yt-dlp를 실행
+- 작업당 OS 스레드(워커 + stderr 읽기) 대신 코루틴을 사용하므로 수십~100개 동시 다운로드에 적합
+- 큐에 작업이 들어오면 콜백으로 깨어남 (워커 스레드의 1초 주기 큐 폴링 없음)
+- DownloadWorker와 같은 큐/시그널/스케줄러 인터페이스를 사용 (스케줄러가 엔진 모드에 따라 선택)
+"""
+import asyncio
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from core import download_handler
+from core.events import EngineThread, Signal
+from core.workers import DownloadTaskMixin
+from utils.logger import log
+from constants import MSG_PAUSED_BY_USER
+from locales.strings import STR
+
+
+class NotifyingPriorityQueue(queue.PriorityQueue):
+    """항목이 들어올 때마다 등록된 콜백을 호출하는 우선순위 큐 (asyncio 엔진이 폴링 없이 깨어나도록)"""
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize)
+        self._listeners = []
+
+    def add_listener(self, callback) -> None:
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def release(self, task_id: int) -> None:
+        """작업의 동시 실행 자리 반납 (제한이 없는 큐는 반납할 자리가 없음, core.task_queue 참고)"""
+
+    def _put(self, item) -> None:
+        super()._put(item)
+        # 큐 잠금 안에서 호출되므로 콜백은 블로킹 없이 끝나야 함 (call_soon_threadsafe 등)
+        for callback in list(self._listeners):
+            callback()
+
+
+class _TaskContext(DownloadTaskMixin):
+    """코루틴 하나가 받는 작업의 상태 (DownloadWorker가 스레드마다 가지던 작업 상태)"""
+
+    def __init__(self, engine: 'AsyncDownloadEngine', task_id: int):
+        self._engine = engine
+        self.stop_event = engine.stop_event
+        self.pause_event = engine.pause_event
+        self.progress_updated = engine.progress_updated
+        self.metadata_fetched = engine.metadata_fetched
+        self._init_task_state()
+        self.current_task_id = task_id
+
+    def parent(self) -> Any:
+        return self._engine.parent()
+
+
+class AsyncDownloadEngine(EngineThread):
+    """
+    이벤트 루프 스레드 1개로 여러 다운로드를 동시에 처리하는 엔진
+    - concurrency: 동시에 실행할 작업 수 (워커 스레드 수에 해당, 실행 중 변경 가능)
+    - 일시정지/취소/타임아웃은 코루틴 안에서 처리 (프로세스 그룹 종료 후 루프에서 회수)
+    - 묶음 다운로드는 작업당 스레드 비용을 줄이기 위한 것이므로 이 엔진에서는 사용하지 않음
+    """
+    progress_updated = Signal(dict, int)
+    download_finished = Signal(bool, str, int, str)
+    task_started = Signal(int)
+    metadata_fetched = Signal(int, dict)
+
+    def __init__(
+        self,
+        download_queue: NotifyingPriorityQueue,
+        stop_event: threading.Event,
+        pause_event: threading.Event,
+        concurrency: int,
+        parent: Optional[Any] = None
+    ):
+        super().__init__(parent)
+        self.download_queue = download_queue
+        self.stop_event = stop_event
+        self.pause_event = pause_event
+        self.concurrency = max(0, concurrency)
+        self.retire_flag: bool = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        # 실행 중인 작업 (메인 스레드의 일시 중지/재개 요청이 조회하므로 잠금으로 보호)
+        self._contexts: Dict[int, _TaskContext] = {}
+        self._contexts_lock = threading.Lock()
+
+    # ============================================================
+    # 스케줄러가 메인 스레드에서 호출
+    # ============================================================
+
+    def wake(self) -> None:
+        """디스패처를 깨움 (큐에 작업 추가, 전체 재개, 동시 실행 수 변경, 종료 시 - 어느 스레드에서나 호출 가능)"""
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # 루프가 이미 닫힘
+            pass
+
+    def set_concurrency(self, concurrency: int) -> None:
+        """동시 실행 수 변경 (줄이면 실행 중인 작업은 끝날 때까지 유지)"""
+        self.concurrency = max(0, concurrency)
+        self.wake()
+
+    def retire(self) -> None:
+        """새 작업을 더 꺼내지 않고 실행 중인 작업이 끝나면 종료 (엔진 모드 전환 시)"""
+        self.retire_flag = True
+        self.wake()
+
+    def running_task_ids(self) -> List[int]:
+        with self._contexts_lock:
+            return list(self._contexts)
+
+    def suspend_download(self, task_id: Optional[int] = None) -> bool:
+        """
+        받는 중인 yt-dlp 프로세스를 일시 중지 (task_id가 없으면 전체)
+        - 하나라도 멈췄으면 True, 아니면 진행률 훅의 예외로 종료하는 기존 방식 사용
+        """
+        with self._contexts_lock:
+            contexts = [c for tid, c in self._contexts.items() if task_id is None or tid == task_id]
+        return any([c.process_control.suspend() for c in contexts])
+
+    def resume_download(self, task_id: Optional[int] = None) -> List[int]:
+        """
+        일시 중지된 프로세스를 재개하고 다시 받기 시작한 작업 ID 목록 반환
+        - task_id가 없으면 개별 일시정지된 작업을 제외하고 전체 재개
+        """
+        scheduler = self.parent()
+        with self._contexts_lock:
+            contexts = [(tid, c) for tid, c in self._contexts.items() if task_id is None or tid == task_id]
+        resumed = []
+        for tid, context in contexts:
+            if task_id is None and scheduler is not None and scheduler.is_task_paused(tid):
+                continue
+            if context.process_control.resume():
+                resumed.append(tid)
+        return resumed
+
+    # ============================================================
+    # 이벤트 루프 스레드
+    # ============================================================
+
+    def run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._wakeup = asyncio.Event()
+        self._loop = loop
+        self.download_queue.add_listener(self.wake)
+        try:
+            loop.run_until_complete(self._dispatch())
+        except Exception as e:
+            log.error(f"asyncio 다운로드 엔진 오류: {e}", exc_info=True)
+        finally:
+            self.download_queue.remove_listener(self.wake)
+            self._loop = None
+            try:
+                loop.run_until_complete(loop.shutdown_default_executor())
+            finally:
+                loop.close()
+
+    async def _dispatch(self) -> None:
+        """큐에서 작업을 꺼내 동시 실행 수만큼 코루틴으로 실행"""
+        running = set()
+        stopping = False
+        while not stopping and not self.stop_event.is_set() and not self.retire_flag:
+            self._wakeup.clear()
+            while self.pause_event.is_set() and len(running) < self.concurrency:
+                try:
+                    entry = self.download_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                # 종료 신호 (스케줄러 shutdown)
+                if not isinstance(entry, tuple) or len(entry) < 5 or entry[1] is None:
+                    self.download_queue.task_done()
+                    stopping = True
+                    break
+
+                task = asyncio.ensure_future(self._run_task(*entry[1:5]))
+                running.add(task)
+                task.add_done_callback(running.discard)
+                task.add_done_callback(lambda _: self._wakeup.set())
+
+            if not stopping:
+                await self._wakeup.wait()
+
+        # 실행 중인 작업 마무리 (종료 시에는 감독자가 프로세스를 종료하므로 곧 끝남)
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    async def _run_task(self, task_id: int, url: str, settings: Dict, metadata: Dict) -> None:
+        """작업 하나 처리 (DownloadWorker.run의 작업 단위 처리와 동일한 순서)"""
+        scheduler = self.parent()
+        if scheduler and hasattr(scheduler, 'on_task_dequeued'):
+            scheduler.on_task_dequeued(task_id)
+
+        context = _TaskContext(self, task_id)
+        try:
+            if context._is_task_held(task_id):
+                self.download_queue.release(task_id)
+                context._notify_skipped(task_id)
+                return
+
+            loop = asyncio.get_running_loop()
+            # 메타데이터가 준비되지 않은 작업만 조회 (yt-dlp 실행이 블로킹이므로 스레드 풀에서)
+            metadata, meta_ok = await loop.run_in_executor(
+                None, context._process_metadata, task_id, url, metadata, settings
+            )
+            if not meta_ok:
+                from utils.utils import is_youtube_url
+                if not is_youtube_url(url):
+                    log.error(f"지원되지 않는 URL (task_id={task_id}): {url}")
+                    self.download_finished.emit(False, STR.ERR_UNSUPPORTED_URL, task_id, "")
+                    return
+
+            with self._contexts_lock:
+                self._contexts[task_id] = context
+            self.task_started.emit(task_id)
+            context._init_progress_tracking(task_id, metadata)
+            context.download_started_at = time.time()
+
+            registry = context._partial_registry()
+            resume_state = None
+            if settings.get('is_resume') and registry is not None:
+                resume_state = registry.get(task_id)
+
+            success, message = await download_handler.download_video_async(
+                url, settings, context._progress_hook,
+                info_json_path=metadata.get('info_json_path'),
+                process_control=context.process_control,
+                task_id=task_id,
+                resume_state=resume_state
+            )
+
+            # 앱 종료로 프로세스가 정리된 경우 결과를 통지하지 않음
+            if self.stop_event.is_set():
+                return
+
+            if not success and context._is_task_cancelled(task_id):
+                context._clear_partial(task_id, delete_files=context._cancel_deletes_files(task_id))
+                self.download_finished.emit(False, STR.MSG_DL_CANCELLED, task_id, "")
+                return
+
+            if not success and MSG_PAUSED_BY_USER in str(message):
+                self.download_finished.emit(False, STR.STATUS_PAUSED, task_id, "")
+                return
+
+            final_path = ""
+            if success:
+                context._clear_partial(task_id)
+                # 폴더 탐색 폴백이 있으므로 스레드 풀에서
+                final_path = await loop.run_in_executor(
+                    None, context._find_downloaded_file, task_id, metadata, settings
+                )
+            self.download_finished.emit(success, message, task_id, final_path)
+
+        except Exception as e:
+            log.error(f"다운로드 오류 (task_id={task_id}): {e}", exc_info=True)
+            self.download_finished.emit(False, f"오류: {e}", task_id, "")
+        finally:
+            with self._contexts_lock:
+                self._contexts.pop(task_id, None)
+            self.download_queue.task_done()
@@ -0,0 +1,293 @@
+"""
+동시 다운로드 수 자동 조절 (autotune_workers)
+- 측정 간격마다 전체 처리량(받은 바이트), 작업당 속도, 실패/429 수를 모아 워커 수를 조절
+    - 대기 작업이 있고 자리가 모두 찼으면 하나 늘려 보고, 처리량이 충분히 늘지 않으면 되돌림 (언덕 오르기)
+    - 429(요청 과다)를 받으면 절반으로 줄이고 한동안 그 수 이상으로는 늘리지 않음, 실패가 잦으면 하나 줄임
+    - 대기 작업이 없으면 유휴 워커를 퇴장시켜 0까지 줄이고, 작업이 들어오면 바로 이전 수로 복구
+- 히스테리시스: 바꾼 뒤 AUTOTUNE_SETTLE_SEC 동안은 측정만 하고, 이득이 없던 증가는 한동안 다시 시도하지 않음
+  (연속으로 이득이 없으면 대기 시간을 두 배씩 늘림)
+- 워커 수 변경은 스케줄러의 adjust_worker_count 사용 (줄일 때 retire_flag로 현재 작업을 마친 뒤 퇴장)
+- 판단마다 이유와 측정값을 로그에 남기고 최근 판단은 snapshot()으로 조회 (데몬 상태 API)
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.events import EngineThread
+from utils.logger import log
+from utils.utils import format_bytes
+from constants import (
+    ENGINE_ASYNC, MAX_DOWNLOADS_RANGE, ASYNC_MAX_DOWNLOADS_RANGE, MSG_PAUSED_BY_USER,
+    DEFAULT_AUTOTUNE_MIN_WORKERS, DEFAULT_AUTOTUNE_MAX_WORKERS,
+    AUTOTUNE_INTERVAL_SEC, AUTOTUNE_SETTLE_SEC, AUTOTUNE_MIN_SAMPLES, AUTOTUNE_GAIN_THRESHOLD,
+    AUTOTUNE_HOLD_SEC, AUTOTUNE_MAX_HOLD_SEC, AUTOTUNE_THROTTLE_BACKOFF_SEC, AUTOTUNE_THROTTLE_CEILING_SEC,
+    AUTOTUNE_ERROR_RATE, AUTOTUNE_MIN_FINISHED,
+    AUTOTUNE_IDLE_GRACE_SEC, AUTOTUNE_HISTORY_SIZE, AUTOTUNE_THROTTLE_MARKERS
+)
+
+
+def _limit_value(value: Any, default: int) -> int:
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def _mean(values: List[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+class ConcurrencyAutotuner(EngineThread):
+    """측정한 처리량/오류에 따라 스케줄러의 워커 수를 조절하는 스레드"""
+
+    def __init__(self, scheduler, clock: Callable[[], float] = time.monotonic):
+        super().__init__(scheduler)
+        self.scheduler = scheduler
+        self._clock = clock
+        self.min_workers = DEFAULT_AUTOTUNE_MIN_WORKERS
+        self.max_workers = DEFAULT_AUTOTUNE_MAX_WORKERS
+        self.decisions = deque(maxlen=AUTOTUNE_HISTORY_SIZE)
+        self._halt = threading.Event()
+        self._wake = threading.Event()
+
+        # 측정 구간 누적값 (워커 스레드의 이벤트에서 갱신) - _stats_lock으로 보호
+        self._stats_lock = threading.Lock()
+        self._bytes = 0
+        self._last_bytes: Dict[int, int] = {}
+        self._speeds: Dict[int, float] = {}
+        self._succeeded = 0
+        self._failed = 0
+        self._throttled = 0
+
+        # 판단 상태 (조절 스레드에서만 사용)
+        now = clock()
+        self._sample_at = now
+        self._changed_at = now
+        self._samples: List[float] = []  # 현재 워커 수에서 측정한 구간별 처리량 (바이트/초)
+        self._probe: Optional[Tuple[int, float]] = None  # 늘려 보는 중이면 (이전 워커 수, 이전 처리량)
+        self._hold_until = 0.0
+        self._hold_sec = AUTOTUNE_HOLD_SEC
+        self._ceiling = 0  # 429를 받은 뒤 한동안 넘지 않을 워커 수 (0이면 없음)
+        self._ceiling_until = 0.0
+        self._idle_since: Optional[float] = None
+        self._resume_level = 0  # 유휴 퇴장 전 워커 수 (작업이 들어오면 복구)
+        self._metrics: Dict[str, Any] = {}
+
+    # ============================================================
+    # 설정 / 제어
+    # ============================================================
+
+    def configure(self, min_workers: Any, max_workers: Any) -> None:
+        self.max_workers = max(1, _limit_value(max_workers, DEFAULT_AUTOTUNE_MAX_WORKERS))
+        self.min_workers = max(1, min(self.max_workers, _limit_value(min_workers, DEFAULT_AUTOTUNE_MIN_WORKERS)))
+        self._wake.set()
+
+    def stop(self) -> None:
+        """조절 중단 (워커 수는 마지막 값으로 유지)"""
+        self._halt.set()
+        self._wake.set()
+
+    def bounds(self) -> Tuple[int, int]:
+        """대기 작업이 있을 때의 워커 수 범위 (엔진별 최대 동시 다운로드 수 이내, 429 상한은 별도)"""
+        engine_range = ASYNC_MAX_DOWNLOADS_RANGE if self.scheduler.engine_mode == ENGINE_ASYNC else MAX_DOWNLOADS_RANGE
+        upper = max(engine_range[0], min(self.max_workers, engine_range[1]))
+        lower = max(engine_range[0], min(self.min_workers, upper))
+        return lower, upper
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 범위, 최근 측정값과 판단 기록 (상태 조회용)"""
+        lower, upper = self.bounds()
+        return {
+            'workers': self.scheduler.get_worker_count(),
+            'min': lower,
+            'max': upper,
+            'ceiling': self._ceiling or None,
+            'metrics': dict(self._metrics),
+            'decisions': list(self.decisions),
+        }
+
+    # ============================================================
+    # 스케줄러 이벤트 (워커 스레드에서 호출)
+    # ============================================================
+
+    def _on_progress(self, d: Dict[str, Any], task_id: int) -> None:
+        if d.get('status') != 'downloading':
+            return
+        downloaded = d.get('downloaded_bytes') or 0
+        speed = d.get('speed')
+        with self._stats_lock:
+            last = self._last_bytes.get(task_id)
+            # 첫 진행률은 기준점으로만 사용 (이어받기 시 이미 받은 크기가 들어 있음)
+            if last is not None:
+                self._bytes += downloaded - last if downloaded >= last else downloaded
+            self._last_bytes[task_id] = downloaded
+            if speed:
+                self._speeds[task_id] = speed
+
+    def _on_finished(self, success: bool, message: str, task_id: int, final_path: str) -> None:
+        with self._stats_lock:
+            self._last_bytes.pop(task_id, None)
+            self._speeds.pop(task_id, None)
+            if success:
+                self._succeeded += 1
+                return
+            # 일시정지/취소는 실패로 세지 않음
+            if MSG_PAUSED_BY_USER in str(message) or self.scheduler.is_task_cancelled(task_id):
+                return
+            self._failed += 1
+            lowered = str(message).lower()
+            if any(marker in lowered for marker in AUTOTUNE_THROTTLE_MARKERS):
+                self._throttled += 1
+
+    # ============================================================
+    # 조절 루프
+    # ============================================================
+
+    def run(self) -> None:
+        scheduler = self.scheduler
+        scheduler.progress_updated.connect(self._on_progress)
+        scheduler.download_finished.connect(self._on_finished)
+        # 작업이 들어오면 바로 깨어나 유휴 상태에서 복구
+        scheduler.download_queue.add_listener(self._wake.set)
+        lower, upper = self.bounds()
+        log.info(f"동시 다운로드 수 자동 조절 시작 (범위 {lower}~{upper})")
+        try:
+            while not self._halt.is_set() and not scheduler.stop_event.is_set():
+                self._wake.wait(AUTOTUNE_INTERVAL_SEC)
+                self._wake.clear()
+                if self._halt.is_set() or scheduler.stop_event.is_set():
+                    break
+                try:
+                    self._tick(self._clock())
+                except Exception as e:
+                    log.error(f"동시 다운로드 수 자동 조절 오류: {e}", exc_info=True)
+        finally:
+            scheduler.download_queue.remove_listener(self._wake.set)
+            scheduler.progress_updated.disconnect(self._on_progress)
+            scheduler.download_finished.disconnect(self._on_finished)
+            log.info("동시 다운로드 수 자동 조절 종료")
+
+    def _tick(self, now: float) -> None:
+        scheduler = self.scheduler
+        current = scheduler.get_worker_count()
+        queued = scheduler.download_queue.qsize() + scheduler.pending_queue.qsize()
+        active = scheduler.download_queue.active_counts().get('total', 0)
+        lower, upper = self.bounds()
+
+        if scheduler.is_paused():
+            # 멈춰 있는 동안의 처리량은 판단에 쓰지 않음
+            self._reset_window(now)
+            return
+
+        # 유휴 상태에서 작업이 들어오면 측정을 기다리지 않고 바로 복구
+        if queued:
+            self._idle_since = None
+            if current < lower or self._resume_level > current:
+                target = min(upper, max(lower, self._resume_level))
+                self._resume_level = 0
+                self._apply(now, current, target, "대기 작업 도착", queued, active)
+                return
+        else:
+            if self._idle_since is None:
+                self._idle_since = now
+            elif now - self._idle_since >= AUTOTUNE_IDLE_GRACE_SEC and active < current:
+                # 늘려 보는 중이었으면 검증된 이전 수로 복구
+                stable = self._probe[0] if self._probe else current
+                self._probe = None
+                self._resume_level = max(self._resume_level, stable)
+                self._apply(now, current, active, "대기 작업 없음 - 유휴 워커 퇴장", queued, active)
+                return
+
+        if now - self._sample_at < AUTOTUNE_INTERVAL_SEC:
+            return
+        elapsed = now - self._sample_at
+        self._sample_at = now
+        with self._stats_lock:
+            received, self._bytes = self._bytes, 0
+            task_speed = _mean(list(self._speeds.values()))
+            succeeded, failed, throttled = self._succeeded, self._failed, self._throttled
+        throughput = received / elapsed
+        self._metrics = {
+            'throughput': round(throughput), 'task_speed': round(task_speed),
+            'succeeded': succeeded, 'failed': failed, 'throttled': throttled,
+            'queued': queued, 'active': active,
+        }
+        settled = now - self._changed_at >= AUTOTUNE_SETTLE_SEC
+        if settled and active:
+            self._samples.append(throughput)
+        if not settled or not queued:
+            return
+
+        if self._ceiling and now >= self._ceiling_until:
+            self._ceiling = 0
+        if self._ceiling:
+            upper = max(lower, min(upper, self._ceiling))
+
+        finished = succeeded + failed
+        target, reason = current, None
+        if throttled:
+            target = max(lower, current // 2)
+            self._hold_until = now + AUTOTUNE_THROTTLE_BACKOFF_SEC
+            self._ceiling = max(lower, current - 1)
+            self._ceiling_until = now + AUTOTUNE_THROTTLE_CEILING_SEC
+            self._probe = None
+            reason = f"요청 과다(429) {throttled}회"
+            self._reset_errors()
+        elif finished >= AUTOTUNE_MIN_FINISHED and failed / finished >= AUTOTUNE_ERROR_RATE:
+            target = max(lower, current - 1)
+            self._probe = None
+            reason = f"실패율 {failed}/{finished}"
+            self._reset_errors()
+        elif current > upper or current < lower:
+            target = min(upper, max(lower, current))
+            reason = f"범위 {lower}~{upper} 적용"
+        elif active >= current and len(self._samples) >= AUTOTUNE_MIN_SAMPLES:
+            # 자리가 모두 찼고 대기 작업이 있음 → 늘려 볼 만한지 판단
+            level_throughput = _mean(self._samples)
+            if self._probe:
+                previous, previous_throughput = self._probe
+                self._probe = None
+                if level_throughput < previous_throughput * (1 + AUTOTUNE_GAIN_THRESHOLD):
+                    target = previous
+                    self._hold_until = now + self._hold_sec
+                    reason = (f"늘려도 처리량 이득 없음 ({format_bytes(previous_throughput)}/s → "
+                              f"{format_bytes(level_throughput)}/s), {self._hold_sec:.0f}초 유지")
+                    self._hold_sec = min(AUTOTUNE_MAX_HOLD_SEC, self._hold_sec * 2)
+                else:
+                    self._hold_sec = AUTOTUNE_HOLD_SEC
+            if reason is None and now >= self._hold_until and current < upper:
+                self._probe = (current, level_throughput)
+                target = current + 1
+                reason = f"대기 {queued}개, 처리량 {format_bytes(level_throughput)}/s에서 늘려 봄"
+
+        if reason and target != current:
+            self._apply(now, current, target, reason, queued, active)
+
+    def _apply(self, now: float, current: int, target: int, reason: str, queued: int, active: int) -> None:
+        """워커 수 변경 후 판단 기록 (측정 구간은 새로 시작)"""
+        metrics = dict(self._metrics, queued=queued, active=active)
+        log.info(
+            f"동시 다운로드 수 자동 조절: {current} → {target} ({reason}) | "
+            f"처리량 {format_bytes(metrics.get('throughput', 0))}/s, "
+            f"작업당 {format_bytes(metrics.get('task_speed', 0))}/s, "
+            f"성공 {metrics.get('succeeded', 0)} / 실패 {metrics.get('failed', 0)} "
+            f"(429 {metrics.get('throttled', 0)}), 대기 {queued}, 실행 중 {active}"
+        )
+        self.decisions.append({
+            'time': time.time(), 'from': current, 'to': target, 'reason': reason, 'metrics': metrics,
+        })
+        self.scheduler.adjust_worker_count(target)
+        self._reset_window(now)
+        self._changed_at = now
+
+    def _reset_window(self, now: float) -> None:
+        self._sample_at = now
+        self._samples = []
+        with self._stats_lock:
+            self._bytes = 0
+        self._reset_errors()
+
+    def _reset_errors(self) -> None:
+        with self._stats_lock:
+            self._succeeded = self._failed = self._throttled = 0
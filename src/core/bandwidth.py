@@ -0,0 +1,144 @@
+"""
+전체 대역폭 예산 (스케줄러 단위)
+- 설정한 총 속도(bandwidth_limit)를 받는 중인 작업끼리 나누어 씀 (우선순위 가중치 선택)
+- 작업이 시작/종료될 때마다 다시 분배
+    - 상주 프로세스 풀: 헬퍼의 yt_dlp가 받는 도중에도 새 몫을 읽으므로(ratelimit) 바로 반영
+    - subprocess/asyncio 엔진: 실행 중에는 --limit-rate를 바꿀 수 없으므로 시작할 때 몫을 고정
+      (비어 있는 동시 실행 자리도 곧 찰 것으로 보고 나누며, 먼저 시작한 작업의 고정 몫을 뺀
+       나머지 안에서만 배정 → 총량을 넘지 않음)
+    - 고정 몫은 다른 작업이 끝나 남는 대역폭이 생겨도 늘어나지 않음 (그 작업이 끝날 때까지 유지,
+      설정 화면의 속도 제한 도움말에 안내) → 늘어난 몫은 그 뒤에 시작하는 작업이 받음
+- 최소 몫(BANDWIDTH_MIN_RATE)도 남은 예산을 넘지 않음 (예산이 바닥나면 1바이트/초, 0은 제한 없음이므로)
+"""
+import threading
+from typing import Callable, Dict, Optional
+
+from constants import BANDWIDTH_MIN_RATE, TASK_PRIORITY_NORMAL
+
+
+class BandwidthShare:
+    """작업 하나의 몫 (바이트/초, 0이면 제한 없음)"""
+
+    def __init__(self, task_id: int, weight: float, adjustable: bool):
+        self.task_id = task_id
+        self.weight = weight
+        self.adjustable = adjustable
+        self.rate = 0
+        self._listener: Optional[Callable[[int], None]] = None
+
+    def bind(self, listener: Optional[Callable[[int], None]]) -> None:
+        """몫이 바뀔 때 호출할 함수 연결 (연결 즉시 현재 몫으로 한 번 호출, None이면 해제)"""
+        self._listener = listener
+        if listener is not None:
+            listener(self.rate)
+
+    def _set_rate(self, rate: int) -> None:
+        if rate == self.rate:
+            return
+        self.rate = rate
+        listener = self._listener
+        if listener is not None:
+            listener(rate)
+
+
+class BandwidthBudget:
+    """총 대역폭을 받는 중인 작업에 나누어 주는 예산 (스레드 안전)"""
+
+    def __init__(self):
+        self.total = 0  # 바이트/초 (0이면 제한 없음)
+        self.weighted = True
+        self.slots = 0  # 동시 실행 자리 수 (고정 몫 계산 시 아직 빈 자리 몫을 남겨 둠)
+        self._shares: Dict[int, BandwidthShare] = {}
+        self._priorities: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, total: int, weighted: bool = True) -> None:
+        with self._lock:
+            self.total = max(0, int(total or 0))
+            self.weighted = bool(weighted)
+            self._rebalance()
+
+    def set_slots(self, slots: int) -> None:
+        with self._lock:
+            self.slots = max(0, int(slots))
+
+    def is_limited(self) -> bool:
+        return self.total > 0
+
+    def set_priority(self, task_id: int, priority: int) -> None:
+        """작업 우선순위 기록 (받는 중이면 가중치를 바꿔 다시 분배)"""
+        with self._lock:
+            self._priorities[task_id] = priority
+            share = self._shares.get(task_id)
+            if share is not None and share.adjustable:
+                share.weight = self._weight(task_id)
+                self._rebalance()
+
+    def acquire(self, task_id: int, adjustable: bool) -> BandwidthShare:
+        """
+        다운로드 시작 시 몫 배정
+
+        Args:
+            adjustable: 받는 도중 몫을 바꿀 수 있는 실행기인지 (상주 프로세스 풀)
+        """
+        with self._lock:
+            self._shares.pop(task_id, None)
+            share = BandwidthShare(task_id, self._weight(task_id), adjustable)
+            if self.total and not adjustable:
+                share.rate = self._fixed_rate(share)
+            self._shares[task_id] = share
+            self._rebalance()
+            return share
+
+    def release(self, task_id: int) -> None:
+        """다운로드 종료 시 몫 반납 후 남은 작업에 다시 분배"""
+        with self._lock:
+            self._priorities.pop(task_id, None)
+            share = self._shares.pop(task_id, None)
+            if share is not None:
+                share.bind(None)
+                self._rebalance()
+
+    def snapshot(self) -> Dict[int, int]:
+        """작업별 현재 몫 (바이트/초, 상태 조회용)"""
+        with self._lock:
+            return {task_id: share.rate for task_id, share in self._shares.items()}
+
+    def _weight(self, task_id: int) -> float:
+        return self._priority_weight(self._priorities.get(task_id, TASK_PRIORITY_NORMAL))
+
+    def _priority_weight(self, priority: int) -> float:
+        if not self.weighted:
+            return 1.0
+        # 우선순위 숫자가 작을수록 더 큰 몫 (이어받기 1 : 일반 3 → 3배)
+        return 1.0 / max(1, priority)
+
+    def _fixed_rate(self, share: BandwidthShare) -> int:
+        """
+        고정 몫: 받는 중인 작업과 빈 자리(일반 우선순위로 가정)까지 포함한 가중치 기준 공정 몫,
+        단 다른 고정 몫을 뺀 나머지 이내 (최소 BANDWIDTH_MIN_RATE, 나머지가 그보다 적으면 나머지)
+        """
+        idle_slots = max(0, self.slots - len(self._shares) - 1)
+        weights = (share.weight + sum(s.weight for s in self._shares.values())
+                   + idle_slots * self._priority_weight(TASK_PRIORITY_NORMAL))
+        fair = self.total * share.weight / weights
+        reserved = sum(s.rate for s in self._shares.values() if not s.adjustable)
+        return _clamp(fair, self.total - reserved)
+
+    def _rebalance(self) -> None:
+        """조절 가능한 작업끼리 고정 몫을 뺀 나머지를 가중치대로 나눔 (잠금 안에서 호출)"""
+        adjustable = [s for s in self._shares.values() if s.adjustable]
+        if not self.total:
+            for share in adjustable:
+                share._set_rate(0)
+            return
+        reserved = sum(s.rate for s in self._shares.values() if not s.adjustable)
+        available = max(0, self.total - reserved)
+        weights = sum(s.weight for s in adjustable)
+        for share in adjustable:
+            share._set_rate(_clamp(available * share.weight / weights, available))
+
+
+def _clamp(rate: float, remaining: float) -> int:
+    """몫 = max(최소 몫, rate), 단 남은 예산 이내 (0은 제한 없음을 뜻하므로 최소 1)"""
+    return max(1, int(min(max(BANDWIDTH_MIN_RATE, round(rate)), remaining)))
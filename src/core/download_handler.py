@@ -3,12 +3,15 @@
 yt-dlp를 사용하여 YouTube 및 기타 모든 지원 사이트의 영상을 다운로드
 (기존 youtube_handler.py에서 범용화)
 """
+import asyncio
 import os
 import re
+import time
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-from utils.utils import get_ffmpeg_path, is_youtube_url
+from utils.utils import get_ffmpeg_path, is_youtube_url, get_user_data_path
 from utils.bin_manager import get_ytdlp_path
-from core.ytdlp_wrapper import YtDlpWrapper
+from core.process_supervisor import supervisor
+from core.ytdlp_wrapper import YtDlpWrapper, info_json_path
 from utils.logger import log
 from constants import (
     ERROR_INVALID_URL, MSG_DOWNLOAD_COMPLETE, MSG_PAUSED_BY_USER, DEFAULT_VIDEO_QUALITY,
@@ -16,10 +19,89 @@ from constants import (
     CONCURRENT_FRAGMENT_DOWNLOADS, LOUDNORM_FILTER, OUTPUT_TEMPLATE, AUDIO_CHANNELS,
     FORMAT_BESTAUDIO, DEFAULT_FORMAT,
     YOUTUBE_PLAYLIST_URL_PREFIX, YOUTUBE_SHORTS_PATH,
-    DOMAIN_YOUTU_BE, AUDIO_FORMATS
+    DOMAIN_YOUTU_BE, AUDIO_FORMATS,
+    INFO_JSON_DIR_NAME, INFO_JSON_MAX_AGE_SEC, INFO_JSON_RETRY_MARKERS, METADATA_FIELDS, FLAT_ENTRY_FIELDS,
+    PLAYLIST_VIDEO_URL_TEMPLATE
 )
 from locales.strings import STR
 
+# =====================================================================
+# 실행기 선택 (상주 프로세스 풀 / subprocess)
+# =====================================================================
+
+# 스케줄러가 엔진 모드에 따라 등록하는 상주 프로세스 풀 (없으면 None)
+_process_pool = None
+
+# 스케줄러가 설정에 따라 등록하는 메타데이터 전용 추출기 (없으면 None)
+_metadata_backend = None
+
+# 스케줄러의 전체 대역폭 예산 (없으면 None)
+_bandwidth_budget = None
+
+
+def set_process_pool(pool):
+    """상주 프로세스 풀 등록 (None이면 해제 → subprocess 방식으로 동작)"""
+    global _process_pool
+    _process_pool = pool
+
+
+def set_metadata_backend(backend):
+    """메타데이터 전용 추출기 등록 (None이면 해제 → 실행기와 동일한 경로 사용)"""
+    global _metadata_backend
+    _metadata_backend = backend
+
+
+def set_bandwidth_budget(budget):
+    """대역폭 예산 등록 (None이면 해제 → 속도 제한 없음)"""
+    global _bandwidth_budget
+    _bandwidth_budget = budget
+
+
+def _acquire_bandwidth(ydl_opts, runner, task_id):
+    """
+    예산에서 작업의 몫을 받아 옵션에 반영
+    - subprocess: 시작 시 몫을 --limit-rate로 고정 (ratelimit)
+    - 상주 프로세스 풀: 받는 도중에도 몫이 바뀌므로 몫 객체를 넘김 (bandwidth_share)
+    """
+    budget = _bandwidth_budget
+    if budget is None or task_id is None or not budget.is_limited():
+        return
+    share = budget.acquire(task_id, adjustable=not isinstance(runner, YtDlpWrapper))
+    if share.adjustable:
+        ydl_opts['bandwidth_share'] = share
+    elif share.rate:
+        ydl_opts['ratelimit'] = share.rate
+
+
+def _release_bandwidth(task_id):
+    budget = _bandwidth_budget
+    if budget is not None and task_id is not None:
+        budget.release(task_id)
+
+
+def _get_runner(ytdlp_path, ffmpeg_path=None):
+    """
+    yt-dlp 실행기 반환
+    - 프로세스 풀이 등록되어 있고 사용 가능하면 풀 사용
+    - 그 외에는 기존 subprocess 방식(YtDlpWrapper)으로 폴백
+    """
+    pool = _process_pool
+    if pool is not None and pool.is_available():
+        return pool
+    return YtDlpWrapper(ytdlp_path, ffmpeg_path)
+
+
+def _get_info_runner(ytdlp_path):
+    """
+    메타데이터 조회용 실행기 반환
+    - 프로세스 내 추출기가 등록되어 있으면 우선 사용 (프로세스 기동 없음)
+    - 그 외에는 _get_runner와 동일
+    """
+    backend = _metadata_backend
+    if backend is not None and backend.is_available():
+        return backend
+    return _get_runner(ytdlp_path)
+
 # =====================================================================
 # YouTube 전용 URL 유틸리티 (YouTube URL일 때만 사용)
 # =====================================================================
@@ -96,48 +178,109 @@ def has_video_and_list(url):
 # 플레이리스트 처리
 # =====================================================================
 
-def extract_playlist_video_ids(url):
-    """플레이리스트 ID 추출 (경량화)"""
+def _playlist_extract_options():
+    """플레이리스트 항목 추출 옵션 (--flat-playlist로 빠르게 경량 항목만 추출)"""
+    extract_opts = {'extract_flat': True, 'fields': FLAT_ENTRY_FIELDS}
+    
+    # 쿠키 및 JS 런타임 옵션 추가 (연령 제한 영상 등 인증 필요 시)
+    advanced_opts = _build_advanced_options({})
+    if 'cookiefile' in advanced_opts:
+        extract_opts['cookiefile'] = advanced_opts['cookiefile']
+    if 'js_runtimes' in advanced_opts:
+        extract_opts['js_runtimes'] = advanced_opts['js_runtimes']
+    return extract_opts
+
+
+def _entry_video_id(entry):
+    """flat-playlist 항목에서 영상 ID 추출"""
+    if not entry:
+        return None
+    return entry.get('id') or (entry.get('url') or '').split('=')[-1] or None
+
+
+def _iter_flat_entries(runner, clean_url, extract_opts):
+    """실행기별 flat-playlist 항목 제너레이터 (subprocess 방식만 스트리밍 지원)"""
+    if isinstance(runner, YtDlpWrapper):
+        yield from runner.iter_extract_info(clean_url, options=extract_opts)
+        return
+    
+    info, success = runner.extract_info(clean_url, download=False, options=extract_opts)
+    if not success or not info:
+        return
+    # 플레이리스트가 아니면 (단일 영상) 항목 없음
+    yield from info.get('entries') or []
+
+
+def _flat_entry_metadata(entry, video_id):
+    """
+    flat-playlist 항목을 초기 메타데이터로 변환 (카드 즉시 표시용)
+    - 크기 추정/포맷 정보가 없으므로 is_flat으로 표시 (다운로드 전에 전체 조회 필요)
+    """
+    thumbnails = entry.get('thumbnails') or []
+    thumbnail = thumbnails[-1].get('url') if thumbnails else entry.get('thumbnail')
+    return {
+        'id': video_id,
+        'title': entry.get('title') or DEFAULT_VIDEO_TITLE,
+        'uploader': entry.get('uploader') or entry.get('channel') or DEFAULT_UPLOADER,
+        'duration': entry.get('duration') or 0,
+        'thumbnail': thumbnail,
+        'extractor': (entry.get('ie_key') or 'youtube').lower(),
+        'webpage_url': PLAYLIST_VIDEO_URL_TEMPLATE.format(video_id=video_id),
+        'is_flat': True
+    }
+
+
+def is_metadata_complete(metadata):
+    """다운로드에 필요한 메타데이터(크기 추정 포함)가 준비되었는지 확인"""
+    return bool(metadata) and bool(metadata.get('title')) and not metadata.get('is_flat')
+
+
+def iter_playlist_entries(url):
+    """
+    플레이리스트 항목을 스트리밍으로 추출 (대형 채널도 목록 완료를 기다리지 않음)
+    
+    Returns:
+        (항목 메타데이터 제너레이터 또는 None, 에러 메시지) 튜플
+        - 항목은 _flat_entry_metadata 형식 (id, title, uploader, duration, thumbnail 등)
+        - URL/환경 오류는 즉시 (None, 메시지)로 반환
+        - 제너레이터가 아무것도 내보내지 않으면 호출 측에서 조회 실패로 처리
+    """
     clean_url, is_playlist = _sanitize_url(url, prefer_playlist=True)
     
     if not is_playlist:
-        return [], False, STR.ERR_NOT_PLAYLIST
+        return None, STR.ERR_NOT_PLAYLIST
     
     ytdlp_path = get_ytdlp_path()
     if not ytdlp_path:
-        return [], False, STR.ERR_YTDLP_MISSING
-    
+        return None, STR.ERR_YTDLP_MISSING
+    
+    runner = _get_info_runner(ytdlp_path)
+    
+    def _generate():
+        entries = _iter_flat_entries(runner, clean_url, _playlist_extract_options())
+        try:
+            for entry in entries:
+                # 유효한 ID만 전달
+                video_id = _entry_video_id(entry)
+                if video_id:
+                    yield _flat_entry_metadata(entry, video_id)
+        finally:
+            entries.close()
+    
+    return _generate(), ""
+
+
+def extract_playlist_video_ids(url):
+    """플레이리스트 ID 추출 (경량화)"""
     try:
-        wrapper = YtDlpWrapper(ytdlp_path)
-        
-        # --flat-playlist 옵션으로 빠르게 ID만 추출
-        extract_opts = {'extract_flat': True}
-        
-        # 쿠키 및 JS 런타임 옵션 추가 (연령 제한 영상 등 인증 필요 시)
-        advanced_opts = _build_advanced_options({})
-        if 'cookiefile' in advanced_opts:
-            extract_opts['cookiefile'] = advanced_opts['cookiefile']
-        if 'js_runtimes' in advanced_opts:
-            extract_opts['js_runtimes'] = advanced_opts['js_runtimes']
+        entries, error_msg = iter_playlist_entries(url)
+        if entries is None:
+            return [], False, error_msg
         
-        info, success = wrapper.extract_info(clean_url, download=False, options=extract_opts)
-        
-        if not success or not info:
+        ids = [entry['id'] for entry in entries]
+        if not ids:
             return [], False, STR.ERR_CANNOT_FETCH_INFO
         
-        # 플레이리스트 처리
-        if '_type' in info and info['_type'] == 'playlist':
-            entries = info.get('entries', [])
-        elif 'entries' in info:
-            entries = info['entries']
-        else:
-            # 단일 영상
-            return [], False, STR.ERR_NOT_PLAYLIST
-        
-        # 유효한 ID만 필터링
-        ids = [e.get('id') or e.get('url', '').split('=')[-1] for e in entries if e]
-        ids = [vid for vid in ids if vid]
-        
         return ids, True, ""
             
     except Exception as e:
@@ -148,6 +291,168 @@ def extract_playlist_video_ids(url):
 # 메타데이터 조회 (범용)
 # =====================================================================
 
+# --- info JSON 재사용 (메타데이터 단계의 추출 결과를 다운로드에 전달) ---
+
+def _get_info_json_dir():
+    return os.path.join(get_user_data_path(), INFO_JSON_DIR_NAME)
+
+
+def _is_info_json_fresh(path):
+    """info JSON이 존재하고 스트림 URL이 아직 유효할 만큼 최근인지 확인"""
+    try:
+        return time.time() - os.path.getmtime(path) < INFO_JSON_MAX_AGE_SEC
+    except OSError:
+        return False
+
+
+def _discard_info_json(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _attach_info_json(meta, info):
+    """
+    단일 영상 메타데이터에 info JSON 경로 추가 (다운로드 시 재추출 생략용)
+    - 파일은 추출 단계에서 실행기가 info_json_dir에 기록 (INFO_JSON_OUTPUT_TEMPLATE)
+    """
+    if meta.get('is_playlist'):
+        return meta
+    source = info['entries'][0] if info.get('entries') else info
+    path = info_json_path(_get_info_json_dir(), source)
+    if path and _is_info_json_fresh(path):
+        meta['info_json_path'] = path
+    return meta
+
+
+def purge_stale_info_json():
+    """만료된 info JSON 파일 정리 (시작 시 호출)"""
+    info_dir = _get_info_json_dir()
+    if not os.path.isdir(info_dir):
+        return
+    removed = 0
+    try:
+        with os.scandir(info_dir) as it:
+            for entry in it:
+                if entry.is_file() and not _is_info_json_fresh(entry.path):
+                    _discard_info_json(entry.path)
+                    removed += 1
+    except OSError as e:
+        log.warning(f"info JSON 정리 실패: {e}")
+    if removed:
+        log.info(f"만료된 info JSON {removed}개 삭제")
+
+
+def _build_metadata_options(settings, is_playlist=False):
+    """메타데이터 추출 옵션 생성 (fetch_metadata / fetch_metadata_many 공용)"""
+    options = {
+        'extract_flat': 'in_playlist',
+        'noplaylist': not is_playlist
+    }
+    
+    if not is_playlist:
+        # 단일 영상은 사용하는 필드만 받음 (전체 formats/자막 목록 제외)
+        options['fields'] = METADATA_FIELDS
+    
+    # settings가 있으면 실제 다운로드 포맷 적용 (크기 추정을 위해)
+    if settings:
+        format_opts = _build_format_options(settings)
+        options.update(format_opts)
+        
+        # 다운로드 시 재사용할 전체 info JSON은 실행기가 파일로 기록
+        if not is_playlist:
+            info_dir = _get_info_json_dir()
+            try:
+                os.makedirs(info_dir, exist_ok=True)
+                options['info_json_dir'] = info_dir
+            except OSError as e:
+                log.warning(f"info JSON 폴더 생성 실패: {e}")
+    
+    # 쿠키 및 JS 런타임 옵션 추가 (연령 제한 영상 등 인증 필요 시)
+    advanced_opts = _build_advanced_options(settings or {})
+    if 'cookiefile' in advanced_opts:
+        options['cookiefile'] = advanced_opts['cookiefile']
+    if 'js_runtimes' in advanced_opts:
+        options['js_runtimes'] = advanced_opts['js_runtimes']
+    
+    return options
+
+
+def get_format_selector(settings):
+    """메타데이터 조회에 사용되는 포맷 선택자 (메타데이터 캐시 키)"""
+    if not settings:
+        return ''
+    return _build_format_options(settings).get('format', '')
+
+
+def _build_metadata_dict(info, clean_url, is_playlist=False):
+    """yt-dlp info dict를 UI/작업에서 사용하는 메타데이터 dict로 축약"""
+    # extractor 정보 추출 (yt-dlp가 자동으로 제공)
+    extractor = info.get('extractor', info.get('extractor_key', 'unknown'))
+    if extractor:
+        extractor = extractor.lower()
+    
+    # 플레이리스트 메타데이터
+    if is_playlist or info.get('_type') == 'playlist':
+        return {
+            'title': info.get('title', DEFAULT_PLAYLIST_TITLE),
+            'uploader': info.get('uploader', DEFAULT_UPLOADER),
+            'is_playlist': True,
+            'video_count': len(info.get('entries', [])),
+            'extractor': extractor
+        }
+
+    # 단일 영상 (플레이리스트 내부 항목일 경우 첫 번째 항목 사용)
+    if 'entries' in info:
+        info = info['entries'][0]
+        # entries의 첫 항목에서 extractor 다시 추출
+        extractor = info.get('extractor', info.get('extractor_key', extractor))
+        if extractor:
+            extractor = extractor.lower()
+
+    # 실제 다운로드 시 사용될 포맷의 크기 추정
+    video_size = 0
+    audio_size = 0
+    
+    # requested_formats에 실제 선택된 포맷 정보가 있음
+    if 'requested_formats' in info:
+        for f in info['requested_formats']:
+            size = f.get('filesize', 0) or f.get('filesize_approx', 0)
+            if f.get('vcodec') != 'none':
+                video_size = size
+            elif f.get('acodec') != 'none':
+                audio_size = size
+    else:
+        # 단일 파일인 경우 (requested_formats가 없는 경우)
+        size = info.get('filesize', 0) or info.get('filesize_approx', 0)
+        if info.get('vcodec') != 'none':
+            video_size = size
+        elif info.get('acodec') != 'none':
+            audio_size = size
+    
+    # requested_formats가 없거나 크기를 알 수 없는 경우 fallback
+    if video_size == 0 and audio_size == 0:
+        formats = info.get('formats', [])
+        if formats:
+            video_size = max([f.get('filesize', 0) or f.get('filesize_approx', 0) 
+                            for f in formats if f.get('vcodec') != 'none'], default=0)
+            audio_size = max([f.get('filesize', 0) or f.get('filesize_approx', 0) 
+                            for f in formats if f.get('acodec') != 'none'], default=0)
+
+    return {
+        'title': info.get('title', DEFAULT_VIDEO_TITLE),
+        'uploader': info.get('uploader', info.get('channel', DEFAULT_UPLOADER)),
+        'duration': info.get('duration', 0),
+        'thumbnail': info.get('thumbnail'),
+        'id': info.get('id'),
+        'extractor': extractor,
+        'webpage_url': info.get('webpage_url', clean_url),
+        'video_size': video_size,
+        'audio_size': audio_size
+    }
+
+
 def fetch_metadata(url, settings=None):
     """
     영상 메타데이터 조회 (범용)
@@ -167,99 +472,74 @@ def fetch_metadata(url, settings=None):
         return {}, False
     
     try:
-        wrapper = YtDlpWrapper(ytdlp_path)
-        
-        # 메타데이터 추출 옵션
-        options = {
-            'extract_flat': 'in_playlist',
-            'noplaylist': not is_playlist
-        }
-        
-        # settings가 있으면 실제 다운로드 포맷 적용 (크기 추정을 위해)
-        if settings:
-            format_opts = _build_format_options(settings)
-            options.update(format_opts)
-        
-        # 쿠키 및 JS 런타임 옵션 추가 (연령 제한 영상 등 인증 필요 시)
-        advanced_opts = _build_advanced_options(settings or {})
-        if 'cookiefile' in advanced_opts:
-            options['cookiefile'] = advanced_opts['cookiefile']
-        if 'js_runtimes' in advanced_opts:
-            options['js_runtimes'] = advanced_opts['js_runtimes']
+        wrapper = _get_info_runner(ytdlp_path)
+        options = _build_metadata_options(settings, is_playlist)
         
         info, success = wrapper.extract_info(clean_url, download=False, options=options)
         
         if not success or not info:
             return {}, False
         
-        # extractor 정보 추출 (yt-dlp가 자동으로 제공)
-        extractor = info.get('extractor', info.get('extractor_key', 'unknown'))
-        if extractor:
-            extractor = extractor.lower()
-        
-        # 플레이리스트 메타데이터
-        if is_playlist or info.get('_type') == 'playlist':
-            return {
-                'title': info.get('title', DEFAULT_PLAYLIST_TITLE),
-                'uploader': info.get('uploader', DEFAULT_UPLOADER),
-                'is_playlist': True,
-                'video_count': len(info.get('entries', [])),
-                'extractor': extractor
-            }, True
-
-        # 단일 영상 (플레이리스트 내부 항목일 경우 첫 번째 항목 사용)
-        if 'entries' in info:
-            info = info['entries'][0]
-            # entries의 첫 항목에서 extractor 다시 추출
-            extractor = info.get('extractor', info.get('extractor_key', extractor))
-            if extractor:
-                extractor = extractor.lower()
-
-        # 실제 다운로드 시 사용될 포맷의 크기 추정
-        video_size = 0
-        audio_size = 0
-        
-        # requested_formats에 실제 선택된 포맷 정보가 있음
-        if 'requested_formats' in info:
-            for f in info['requested_formats']:
-                size = f.get('filesize', 0) or f.get('filesize_approx', 0)
-                if f.get('vcodec') != 'none':
-                    video_size = size
-                elif f.get('acodec') != 'none':
-                    audio_size = size
-        else:
-            # 단일 파일인 경우 (requested_formats가 없는 경우)
-            size = info.get('filesize', 0) or info.get('filesize_approx', 0)
-            if info.get('vcodec') != 'none':
-                video_size = size
-            elif info.get('acodec') != 'none':
-                audio_size = size
-        
-        # requested_formats가 없거나 크기를 알 수 없는 경우 fallback
-        if video_size == 0 and audio_size == 0:
-            formats = info.get('formats', [])
-            if formats:
-                video_size = max([f.get('filesize', 0) or f.get('filesize_approx', 0) 
-                                for f in formats if f.get('vcodec') != 'none'], default=0)
-                audio_size = max([f.get('filesize', 0) or f.get('filesize_approx', 0) 
-                                for f in formats if f.get('acodec') != 'none'], default=0)
-
-        return {
-            'title': info.get('title', DEFAULT_VIDEO_TITLE),
-            'uploader': info.get('uploader', info.get('channel', DEFAULT_UPLOADER)),
-            'duration': info.get('duration', 0),
-            'thumbnail': info.get('thumbnail'),
-            'id': info.get('id'),
-            'extractor': extractor,
-            'webpage_url': info.get('webpage_url', clean_url),
-            'video_size': video_size,
-            'audio_size': audio_size
-        }, True
+        meta = _build_metadata_dict(info, clean_url, is_playlist)
+        return _attach_info_json(meta, info), True
         
     except Exception as e:
         log.error(f"Metadata Error: {e}")
         return {}, False
 
+
+def fetch_metadata_many(urls, settings=None):
+    """
+    여러 영상의 메타데이터를 한 번에 조회 (제너레이터)
+    - subprocess 방식: yt-dlp 1회 실행으로 배치 전체를 처리 (프로세스 기동 비용을 배치당 1회로)
+    - 프로세스 풀/프로세스 내 추출기: 이미 기동 비용이 없으므로 URL별로 조회
+    - 플레이리스트 URL은 배치에서 제외하고 fetch_metadata로 개별 조회
+    
+    Args:
+        urls: 영상 URL 목록
+        settings: 다운로드 설정 (크기 추정용 포맷 선택)
+    
+    Yields:
+        (요청한 URL, 메타데이터 dict, 성공 여부) - 결과가 준비되는 순서대로
+    """
+    ytdlp_path = get_ytdlp_path()
+    if not ytdlp_path:
+        for url in urls:
+            yield url, {}, False
+        return
+    
+    # 요청 URL → 정리된 URL (결과 매핑용)
+    batch = {}
+    for url in urls:
+        clean_url, is_playlist = _sanitize_url(url) if is_youtube_url(url) else (url, False)
+        if not clean_url:
+            yield url, {}, False
+        elif is_playlist:
+            meta, success = fetch_metadata(url, settings)
+            yield url, meta, success
+        else:
+            batch.setdefault(clean_url, []).append(url)
+    
+    if not batch:
+        return
+    
+    runner = _get_info_runner(ytdlp_path)
+    if not isinstance(runner, YtDlpWrapper):
+        for clean_url, originals in batch.items():
+            meta, success = fetch_metadata(clean_url, settings)
+            for url in originals:
+                yield url, meta, success
+        return
+    
+    options = _build_metadata_options(settings)
+    try:
+        for clean_url, info in runner.extract_info_many(list(batch), options=options):
+            meta = _attach_info_json(_build_metadata_dict(info, clean_url), info) if info else {}
+            for url in batch.get(clean_url, ()):
+                yield url, meta, bool(info)
+    except Exception as e:
+        log.error(f"Batch Metadata Error: {e}")
+
 # =====================================================================
 # 다운로드 옵션 빌더
 # =====================================================================
@@ -453,14 +733,87 @@ def _build_all_options(settings, save_path, ffmpeg_path, is_playlist, progress_h
 # 다운로드 실행 (범용)
 # =====================================================================
 
-def download_video(url, settings, progress_hook):
+def download_video(url, settings, progress_hook, info_json_path=None, process_control=None, task_id=None,
+                   resume_state=None):
     """
     영상 다운로드 핵심 로직 (범용)
-    - YtDlpWrapper를 사용하여 subprocess로 실행
+    - 상주 프로세스 풀이 있으면 풀에서, 없으면 YtDlpWrapper로 subprocess 실행
     - YouTube 및 기타 모든 yt-dlp 지원 사이트 대응
+    - info_json_path가 있고 만료 전이면 --load-info-json으로 재추출 없이 다운로드,
+      실패하면 (스트림 URL 만료 등) URL로 다시 시도
+    - process_control(ProcessSuspender)을 주면 subprocess 실행 시 일시 중지/재개에 사용
+    - task_id를 주면 실행한 프로세스를 작업 단위로 취소할 수 있도록 감독자에 등록
+    - resume_state(PartialDownloadRegistry.get 결과)를 주면 이전 포맷/파일 이름을 고정하여 이어받기
+    """
+    plan, error = _prepare_download(url, settings, progress_hook, process_control, task_id, resume_state)
+    if error:
+        return False, error
+    clean_url, is_playlist, ydl_opts, wrapper = plan
+
+    # 다운로드 실행 (프로세스 풀 또는 YtDlpWrapper)
+    try:
+        if _can_load_info_json(info_json_path, is_playlist):
+            info_opts = dict(ydl_opts)
+            info_opts['load_info_json'] = info_json_path
+            success, message = wrapper.download(clean_url, info_opts, progress_hook)
+            if _info_json_attempt_done(info_json_path, success, message):
+                return _download_result(success, message)
+        
+        success, message = wrapper.download(clean_url, ydl_opts, progress_hook)
+        return _download_result(success, message)
+            
+    except Exception as e:
+        return _download_exception_result(e)
+    finally:
+        _release_bandwidth(task_id)
+
+
+async def download_video_async(url, settings, progress_hook, info_json_path=None, process_control=None,
+                               task_id=None, resume_state=None):
+    """
+    download_video의 asyncio 버전 (AsyncDownloadEngine 전용, 인자/반환값 동일)
+    - subprocess 실행기는 이벤트 루프에서 직접 실행 (작업당 스레드 없음)
+    - 비동기 인터페이스가 없는 실행기(상주 프로세스 풀)는 기본 스레드 풀에서 실행
+    """
+    plan, error = _prepare_download(url, settings, progress_hook, process_control, task_id, resume_state)
+    if error:
+        return False, error
+    clean_url, is_playlist, ydl_opts, wrapper = plan
+    
+    if hasattr(wrapper, 'download_async'):
+        run = wrapper.download_async
+    else:
+        loop = asyncio.get_running_loop()
+        
+        async def run(run_url, options, hook):
+            return await loop.run_in_executor(None, wrapper.download, run_url, options, hook)
+    
+    try:
+        if _can_load_info_json(info_json_path, is_playlist):
+            info_opts = dict(ydl_opts)
+            info_opts['load_info_json'] = info_json_path
+            success, message = await run(clean_url, info_opts, progress_hook)
+            if _info_json_attempt_done(info_json_path, success, message):
+                return _download_result(success, message)
+        
+        success, message = await run(clean_url, ydl_opts, progress_hook)
+        return _download_result(success, message)
+    
+    except Exception as e:
+        return _download_exception_result(e)
+    finally:
+        _release_bandwidth(task_id)
+
+
+def _prepare_download(url, settings, progress_hook, process_control=None, task_id=None, resume_state=None):
+    """
+    download_video/download_video_async 공통 준비 (URL 정리, 옵션 조립, 실행기 선택)
+    
+    Returns:
+        ((clean_url, is_playlist, ydl_opts, 실행기), None) 또는 실패 시 (None, 오류 메시지)
     """
     if not url: 
-        return False, ERROR_INVALID_URL
+        return None, ERROR_INVALID_URL
 
     # YouTube URL인 경우에만 sanitize 수행
     if is_youtube_url(url):
@@ -472,7 +825,7 @@ def download_video(url, settings, progress_hook):
     # 경로 확인
     ytdlp_path = get_ytdlp_path()
     if not ytdlp_path:
-        return False, STR.ERR_YTDLP_RESTART
+        return None, STR.ERR_YTDLP_RESTART
     
     # 저장 경로 설정
     save_path = settings.get('download_folder') or settings.get('save_path') or os.getcwd()
@@ -480,25 +833,136 @@ def download_video(url, settings, progress_hook):
     
     # 모든 옵션 조립
     ydl_opts = _build_all_options(settings, save_path, ffmpeg_path, is_playlist, progress_hook)
+    if process_control is not None:
+        ydl_opts['process_control'] = process_control
+    if task_id is not None:
+        ydl_opts['task_ids'] = (task_id,)
+    if resume_state:
+        _apply_resume_state(ydl_opts, resume_state)
+    
+    runner = _get_runner(ytdlp_path, ffmpeg_path)
+    _acquire_bandwidth(ydl_opts, runner, task_id)
+    return (clean_url, is_playlist, ydl_opts, runner), None
 
-    # YtDlpWrapper로 다운로드 실행
-    try:
-        wrapper = YtDlpWrapper(ytdlp_path, ffmpeg_path)
-        success, message = wrapper.download(clean_url, ydl_opts, progress_hook)
+
+def _can_load_info_json(info_json_path, is_playlist):
+    """저장해 둔 info JSON으로 재추출 없이 받을 수 있는지 확인"""
+    return bool(info_json_path) and not is_playlist and _is_info_json_fresh(info_json_path)
+
+
+def _info_json_attempt_done(info_json_path, success, message):
+    """
+    info JSON 재사용 시도 결과 처리
+    - 추출/스트림 URL 만료 오류(INFO_JSON_RETRY_MARKERS)일 때만 URL로 다시 시도
+    - 일시정지, 취소/앱 종료로 프로세스가 종료된 경우, 그 외 오류는 결과를 그대로 반환
+      (취소된 작업을 URL로 다시 실행하지 않도록)
+    
+    Returns:
+        결과를 그대로 반환하면 True, URL로 다시 시도해야 하면 False
+    """
+    if success:
+        _discard_info_json(info_json_path)
+        return True
+    if MSG_PAUSED_BY_USER in message or supervisor.closing:
+        return True
+    lowered = (message or '').lower()
+    if not any(marker in lowered for marker in INFO_JSON_RETRY_MARKERS):
+        return True
+    log.warning(f"info JSON 재사용 다운로드 실패, URL로 다시 시도: {message}")
+    _discard_info_json(info_json_path)
+    return False
+
+
+def _download_exception_result(e):
+    """다운로드 중 예외를 download_video 반환값으로 변환"""
+    error_msg = str(e)
+    # 사용자가 일시정지 버튼을 누른 경우
+    if MSG_PAUSED_BY_USER in error_msg:
+        return False, MSG_PAUSED_BY_USER
         
-        if success:
-            return True, MSG_DOWNLOAD_COMPLETE
-        else:
-            # 일시정지 체크
-            if MSG_PAUSED_BY_USER in message:
-                return False, MSG_PAUSED_BY_USER
-            return False, message
-            
+    log.error(f"Download Error: {error_msg}")
+    return False, error_msg
+
+
+def _apply_resume_state(ydl_opts, resume_state):
+    """
+    이전 실행에서 기록한 포맷 ID/출력 경로를 고정 (남은 .part 파일 이름과 정확히 일치시킴)
+    - 포맷은 기록한 ID를 우선하고, 더 이상 제공되지 않으면 원래 포맷 선택으로 폴백
+    """
+    format_id = resume_state.get('format_id')
+    if format_id:
+        fallback = ydl_opts.get('format')
+        ydl_opts['format'] = f"{format_id}/{fallback}" if fallback else format_id
+    
+    stem = resume_state.get('output_stem')
+    if stem:
+        ydl_opts['outtmpl'] = stem.replace('%', '%%') + '.%(ext)s'
+    log.info(f"이어받기 기록 사용: format={ydl_opts.get('format')}, output={ydl_opts.get('outtmpl')}")
+
+
+def _download_result(success, message):
+    """실행기 결과를 download_video 반환값으로 변환"""
+    if success:
+        return True, MSG_DOWNLOAD_COMPLETE
+    # 일시정지 체크
+    if MSG_PAUSED_BY_USER in message:
+        return False, MSG_PAUSED_BY_USER
+    return False, message
+
+
+# yt-dlp가 --ignore-errors로 건너뛴 항목의 오류 줄 ("ERROR: [youtube] VIDEO_ID: 사유")
+_BATCH_ERROR_PATTERN = re.compile(r'ERROR: \[[^\]]+\] ([^:\s]+): ([^\r\n]+)')
+
+
+def supports_batch_download():
+    """
+    묶음 다운로드 가능 여부
+    - subprocess 실행기(YtDlpWrapper)만 지원 (프로세스 기동 비용을 줄이는 것이 목적)
+    - 상주 프로세스 풀은 기동 비용이 없으므로 작업별로 실행
+    """
+    ytdlp_path = get_ytdlp_path()
+    if not ytdlp_path:
+        return False
+    return isinstance(_get_runner(ytdlp_path), YtDlpWrapper)
+
+
+def download_batch(urls, settings, progress_hook, task_ids=()):
+    """
+    같은 설정의 여러 영상을 yt-dlp 1회 실행으로 다운로드
+    - 진행률/최종 경로 이벤트에는 'video_id'가 포함되므로 호출 측에서 작업별로 분배
+    - 플레이리스트 URL은 묶지 않으므로 모두 단일 영상으로 처리
+    
+    Returns:
+        (모두 성공 여부, 메시지, {영상 ID: 실패 사유})
+    """
+    if not urls:
+        return False, ERROR_INVALID_URL, {}
+    
+    ytdlp_path = get_ytdlp_path()
+    if not ytdlp_path:
+        return False, STR.ERR_YTDLP_RESTART, {}
+    
+    clean_urls = [_sanitize_url(url)[0] if is_youtube_url(url) else url for url in urls]
+    save_path = settings.get('download_folder') or settings.get('save_path') or os.getcwd()
+    ffmpeg_path = get_ffmpeg_path()
+    ydl_opts = _build_all_options(settings, save_path, ffmpeg_path, False, progress_hook)
+    ydl_opts['task_ids'] = tuple(task_ids)
+    wrapper = YtDlpWrapper(ytdlp_path, ffmpeg_path)
+    # 묶음은 영상을 차례로 받으므로 첫 작업 ID로 몫 하나만 사용
+    batch_id = task_ids[0] if task_ids else None
+    _acquire_bandwidth(ydl_opts, wrapper, batch_id)
+    
+    try:
+        success, message = wrapper.download_many(clean_urls, ydl_opts, progress_hook)
     except Exception as e:
         error_msg = str(e)
-        # 사용자가 일시정지 버튼을 누른 경우
         if MSG_PAUSED_BY_USER in error_msg:
-            return False, MSG_PAUSED_BY_USER
-            
-        log.error(f"Download Error: {error_msg}")
-        return False, error_msg
+            return False, MSG_PAUSED_BY_USER, {}
+        log.error(f"Batch Download Error: {error_msg}")
+        return False, error_msg, {}
+    finally:
+        _release_bandwidth(batch_id)
+    
+    errors = {video_id: reason.strip() for video_id, reason in _BATCH_ERROR_PATTERN.findall(message or '')}
+    success, message = _download_result(success, message)
+    return success, message, errors
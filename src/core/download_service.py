@@ -0,0 +1,453 @@
+"""
+다운로드 작업 서비스 (Qt 없음)
+- DownloadScheduler 위에 작업 목록/상태/중복 검사/저장을 얹은 계층 (GUI의 메인 윈도우가 하던 역할)
+- 로컬 데몬(API 서버)이 사용하며, 모든 공개 메서드는 어느 스레드에서나 호출 가능
+- 작업 상태 변화는 task_event로 dict 하나씩 전달 (스트리밍 진행률 피드용)
+"""
+import itertools
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from core import download_handler
+from core.events import Signal
+from core.scheduler import DownloadScheduler
+from core.url_processor import UrlProcessor
+from data.managers import HistoryManager, TaskManager
+from data.models import DownloadTask
+from utils.logger import log
+from utils.utils import validate_url, is_youtube_url
+from constants import (
+    TaskStatus, KEY_DOWNLOAD_FOLDER, KEY_FORMAT, DEFAULT_FORMAT, STATUS_DOWNLOADING,
+    TASK_PRIORITY_NORMAL, TASK_PRIORITY_RESUME, API_PRIORITY_RANGE,
+    API_PROGRESS_INTERVAL_SEC, DAEMON_TASKS_JSON_FILENAME, DAEMON_SAVE_DEBOUNCE_SEC,
+    PLAYLIST_VIDEO_URL_TEMPLATE
+)
+from locales.strings import STR
+
+
+class ServiceError(Exception):
+    """잘못된 요청 (API에서 클라이언트 오류로 응답)"""
+
+
+def progress_summary(d: Dict) -> Dict[str, Any]:
+    """워커 진행률 dict에서 외부로 내보낼 필드만 추림 (CLI/API 공용)"""
+    downloaded = d.get('downloaded_bytes') or 0
+    total = d.get('total_bytes') or d.get('total_bytes_estimate') or 0
+    return {
+        'status': d.get('status'),
+        'downloaded_bytes': downloaded,
+        'total_bytes': total,
+        'percent': round(downloaded * 100 / total, 1) if total else None,
+        'speed': d.get('speed'),
+        'eta': d.get('eta'),
+    }
+
+
+class DownloadService:
+    """
+    작업 목록 + 스케줄러
+    - 작업 ID 발급, 중복 검사(history.db + 목록 안의 같은 영상), 일시정지/재개/취소/우선순위 변경
+    - 작업 목록은 TaskManager로 데몬 전용 파일에 모아서 저장 (대량 등록 시 매번 쓰지 않음)
+    """
+    task_event = Signal(dict)
+
+    def __init__(self, settings: Dict, scheduler: Optional[DownloadScheduler] = None,
+                 task_manager: Optional[TaskManager] = None, history: Optional[HistoryManager] = None):
+        self.settings = settings
+        self.scheduler = scheduler or DownloadScheduler()
+        self.task_manager = task_manager or TaskManager(DAEMON_TASKS_JSON_FILENAME)
+        self.history = history or HistoryManager()
+        self.tasks: Dict[int, DownloadTask] = {}
+        self.priorities: Dict[int, int] = {}
+        self.progress: Dict[int, Dict] = {}
+        self.errors: Dict[int, str] = {}
+        self._next_id = 1
+        # 목록 안의 활성 작업 (extractor, video_id, format) → task_id (같은 영상 중복 등록 방지)
+        self._active_keys: Dict[tuple, int] = {}
+        self._batch_ids = itertools.count(1)  # enqueue_many 묶음 번호 (fair 정책의 묶음)
+        self._lock = threading.RLock()
+        self._last_progress: Dict[int, float] = {}
+        self._save_timer: Optional[threading.Timer] = None
+
+        self.scheduler.task_started.connect(self._on_task_started)
+        self.scheduler.progress_updated.connect(self._on_progress)
+        self.scheduler.download_finished.connect(self._on_finished)
+        self.scheduler.metadata_fetched.connect(self._on_metadata)
+
+    # ============================================================
+    # 시작/종료
+    # ============================================================
+
+    def start(self, jobs: int) -> None:
+        """저장된 작업 목록 복원 후 스케줄러 시작 (복원된 미완료 작업은 일시정지 상태)"""
+        for data in self.task_manager.load_tasks():
+            task = DownloadTask.from_dict(data)
+            if task.status in (TaskStatus.WAITING, TaskStatus.DOWNLOADING):
+                task.status = TaskStatus.PAUSED
+            self.tasks[task.id] = task
+            self.priorities[task.id] = TASK_PRIORITY_NORMAL
+            if task.is_active() and task.video_id:
+                self._active_keys[self._task_key(task)] = task.id
+            self._next_id = max(self._next_id, task.id + 1)
+        if self.tasks:
+            self.scheduler.partial_registry.scan(list(self.tasks.values()), self.settings.get(KEY_DOWNLOAD_FOLDER))
+            log.info(f"데몬 작업 목록 복원: {len(self.tasks)}개")
+
+        self.scheduler.configure(self.settings)
+        self.scheduler.initialize(jobs)
+
+    def shutdown(self) -> None:
+        """스케줄러 종료 및 작업 목록 저장"""
+        with self._lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+                self._save_timer = None
+        self.scheduler.shutdown()
+        self.save()
+
+    def save(self) -> None:
+        with self._lock:
+            self._save_timer = None
+            tasks = sorted(self.tasks.values(), key=lambda t: t.id)
+            self.task_manager.save_tasks(tasks)
+
+    def _schedule_save(self) -> None:
+        """작업 목록 저장 예약 (짧은 시간 안의 변경은 한 번에 저장)"""
+        with self._lock:
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(DAEMON_SAVE_DEBOUNCE_SEC, self.save)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    # ============================================================
+    # 작업 등록
+    # ============================================================
+
+    def enqueue(self, url: str, priority: Optional[int] = None, playlist: Optional[bool] = None,
+                settings: Optional[Dict] = None, force: bool = False,
+                group: Optional[str] = None) -> Dict[str, Any]:
+        """
+        URL 하나 등록 (단일 영상 또는 플레이리스트)
+
+        Args:
+            url: 영상/플레이리스트 URL
+            priority: 작업 우선순위 (작을수록 먼저, 기본 TASK_PRIORITY_NORMAL)
+            playlist: v와 list가 함께 있는 YouTube URL에서 플레이리스트로 받을지 (None이면 단일 영상)
+            settings: 이 작업에만 적용할 설정 (데몬 설정 위에 덮어씀)
+            force: 다운로드 기록/목록에 같은 영상이 있어도 등록
+            group: 작업 묶음 이름 (fair 정책에서 묶음끼리 번갈아 받음, 플레이리스트는 기본으로 플레이리스트 URL)
+
+        Returns:
+            {'task_id': ...} 또는 {'skipped': 기존 task_id 또는 None} 또는 {'playlist': 정리된 URL}
+            (플레이리스트 항목은 분석되는 대로 'added' 이벤트로 전달)
+        """
+        if not url or not validate_url(url):
+            raise ServiceError(f"invalid url: {url!r}")
+        priority = self._check_priority(priority)
+        task_settings = dict(self.settings)
+        if settings:
+            task_settings.update(settings)
+
+        clean_url, is_playlist = download_handler._sanitize_url(url, prefer_playlist=bool(playlist))
+        if is_playlist:
+            threading.Thread(
+                target=self._expand_playlist,
+                args=(clean_url, priority, task_settings, force, group or f"playlist:{clean_url}"), daemon=True
+            ).start()
+            return {'playlist': clean_url}
+
+        video_id = UrlProcessor.extract_video_id(clean_url)
+        extractor = 'youtube' if is_youtube_url(clean_url) else 'unknown'
+        return self._register(clean_url, video_id, extractor, priority, task_settings, force, group=group)
+
+    def enqueue_many(self, items: List[Any], force: bool = False) -> List[Dict[str, Any]]:
+        """
+        여러 URL을 한 번에 등록 (항목은 URL 문자열 또는 enqueue 인자 dict)
+        - 잘못된 항목은 {'error': ...}로 표시하고 나머지는 계속 등록
+        - group을 지정하지 않은 항목은 한 묶음으로 등록 (fair 정책에서 다른 묶음과 번갈아 받음)
+        """
+        results = []
+        batch_group = f"batch:{next(self._batch_ids)}"
+        for item in items:
+            params = {'url': item} if isinstance(item, str) else dict(item or {})
+            params.setdefault('force', force)
+            params.setdefault('group', batch_group)
+            try:
+                results.append(self.enqueue(**params))
+            except (ServiceError, TypeError) as e:
+                results.append({'error': str(e)})
+        return results
+
+    def _expand_playlist(self, url: str, priority: int, settings: Dict, force: bool, group: str) -> None:
+        """플레이리스트 항목을 스트리밍으로 받아 등록 (별도 스레드)"""
+        added = skipped = 0
+        error = ""
+        try:
+            entries, error = download_handler.iter_playlist_entries(url)
+            if entries is not None:
+                prefetch = []
+                try:
+                    for entry in entries:
+                        video_url = PLAYLIST_VIDEO_URL_TEMPLATE.format(video_id=entry['id'])
+                        result = self._register(video_url, entry['id'], 'youtube', priority, settings,
+                                                force, metadata=entry, group=group)
+                        if 'task_id' in result:
+                            added += 1
+                            prefetch.append((result['task_id'], video_url))
+                        else:
+                            skipped += 1
+                finally:
+                    entries.close()
+                # 크기 추정용 전체 메타데이터는 배치로 미리 조회
+                if prefetch:
+                    self.scheduler.prefetch_metadata(prefetch, settings)
+                if added == 0 and skipped == 0:
+                    error = STR.ERR_CANNOT_FETCH_INFO
+        except Exception as e:
+            log.error(f"Playlist Error: {e}")
+            error = str(e)
+        self._emit('playlist_done', url=url, added=added, skipped=skipped, error=error or None)
+
+    def _register(self, url: str, video_id: Optional[str], extractor: str, priority: int,
+                  settings: Dict, force: bool, metadata: Optional[Dict] = None,
+                  group: Optional[str] = None) -> Dict[str, Any]:
+        """중복 검사 후 작업 생성 및 스케줄러에 추가"""
+        fmt = settings.get(KEY_FORMAT, DEFAULT_FORMAT)
+        with self._lock:
+            if video_id and not force:
+                existing = self._active_keys.get((extractor, video_id, fmt))
+                if existing is not None or self.history.is_downloaded(extractor, video_id, fmt):
+                    self._emit('skipped', url=url, video_id=video_id, existing=existing)
+                    return {'skipped': existing}
+
+            task_id = self._next_id
+            self._next_id += 1
+            task = DownloadTask(id=task_id, url=url, video_id=video_id, extractor=extractor, settings=settings)
+            if metadata:
+                task.meta = dict(metadata)
+            self.tasks[task_id] = task
+            self.priorities[task_id] = priority
+            if video_id:
+                self._active_keys[(extractor, video_id, fmt)] = task_id
+
+        self.scheduler.add_task(priority, task_id, url, settings, dict(metadata) if metadata else None,
+                                group=group)
+        self._emit('added', task_id=task_id, url=url, video_id=video_id, priority=priority)
+        self._schedule_save()
+        return {'task_id': task_id}
+
+    # ============================================================
+    # 작업 제어
+    # ============================================================
+
+    def pause(self, task_id: Optional[int] = None) -> Dict[str, Any]:
+        """작업 일시정지 (task_id가 없으면 전체)"""
+        if task_id is None:
+            self.scheduler.pause_all()
+            self._emit('paused', task_id=None)
+            return {'paused': 'all'}
+        task = self._get(task_id)
+        if task.status not in (TaskStatus.WAITING, TaskStatus.DOWNLOADING):
+            return {'paused': False}
+        self.scheduler.pause_task(task_id)
+        self._set_status(task, TaskStatus.PAUSED)
+        return {'paused': True}
+
+    def resume(self, task_id: Optional[int] = None) -> Dict[str, Any]:
+        """작업 재개 (task_id가 없으면 전체 일시정지 해제)"""
+        if task_id is None:
+            self.scheduler.resume_all()
+            self._emit('resumed', task_id=None)
+            return {'resumed': 'all'}
+        task = self._get(task_id)
+        if task.status != TaskStatus.PAUSED:
+            return {'resumed': False}
+        # 프로세스가 멈춰 있던 작업은 그 자리에서 재개, 아니면 이어받기로 다시 큐에 넣음
+        if self.scheduler.resume_task(task_id):
+            self._set_status(task, TaskStatus.DOWNLOADING)
+            return {'resumed': True}
+        settings = dict(task.settings or self.settings)
+        settings['is_resume'] = True
+        priority = min(self.priorities.get(task_id, TASK_PRIORITY_NORMAL), TASK_PRIORITY_RESUME)
+        self._set_status(task, TaskStatus.WAITING)
+        self.scheduler.add_task(priority, task_id, task.url, settings, dict(task.meta) if task.meta else None)
+        return {'resumed': True}
+
+    def cancel(self, task_id: int) -> Dict[str, Any]:
+        """작업 취소 (받는 중이면 프로세스 종료, 대기 중이면 큐에서 건너뜀)"""
+        task = self._get(task_id)
+        if not task.is_active():
+            return {'cancelled': False}
+        was_waiting = task.status != TaskStatus.DOWNLOADING
+        self.scheduler.cancel_task(task_id)
+        # 대기/일시정지 작업은 큐에서 빠지기만 하고 완료 통지가 없으므로 여기서 바로 실패 처리
+        if was_waiting:
+            self._fail(task, STR.MSG_DL_CANCELLED)
+        return {'cancelled': True}
+
+    def set_priority(self, task_id: int, priority: int) -> Dict[str, Any]:
+        """대기 중인 작업의 우선순위 변경 (이미 받는 중이면 다음 재개부터 적용)"""
+        task = self._get(task_id)
+        priority = self._check_priority(priority)
+        with self._lock:
+            self.priorities[task_id] = priority
+        requeued = task.status == TaskStatus.WAITING and self.scheduler.set_task_priority(task_id, priority)
+        self._emit('priority', task_id=task_id, priority=priority)
+        return {'task_id': task_id, 'priority': priority, 'requeued': bool(requeued)}
+
+    def move(self, task_id: int, position: str) -> Dict[str, Any]:
+        """대기 중인 작업을 대기열 맨 앞('top')이나 맨 뒤('bottom')로 이동"""
+        task = self._get(task_id)
+        if position not in ('top', 'bottom'):
+            raise ServiceError("position must be 'top' or 'bottom'")
+        priority = None
+        if task.status == TaskStatus.WAITING:
+            priority = self.scheduler.move_task(task_id, position == 'top')
+        if priority is None:
+            return {'task_id': task_id, 'moved': False}
+        with self._lock:
+            self.priorities[task_id] = priority
+        self._emit('priority', task_id=task_id, priority=priority)
+        return {'task_id': task_id, 'moved': True, 'priority': priority}
+
+    # ============================================================
+    # 조회
+    # ============================================================
+
+    def status(self, task_id: Optional[int] = None, state: Optional[str] = None) -> Any:
+        """작업 하나 또는 전체(상태로 거를 수 있음)의 현재 상태"""
+        if task_id is not None:
+            return self._describe(self._get(task_id))
+        with self._lock:
+            tasks = sorted(self.tasks.values(), key=lambda t: t.id)
+        if state:
+            tasks = [t for t in tasks if t.status.value == state]
+        return {
+            'paused': self.scheduler.is_paused(),
+            'workers': self.scheduler.get_worker_count(),
+            'active': self.scheduler.download_queue.active_counts(),
+            'bandwidth': self.scheduler.bandwidth.snapshot(),
+            'autotune': self.scheduler.autotuner.snapshot() if self.scheduler.autotuner else None,
+            'policy': self.scheduler.scheduling_policy.name,
+            'counts': self._counts(),
+            'tasks': [self._describe(t) for t in tasks],
+        }
+
+    def _describe(self, task: DownloadTask) -> Dict[str, Any]:
+        return {
+            'task_id': task.id,
+            'url': task.url,
+            'status': task.status.value,
+            'priority': self.priorities.get(task.id, TASK_PRIORITY_NORMAL),
+            'video_id': task.video_id,
+            'extractor': task.extractor,
+            'title': task.meta.get('title'),
+            'progress': self.progress.get(task.id),
+            'output_path': task.output_path or None,
+            'error': self.errors.get(task.id),
+            'agent': task.meta.get('agent'),
+        }
+
+    def _counts(self) -> Dict[str, int]:
+        counts = {status.value: 0 for status in TaskStatus}
+        with self._lock:
+            for task in self.tasks.values():
+                counts[task.status.value] += 1
+        return counts
+
+    # ============================================================
+    # 스케줄러 이벤트 (워커 스레드에서 호출)
+    # ============================================================
+
+    def _on_task_started(self, task_id: int) -> None:
+        task = self.tasks.get(task_id)
+        if task:
+            self._set_status(task, TaskStatus.DOWNLOADING)
+
+    def _on_progress(self, d: Dict, task_id: int) -> None:
+        summary = progress_summary(d)
+        self.progress[task_id] = summary
+        # 다운로드 중 진행률만 간격 제한 (상태 변화는 바로 전달)
+        now = time.monotonic()
+        if summary['status'] == STATUS_DOWNLOADING and \
+                now - self._last_progress.get(task_id, 0.0) < API_PROGRESS_INTERVAL_SEC:
+            return
+        self._last_progress[task_id] = now
+        self._emit('progress', task_id=task_id, **summary)
+
+    def _on_metadata(self, task_id: int, metadata: Dict) -> None:
+        task = self.tasks.get(task_id)
+        if not task or not metadata:
+            return
+        task.meta.update(metadata)
+        if metadata.get('id') and not task.video_id:
+            task.video_id = metadata.get('id')
+            task.extractor = metadata.get('extractor') or task.extractor
+        self._emit('metadata', task_id=task_id, title=metadata.get('title'), video_id=task.video_id)
+
+    def _on_finished(self, success: bool, message: str, task_id: int, final_path: str) -> None:
+        task = self.tasks.get(task_id)
+        # 대기 중 취소로 이미 실패 처리된 작업의 늦은 통지는 무시
+        if not task or task.status == TaskStatus.FAILED:
+            return
+        self._last_progress.pop(task_id, None)
+        if success:
+            task.output_path = final_path or ""
+            fmt = task.settings.get(KEY_FORMAT, DEFAULT_FORMAT)
+            self.history.add_to_history(task.extractor, task.video_id, task.meta, fmt)
+            self._release_key(task)
+            self._set_status(task, TaskStatus.FINISHED, output_path=task.output_path or None)
+        elif message == STR.STATUS_PAUSED:
+            # 재개 요청으로 이미 대기 상태면 이전 일시정지 신호는 무시
+            if task.status != TaskStatus.WAITING:
+                self._set_status(task, TaskStatus.PAUSED)
+        else:
+            self._fail(task, message)
+
+    # ============================================================
+    # 헬퍼
+    # ============================================================
+
+    def _get(self, task_id) -> DownloadTask:
+        try:
+            task = self.tasks.get(int(task_id))
+        except (TypeError, ValueError):
+            task = None
+        if task is None:
+            raise ServiceError(f"unknown task_id: {task_id!r}")
+        return task
+
+    @staticmethod
+    def _check_priority(priority) -> int:
+        if priority is None:
+            return TASK_PRIORITY_NORMAL
+        low, high = API_PRIORITY_RANGE
+        if isinstance(priority, bool) or not isinstance(priority, int) or not low <= priority <= high:
+            raise ServiceError(f"priority must be an integer in {low}..{high}")
+        return priority
+
+    @staticmethod
+    def _task_key(task: DownloadTask) -> tuple:
+        return task.extractor, task.video_id, task.settings.get(KEY_FORMAT, DEFAULT_FORMAT)
+
+    def _release_key(self, task: DownloadTask) -> None:
+        with self._lock:
+            key = self._task_key(task)
+            if self._active_keys.get(key) == task.id:
+                del self._active_keys[key]
+
+    def _fail(self, task: DownloadTask, message: str) -> None:
+        self.errors[task.id] = str(message)
+        self._release_key(task)
+        self._set_status(task, TaskStatus.FAILED, error=str(message))
+
+    def _set_status(self, task: DownloadTask, status: TaskStatus, **fields) -> None:
+        task.status = status
+        self._emit(status.value, task_id=task.id, **fields)
+        self._schedule_save()
+
+    def _emit(self, event: str, **fields) -> None:
+        record = {'event': event, 'time': round(time.time(), 3)}
+        record.update(fields)
+        self.task_event.emit(record)
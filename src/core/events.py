@@ -0,0 +1,65 @@
+"""
+다운로드 엔진용 이벤트/스레드 기반 클래스 (Qt 없음)
+- 스케줄러/워커/엔진은 PyQt5 없이 동작 (헤드리스 CLI, 서버)
+- GUI는 gui.scheduler_adapter가 이 이벤트를 Qt 시그널로 옮겨 메인 스레드에서 처리
+"""
+import threading
+from typing import Any, Callable
+
+
+class BoundSignal:
+    """인스턴스별 콜백 목록 (스레드 안전)"""
+
+    def __init__(self):
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def connect(self, callback: Callable) -> None:
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def disconnect(self, callback: Callable) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def emit(self, *args) -> None:
+        """연결된 콜백을 호출한 스레드에서 바로 실행 (UI 스레드로 넘기는 것은 어댑터 책임)"""
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            callback(*args)
+
+
+class Signal:
+    """
+    pyqtSignal의 connect/emit만 대체하는 이벤트 선언
+    - 클래스 속성으로 선언하면 인스턴스마다 별도의 BoundSignal을 가짐
+    - 인자 타입은 문서 목적 (검사하지 않음)
+    """
+
+    def __init__(self, *types):
+        self.types = types
+        self._attr = None
+
+    def __set_name__(self, owner, name):
+        self._attr = '_signal_' + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        bound = instance.__dict__.get(self._attr)
+        if bound is None:
+            bound = instance.__dict__.setdefault(self._attr, BoundSignal())
+        return bound
+
+
+class EngineThread(threading.Thread):
+    """엔진 워커 스레드 기반 클래스 (QThread 대신 사용, 부모인 스케줄러 참조 유지)"""
+
+    def __init__(self, parent: Any = None):
+        super().__init__(daemon=True)
+        self._parent = parent
+
+    def parent(self) -> Any:
+        return self._parent
@@ -0,0 +1,201 @@
+"""
+yt-dlp 자식 프로세스 감독
+- 모든 yt-dlp 프로세스를 별도 프로세스 그룹으로 실행하고 작업(task_id)별로 추적
+- 작업 취소 시 yt-dlp가 띄운 ffmpeg 등 손자 프로세스까지 그룹 단위로 즉시 종료
+- 앱 종료 시 전체 프로세스에 한꺼번에 종료 신호 → 공통 제한 시간 안에 회수 → 남은 프로세스 강제 종료
+- 신호는 아직 회수되지 않은 프로세스에만 보냄 (회수된 pid는 다른 프로세스가 재사용할 수 있음)
+"""
+import os
+import signal
+import subprocess
+import threading
+import time
+from typing import Dict, Iterable, List, Set
+
+from utils.logger import log
+from constants import PROCESS_SHUTDOWN_TIMEOUT_SEC, PROCESS_KILL_WAIT_SEC
+
+
+class ProcessSupervisor:
+    """yt-dlp 자식 프로세스 등록/취소/일괄 종료 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._processes: Dict[int, subprocess.Popen] = {}  # pid -> 프로세스
+        self._task_pids: Dict[int, Set[int]] = {}          # task_id -> pid 집합
+        self._closing = False
+
+    @property
+    def closing(self) -> bool:
+        """종료 중인지 (shutdown 이후 reopen 전까지 새 프로세스 실행 거부)"""
+        return self._closing
+
+    def reopen(self) -> None:
+        """shutdown 이후 다시 프로세스를 실행할 수 있게 함 (스케줄러를 다시 초기화할 때)"""
+        with self._lock:
+            self._closing = False
+
+    def spawn(self, args: List[str], task_ids: Iterable[int] = (), **popen_kwargs) -> subprocess.Popen:
+        """
+        새 프로세스 그룹으로 프로세스를 실행하고 등록
+        - POSIX: start_new_session (pgid == pid)
+        - Windows: CREATE_NEW_PROCESS_GROUP (taskkill /T로 자식까지 종료)
+
+        Args:
+            args: 실행 인자
+            task_ids: 이 프로세스가 처리하는 작업 ID (묶음 다운로드는 여러 개)
+            popen_kwargs: subprocess.Popen에 그대로 전달
+
+        Raises:
+            RuntimeError: 종료 중이라 새 프로세스를 실행할 수 없음
+        """
+        if self._closing:
+            raise RuntimeError("process supervisor is shutting down")
+
+        popen_kwargs.update(self.group_options(popen_kwargs.get('creationflags', 0)))
+        process = subprocess.Popen(args, **popen_kwargs)
+        return self.adopt(process, task_ids)
+
+    @staticmethod
+    def group_options(creationflags: int = 0) -> dict:
+        """새 프로세스 그룹으로 실행하기 위한 Popen/asyncio.create_subprocess_exec 인자"""
+        if os.name == 'nt':
+            return {'creationflags': creationflags
+                    | subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.CREATE_NO_WINDOW}
+        return {'start_new_session': True}
+
+    def adopt(self, process, task_ids: Iterable[int] = (), wait: bool = True):
+        """
+        다른 곳에서 group_options()로 실행한 프로세스 등록 (asyncio 프로세스 등)
+        - process는 Popen과 같은 pid/poll()/wait(timeout)을 제공해야 함
+        - wait=False: 종료 중이라 바로 정리할 때 회수를 기다리지 않음 (이벤트 루프 스레드용)
+        """
+        with self._lock:
+            self._processes[process.pid] = process
+            for task_id in task_ids:
+                self._task_pids.setdefault(task_id, set()).add(process.pid)
+            closing = self._closing
+
+        # 등록 직전에 종료가 시작된 경우 바로 정리
+        if closing:
+            self.kill(process, wait=wait)
+        return process
+
+    def detach(self, process, task_ids: Iterable[int]) -> None:
+        """작업 연결만 해제 (상주 프로세스가 작업 하나를 마쳤을 때, 프로세스 등록은 유지)"""
+        with self._lock:
+            for task_id in task_ids:
+                pids = self._task_pids.get(task_id)
+                if pids is not None:
+                    pids.discard(process.pid)
+                    if not pids:
+                        del self._task_pids[task_id]
+
+    def release(self, process: subprocess.Popen) -> None:
+        """종료된 프로세스 등록 해제"""
+        if process is None:
+            return
+        with self._lock:
+            self._processes.pop(process.pid, None)
+            for task_id in list(self._task_pids):
+                pids = self._task_pids[task_id]
+                pids.discard(process.pid)
+                if not pids:
+                    del self._task_pids[task_id]
+
+    def kill(self, process: subprocess.Popen, wait: bool = True) -> None:
+        """
+        프로세스 그룹 강제 종료 후 회수 및 등록 해제
+        - wait=False면 신호만 보내고 회수는 호출 측에 맡김 (asyncio 프로세스는 루프에서 await)
+        """
+        if process is None:
+            return
+        try:
+            if self._signal_group(process, force=True) and wait:
+                process.wait(timeout=PROCESS_KILL_WAIT_SEC)
+        except Exception:
+            pass
+        finally:
+            self.release(process)
+
+    def cancel_task(self, task_id: int) -> bool:
+        """
+        작업에 연결된 프로세스를 즉시 종료
+
+        Returns:
+            종료한 프로세스가 있으면 True
+        """
+        with self._lock:
+            processes = [self._processes[pid] for pid in self._task_pids.get(task_id, ())
+                         if pid in self._processes]
+        for process in processes:
+            log.info(f"작업 취소: yt-dlp 프로세스 종료 (task_id={task_id}, pid={process.pid})")
+            self.kill(process)
+        return bool(processes)
+
+    def shutdown(self, timeout: float = PROCESS_SHUTDOWN_TIMEOUT_SEC) -> None:
+        """
+        등록된 모든 프로세스 종료 (앱 종료 시)
+        - 모든 그룹에 동시에 종료 신호 → timeout 안에 병렬로 회수 → 남은 그룹은 강제 종료
+        - 이후 새 프로세스 실행은 거부 (reopen()으로 다시 허용)
+        """
+        with self._lock:
+            self._closing = True
+            processes = list(self._processes.values())
+        if not processes:
+            return
+
+        log.info(f"yt-dlp 프로세스 {len(processes)}개 종료 중")
+        remaining = [p for p in processes if self._signal_group(p, force=False)]
+
+        deadline = time.monotonic() + timeout
+        while remaining and time.monotonic() < deadline:
+            remaining = [p for p in remaining if p.poll() is None]
+            if remaining:
+                time.sleep(0.05)
+
+        if remaining:
+            log.warning(f"제한 시간 내 종료되지 않은 프로세스 {len(remaining)}개 강제 종료")
+        for process in remaining:
+            if self._signal_group(process, force=True):
+                try:
+                    process.wait(timeout=PROCESS_KILL_WAIT_SEC)
+                except Exception:
+                    pass
+        for process in processes:
+            self.release(process)
+
+    def _signal_group(self, process: subprocess.Popen, force: bool) -> bool:
+        """
+        프로세스 그룹에 종료 신호 전송 (force=False면 정상 종료 요청)
+        - 이미 회수된 프로세스는 신호를 보내지 않고 등록 해제 (pid 재사용 시 다른 그룹에 보내지 않도록)
+
+        Returns:
+            신호를 보냈으면 True (이미 끝난 프로세스면 False)
+        """
+        if process.poll() is not None:
+            self.release(process)
+            return False
+        try:
+            if os.name == 'nt':
+                # Windows는 콘솔 없는 프로세스에 정상 종료를 요청할 방법이 없어 트리 전체를 종료
+                subprocess.run(
+                    ['taskkill', '/F', '/T', '/PID', str(process.pid)],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                    creationflags=subprocess.CREATE_NO_WINDOW
+                )
+            else:
+                os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+                # 일시 중지(SIGSTOP)된 그룹은 재개해야 SIGTERM을 처리함
+                if not force:
+                    os.killpg(process.pid, signal.SIGCONT)
+        except ProcessLookupError:
+            self.release(process)
+            return False
+        except (OSError, subprocess.SubprocessError):
+            pass
+        return True
+
+
+# 앱 전체에서 공유하는 감독자 (YtDlpWrapper가 모든 yt-dlp 프로세스를 여기서 실행)
+supervisor = ProcessSupervisor()
@@ -0,0 +1,303 @@
+"""
+원격 에이전트
+- 코디네이터에 접속해 작업을 받아 로컬 DownloadScheduler로 다운로드 (파일은 에이전트 저장소에 남음)
+- 받은 작업마다 로컬 작업 ID를 새로 붙이고 임대(lease) 번호와 연결
+- 시작/진행률/메타데이터/완료를 코디네이터로 보내고, 하트비트로 받는 중인 작업의 임대를 연장
+- 연결이 끊기면 받던 작업을 모두 취소하고(코디네이터가 다른 에이전트에 다시 배정) 간격을 늘려 가며 재접속
+"""
+import asyncio
+import itertools
+import socket
+import time
+from typing import Any, Dict, Optional
+
+from core.events import EngineThread
+from core.remote_protocol import (
+    encode, read_message, json_safe, STATE_FINISHED, STATE_PAUSED, STATE_FAILED
+)
+from core.scheduler import DownloadScheduler
+from utils.logger import log
+from constants import (
+    KEY_DOWNLOAD_FOLDER, TASK_PRIORITY_RESUME,
+    REMOTE_PROTOCOL_VERSION, REMOTE_HEARTBEAT_SEC, REMOTE_PROGRESS_INTERVAL_SEC,
+    REMOTE_HANDSHAKE_TIMEOUT_SEC, REMOTE_RECONNECT_MIN_SEC, REMOTE_RECONNECT_MAX_SEC,
+    REMOTE_MAX_MESSAGE_BYTES
+)
+from locales.strings import STR
+
+
+class RemoteAgent(EngineThread):
+    """
+    코디네이터에서 작업을 받아 실행하는 에이전트 스레드
+    - 스케줄러 이벤트는 워커 스레드에서 오므로 call_soon_threadsafe로 루프에 넘겨 처리
+      (임대 ↔ 로컬 작업 ID 매핑은 루프 스레드에서만 변경)
+    """
+
+    def __init__(self, host: str, port: int, settings: Dict[str, Any], jobs: int,
+                 name: Optional[str] = None, token: Optional[str] = None):
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.settings = settings
+        self.jobs = max(1, jobs)
+        self.name = name or socket.gethostname()
+        self.token = token
+        self.error: Optional[str] = None  # 코디네이터가 접속을 거부한 사유 (재접속하지 않음)
+        self.scheduler = DownloadScheduler()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._shutdown: Optional[asyncio.Event] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._local_ids = itertools.count(1)
+        self._by_lease: Dict[int, int] = {}  # lease -> 로컬 작업 ID
+        self._by_local: Dict[int, int] = {}  # 로컬 작업 ID -> lease
+        self._jobs: Dict[int, tuple] = {}  # lease -> (priority, url, settings, metadata) 이어받기용
+        self._last_progress: Dict[int, float] = {}
+
+    # ============================================================
+    # 스레드 / 수명
+    # ============================================================
+
+    def run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        scheduler = self.scheduler
+        scheduler.task_started.connect(lambda tid: self._post(self._on_started, tid))
+        scheduler.progress_updated.connect(lambda d, tid: self._post(self._on_progress, d, tid))
+        scheduler.metadata_fetched.connect(lambda tid, meta: self._post(self._on_metadata, tid, meta))
+        scheduler.download_finished.connect(
+            lambda ok, msg, tid, path: self._post(self._on_finished, ok, msg, tid, path)
+        )
+        scheduler.configure(self.settings)
+        scheduler.initialize(self.jobs)
+        try:
+            loop.run_until_complete(self._main())
+        except Exception as e:
+            log.error(f"원격 에이전트 오류: {e}", exc_info=True)
+        finally:
+            self._loop = None
+            scheduler.shutdown()
+            loop.close()
+
+    def stop(self) -> None:
+        """에이전트 종료 요청 (어느 스레드에서나 호출 가능)"""
+        loop = self._loop
+        if loop is not None and self._shutdown is not None:
+            try:
+                loop.call_soon_threadsafe(self._shutdown.set)
+            except RuntimeError:
+                pass
+
+    def _post(self, callback, *args) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            pass
+
+    async def _main(self) -> None:
+        """접속 → 세션 → 끊기면 간격을 늘려 가며 재접속 (종료 요청이나 접속 거부 시 중단)"""
+        self._shutdown = asyncio.Event()
+        delay = REMOTE_RECONNECT_MIN_SEC
+        while not self._shutdown.is_set():
+            welcomed = False
+            try:
+                reader, writer = await asyncio.open_connection(
+                    self.host, self.port, limit=REMOTE_MAX_MESSAGE_BYTES
+                )
+            except OSError as e:
+                log.warning(f"코디네이터 접속 실패 ({self.host}:{self.port}): {e}")
+            else:
+                welcomed = await self._session(reader, writer)
+            if self.error is not None:
+                return
+            if welcomed:
+                delay = REMOTE_RECONNECT_MIN_SEC
+            try:
+                await asyncio.wait_for(self._shutdown.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            delay = min(REMOTE_RECONNECT_MAX_SEC, delay * 2)
+
+    async def _session(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        """연결 하나 처리, 코디네이터가 hello를 수락했으면 True"""
+        heartbeat = None
+        closer = None
+        try:
+            writer.write(encode({
+                'type': 'hello', 'version': REMOTE_PROTOCOL_VERSION, 'agent': self.name,
+                'slots': self.jobs, 'token': self.token
+            }))
+            await writer.drain()
+            reply = await asyncio.wait_for(read_message(reader), REMOTE_HANDSHAKE_TIMEOUT_SEC)
+            if reply is None:
+                return False
+            if reply['type'] != 'welcome':
+                self.error = str(reply.get('message') or reply['type'])
+                log.error(f"코디네이터가 접속을 거부했습니다: {self.error}")
+                return False
+
+            log.info(f"코디네이터 접속: {self.host}:{self.port} (에이전트 {self.name}, 슬롯 {self.jobs})")
+            self._writer = writer
+            heartbeat = asyncio.ensure_future(
+                self._heartbeat(float(reply.get('heartbeat_sec') or REMOTE_HEARTBEAT_SEC))
+            )
+            # 종료 요청 시 읽기 대기를 풀기 위해 연결을 닫음
+            closer = asyncio.ensure_future(self._close_on_shutdown(writer))
+            while True:
+                message = await read_message(reader)
+                if message is None:
+                    break
+                self._on_message(message)
+                await writer.drain()
+            return True
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError) as e:
+            log.warning(f"코디네이터 연결 오류: {e}")
+            return self._writer is writer
+        finally:
+            for task in (heartbeat, closer):
+                if task is not None:
+                    task.cancel()
+            self._writer = None
+            writer.close()
+            self._drop_all_jobs()
+
+    async def _heartbeat(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self._send({'type': 'heartbeat', 'leases': list(self._by_lease)})
+
+    async def _close_on_shutdown(self, writer: asyncio.StreamWriter) -> None:
+        await self._shutdown.wait()
+        writer.close()
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        writer = self._writer
+        if writer is not None and not writer.is_closing():
+            writer.write(encode(message))
+
+    # ============================================================
+    # 코디네이터 → 에이전트
+    # ============================================================
+
+    def _on_message(self, message: Dict[str, Any]) -> None:
+        kind = message['type']
+        lease = message.get('lease')
+        if kind == 'job':
+            self._start_job(lease, message.get('priority'), message.get('task') or {})
+        elif kind == 'cancel':
+            self._cancel_job(lease)
+        elif kind == 'pause':
+            if lease is None:
+                self.scheduler.pause_all()
+            elif lease in self._by_lease:
+                self.scheduler.pause_task(self._by_lease[lease])
+        elif kind == 'resume':
+            if lease is None:
+                self.scheduler.resume_all()
+            elif lease in self._by_lease:
+                self._resume_job(lease)
+
+    def _start_job(self, lease: int, priority: Any, task: Dict[str, Any]) -> None:
+        url = task.get('url')
+        if not isinstance(lease, int) or not url:
+            log.warning(f"잘못된 원격 작업을 무시합니다: lease={lease}")
+            return
+        settings = dict(task.get('settings') or self.settings)
+        # 파일은 에이전트 저장소에 받음 (코디네이터의 폴더 경로는 이 노드에 없을 수 있음)
+        settings[KEY_DOWNLOAD_FOLDER] = self.settings.get(KEY_DOWNLOAD_FOLDER)
+        metadata = dict(task.get('meta') or {})
+        priority = priority if isinstance(priority, int) else TASK_PRIORITY_RESUME
+        self._jobs[lease] = (priority, url, settings, metadata)
+        self._enqueue(lease, priority)
+        log.info(f"원격 작업 수신: lease={lease} task_id={task.get('id')} {url}")
+
+    def _enqueue(self, lease: int, priority: int) -> None:
+        """lease의 작업을 새 로컬 작업 ID로 로컬 큐에 넣음"""
+        _, url, settings, metadata = self._jobs[lease]
+        local_id = next(self._local_ids)
+        self._by_lease[lease] = local_id
+        self._by_local[local_id] = lease
+        self.scheduler.add_task(priority, local_id, url, dict(settings), dict(metadata))
+
+    def _resume_job(self, lease: int) -> None:
+        """
+        개별 재개
+        - 멈춰 둔 프로세스를 그대로 재개했거나 아직 로컬 큐에 있으면 그대로 둠
+        - 일시정지로 로컬 큐에서 빠진 작업은 새 로컬 ID로 다시 넣음 (이어받기)
+        """
+        local_id = self._by_lease[lease]
+        if self.scheduler.resume_task(local_id) or self.scheduler.is_task_queued(local_id):
+            return
+        self._forget(local_id)
+        self.scheduler.cancel_task(local_id)
+        self._enqueue(lease, TASK_PRIORITY_RESUME)
+
+    def _cancel_job(self, lease: int) -> None:
+        local_id = self._by_lease.get(lease)
+        if local_id is None:
+            return
+        self._forget(local_id)
+        self.scheduler.cancel_task(local_id)
+        # 대기 중이던 작업은 워커가 조용히 건너뛰므로 여기서 바로 결과를 보냄
+        # (실행 중이던 작업의 늦은 완료 통지는 매핑이 없어 무시됨)
+        self._send({'type': 'finished', 'lease': lease, 'state': STATE_FAILED,
+                    'message': STR.MSG_DL_CANCELLED, 'path': ''})
+        self._jobs.pop(lease, None)
+
+    def _forget(self, local_id: int) -> Optional[int]:
+        lease = self._by_local.pop(local_id, None)
+        if lease is not None and self._by_lease.get(lease) == local_id:
+            del self._by_lease[lease]
+        self._last_progress.pop(local_id, None)
+        return lease
+
+    def _drop_all_jobs(self) -> None:
+        """연결이 끊기면 받던 작업을 모두 취소 (코디네이터가 다른 에이전트에 다시 배정)"""
+        if self._by_local:
+            log.info(f"코디네이터 연결 끊김 - 원격 작업 {len(self._by_local)}개 취소")
+        for local_id in list(self._by_local):
+            self._forget(local_id)
+            self.scheduler.cancel_task(local_id)
+        self._jobs.clear()
+
+    # ============================================================
+    # 로컬 스케줄러 → 코디네이터 (루프 스레드에서 실행)
+    # ============================================================
+
+    def _on_started(self, local_id: int) -> None:
+        lease = self._by_local.get(local_id)
+        if lease is not None:
+            self._send({'type': 'started', 'lease': lease})
+
+    def _on_progress(self, d: Dict[str, Any], local_id: int) -> None:
+        lease = self._by_local.get(local_id)
+        if lease is None:
+            return
+        now = time.monotonic()
+        # 다운로드 중 진행률만 간격 제한 (상태 변화는 바로 전송)
+        if d.get('status') == 'downloading' and now - self._last_progress.get(local_id, 0.0) < REMOTE_PROGRESS_INTERVAL_SEC:
+            return
+        self._last_progress[local_id] = now
+        self._send({'type': 'progress', 'lease': lease, 'progress': json_safe(d)})
+
+    def _on_metadata(self, local_id: int, metadata: Dict[str, Any]) -> None:
+        lease = self._by_local.get(local_id)
+        if lease is not None:
+            self._send({'type': 'metadata', 'lease': lease, 'metadata': json_safe(metadata)})
+
+    def _on_finished(self, success: bool, message: str, local_id: int, final_path: str) -> None:
+        lease = self._forget(local_id)
+        if lease is None:
+            return
+        self._jobs.pop(lease, None)
+        if success:
+            state = STATE_FINISHED
+        elif message == STR.STATUS_PAUSED:
+            state = STATE_PAUSED
+        else:
+            state = STATE_FAILED
+        self._send({'type': 'finished', 'lease': lease, 'state': state,
+                    'message': str(message or ''), 'path': final_path or ''})
@@ -0,0 +1,383 @@
+"""
+원격 에이전트 코디네이터
+- 스케줄러의 다운로드 큐를 로컬 워커와 함께 소비하면서 접속한 에이전트의 빈 슬롯에 작업을 배정
+- 배정한 작업은 임대(lease)로 관리: 에이전트의 하트비트/진행률이 임대를 연장하고,
+  연결이 끊기거나 임대가 만료되면 작업을 다시 큐에 넣음 (REMOTE_MAX_ATTEMPTS회까지)
+- 에이전트의 시작/진행률/완료는 스케줄러 시그널로 그대로 중계 (서비스/히스토리는 코디네이터 쪽에서 처리)
+- 스케줄러 입장에서는 워커/asyncio 엔진과 같은 실행기 (일시 중지/재개/취소/종료 신호)
+"""
+import asyncio
+import itertools
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from core.events import EngineThread, Signal
+from core.remote_protocol import encode, read_message, STATE_FINISHED, STATE_PAUSED
+from data.models import DownloadTask
+from utils.logger import log
+from constants import (
+    REMOTE_PROTOCOL_VERSION, REMOTE_HEARTBEAT_SEC, REMOTE_LEASE_SEC, REMOTE_MAX_ATTEMPTS,
+    REMOTE_HANDSHAKE_TIMEOUT_SEC, REMOTE_MAX_MESSAGE_BYTES
+)
+from locales.strings import STR
+
+
+class _Agent:
+    """접속한 에이전트 하나"""
+
+    def __init__(self, name: str, slots: int, writer: asyncio.StreamWriter):
+        self.name = name
+        self.slots = slots
+        self.writer = writer
+        self.leases = set()
+
+    def free_slots(self) -> int:
+        # 닫는 중인 연결에는 배정하지 않음
+        if self.writer.is_closing():
+            return 0
+        return self.slots - len(self.leases)
+
+    def send(self, message: Dict[str, Any]) -> None:
+        if not self.writer.is_closing():
+            self.writer.write(encode(message))
+
+
+class _Lease:
+    """에이전트에 배정한 작업 하나"""
+
+    def __init__(self, lease_id: int, entry: tuple, agent: _Agent):
+        self.lease_id = lease_id
+        self.entry = entry
+        self.agent = agent
+        self.expires = time.monotonic() + REMOTE_LEASE_SEC
+
+    @property
+    def task_id(self) -> int:
+        return self.entry[1]
+
+    def renew(self) -> None:
+        self.expires = time.monotonic() + REMOTE_LEASE_SEC
+
+
+class RemoteCoordinator(EngineThread):
+    """에이전트 접속을 받고 큐의 작업을 배정하는 서버 스레드"""
+    progress_updated = Signal(dict, int)
+    download_finished = Signal(bool, str, int, str)
+    task_started = Signal(int)
+    metadata_fetched = Signal(int, dict)
+
+    def __init__(self, download_queue, stop_event: threading.Event, pause_event: threading.Event,
+                 host: str, port: int, token: Optional[str] = None, parent: Optional[Any] = None):
+        super().__init__(parent)
+        self.download_queue = download_queue
+        self.stop_event = stop_event
+        self.pause_event = pause_event
+        self.host = host
+        self.port = port
+        self.token = token
+        self.started = threading.Event()
+        self.error: Optional[BaseException] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._closing = False
+        self._agents: List[_Agent] = []
+        self._lease_ids = itertools.count(1)
+        # 임대 목록 (메인 스레드의 일시 중지/취소 요청이 조회하므로 잠금으로 보호)
+        self._leases: Dict[int, _Lease] = {}
+        self._leases_lock = threading.Lock()
+        self._attempts: Dict[int, int] = {}
+
+    # ============================================================
+    # 스케줄러가 메인 스레드에서 호출
+    # ============================================================
+
+    def wake(self) -> None:
+        """배정 루프를 깨움 (큐에 작업 추가, 전체 재개, 종료 시 - 어느 스레드에서나 호출 가능)"""
+        loop = self._loop
+        if loop is None or self._wakeup is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            pass
+
+    def running_task_ids(self) -> List[int]:
+        with self._leases_lock:
+            return [lease.task_id for lease in self._leases.values()]
+
+    def agent_count(self) -> int:
+        return len(self._agents)
+
+    def suspend_download(self, task_id: Optional[int] = None) -> bool:
+        """에이전트에서 받는 중인 작업 일시 중지 (task_id가 없으면 전체)"""
+        if task_id is None:
+            self._call(self._broadcast, {'type': 'pause', 'lease': None})
+            return bool(self._agents)
+        lease = self._find(task_id)
+        if lease is None:
+            return False
+        self._call(lease.agent.send, {'type': 'pause', 'lease': lease.lease_id})
+        return True
+
+    def resume_download(self, task_id: Optional[int] = None) -> List[int]:
+        """
+        에이전트의 작업 재개 요청 후 재개 대상 작업 ID 목록 반환
+        - 임대 중인 작업은 에이전트가 그 자리에서 재개하거나 자체적으로 이어받기 (다시 큐에 넣을 필요 없음)
+        - task_id가 없으면 개별 일시정지된 작업을 제외하고 전체 재개
+        """
+        scheduler = self.parent()
+        if task_id is None:
+            self._call(self._broadcast, {'type': 'resume', 'lease': None})
+            self.wake()
+            with self._leases_lock:
+                task_ids = [lease.task_id for lease in self._leases.values()]
+            return [tid for tid in task_ids if not (scheduler and scheduler.is_task_paused(tid))]
+        lease = self._find(task_id)
+        if lease is None:
+            return []
+        self._call(lease.agent.send, {'type': 'resume', 'lease': lease.lease_id})
+        return [task_id]
+
+    def cancel_task(self, task_id: int) -> bool:
+        """에이전트에서 받는 중인 작업 취소 (결과는 에이전트의 finished 메시지로 통지)"""
+        lease = self._find(task_id)
+        if lease is None:
+            return False
+        self._call(lease.agent.send, {'type': 'cancel', 'lease': lease.lease_id})
+        return True
+
+    def _find(self, task_id: int) -> Optional[_Lease]:
+        with self._leases_lock:
+            return next((lease for lease in self._leases.values() if lease.task_id == task_id), None)
+
+    def _call(self, callback, *args) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            pass
+
+    # ============================================================
+    # 이벤트 루프 스레드
+    # ============================================================
+
+    def run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        self.download_queue.add_listener(self.wake)
+        try:
+            loop.run_until_complete(self._serve())
+        except Exception as e:
+            self.error = e
+            log.error(f"원격 코디네이터 오류: {e}", exc_info=True)
+        finally:
+            self.download_queue.remove_listener(self.wake)
+            self._loop = None
+            self.started.set()
+            loop.close()
+
+    async def _serve(self) -> None:
+        self._wakeup = asyncio.Event()
+        server = await asyncio.start_server(
+            self._handle_agent, self.host, self.port, limit=REMOTE_MAX_MESSAGE_BYTES
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        log.info(f"원격 코디네이터 시작: {self.host}:{self.port}")
+        self.started.set()
+        reaper = asyncio.ensure_future(self._reap_expired())
+        async with server:
+            await self._dispatch()
+            reaper.cancel()
+            # 에이전트 연결 종료 (에이전트는 연결이 끊기면 받던 작업을 취소)
+            for agent in list(self._agents):
+                agent.writer.close()
+            await asyncio.sleep(0)
+
+    async def _dispatch(self) -> None:
+        """큐에서 작업을 꺼내 빈 슬롯이 있는 에이전트에 배정"""
+        while not self._closing and not self.stop_event.is_set():
+            self._wakeup.clear()
+            self._assign_jobs()
+            if not self._closing:
+                await self._wakeup.wait()
+        self._closing = True
+
+    def _assign_jobs(self) -> None:
+        scheduler = self.parent()
+        while self.pause_event.is_set():
+            agent = max(self._agents, key=_Agent.free_slots, default=None)
+            if agent is None or agent.free_slots() <= 0:
+                return
+            try:
+                # 사이트별 동시 실행 제한은 각 에이전트가 자체 설정으로 적용
+                entry = self.download_queue.get_nowait(limited=False)
+            except queue.Empty:
+                return
+            self.download_queue.task_done()
+
+            # 종료 신호 (스케줄러 shutdown)
+            if not isinstance(entry, tuple) or len(entry) < 5 or entry[1] is None:
+                self._closing = True
+                return
+
+            task_id = entry[1]
+            # 확인 전에 먼저 등록 (그 사이 취소되면 스케줄러가 실행 중인 작업으로 보고 취소 상태를 남김)
+            lease = _Lease(next(self._lease_ids), entry, agent)
+            with self._leases_lock:
+                self._leases[lease.lease_id] = lease
+            if scheduler is not None:
+                scheduler.on_task_dequeued(task_id)
+                if (scheduler.is_task_cancelled(task_id) or scheduler.is_task_paused(task_id)
+                        or not scheduler.is_entry_current(entry)):
+                    with self._leases_lock:
+                        self._leases.pop(lease.lease_id, None)
+                    scheduler.on_task_skipped(task_id)
+                    continue
+            agent.leases.add(lease.lease_id)
+            priority, _, url, settings, metadata = entry[:5]
+            task = DownloadTask(id=task_id, url=url, settings=settings, meta=metadata or {})
+            agent.send({'type': 'job', 'lease': lease.lease_id, 'priority': priority, 'task': task.to_dict()})
+            log.info(f"원격 배정: task_id={task_id} → {agent.name} (lease={lease.lease_id})")
+
+    async def _reap_expired(self) -> None:
+        """임대가 만료된 작업 회수 (응답 없는 에이전트는 연결을 끊어 남은 작업도 회수)"""
+        while True:
+            await asyncio.sleep(1.0)
+            now = time.monotonic()
+            with self._leases_lock:
+                expired = [lease for lease in self._leases.values() if lease.expires < now]
+            for lease in expired:
+                log.warning(f"원격 작업 임대 만료: task_id={lease.task_id} ({lease.agent.name})")
+                lease.agent.writer.close()
+                self._requeue(lease)
+
+    def _release(self, lease: _Lease) -> bool:
+        """임대 해제 (이미 해제되었으면 False)"""
+        with self._leases_lock:
+            if self._leases.pop(lease.lease_id, None) is None:
+                return False
+        lease.agent.leases.discard(lease.lease_id)
+        self.wake()
+        return True
+
+    def _requeue(self, lease: _Lease) -> None:
+        """에이전트를 잃은 작업을 다시 큐에 넣음 (취소/종료 중이거나 횟수를 넘으면 결과 통지)"""
+        if not self._release(lease) or self.stop_event.is_set():
+            return
+        task_id = lease.task_id
+        scheduler = self.parent()
+        if scheduler is not None and scheduler.is_task_cancelled(task_id):
+            self.download_finished.emit(False, STR.MSG_DL_CANCELLED, task_id, "")
+            return
+        attempts = self._attempts.get(task_id, 0) + 1
+        if attempts >= REMOTE_MAX_ATTEMPTS:
+            self._attempts.pop(task_id, None)
+            self.download_finished.emit(False, STR.ERR_REMOTE_AGENT_LOST, task_id, "")
+            return
+        self._attempts[task_id] = attempts
+        self.download_queue.put(lease.entry)
+
+    def _broadcast(self, message: Dict[str, Any]) -> None:
+        for agent in self._agents:
+            agent.send(message)
+
+    # ============================================================
+    # 에이전트 연결
+    # ============================================================
+
+    async def _handle_agent(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        agent = None
+        try:
+            hello = await asyncio.wait_for(read_message(reader), REMOTE_HANDSHAKE_TIMEOUT_SEC)
+            error = self._check_hello(hello)
+            if error:
+                writer.write(encode({'type': 'error', 'message': error}))
+                await writer.drain()
+                return
+
+            peer = writer.get_extra_info('peername')
+            agent = _Agent(str(hello.get('agent') or peer), int(hello['slots']), writer)
+            self._agents.append(agent)
+            writer.write(encode({
+                'type': 'welcome', 'heartbeat_sec': REMOTE_HEARTBEAT_SEC, 'lease_sec': REMOTE_LEASE_SEC
+            }))
+            log.info(f"원격 에이전트 접속: {agent.name} (슬롯 {agent.slots}, {peer})")
+            self._wakeup.set()
+
+            while not self._closing:
+                message = await read_message(reader)
+                if message is None:
+                    break
+                self._on_message(agent, message)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError) as e:
+            log.warning(f"원격 에이전트 연결 오류: {e}")
+        finally:
+            if agent is not None:
+                self._agents.remove(agent)
+                log.info(f"원격 에이전트 연결 종료: {agent.name}")
+                with self._leases_lock:
+                    orphaned = [self._leases[lid] for lid in list(agent.leases) if lid in self._leases]
+                for lease in orphaned:
+                    self._requeue(lease)
+            writer.close()
+
+    def _check_hello(self, hello: Optional[Dict]) -> Optional[str]:
+        if not hello or hello.get('type') != 'hello':
+            return 'expected hello'
+        if hello.get('version') != REMOTE_PROTOCOL_VERSION:
+            return f"protocol version mismatch (coordinator {REMOTE_PROTOCOL_VERSION})"
+        if self.token and hello.get('token') != self.token:
+            return 'invalid token'
+        slots = hello.get('slots')
+        if isinstance(slots, bool) or not isinstance(slots, int) or slots < 1:
+            return 'slots must be a positive integer'
+        return None
+
+    def _on_message(self, agent: _Agent, message: Dict[str, Any]) -> None:
+        kind = message['type']
+        if kind == 'heartbeat':
+            with self._leases_lock:
+                for lease_id in message.get('leases', []):
+                    lease = self._leases.get(lease_id)
+                    if lease is not None and lease.agent is agent:
+                        lease.renew()
+            return
+
+        with self._leases_lock:
+            lease = self._leases.get(message.get('lease'))
+        # 회수된 임대의 늦은 메시지는 무시
+        if lease is None or lease.agent is not agent:
+            return
+        lease.renew()
+        task_id = lease.task_id
+
+        if kind == 'started':
+            self.metadata_fetched.emit(task_id, {'agent': agent.name})
+            self.task_started.emit(task_id)
+        elif kind == 'progress':
+            self.progress_updated.emit(dict(message.get('progress') or {}), task_id)
+        elif kind == 'metadata':
+            self.metadata_fetched.emit(task_id, dict(message.get('metadata') or {}))
+        elif kind == 'finished':
+            if not self._release(lease):
+                return
+            self._attempts.pop(task_id, None)
+            state = message.get('state')
+            if state == STATE_FINISHED:
+                self.download_finished.emit(True, str(message.get('message') or ''), task_id,
+                                            str(message.get('path') or ''))
+            elif state == STATE_PAUSED:
+                self.download_finished.emit(False, STR.STATUS_PAUSED, task_id, "")
+            else:
+                scheduler = self.parent()
+                if scheduler is not None and scheduler.is_task_cancelled(task_id):
+                    text = STR.MSG_DL_CANCELLED
+                else:
+                    text = f"[{agent.name}] {message.get('message') or ''}"
+                self.download_finished.emit(False, text, task_id, "")
@@ -0,0 +1,48 @@
+"""
+원격 에이전트 프로토콜 (TCP, 메시지마다 JSON 한 줄)
+
+에이전트 → 코디네이터
+    hello      {agent, slots, version, token}       접속 직후 1회
+    heartbeat  {leases: [lease, ...]}               REMOTE_HEARTBEAT_SEC마다 (나열된 임대 연장)
+    started    {lease}                              다운로드 시작
+    progress   {lease, progress}                    진행률 (작업별 간격 제한)
+    metadata   {lease, metadata}                    에이전트가 조회한 메타데이터
+    finished   {lease, state, message, path}        state: finished | paused | failed
+
+코디네이터 → 에이전트
+    welcome    {heartbeat_sec, lease_sec}           hello 수락
+    error      {message}                            hello 거부 (연결 종료)
+    job        {lease, priority, task}              task는 DownloadTask.to_dict() (settings 포함)
+    cancel     {lease}
+    pause      {lease 또는 null(전체)}
+    resume     {lease 또는 null(전체)}
+"""
+import asyncio
+import json
+from typing import Any, Dict, Optional
+
+# 작업 종료 상태 (언어 설정이 다른 노드끼리도 같은 의미로 해석하도록 메시지 문자열 대신 사용)
+STATE_FINISHED = 'finished'
+STATE_PAUSED = 'paused'
+STATE_FAILED = 'failed'
+
+
+def encode(message: Dict[str, Any]) -> bytes:
+    # 메타데이터에 JSON으로 표현할 수 없는 값이 섞여 있으면 문자열로 보냄
+    return json.dumps(message, ensure_ascii=False, default=str).encode('utf-8') + b'\n'
+
+
+async def read_message(reader: asyncio.StreamReader) -> Optional[Dict[str, Any]]:
+    """메시지 하나 읽기 (연결이 끊기면 None, 형식 오류는 ValueError)"""
+    line = await reader.readline()
+    if not line:
+        return None
+    message = json.loads(line.decode('utf-8'))
+    if not isinstance(message, dict) or not isinstance(message.get('type'), str):
+        raise ValueError('invalid message')
+    return message
+
+
+def json_safe(d: Dict[str, Any]) -> Dict[str, Any]:
+    """진행률/메타데이터 dict에서 JSON으로 보낼 수 있는 단순 값만 남김"""
+    return {k: v for k, v in d.items() if isinstance(v, (str, int, float, bool, type(None)))}
@@ -2,39 +2,87 @@
 다운로드 스케줄러
 워커 스레드 풀과 다운로드 큐를 관리하는 클래스
 main_window.py에서 분리하여 관심사 분리 (SRP)
+Qt 없이 동작 (GUI는 gui.scheduler_adapter.QtDownloadScheduler로 감싸서 사용)
 """
 import threading
+import time
 import queue
 
-from PyQt5.QtCore import QObject, pyqtSignal
-
-from core.workers import DownloadWorker
+from core import download_handler
+from core.async_engine import AsyncDownloadEngine
+from core.autotuner import ConcurrencyAutotuner
+from core.bandwidth import BandwidthBudget
+from core.events import Signal
+from core.process_supervisor import supervisor
+from core.scheduling_policy import create_policy
+from core.task_queue import IndexedPriorityQueue, LimitedPriorityQueue, QueueEntry, TaskGenerations
+from core.workers import DownloadWorker, MetadataBatchWorker, MetadataWorker
+from data.managers import MetadataCache, PartialDownloadRegistry
 from utils.logger import log
-from constants import WORKER_CLEANUP_WAIT_MS, SCHEDULER_PRIORITY_NORMAL
+from locales.strings import STR
+from constants import (
+    WORKER_CLEANUP_WAIT_MS, SCHEDULER_PRIORITY_NORMAL,
+    KEY_ENGINE_MODE, DEFAULT_ENGINE_MODE, ENGINE_POOL, ENGINE_ASYNC, ENGINE_MODES, POOL_EXTRA_HELPERS,
+    KEY_METADATA_BACKEND, DEFAULT_METADATA_BACKEND, METADATA_BACKEND_INPROCESS,
+    INPROCESS_METADATA_WORKERS, METADATA_BATCH_SIZE,
+    KEY_METADATA_LOOKAHEAD, DEFAULT_METADATA_LOOKAHEAD, METADATA_PIPELINE_WORKERS,
+    KEY_DOWNLOAD_BATCH_SIZE, DEFAULT_DOWNLOAD_BATCH_SIZE, DOWNLOAD_BATCH_MAX_SIZE,
+    KEY_EXTRACTOR_LIMITS, KEY_HOST_LIMITS, KEY_PER_HOST_LIMIT,
+    DEFAULT_EXTRACTOR_LIMITS, DEFAULT_HOST_LIMITS, DEFAULT_PER_HOST_LIMIT,
+    KEY_BANDWIDTH_LIMIT, KEY_BANDWIDTH_WEIGHTED, DEFAULT_BANDWIDTH_LIMIT, DEFAULT_BANDWIDTH_WEIGHTED,
+    KEY_AUTOTUNE_WORKERS, KEY_AUTOTUNE_MIN_WORKERS, KEY_AUTOTUNE_MAX_WORKERS,
+    DEFAULT_AUTOTUNE_WORKERS, DEFAULT_AUTOTUNE_MIN_WORKERS, DEFAULT_AUTOTUNE_MAX_WORKERS,
+    KEY_SCHEDULING_POLICY, DEFAULT_SCHEDULING_POLICY,
+    BYTES_PER_KB,
+    PROCESS_SHUTDOWN_TIMEOUT_SEC
+)
 
 
-class DownloadScheduler(QObject):
+class DownloadScheduler:
     """
     다운로드 워커 스레드 풀과 큐를 관리하는 스케줄러
     
     역할:
     - 워커 스레드 생성/삭제/관리
-    - 다운로드 큐 관리
+    - 다운로드 큐 관리 (메타데이터 선행 조회 단계 → 다운로드 단계)
     - 일시정지/재개 제어
-    - 워커 시그널을 메인 윈도우로 중계
+    - 실행 엔진(subprocess / 상주 프로세스 풀 / asyncio 이벤트 루프) 관리
+    - 워커 이벤트를 구독자(Qt 어댑터, CLI 등)로 중계 (워커 스레드에서 호출됨)
     """
     
-    # 메인 윈도우로 중계할 시그널
-    progress_updated = pyqtSignal(dict, int)  # 진행률, task_id
-    download_finished = pyqtSignal(bool, str, int, str)  # 성공여부, 메시지, task_id, 파일경로
-    task_started = pyqtSignal(int)  # task_id
-    metadata_fetched = pyqtSignal(int, dict)  # task_id, metadata
+    # 구독자에게 중계할 이벤트
+    progress_updated = Signal(dict, int)  # 진행률, task_id
+    download_finished = Signal(bool, str, int, str)  # 성공여부, 메시지, task_id, 파일경로
+    task_started = Signal(int)  # task_id
+    metadata_fetched = Signal(int, dict)  # task_id, metadata
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
+    def __init__(self):
+        
+        # 작업별 세대 번호 (다시 넣기/일시정지/취소 전에 꺼내 간 항목은 큐에 되돌아오지 못함)
+        self.task_generations = TaskGenerations()
+        
+        # 스케줄링 정책 (같은 우선순위 안의 순서, 두 큐가 공유) 및 작업별 묶음 (플레이리스트/일괄 등록, fair 정책에서 사용)
+        self.task_groups = {}
+        self.scheduling_policy = create_policy(DEFAULT_SCHEDULING_POLICY, self.task_groups.get)
+        
+        # 다운로드 큐 (우선순위 큐) - 메타데이터가 준비된 작업만 들어감
+        # (asyncio 엔진은 항목이 들어올 때 콜백으로 깨어남, 추출기/호스트/전체 동시 실행 수 제한)
+        # 이전 세대 항목을 버리면 선행 조회 자리 반납 (꺼내 간 것과 같게 처리)
+        self.download_queue = LimitedPriorityQueue(
+            generations=self.task_generations, on_drop=self.on_task_dequeued, policy=self.scheduling_policy
+        )
         
-        # 다운로드 큐 (우선순위 큐)
-        self.download_queue = queue.PriorityQueue()
+        # 메타데이터 선행 조회 대기 큐 및 워커
+        # look-ahead 깊이만큼만 미리 조회하여 다운로드 큐에 준비해 둠 (0이면 비활성)
+        self.pending_queue = IndexedPriorityQueue(generations=self.task_generations, policy=self.scheduling_policy)
+        self.metadata_pipeline_workers = []
+        self.metadata_lookahead = DEFAULT_METADATA_LOOKAHEAD
+        self._lookahead_in_use = 0  # 조회 중 + 준비 완료(다운로드 대기) 작업 수
+        self._lookahead_ready_ids = set()
+        self._lookahead_cond = threading.Condition()
+        
+        # 묶음 다운로드 크기 (짧은 작업을 yt-dlp 1회 실행으로 묶어 받음, 1이면 비활성)
+        self.download_batch_size = DEFAULT_DOWNLOAD_BATCH_SIZE
         
         # 스레드 제어 이벤트
         self.stop_event = threading.Event()
@@ -43,50 +91,505 @@ class DownloadScheduler(QObject):
         
         # 워커 리스트
         self.workers = []
+        # asyncio 엔진 (ENGINE_ASYNC일 때 워커 스레드 대신 사용)
+        self.async_engine = None
+        # 원격 에이전트 코디네이터 (로컬 실행기와 같은 큐를 소비, start_remote_coordinator로 시작)
+        self.remote_coordinator = None
         
         # 개별 작업 일시정지 플래그 (task_id -> bool) - 스레드 안전을 위한 Lock 추가
         self.task_paused_flags = {}
         self._paused_flags_lock = threading.Lock()
+        
+        # 취소된 작업 ID (큐에 남은 항목은 워커가 건너뜀) - _paused_flags_lock으로 보호
+        self.cancelled_task_ids = set()
+        # 받던 파일을 남기고 취소한 작업 ID (목록에서 제거) - _paused_flags_lock으로 보호
+        self._keep_files_task_ids = set()
+        
+        # 실행 엔진 (ENGINE_POOL일 때만 상주 프로세스 풀 사용)
+        self.engine_mode = DEFAULT_ENGINE_MODE
+        self.process_pool = None
+        self._target_worker_count = 0
+        
+        # 메타데이터 전용 추출기 (METADATA_BACKEND_INPROCESS일 때만 사용)
+        self.metadata_backend = None
+        
+        # 배치로 미리 조회한 메타데이터 (task_id -> metadata) 및 조회 스레드/큐
+        self._prefetched_metadata = {}
+        self._prefetch_lock = threading.Lock()
+        self.metadata_queue = queue.Queue()
+        self.metadata_worker = None
+        
+        # 메타데이터 디스크 캐시 (워커/배치 조회가 yt-dlp 실행 전에 확인)
+        self.metadata_cache = MetadataCache()
+        # 작업별 임시 파일 기록 (재시작 후 같은 포맷/파일 이름으로 이어받기)
+        self.partial_registry = PartialDownloadRegistry()
+        # 전체 대역폭 예산 (받는 중인 작업끼리 나누어 씀, download_handler가 다운로드 시작/종료 시 사용)
+        self.bandwidth = BandwidthBudget()
+        # 동시 다운로드 수 자동 조절 (autotune_workers 설정 시, 워커 시작 후 실행)
+        self.autotuner = None
+        self._initialized = False
     
     def initialize(self, max_workers: int):
-        """스케줄러 초기화 및 워커 시작"""
+        """스케줄러 초기화 및 워커 시작 (자동 조절이 켜져 있으면 max_workers는 시작값)"""
         self.stop_event.clear()
+        supervisor.reopen()  # 이전 shutdown 이후 다시 시작하는 경우
+        download_handler.purge_stale_info_json()
+        self._start_metadata_pipeline()
         self.adjust_worker_count(max_workers)
+        self._initialized = True
+        self._start_autotuner()
+    
+    def configure(self, settings: dict):
+        """
+        설정에 따라 실행 엔진 구성
+        - engine_mode가 'pool'이면 상주 프로세스 풀을 띄워 download_handler에 등록
+        - 'async'면 워커 스레드 대신 이벤트 루프 스레드 1개에서 작업마다 코루틴으로 subprocess 실행
+        - 그 외에는 풀을 정리하고 작업마다 subprocess를 실행하는 기존 방식 사용
+        - metadata_backend가 'inprocess'면 메타데이터 조회를 프로세스 내 스레드 풀로 처리
+        - download_batch_size가 2 이상이면 짧은 작업을 묶어 yt-dlp 1회 실행으로 다운로드
+        - extractor_limits / host_limits / per_host_limit로 사이트별 동시 다운로드 수 제한
+        - bandwidth_limit(KB/s)가 있으면 받는 중인 작업끼리 나누어 쓰는 전체 속도 제한
+        - autotune_workers가 켜져 있으면 측정한 처리량/오류에 따라 워커 수 자동 조절
+        - scheduling_policy로 같은 우선순위 안의 순서 (fifo / sjf / fair)
+        """
+        self.download_queue.configure_limits(
+            settings.get(KEY_EXTRACTOR_LIMITS, DEFAULT_EXTRACTOR_LIMITS),
+            settings.get(KEY_HOST_LIMITS, DEFAULT_HOST_LIMITS),
+            settings.get(KEY_PER_HOST_LIMIT, DEFAULT_PER_HOST_LIMIT)
+        )
+        self._configure_bandwidth(settings)
+        self._configure_autotuner(settings)
+        self._set_scheduling_policy(settings.get(KEY_SCHEDULING_POLICY, DEFAULT_SCHEDULING_POLICY))
+        self._configure_metadata_backend(settings.get(KEY_METADATA_BACKEND, DEFAULT_METADATA_BACKEND))
+        self._set_metadata_lookahead(settings.get(KEY_METADATA_LOOKAHEAD, DEFAULT_METADATA_LOOKAHEAD))
+        self._set_download_batch_size(settings.get(KEY_DOWNLOAD_BATCH_SIZE, DEFAULT_DOWNLOAD_BATCH_SIZE))
+        
+        mode = settings.get(KEY_ENGINE_MODE, DEFAULT_ENGINE_MODE)
+        if mode not in ENGINE_MODES:
+            log.warning(f"알 수 없는 엔진 모드: {mode} → {DEFAULT_ENGINE_MODE} 사용")
+            mode = DEFAULT_ENGINE_MODE
+        
+        if mode == self.engine_mode and (mode != ENGINE_POOL or self.process_pool):
+            return
+        
+        self.engine_mode = mode
+        if mode == ENGINE_POOL:
+            self._start_process_pool()
+        else:
+            self._stop_process_pool()
+        log.info(f"실행 엔진 모드: {mode}")
+        
+        # 실행 중 전환: 기존 워커/엔진은 현재 작업을 마치고 퇴장, 새 방식으로 같은 큐를 이어서 처리
+        if self.workers or self.async_engine:
+            self.adjust_worker_count(self._target_worker_count)
+    
+    def _configure_bandwidth(self, settings: dict):
+        """대역폭 예산 설정 후 download_handler에 등록 (받는 중인 풀 작업은 바로 다시 분배)"""
+        try:
+            limit_kb = max(0, int(settings.get(KEY_BANDWIDTH_LIMIT, DEFAULT_BANDWIDTH_LIMIT) or 0))
+        except (TypeError, ValueError):
+            limit_kb = DEFAULT_BANDWIDTH_LIMIT
+        self.bandwidth.configure(
+            limit_kb * BYTES_PER_KB, settings.get(KEY_BANDWIDTH_WEIGHTED, DEFAULT_BANDWIDTH_WEIGHTED)
+        )
+        download_handler.set_bandwidth_budget(self.bandwidth)
+        if limit_kb:
+            log.info(f"전체 대역폭 제한: {limit_kb} KB/s")
+    
+    def _configure_autotuner(self, settings: dict):
+        """자동 조절 켜기/끄기 및 범위 설정 (끄면 워커 수는 마지막 값으로 유지)"""
+        if not settings.get(KEY_AUTOTUNE_WORKERS, DEFAULT_AUTOTUNE_WORKERS):
+            if self.autotuner:
+                self.autotuner.stop()
+                self.autotuner = None
+            return
+        if self.autotuner is None:
+            self.autotuner = ConcurrencyAutotuner(self)
+        self.autotuner.configure(
+            settings.get(KEY_AUTOTUNE_MIN_WORKERS, DEFAULT_AUTOTUNE_MIN_WORKERS),
+            settings.get(KEY_AUTOTUNE_MAX_WORKERS, DEFAULT_AUTOTUNE_MAX_WORKERS)
+        )
+        self._start_autotuner()
+    
+    def _start_autotuner(self):
+        """워커를 시작한 뒤에만 조절 스레드 시작 (이미 실행 중이면 무시)"""
+        if self.autotuner and self._initialized and self.autotuner.ident is None:
+            self.autotuner.start()
+    
+    def _set_scheduling_policy(self, name: str):
+        """스케줄링 정책 교체 (대기 중인 작업도 새 정책 순서로 다시 정렬)"""
+        if name == self.scheduling_policy.name:
+            return
+        try:
+            policy = create_policy(name, self.task_groups.get)
+        except ValueError:
+            log.warning(f"알 수 없는 스케줄링 정책: {name} → {DEFAULT_SCHEDULING_POLICY} 사용")
+            policy = create_policy(DEFAULT_SCHEDULING_POLICY, self.task_groups.get)
+            if policy.name == self.scheduling_policy.name:
+                return
+        self.scheduling_policy = policy
+        self.pending_queue.set_policy(policy)
+        self.download_queue.set_policy(policy)
+        log.info(f"스케줄링 정책: {policy.name}")
+    
+    def _set_download_batch_size(self, size):
+        """묶음 다운로드 크기 설정 (1이면 묶지 않음, 워커가 다음 작업부터 적용)"""
+        try:
+            size = int(size)
+        except (TypeError, ValueError):
+            size = DEFAULT_DOWNLOAD_BATCH_SIZE
+        self.download_batch_size = max(1, min(DOWNLOAD_BATCH_MAX_SIZE, size))
+    
+    def _configure_metadata_backend(self, backend: str):
+        """메타데이터 조회 백엔드 구성 (프로세스 내 추출기 생성/해제)"""
+        if backend == METADATA_BACKEND_INPROCESS:
+            if self.metadata_backend:
+                return
+            from core.ytdlp_inprocess import InProcessExtractor
+            extractor = InProcessExtractor(INPROCESS_METADATA_WORKERS)
+            if not extractor.is_available():
+                extractor.shutdown()
+                return
+            self.metadata_backend = extractor
+            download_handler.set_metadata_backend(extractor)
+            log.info("메타데이터 조회 백엔드: inprocess")
+        elif self.metadata_backend:
+            download_handler.set_metadata_backend(None)
+            self.metadata_backend.shutdown()
+            self.metadata_backend = None
+            log.info("메타데이터 조회 백엔드: subprocess")
+    
+    def _start_process_pool(self):
+        """상주 프로세스 풀 생성 및 등록 (실패 시 subprocess 방식 유지)"""
+        if self.process_pool:
+            return
+        # 헬퍼는 감독자에 등록되므로 이전 shutdown 이후 다시 구성하는 경우 먼저 다시 열어 둠 (initialize보다 먼저 호출됨)
+        supervisor.reopen()
+        try:
+            from core.ytdlp_pool import YtDlpProcessPool
+            from utils.utils import get_ffmpeg_path
+            
+            size = max(1, self._target_worker_count) + POOL_EXTRA_HELPERS
+            pool = YtDlpProcessPool(size, get_ffmpeg_path())
+            pool.start()
+            self.process_pool = pool
+            download_handler.set_process_pool(pool)
+        except Exception as e:
+            log.error(f"프로세스 풀 시작 실패, subprocess 방식으로 동작: {e}", exc_info=True)
+            self.process_pool = None
+    
+    def _stop_process_pool(self):
+        """상주 프로세스 풀 해제 및 종료"""
+        if not self.process_pool:
+            return
+        download_handler.set_process_pool(None)
+        pool = self.process_pool
+        self.process_pool = None
+        pool.shutdown()
     
-    def add_task(self, priority: int, task_id: int, url: str, settings: dict, metadata: dict = None):
-        """다운로드 큐에 작업 추가"""
+    def add_task(self, priority: int, task_id: int, url: str, settings: dict, metadata: dict = None,
+                 group=None):
+        """
+        작업 추가
+        - group: 작업이 속한 묶음 (플레이리스트 URL 등, fair 정책에서 묶음끼리 번갈아 받음)
+          None이면 이전에 지정한 묶음 유지 (처음이면 작업 하나가 묶음 하나)
+        - 메타데이터가 없거나 flat 항목뿐이면 선행 조회 대기 큐로 (선행 조회 비활성 시 다운로드 워커가 직접 조회)
+        - 메타데이터가 있으면 바로 다운로드 큐로
+        - 이미 대기 중인 작업(재개/전체 재개)은 새 항목으로 대체 (큐마다 작업당 항목 하나)
+        """
         if metadata is None:
             metadata = {}
-        self.download_queue.put((priority, task_id, url, settings, metadata))
+        if group is not None:
+            self.task_groups[task_id] = group
+        self.bandwidth.set_priority(task_id, priority)
+        entry = QueueEntry((priority, task_id, url, settings, metadata), self._invalidate_task(task_id))
+        if self.metadata_lookahead > 0 and not download_handler.is_metadata_complete(metadata):
+            self.pending_queue.put(entry)
+        else:
+            self.download_queue.put(entry)
+    
+    # --- 메타데이터 선행 조회 단계 ---
+    
+    def _start_metadata_pipeline(self):
+        """선행 조회 워커 시작 (이미 실행 중이면 무시)"""
+        self.metadata_pipeline_workers = [w for w in self.metadata_pipeline_workers if w.is_alive()]
+        for _ in range(METADATA_PIPELINE_WORKERS - len(self.metadata_pipeline_workers)):
+            worker = MetadataWorker(self.pending_queue, self.download_queue, self.stop_event, self)
+            worker.metadata_fetched.connect(self.metadata_fetched.emit)
+            worker.download_finished.connect(self._on_download_finished)
+            worker.start()
+            self.metadata_pipeline_workers.append(worker)
+    
+    def _set_metadata_lookahead(self, depth):
+        """선행 조회 깊이 변경 (0이면 대기 중인 작업을 모두 다운로드 큐로 넘김)"""
+        try:
+            depth = max(0, int(depth))
+        except (TypeError, ValueError):
+            depth = DEFAULT_METADATA_LOOKAHEAD
+        
+        with self._lookahead_cond:
+            self.metadata_lookahead = depth
+            self._lookahead_cond.notify_all()
+        
+        if depth == 0:
+            while True:
+                try:
+                    entry = self.pending_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self.download_queue.put(entry)
+                self.pending_queue.task_done()
+    
+    def acquire_lookahead_slot(self, timeout: float) -> bool:
+        """선행 조회 자리 확보 (준비된 작업이 깊이만큼 쌓여 있으면 대기)"""
+        with self._lookahead_cond:
+            if not self._lookahead_cond.wait_for(
+                lambda: self._lookahead_in_use < self.metadata_lookahead, timeout
+            ):
+                return False
+            self._lookahead_in_use += 1
+            return True
+    
+    def release_lookahead_slot(self):
+        """조회 자리 반납 (작업을 가져오지 못했거나 다운로드 큐에 넣지 않은 경우)"""
+        with self._lookahead_cond:
+            self._lookahead_in_use = max(0, self._lookahead_in_use - 1)
+            self._lookahead_cond.notify()
+    
+    def mark_lookahead_ready(self, task_id: int):
+        """조회를 마치고 다운로드 큐에 넣은 작업 기록 (다운로드 워커가 가져갈 때 자리 반납)"""
+        with self._lookahead_cond:
+            self._lookahead_ready_ids.add(task_id)
+    
+    def on_task_dequeued(self, task_id: int):
+        """다운로드 워커가 작업을 가져감 → 선행 조회로 준비된 작업이면 자리 반납"""
+        with self._lookahead_cond:
+            if task_id in self._lookahead_ready_ids:
+                self._lookahead_ready_ids.discard(task_id)
+                self._lookahead_in_use = max(0, self._lookahead_in_use - 1)
+                self._lookahead_cond.notify()
+    
+    def prefetch_metadata(self, items: list, settings: dict):
+        """
+        여러 작업의 메타데이터를 배치로 미리 조회 (플레이리스트 등록 시)
+        - 결과는 metadata_fetched로 즉시 중계하고, 워커가 다운로드 시작 시 재사용
+        
+        Args:
+            items: (task_id, url) 목록
+            settings: 다운로드 설정 (크기 추정용 포맷 선택)
+        """
+        # 캐시에 있는 항목은 바로 전달하고 나머지만 조회
+        format_selector = download_handler.get_format_selector(settings)
+        pending = []
+        for task_id, url in items:
+            cached = self.metadata_cache.get(url, format_selector)
+            if cached:
+                self._on_metadata_prefetched(task_id, cached)
+            else:
+                pending.append((task_id, url))
+        
+        if not pending:
+            return
+        
+        for start in range(0, len(pending), METADATA_BATCH_SIZE):
+            self.metadata_queue.put((pending[start:start + METADATA_BATCH_SIZE], settings))
+        
+        if not self.metadata_worker or not self.metadata_worker.is_alive():
+            self.metadata_worker = MetadataBatchWorker(
+                self.metadata_queue, self.stop_event, self.metadata_cache, self
+            )
+            self.metadata_worker.metadata_fetched.connect(self._on_metadata_prefetched)
+            self.metadata_worker.start()
+    
+    def _on_metadata_prefetched(self, task_id: int, metadata: dict):
+        """배치 조회 결과 저장 후 시그널 중계"""
+        with self._prefetch_lock:
+            self._prefetched_metadata[task_id] = metadata
+        self.metadata_fetched.emit(task_id, metadata)
+    
+    def take_prefetched_metadata(self, task_id: int):
+        """미리 조회한 메타데이터를 꺼내서 반환 (없으면 None, 스레드 안전)"""
+        with self._prefetch_lock:
+            return self._prefetched_metadata.pop(task_id, None)
     
     def pause_all(self):
-        """모든 다운로드 일시정지"""
+        """
+        모든 다운로드 일시정지
+        - 받는 중인 프로세스는 가능하면 그대로 멈춤 (재개 시 이어서 진행)
+        - 그 외에는 다음 진행률 갱신 때 종료 (이어받기)
+        """
+        for worker in self._runners():
+            worker.suspend_download()
         self.pause_event.clear()
     
-    def resume_all(self):
-        """모든 다운로드 재개"""
+    def resume_all(self) -> set:
+        """
+        모든 다운로드 재개
+        
+        Returns:
+            멈춰 있던 프로세스를 그대로 재개한 task_id 집합 (다시 큐에 넣을 필요 없음)
+        """
         self.pause_event.set()
+        resumed = set()
+        for worker in self.workers:
+            # 개별 일시정지된 작업은 전체 재개 대상에서 제외
+            if self.is_task_paused(worker.current_task_id):
+                continue
+            resumed.update(worker.resume_download())
+        if self.async_engine:
+            # 엔진은 개별 일시정지된 작업을 스스로 제외
+            resumed.update(self.async_engine.resume_download())
+            self.async_engine.wake()
+        if self.remote_coordinator:
+            resumed.update(self.remote_coordinator.resume_download())
+        return resumed
     
     def is_paused(self) -> bool:
         """전체 일시정지 상태인지 확인"""
         return not self.pause_event.is_set()
     
     def pause_task(self, task_id: int):
-        """개별 작업 일시정지 플래그 설정 (스레드 안전)"""
+        """
+        개별 작업 일시정지 플래그 설정 (스레드 안전), 받는 중이면 프로세스를 멈춤
+        - 대기 중이면 큐에서 빼냄 (재개할 때 add_task로 다시 넣음)
+        """
+        for worker in self._runners():
+            if worker.suspend_download(task_id):
+                break
         with self._paused_flags_lock:
             self.task_paused_flags[task_id] = True
+        self._invalidate_task(task_id)
     
-    def resume_task(self, task_id: int):
-        """개별 작업 일시정지 플래그 해제 (스레드 안전)"""
+    def resume_task(self, task_id: int) -> bool:
+        """
+        개별 작업 일시정지 플래그 해제 (스레드 안전)
+        
+        Returns:
+            멈춰 있던 프로세스를 그대로 재개했으면 True (다시 큐에 넣을 필요 없음)
+        """
         with self._paused_flags_lock:
             if task_id in self.task_paused_flags:
                 del self.task_paused_flags[task_id]
+        if self.is_paused():
+            return False
+        return any(worker.resume_download(task_id) for worker in self._runners())
     
     def is_task_paused(self, task_id: int) -> bool:
         """개별 작업이 일시정지 상태인지 확인 (스레드 안전)"""
         with self._paused_flags_lock:
             return self.task_paused_flags.get(task_id, False)
     
+    def cancel_task(self, task_id: int, delete_files: bool = True) -> bool:
+        """
+        작업 즉시 취소
+        - 받는 중이면 yt-dlp/ffmpeg 프로세스 그룹을 바로 종료 (다음 진행률 갱신을 기다리지 않음)
+        - 대기 중이면 큐에서 빼냄
+        
+        Args:
+            task_id: 작업 ID
+            delete_files: 받던 파일(.part 등)도 삭제할지 (False: 목록에서만 제거)
+        
+        Returns:
+            실행 중인 프로세스를 종료했으면 True
+        """
+        with self._paused_flags_lock:
+            self.cancelled_task_ids.add(task_id)
+            self.task_paused_flags.pop(task_id, None)
+            if delete_files:
+                self._keep_files_task_ids.discard(task_id)
+            else:
+                self._keep_files_task_ids.add(task_id)
+        self._invalidate_task(task_id)
+        self.bandwidth.release(task_id)
+        if self.remote_coordinator and self.remote_coordinator.cancel_task(task_id):
+            return True
+        killed = supervisor.cancel_task(task_id)
+        # 대기 중이던 작업은 완료 통지가 오지 않으므로 여기서 정리
+        # (큐 항목은 세대가 바뀌어 다시 실행되지 않음, 실행 중인 작업은 완료 통지에서 정리)
+        if not killed and not self._is_task_running(task_id):
+            self._forget_cancelled(task_id)
+        return killed
+    
+    def is_task_cancelled(self, task_id: int) -> bool:
+        """작업이 취소되었는지 확인 (스레드 안전)"""
+        with self._paused_flags_lock:
+            return task_id in self.cancelled_task_ids
+    
+    def on_task_skipped(self, task_id: int):
+        """러너가 꺼낸 작업을 실행하지 않고 버림 (일시정지/취소/이전 세대) → 완료 통지 대신 취소 상태 정리"""
+        self._forget_cancelled(task_id)
+    
+    def is_entry_current(self, entry) -> bool:
+        """꺼낸 큐 항목이 작업의 최신 세대인지 (그 사이 취소/일시정지/다시 넣기가 없었는지)"""
+        return self.task_generations.is_current(entry)
+    
+    def _forget_cancelled(self, task_id: int):
+        with self._paused_flags_lock:
+            self.cancelled_task_ids.discard(task_id)
+            self._keep_files_task_ids.discard(task_id)
+    
+    def _is_task_running(self, task_id: int) -> bool:
+        """러너가 꺼내 간 작업인지 (동시 실행 자리를 잡았거나 묶음/원격 배정에 포함)"""
+        if self.download_queue.holds(task_id):
+            return True
+        return any(task_id in runner.running_task_ids() for runner in self._runners())
+    
+    def cancel_deletes_files(self, task_id: int) -> bool:
+        """취소된 작업의 받던 파일을 삭제할지 (cancel_task(delete_files=False)면 False)"""
+        with self._paused_flags_lock:
+            return task_id not in self._keep_files_task_ids
+    
+    def is_task_queued(self, task_id: int) -> bool:
+        """작업이 아직 선행 조회 대기 큐나 다운로드 큐에 있는지 확인"""
+        return task_id in self.pending_queue or task_id in self.download_queue
+    
+    def set_task_priority(self, task_id: int, priority: int) -> bool:
+        """
+        대기 중인 작업의 우선순위 변경 (선행 조회 대기 큐와 다운로드 큐 모두, O(log n))
+        
+        Returns:
+            큐에서 작업을 찾아 바꿨으면 True (이미 워커가 가져간 작업은 False)
+        """
+        # 받는 중인 작업이면 대역폭 몫의 가중치만 바뀜
+        self.bandwidth.set_priority(task_id, priority)
+        found = False
+        for target in (self.pending_queue, self.download_queue):
+            found = target.reprioritize(task_id, priority) or found
+        return found
+    
+    def move_task(self, task_id: int, to_top: bool):
+        """
+        대기 중인 작업을 대기열 맨 앞/맨 뒤로 이동 (작업이 있는 큐 안에서)
+        
+        Returns:
+            바뀐 우선순위 (대기 중이 아니면 None)
+        """
+        for target in (self.pending_queue, self.download_queue):
+            priority = target.move_to_top(task_id) if to_top else target.move_to_bottom(task_id)
+            if priority is not None:
+                self.bandwidth.set_priority(task_id, priority)
+                return priority
+        return None
+    
+    def _invalidate_task(self, task_id: int) -> int:
+        """
+        작업의 대기 항목을 큐에서 빼고 세대 번호를 올림
+        - 그 전에 꺼내 간 항목(선행 조회 중, 묶음에서 되돌릴 항목 등)은 큐에 다시 들어오지 못함
+        - 선행 조회로 준비된 항목이었으면 조회 자리 반납 (워커가 가져간 것과 같게 처리)
+        - 미리 조회해 둔 메타데이터도 버림 (다시 넣으면 작업의 메타데이터로 새로 시작)
+        
+        Returns:
+            새 세대 번호 (add_task가 새 항목에 붙임)
+        """
+        generation = self.task_generations.bump(task_id)
+        self.pending_queue.remove(task_id)
+        self.download_queue.remove(task_id)
+        self.on_task_dequeued(task_id)
+        with self._prefetch_lock:
+            self._prefetched_metadata.pop(task_id, None)
+        self.scheduling_policy.discard(task_id)
+        return generation
+    
     def adjust_worker_count(self, target_count: int):
         """
         워커 스레드 수를 동적으로 조절
@@ -94,7 +597,24 @@ class DownloadScheduler(QObject):
         - 줄일 때: '우아한 퇴장(retire_flag)'을 사용하여 현재 작업 완료 후 종료
         """
         # 이미 종료된 워커들을 리스트에서 정리
-        self.workers = [w for w in self.workers if w.isRunning()]
+        self.workers = [w for w in self.workers if w.is_alive()]
+        self._target_worker_count = target_count
+        # 전체 동시 실행 수 (퇴장 중인 워커가 작업을 마칠 때까지 새 워커/엔진이 더 꺼내지 않음, 0이면 멈춤)
+        self.download_queue.set_worker_limit(target_count)
+        self.bandwidth.set_slots(target_count)
+        
+        # 프로세스 풀 크기도 워커 수에 맞춤
+        if self.process_pool:
+            self.process_pool.resize(target_count + POOL_EXTRA_HELPERS)
+        
+        # asyncio 엔진: 워커 스레드를 모두 퇴장시키고 엔진의 동시 실행 수로 조절
+        if self.engine_mode == ENGINE_ASYNC:
+            for worker in self.workers:
+                worker.retire_flag = True
+            self.workers = []
+            self._start_async_engine(target_count)
+            return
+        self._retire_async_engine()
         
         current_count = len(self.workers)
         
@@ -111,10 +631,10 @@ class DownloadScheduler(QObject):
                     self  # 스케줄러를 parent로 전달
                 )
                 # 워커 시그널을 스케줄러 시그널로 연결 (중계)
-                worker.progress_updated.connect(self.progress_updated)
+                worker.progress_updated.connect(self.progress_updated.emit)
                 worker.download_finished.connect(self._on_download_finished)
-                worker.task_started.connect(self.task_started)
-                worker.metadata_fetched.connect(self.metadata_fetched)
+                worker.task_started.connect(self.task_started.emit)
+                worker.metadata_fetched.connect(self.metadata_fetched.emit)
                 worker.start()
                 self.workers.append(worker)
                 
@@ -128,30 +648,135 @@ class DownloadScheduler(QObject):
                     worker = self.workers.pop()
                     worker.retire_flag = True
     
+    def _start_async_engine(self, concurrency: int):
+        """asyncio 엔진 시작 (이미 실행 중이면 동시 실행 수만 변경)"""
+        if self.async_engine and self.async_engine.is_alive():
+            self.async_engine.set_concurrency(concurrency)
+            return
+        log.info(f"asyncio 다운로드 엔진 시작 (동시 실행 {concurrency})")
+        engine = AsyncDownloadEngine(
+            self.download_queue, self.stop_event, self.pause_event, concurrency, self
+        )
+        engine.progress_updated.connect(self.progress_updated.emit)
+        engine.download_finished.connect(self._on_download_finished)
+        engine.task_started.connect(self.task_started.emit)
+        engine.metadata_fetched.connect(self.metadata_fetched.emit)
+        engine.start()
+        self.async_engine = engine
+    
+    def _retire_async_engine(self):
+        """asyncio 엔진 퇴장 (실행 중인 작업을 마친 뒤 종료)"""
+        if self.async_engine:
+            log.info("asyncio 다운로드 엔진 종료 예약")
+            self.async_engine.retire()
+            self.async_engine = None
+    
+    def start_remote_coordinator(self, host: str, port: int, token: str = None):
+        """
+        원격 에이전트 코디네이터 시작 (이미 실행 중이면 그대로 반환)
+        - 로컬 워커와 같은 다운로드 큐에서 작업을 꺼내 접속한 에이전트의 빈 슬롯에 배정
+        
+        Returns:
+            RemoteCoordinator (포트를 열지 못하면 None)
+        """
+        if self.remote_coordinator and self.remote_coordinator.is_alive():
+            return self.remote_coordinator
+        from core.remote_coordinator import RemoteCoordinator
+        coordinator = RemoteCoordinator(
+            self.download_queue, self.stop_event, self.pause_event, host, port, token, self
+        )
+        coordinator.progress_updated.connect(self.progress_updated.emit)
+        coordinator.download_finished.connect(self._on_download_finished)
+        coordinator.task_started.connect(self.task_started.emit)
+        coordinator.metadata_fetched.connect(self.metadata_fetched.emit)
+        coordinator.start()
+        coordinator.started.wait()
+        if coordinator.error is not None or not coordinator.is_alive():
+            log.error(f"원격 코디네이터를 시작할 수 없습니다: {coordinator.error}")
+            return None
+        self.remote_coordinator = coordinator
+        return coordinator
+    
+    def _runners(self) -> list:
+        """일시 중지/재개 대상 (워커 스레드들 또는 asyncio 엔진, 원격 코디네이터)"""
+        runners = self.workers + ([self.async_engine] if self.async_engine else [])
+        if self.remote_coordinator:
+            runners.append(self.remote_coordinator)
+        return runners
+    
     def _on_download_finished(self, success: bool, message: str, task_id: int, final_path: str):
-        """다운로드 완료 시 죽은 워커 정리 후 시그널 중계"""
+        """
+        다운로드 완료 시 동시 실행 자리 반납, 작업별 상태와 죽은 워커 정리 후 시그널 중계
+        - 일시정지로 끝난 작업은 개별 일시정지 플래그를 남김 (전체 재개 시 건너뛰도록)
+        """
+        self.download_queue.release(task_id)
+        self.task_generations.forget(task_id)
+        self.task_groups.pop(task_id, None)
+        self.scheduling_policy.discard(task_id)
+        with self._paused_flags_lock:
+            self.cancelled_task_ids.discard(task_id)
+            self._keep_files_task_ids.discard(task_id)
+            if message != STR.STATUS_PAUSED:
+                self.task_paused_flags.pop(task_id, None)
         # 죽은 스레드 정리
-        self.workers = [w for w in self.workers if w.isRunning()]
+        self.workers = [w for w in self.workers if w.is_alive()]
         # 시그널 중계
         self.download_finished.emit(success, message, task_id, final_path)
     
     def get_worker_count(self) -> int:
-        """현재 활성 워커 수 반환"""
-        self.workers = [w for w in self.workers if w.isRunning()]
+        """현재 활성 워커 수 반환 (asyncio 엔진은 동시 실행 수)"""
+        if self.async_engine and self.async_engine.is_alive():
+            return self.async_engine.concurrency
+        self.workers = [w for w in self.workers if w.is_alive()]
         return len(self.workers)
     
     def shutdown(self):
-        """스케줄러 종료 - 모든 워커 정리"""
-        # 전체 종료 신호 전송
+        """
+        스케줄러 종료 - 모든 워커 정리
+        - 실행 중인 yt-dlp/ffmpeg 프로세스를 한꺼번에 종료하여 워커가 바로 빠져나오게 함
+        - 워커 대기는 워커별이 아닌 전체 공통 제한 시간 안에서 처리
+        """
+        # 전체 종료 신호 전송 (멈춰 둔 프로세스는 재개해야 종료 신호를 받음)
         self.stop_event.set()
+        self._initialized = False
+        if self.autotuner:
+            self.autotuner.stop()
+            self.autotuner = None
+        runners = self._runners()
+        for worker in runners:
+            worker.resume_download()
         
-        # 워커에게 종료 신호 전송 (큐에 종료 마커 추가)
-        for _ in self.workers:
+        # 워커에게 종료 신호 전송 (큐에 종료 마커 추가, asyncio 엔진은 큐 콜백으로 깨어남)
+        for _ in runners:
             self.download_queue.put((SCHEDULER_PRIORITY_NORMAL, None))
         
-        # 워커들이 정리할 시간을 줌
-        for worker in self.workers:
-            if worker.isRunning():
-                worker.wait(WORKER_CLEANUP_WAIT_MS)
+        # 자식 프로세스 일괄 종료 (병렬, 제한 시간 후 강제 종료)
+        supervisor.shutdown(PROCESS_SHUTDOWN_TIMEOUT_SEC)
+        
+        # 메타데이터 선행 조회/배치 조회 스레드에도 종료 신호
+        with self._lookahead_cond:
+            self._lookahead_cond.notify_all()
+        if self.metadata_worker:
+            self.metadata_queue.put(None)
+        
+        # 모든 스레드가 정리할 시간을 줌 (스레드별이 아닌 전체 공통 제한 시간)
+        deadline = time.monotonic() + WORKER_CLEANUP_WAIT_MS / 1000
+        threads = runners + self.metadata_pipeline_workers
+        if self.metadata_worker:
+            threads.append(self.metadata_worker)
+        for worker in threads:
+            remaining = deadline - time.monotonic()
+            if worker.is_alive() and remaining > 0:
+                worker.join(remaining)
+            if worker.is_alive():
+                log.warning(f"{type(worker).__name__}가 제한 시간 내에 종료되지 않았습니다.")
         
         self.workers.clear()
+        self.async_engine = None
+        self.remote_coordinator = None
+        self.metadata_pipeline_workers.clear()
+        self.metadata_worker = None
+        
+        # 상주 프로세스 풀 및 메타데이터 추출기 종료
+        self._stop_process_pool()
+        self._configure_metadata_backend(None)
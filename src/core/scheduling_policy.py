@@ -0,0 +1,132 @@
+"""
+대기열 스케줄링 정책 (같은 우선순위 안에서 어떤 작업을 먼저 받을지)
+- 큐 정렬 키: (우선순위, 순번(맨 위/아래로 옮긴 작업), 정책 키..., task_id)
+    → 이어받기(우선순위 1)와 사용자가 옮긴 순서는 정책과 관계없이 그대로 유지
+- 정책 키는 항목을 넣을 때 한 번 계산 (큐 잠금 안에서 호출되므로 가볍게, 힙 연산은 O(log n) 그대로)
+- fifo: 등록 순 (기존 동작)
+- sjf:  예상 크기(video_size + audio_size)가 작은 작업 먼저
+        (크기를 모르는 선행 조회 대기 항목은 재생 시간으로 추정 → 선행 조회도 짧은 작업부터)
+- fair: 묶음(플레이리스트/일괄 등록)끼리 번갈아 받음 (시작 시각 기준 공정 큐잉)
+        → 2,000개짜리 플레이리스트 뒤에 넣은 URL 하나도 다음 차례에 받음
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from constants import (
+    SCHEDULING_POLICIES, SCHEDULING_FIFO, SCHEDULING_SJF, SCHEDULING_FAIR,
+    SJF_BYTES_PER_SECOND, SJF_UNKNOWN_JOB_BYTES
+)
+
+
+def estimate_job_bytes(metadata: Optional[Dict]) -> int:
+    """
+    작업의 예상 다운로드 크기 (바이트)
+    - 메타데이터 조회 결과의 video_size + audio_size
+    - 크기가 없으면(flat 항목 등) 재생 시간 × SJF_BYTES_PER_SECOND, 그것도 없으면 SJF_UNKNOWN_JOB_BYTES
+    """
+    if metadata:
+        size = (metadata.get('video_size') or 0) + (metadata.get('audio_size') or 0)
+        if size > 0:
+            return int(size)
+        duration = metadata.get('duration') or 0
+        if duration > 0:
+            return int(duration * SJF_BYTES_PER_SECOND)
+    return SJF_UNKNOWN_JOB_BYTES
+
+
+class SchedulingPolicy:
+    """
+    스케줄링 정책 기본 클래스 (등록 순 = fifo)
+    - key(entry): 정렬 키 중 정책 부분 (튜플, 작을수록 먼저)
+    - dispatched(entry): 다운로드 큐에서 실행하려고 꺼냈을 때 (다음 키 계산에 반영할 상태 갱신)
+    - discard(task_id): 작업을 다시 넣거나 일시정지/취소해 대기 항목이 없어질 때 (작업별 상태 정리)
+    - key/dispatched는 큐 잠금 안에서 호출 (두 큐가 같은 정책을 공유하므로 상태는 정책 잠금으로 보호)
+    """
+
+    name = SCHEDULING_FIFO
+
+    def key(self, entry: tuple) -> Tuple:
+        return ()
+
+    def dispatched(self, entry: tuple) -> None:
+        pass
+
+    def discard(self, task_id: int) -> None:
+        pass
+
+
+class FifoPolicy(SchedulingPolicy):
+    """등록 순 (task_id 순서)"""
+
+
+class ShortestJobFirstPolicy(SchedulingPolicy):
+    """예상 크기가 작은 작업 먼저 (큰 파일 하나가 작은 파일 여러 개를 막지 않도록)"""
+
+    name = SCHEDULING_SJF
+
+    def key(self, entry: tuple) -> Tuple:
+        return (estimate_job_bytes(entry[4] if len(entry) >= 5 else None),)
+
+
+class FairSharePolicy(SchedulingPolicy):
+    """
+    묶음(플레이리스트/일괄 등록)끼리 번갈아 받는 공정 큐잉 (start-time fair queuing, 작업당 비용 1)
+    - 작업의 차례 = max(현재 차례, 같은 묶음의 마지막 차례 + 1) → 묶음마다 한 차례에 하나씩
+    - 묶음이 없는 작업은 작업 하나가 묶음 하나 (단일 URL은 지금 차례에 바로 끼어듦)
+    - 차례는 처음 넣을 때 정해 두고 유지 (선행 조회 → 다운로드 큐, 묶음에서 되돌린 항목도 같은 차례)
+    """
+
+    name = SCHEDULING_FAIR
+
+    def __init__(self, group_of: Callable[[int], Optional[Hashable]]):
+        self.group_of = group_of
+        self._tags: Dict[int, int] = {}  # task_id -> 차례
+        self._group_next: Dict[Hashable, int] = {}  # 묶음 -> 다음 작업의 최소 차례
+        self._virtual_time = 0  # 마지막으로 꺼낸 작업의 차례
+        self._lock = threading.Lock()
+
+    def key(self, entry: tuple) -> Tuple:
+        task_id = entry[1]
+        with self._lock:
+            tag = self._tags.get(task_id)
+            if tag is None:
+                group = self.group_of(task_id)
+                if group is None:
+                    group = ('task', task_id)
+                tag = max(self._virtual_time, self._group_next.get(group, 0))
+                self._group_next[group] = tag + 1
+                self._tags[task_id] = tag
+            return (tag,)
+
+    def dispatched(self, entry: tuple) -> None:
+        with self._lock:
+            tag = self._tags.get(entry[1])
+            if tag is not None and tag > self._virtual_time:
+                self._virtual_time = tag
+                # 뒤처진 묶음 기록 정리 (현재 차례 이하면 기본값과 같음)
+                if len(self._group_next) > len(self._tags):
+                    self._group_next = {
+                        group: next_tag for group, next_tag in self._group_next.items()
+                        if next_tag > self._virtual_time
+                    }
+
+    def discard(self, task_id: int) -> None:
+        with self._lock:
+            self._tags.pop(task_id, None)
+
+
+def create_policy(name: str, group_of: Optional[Callable[[int], Any]] = None) -> SchedulingPolicy:
+    """
+    이름으로 정책 생성 (알 수 없는 이름은 ValueError)
+
+    Args:
+        name: SCHEDULING_POLICIES 중 하나
+        group_of: task_id → 묶음 키 (없으면 None, fair 정책에서 사용)
+    """
+    if name == SCHEDULING_SJF:
+        return ShortestJobFirstPolicy()
+    if name == SCHEDULING_FAIR:
+        return FairSharePolicy(group_of or (lambda task_id: None))
+    if name == SCHEDULING_FIFO:
+        return FifoPolicy()
+    raise ValueError(f"unknown scheduling policy: {name!r} (choose from {', '.join(SCHEDULING_POLICIES)})")
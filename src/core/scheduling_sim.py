@@ -0,0 +1,146 @@
+"""
+스케줄링 정책 시뮬레이션 (python -m cli --simulate)
+- 실제 대기열(LimitedPriorityQueue)과 정책 객체를 그대로 사용하는 이산 사건 시뮬레이션
+- 다운로드 시간 = 크기 / 다운로드 하나의 속도 (동시 다운로드 수만큼 병렬, 중간에 끼어들기 없음)
+- 크기는 미리 알고 있다고 가정 (실제로는 선행 조회가 끝난 작업부터 크기가 반영됨)
+- 사이트별 제한(site_limits)을 주면 워커처럼 제한을 적용해 꺼냄 (limited=True, 완료 시 자리 반납)
+- 사이트별 전체 속도(site_throughput)는 시작 시점에 그 사이트에서 받는 중인 작업 수로 나눠 고정
+  (한 사이트가 느려도 제한이 없으면 모든 자리를 차지해 다른 사이트 작업이 뒤에서 기다림)
+- 결과: makespan(전체 완료 시각), 평균 완료 시간(등록 → 완료), 대기 시간(등록 → 시작) 평균/p95/최대,
+        묶음별 평균 대기 시간 (단독 작업은 'single')
+"""
+import heapq
+import math
+import random
+from queue import Empty
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from core.scheduling_policy import create_policy
+from core.task_queue import LimitedPriorityQueue, QueueEntry
+from constants import SCHEDULING_POLICIES, SCHEDULING_SIM_THROUGHPUT, TASK_PRIORITY_NORMAL
+
+_MB = 1024 * 1024
+
+
+class SimJob(NamedTuple):
+    """시뮬레이션 작업 (arrival: 등록 시각(초), size: 바이트, group: 묶음(None이면 단독), site: 추출기 이름)"""
+    arrival: float
+    size: int
+    group: Optional[str] = None
+    priority: int = TASK_PRIORITY_NORMAL
+    site: str = ''
+
+
+def default_workload(seed: int = 1) -> List[SimJob]:
+    """
+    기본 작업 부하 (같은 seed면 같은 결과)
+    - 0초: 300개짜리 플레이리스트 (크기는 로그 정규 분포, 중앙값 40MB)
+    - 120초: 60개짜리 짧은 영상 플레이리스트 (중앙값 8MB)
+    - 30초마다: 단일 URL 15개
+    """
+    rng = random.Random(seed)
+
+    def size(median_mb: float) -> int:
+        return max(_MB, int(rng.lognormvariate(math.log(median_mb), 1.0) * _MB))
+
+    jobs = [SimJob(0.0, size(40), 'playlist:long') for _ in range(300)]
+    jobs += [SimJob(120.0, size(8), 'playlist:short') for _ in range(60)]
+    jobs += [SimJob(30.0 * (i + 1), size(40)) for i in range(15)]
+    return jobs
+
+
+def simulate(policy: str, jobs: Optional[List[SimJob]] = None, workers: int = 3,
+             throughput: float = SCHEDULING_SIM_THROUGHPUT, site_limits: Optional[Dict[str, int]] = None,
+             site_throughput: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """
+    작업 부하를 정책 하나로 실행한 결과
+
+    Args:
+        policy: SCHEDULING_POLICIES 중 하나
+        jobs: 작업 목록 (없으면 default_workload())
+        workers: 동시 다운로드 수
+        throughput: 다운로드 하나의 속도 (바이트/초)
+        site_limits: 사이트별 동시 실행 수 (extractor_limits 형식, 없으면 제한 없이 꺼냄)
+        site_throughput: 사이트별 전체 속도 (바이트/초, 같은 사이트의 동시 다운로드가 나눠 씀)
+
+    Returns:
+        {'jobs', 'makespan', 'mean_completion', 'mean_wait', 'p95_wait', 'max_wait', 'group_mean_wait'} (시간은 초)
+    """
+    if jobs is None:
+        jobs = default_workload()
+    if not jobs:
+        return {'jobs': 0, 'makespan': 0.0, 'mean_completion': 0.0, 'mean_wait': 0.0, 'p95_wait': 0.0,
+                'max_wait': 0.0, 'group_mean_wait': {}}
+
+    groups = {}
+    queue = LimitedPriorityQueue(policy=create_policy(policy, groups.get))
+    limited = bool(site_limits)
+    if limited:
+        queue.configure_limits(site_limits)
+    site_throughput = site_throughput or {}
+    site_active = {}  # 사이트 -> 받는 중인 작업 수
+    arrivals = sorted(enumerate(jobs), key=lambda item: (item[1].arrival, item[0]))
+    running = []  # (완료 시각, task_id)
+    free = max(1, workers)
+    waits = []
+    group_waits = {}  # 묶음 -> 대기 시간 목록
+    completions = []
+    finish_time = 0.0
+    next_arrival = 0
+
+    while next_arrival < len(arrivals) or running:
+        upcoming = arrivals[next_arrival][1].arrival if next_arrival < len(arrivals) else math.inf
+        now = min(upcoming, running[0][0] if running else math.inf)
+
+        # 같은 시각의 완료를 먼저 처리 (빈자리에 새로 도착한 작업도 바로 들어갈 수 있도록)
+        while running and running[0][0] <= now:
+            _, task_id = heapq.heappop(running)
+            free += 1
+            site_active[jobs[task_id].site] -= 1
+            queue.release(task_id)
+        while next_arrival < len(arrivals) and arrivals[next_arrival][1].arrival <= now:
+            task_id, job = arrivals[next_arrival]
+            next_arrival += 1
+            if job.group is not None:
+                groups[task_id] = job.group
+            metadata = {'video_size': job.size, 'audio_size': 0, 'extractor': job.site}
+            queue.put(QueueEntry((job.priority, task_id, '', {}, metadata)))
+
+        while free and queue.qsize():
+            try:
+                entry = queue.get_nowait(limited=limited)
+            except Empty:
+                break  # 남은 작업은 모두 자리가 찬 사이트 (다음 완료까지 대기)
+            queue.task_done()
+            job = jobs[entry[1]]
+            site_active[job.site] = site_active.get(job.site, 0) + 1
+            rate = throughput
+            if job.site in site_throughput:
+                rate = min(rate, site_throughput[job.site] / site_active[job.site])
+            done = now + job.size / rate
+            heapq.heappush(running, (done, entry[1]))
+            free -= 1
+            waits.append(now - job.arrival)
+            group_waits.setdefault(job.group or 'single', []).append(now - job.arrival)
+            completions.append(done - job.arrival)
+            finish_time = max(finish_time, done)
+
+    waits.sort()
+    first_arrival = arrivals[0][1].arrival
+    return {
+        'jobs': len(jobs),
+        'makespan': round(finish_time - first_arrival, 1),
+        'mean_completion': round(sum(completions) / len(completions), 1),
+        'mean_wait': round(sum(waits) / len(waits), 1),
+        'p95_wait': round(waits[max(0, math.ceil(0.95 * len(waits)) - 1)], 1),
+        'max_wait': round(waits[-1], 1),
+        'group_mean_wait': {group: round(sum(values) / len(values), 1) for group, values in group_waits.items()},
+    }
+
+
+def compare_policies(jobs: Optional[List[SimJob]] = None, workers: int = 3,
+                     throughput: float = SCHEDULING_SIM_THROUGHPUT) -> Dict[str, Dict[str, Any]]:
+    """같은 작업 부하를 모든 정책으로 실행한 결과 (정책 이름 -> simulate 결과)"""
+    if jobs is None:
+        jobs = default_workload()
+    return {name: simulate(name, jobs, workers, throughput) for name in SCHEDULING_POLICIES}
@@ -0,0 +1,614 @@
+"""
+다운로드 큐
+- IndexedPriorityQueue: task_id로 찾아 우선순위 변경/제거/맨 위·아래로 이동할 수 있는 우선순위 큐
+    - 작업마다 항목은 하나 (같은 작업을 다시 넣으면 기존 항목을 대체)
+    - 세대 번호가 지난 항목은 넣을 때 버림 → 일시정지/취소 전에 꺼내 간 항목이 되돌아와도 워커까지 가지 않음
+    - 같은 우선순위 안의 순서는 스케줄링 정책(core.scheduling_policy)이 정함 (기본 fifo)
+- LimitedPriorityQueue: 키별 동시 실행 제한
+    - 추출기별(youtube 등) / 호스트별 / 전체 동시 실행 수를 제한
+    - 꺼낼 때 자리가 남은 키의 작업 중 우선순위가 가장 높은 작업을 반환
+      (자리가 찬 키의 작업은 큐에 그대로 두고 건너뜀 → 한 사이트가 막혀도 다른 사이트 작업은 계속 진행)
+    - 자리는 작업을 꺼낼 때 잡고, 완료 통지(스케줄러)나 큐에 되돌릴 때, 실행하지 않고 버릴 때 반납
+"""
+import itertools
+import threading
+import time
+from queue import Empty
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from core.async_engine import NotifyingPriorityQueue
+from core.scheduling_policy import FifoPolicy, SchedulingPolicy
+from utils.utils import is_youtube_url
+
+_NOTHING = object()
+
+
+def _is_sentinel(entry: Any) -> bool:
+    return not isinstance(entry, tuple) or len(entry) < 2 or entry[1] is None
+
+
+def _limit_value(value: Any) -> int:
+    """설정값 → 제한 수 (0 이하나 잘못된 값은 제한 없음)"""
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+class QueueEntry(tuple):
+    """
+    큐 항목 (priority, task_id, url, settings, metadata) + 세대 번호
+    - 튜플과 똑같이 비교/언패킹/슬라이스 가능 (기존 워커/엔진 코드 그대로 사용)
+    """
+
+    def __new__(cls, items, generation: int = 0):
+        entry = super().__new__(cls, items)
+        entry.generation = generation
+        return entry
+
+
+def replace_entry(entry: tuple, **fields) -> tuple:
+    """항목의 일부 필드(priority, metadata)만 바꾼 새 항목 (세대 번호 유지)"""
+    items = list(entry)
+    if 'priority' in fields:
+        items[0] = fields['priority']
+    if 'metadata' in fields:
+        items[4] = fields['metadata']
+    if isinstance(entry, QueueEntry):
+        return QueueEntry(items, entry.generation)
+    return tuple(items)
+
+
+class TaskGenerations:
+    """
+    작업별 현재 세대 번호 (선행 조회 대기 큐와 다운로드 큐가 함께 사용, 스레드 안전)
+    - 다시 넣기/일시정지/취소마다 새 번호 → 그 전에 꺼내 간 항목은 이전 세대가 되어 큐에 되돌아오지 못함
+    - 번호는 전체에서 증가하므로 잊은(완료된) 작업의 항목도 다시 맞을 일이 없음
+    """
+
+    def __init__(self):
+        self._current: Dict[int, int] = {}
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def bump(self, task_id: int) -> int:
+        with self._lock:
+            generation = next(self._counter)
+            self._current[task_id] = generation
+            return generation
+
+    def forget(self, task_id: int) -> None:
+        with self._lock:
+            self._current.pop(task_id, None)
+
+    def is_current(self, entry: tuple) -> bool:
+        """세대 번호가 없는 항목(직접 만든 튜플)은 항상 유효"""
+        generation = getattr(entry, 'generation', None)
+        if generation is None:
+            return True
+        with self._lock:
+            return self._current.get(entry[1]) == generation
+
+
+class _Node:
+    __slots__ = ('key', 'entry', 'index', 'heap')
+
+    def __init__(self, key: tuple, entry: Any):
+        self.key = key
+        self.entry = entry
+        self.index = 0
+        self.heap: Optional['_NodeHeap'] = None
+
+
+class _NodeHeap:
+    """
+    위치 인덱스를 가진 이진 힙 (노드가 자기 위치를 알아 중간 항목도 O(log n)에 제거/갱신)
+    - keys: 이 힙 항목들의 동시 실행 제한 키 (LimitedPriorityQueue의 키별 힙)
+    """
+    __slots__ = ('nodes', 'keys')
+
+    def __init__(self, keys: Tuple[Tuple[str, str], ...] = ()):
+        self.nodes: List[_Node] = []
+        self.keys = keys
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def top(self) -> _Node:
+        return self.nodes[0]
+
+    def push(self, node: _Node) -> None:
+        node.heap = self
+        node.index = len(self.nodes)
+        self.nodes.append(node)
+        self._sift_up(node.index)
+
+    def delete(self, node: _Node) -> None:
+        nodes = self.nodes
+        index = node.index
+        last = nodes.pop()
+        node.heap = None
+        if index < len(nodes):
+            nodes[index] = last
+            last.index = index
+            self._sift_down(index)
+            self._sift_up(last.index)
+
+    def update(self, node: _Node) -> None:
+        """노드의 정렬 키가 바뀐 뒤 위치 복원"""
+        self._sift_up(node.index)
+        self._sift_down(node.index)
+
+    def heapify(self) -> None:
+        for index in reversed(range(len(self.nodes) // 2)):
+            self._sift_down(index)
+
+    def _sift_up(self, index: int) -> None:
+        nodes = self.nodes
+        node = nodes[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if nodes[parent].key <= node.key:
+                break
+            nodes[index] = nodes[parent]
+            nodes[index].index = index
+            index = parent
+        nodes[index] = node
+        node.index = index
+
+    def _sift_down(self, index: int) -> None:
+        nodes = self.nodes
+        size = len(nodes)
+        node = nodes[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and nodes[child + 1].key < nodes[child].key:
+                child += 1
+            if node.key <= nodes[child].key:
+                break
+            nodes[index] = nodes[child]
+            nodes[index].index = index
+            index = child
+        nodes[index] = node
+        node.index = index
+
+
+class IndexedPriorityQueue(NotifyingPriorityQueue):
+    """
+    task_id로 항목을 찾아 바꿀 수 있는 우선순위 큐 (위치 인덱스를 가진 이진 힙)
+    - reprioritize / remove / move_to_top / move_to_bottom: O(log n)
+    - 정렬 키: (우선순위, 순번, 정책 키..., task_id) - 순번은 맨 위/아래로 옮길 때만 바뀜
+      (정책 키는 스케줄링 정책이 정함, fifo면 비어 있어 같은 우선순위 안에서는 등록 순)
+    - 이전 세대 항목을 버리면 on_drop(task_id) 호출 (큐 잠금 안에서 호출되므로 블로킹 없이 끝나야 함)
+    """
+
+    def __init__(self, maxsize: int = 0, generations: Optional[TaskGenerations] = None,
+                 on_drop: Optional[Callable[[int], None]] = None, policy: Optional[SchedulingPolicy] = None):
+        self.policy = policy or FifoPolicy()
+        super().__init__(maxsize)
+        self.generations = generations
+        self.on_drop = on_drop
+
+    def _init(self, maxsize: int) -> None:
+        self._heap = _NodeHeap()
+        self._index: Dict[int, _Node] = {}
+        self._ranks: Dict[int, int] = {}  # 맨 위(음수)/아래(양수)로 옮긴 작업의 순번
+        self._priority_counts: Dict[int, int] = {}  # 우선순위별 항목 수 (맨 위/아래로 옮길 때 사용)
+        self._top_rank = 0
+        self._bottom_rank = 0
+
+    # --- queue.Queue 확장 지점 (큐 잠금 안에서 호출) ---
+
+    def _qsize(self) -> int:
+        return sum(len(heap) for heap in self._heaps())
+
+    def _put(self, item) -> None:
+        if not _is_sentinel(item):
+            task_id = item[1]
+            if self.generations is not None and not self.generations.is_current(item):
+                # 일시정지/취소/다시 넣기 전에 꺼내 간 항목 → 버림 (put()이 늘리는 미완료 수 상쇄)
+                self.unfinished_tasks -= 1
+                if self.on_drop:
+                    self.on_drop(task_id)
+                return
+            node = self._index.get(task_id)
+            if node is not None:
+                # 같은 작업은 항목 하나만 유지 (재개/전체 재개로 다시 넣어도 중복 없음)
+                self.unfinished_tasks -= 1
+                self._set_entry(node, item)
+                self._notify_listeners()
+                return
+        self._push(item)
+        self._notify_listeners()
+
+    def _get(self) -> Any:
+        return self._pop_root()
+
+    def set_policy(self, policy: SchedulingPolicy) -> None:
+        """스케줄링 정책 교체 (대기 항목의 정렬 키를 다시 계산해 힙 재구성, O(n))"""
+        with self.mutex:
+            self.policy = policy
+            for heap in self._heaps():
+                for node in heap.nodes:
+                    node.key = self._key(node.entry)
+                heap.heapify()
+            self._notify_listeners()
+
+    # --- task_id로 조작 ---
+
+    def __contains__(self, task_id: int) -> bool:
+        with self.mutex:
+            return task_id in self._index
+
+    def remove(self, task_id: int) -> bool:
+        """대기 중인 작업 항목 제거 (없으면 False)"""
+        with self.mutex:
+            self._ranks.pop(task_id, None)
+            node = self._index.pop(task_id, None)
+            if node is None:
+                return False
+            self._count(node.entry[0], -1)
+            node.heap.delete(node)
+            self.unfinished_tasks -= 1
+            if self.unfinished_tasks <= 0:
+                self.all_tasks_done.notify_all()
+            self.not_full.notify()
+            return True
+
+    def reprioritize(self, task_id: int, priority: int) -> bool:
+        """대기 중인 작업의 우선순위 변경 (없으면 False)"""
+        with self.mutex:
+            node = self._index.get(task_id)
+            if node is None:
+                return False
+            if node.entry[0] != priority:
+                self._set_entry(node, replace_entry(node.entry, priority=priority))
+            return True
+
+    def move_to_top(self, task_id: int) -> Optional[int]:
+        """
+        대기 중인 작업을 맨 앞으로 (가장 높은 우선순위로 올리고 그 안에서 첫 번째)
+
+        Returns:
+            바뀐 우선순위 (큐에 없으면 None)
+        """
+        with self.mutex:
+            node = self._index.get(task_id)
+            if node is None:
+                return None
+            self._top_rank -= 1
+            self._ranks[task_id] = self._top_rank
+            priority = min(self._priority_counts)
+            self._set_entry(node, replace_entry(node.entry, priority=priority))
+            return priority
+
+    def move_to_bottom(self, task_id: int) -> Optional[int]:
+        """
+        대기 중인 작업을 맨 뒤로 (가장 낮은 우선순위로 내리고 그 안에서 마지막)
+
+        Returns:
+            바뀐 우선순위 (큐에 없으면 None)
+        """
+        with self.mutex:
+            node = self._index.get(task_id)
+            if node is None:
+                return None
+            self._bottom_rank += 1
+            self._ranks[task_id] = self._bottom_rank
+            priority = max(self._priority_counts)
+            self._set_entry(node, replace_entry(node.entry, priority=priority))
+            return priority
+
+    # --- 힙 (큐 잠금 안에서 호출) ---
+
+    def _key(self, entry: Any) -> tuple:
+        if _is_sentinel(entry):
+            # 종료 신호는 같은 우선순위의 작업보다 먼저
+            return (entry[0] if isinstance(entry, tuple) and entry else 0, 0, -1)
+        return (entry[0], self._ranks.get(entry[1], 0)) + self.policy.key(entry) + (entry[1],)
+
+    def _count(self, priority: int, delta: int) -> None:
+        count = self._priority_counts.get(priority, 0) + delta
+        if count > 0:
+            self._priority_counts[priority] = count
+        else:
+            self._priority_counts.pop(priority, None)
+
+    def _heaps(self) -> Tuple[_NodeHeap, ...]:
+        return (self._heap,)
+
+    def _heap_for(self, entry: Any) -> _NodeHeap:
+        """항목을 넣을 힙"""
+        return self._heap
+
+    def _first_heap(self) -> Optional[_NodeHeap]:
+        """맨 앞 항목이 있는 힙 (비었으면 None)"""
+        return self._heap if self._heap else None
+
+    def _push(self, entry: Any) -> None:
+        node = _Node(self._key(entry), entry)
+        if not _is_sentinel(entry):
+            self._index[entry[1]] = node
+            self._count(entry[0], 1)
+        self._heap_for(entry).push(node)
+
+    def _pop_root(self) -> Any:
+        return self._pop_node(self._first_heap().top())
+
+    def _pop_node(self, node: _Node) -> Any:
+        entry = node.entry
+        if not _is_sentinel(entry):
+            self._index.pop(entry[1], None)
+            self._count(entry[0], -1)
+        node.heap.delete(node)
+        return entry
+
+    def _set_entry(self, node: _Node, entry: Any) -> None:
+        self._count(node.entry[0], -1)
+        self._count(entry[0], 1)
+        node.entry = entry
+        node.key = self._key(entry)
+        heap = self._heap_for(entry)
+        if heap is node.heap:
+            heap.update(node)
+        else:
+            # 메타데이터가 바뀌어 제한 키가 달라짐 (LimitedPriorityQueue)
+            node.heap.delete(node)
+            heap.push(node)
+
+    def _notify_listeners(self) -> None:
+        # 큐 잠금 안에서 호출되므로 콜백은 블로킹 없이 끝나야 함 (call_soon_threadsafe 등)
+        for callback in list(self._listeners):
+            callback()
+
+
+class ConcurrencyLimiter:
+    """
+    키별 실행 중 작업 수 집계 (LimitedPriorityQueue의 잠금 안에서만 사용)
+    - 키: ('extractor', 이름), ('host', 호스트)
+    - 제한이 설정된 키만 작업에 붙이므로 제한이 없으면 집계 비용도 없음
+    """
+
+    def __init__(self):
+        self.extractor_limits: Dict[str, int] = {}
+        self.host_limits: Dict[str, int] = {}
+        self.per_host_limit = 0  # host_limits에 없는 호스트마다 적용 (0이면 제한 없음)
+        self.global_limit = 0  # 전체 동시 실행 수 (0이면 제한 없음)
+        self.suspended = False  # 워커가 0명 (자동 조절 유휴 상태) → 어떤 작업도 꺼내지 않음
+        self._counts: Dict[Tuple[str, str], int] = {}
+        self._active: Dict[int, Tuple[Tuple[str, str], ...]] = {}
+
+    def configure(self, extractor_limits: Optional[Dict] = None, host_limits: Optional[Dict] = None,
+                  per_host_limit: Any = 0) -> None:
+        self.extractor_limits = {
+            str(k).lower(): _limit_value(v) for k, v in (extractor_limits or {}).items() if _limit_value(v)
+        }
+        self.host_limits = {
+            _normalize_host(k): _limit_value(v) for k, v in (host_limits or {}).items() if _limit_value(v)
+        }
+        self.per_host_limit = _limit_value(per_host_limit)
+
+    def keys_for(self, url: str, metadata: Optional[Dict]) -> Tuple[Tuple[str, str], ...]:
+        """작업에 적용되는 제한 키 목록"""
+        keys = []
+        extractor = str((metadata or {}).get('extractor') or '').split(':')[0].lower()
+        if not extractor and url and is_youtube_url(url):
+            extractor = 'youtube'  # 메타데이터 조회 전 작업도 같은 자리를 쓰도록
+        if extractor in self.extractor_limits:
+            keys.append(('extractor', extractor))
+        host = _normalize_host(urlsplit(url or '').hostname or '')
+        if host and (host in self.host_limits or self.per_host_limit):
+            keys.append(('host', host))
+        return tuple(keys)
+
+    def limit_for(self, key: Tuple[str, str]) -> int:
+        kind, name = key
+        if kind == 'extractor':
+            return self.extractor_limits.get(name, 0)
+        return self.host_limits.get(name, self.per_host_limit)
+
+    def can_start(self, keys: Tuple[Tuple[str, str], ...]) -> bool:
+        if self.suspended:
+            return False
+        if self.global_limit and len(self._active) >= self.global_limit:
+            return False
+        for key in keys:
+            limit = self.limit_for(key)
+            if limit and self._counts.get(key, 0) >= limit:
+                return False
+        return True
+
+    def acquire(self, task_id: int, keys: Tuple[Tuple[str, str], ...]) -> None:
+        self.release(task_id)
+        self._active[task_id] = keys
+        for key in keys:
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    def release(self, task_id: int) -> bool:
+        """작업의 자리 반납 (잡고 있던 자리가 없으면 False)"""
+        keys = self._active.pop(task_id, None)
+        if keys is None:
+            return False
+        for key in keys:
+            count = self._counts.get(key, 0) - 1
+            if count > 0:
+                self._counts[key] = count
+            else:
+                self._counts.pop(key, None)
+        return True
+
+    def holds(self, task_id: int) -> bool:
+        return task_id in self._active
+
+    def snapshot(self) -> Dict[str, int]:
+        """키별 실행 중 작업 수 ('extractor:youtube' 형식, 상태 조회용)"""
+        counts = {f"{kind}:{name}": count for (kind, name), count in self._counts.items()}
+        counts['total'] = len(self._active)
+        return counts
+
+
+def _normalize_host(host: str) -> str:
+    host = str(host).lower().strip('.')
+    return host[4:] if host.startswith('www.') else host
+
+
+class LimitedPriorityQueue(IndexedPriorityQueue):
+    """
+    키별 동시 실행 제한이 있는 우선순위 큐 (task_id로 조작하는 기능은 IndexedPriorityQueue)
+    - 항목은 제한 키(추출기/호스트)가 같은 것끼리 힙을 따로 둠
+      → 꺼낼 때 자리가 남은 키 힙의 맨 앞만 비교 (키 수 k에 대해 O(k + log n), 막힌 키의 항목은 건드리지 않음)
+    - get()은 자리가 남은 작업이 없으면 새 작업이 들어오거나 자리가 반납될 때까지 대기
+      (자리 하나가 반납되면 꺼낼 수 있는 작업이 있을 때만 대기자 하나를 깨움)
+    - 종료 신호는 제한 없이 바로 꺼냄
+    - limited=False로 꺼내면 제한/집계 없이 우선순위 순서대로 (원격 코디네이터: 에이전트가 자체 제한 적용)
+    """
+
+    def __init__(self, maxsize: int = 0, generations: Optional[TaskGenerations] = None,
+                 on_drop: Optional[Callable[[int], None]] = None, policy: Optional[SchedulingPolicy] = None):
+        self.limiter = ConcurrencyLimiter()
+        super().__init__(maxsize, generations, on_drop, policy)
+
+    def _init(self, maxsize: int) -> None:
+        super()._init(maxsize)
+        # 제한 키 -> 그 키의 대기 항목 힙 (종료 신호는 self._heap)
+        self._groups: Dict[Tuple[Tuple[str, str], ...], _NodeHeap] = {}
+
+    def configure_limits(self, extractor_limits: Optional[Dict] = None, host_limits: Optional[Dict] = None,
+                         per_host_limit: Any = 0) -> None:
+        with self.mutex:
+            self.limiter.configure(extractor_limits, host_limits, per_host_limit)
+            # 키 계산 방식이 바뀌었으므로 대기 항목을 새 키 힙으로 다시 나눔 (설정 변경 시에만, O(n log n))
+            nodes = [node for heap in self._groups.values() for node in heap.nodes]
+            self._groups = {}
+            for node in nodes:
+                self._heap_for(node.entry).push(node)
+            self._notify_waiters()
+
+    def set_global_limit(self, limit: int) -> None:
+        with self.mutex:
+            self.limiter.global_limit = _limit_value(limit)
+            self._notify_waiters()
+
+    def set_worker_limit(self, count: int) -> None:
+        """
+        워커 수에 맞춘 전체 동시 실행 수
+        - 0이면 제한 없음이 아니라 꺼내기를 멈춤 (자동 조절이 유휴 워커를 모두 퇴장시킨 상태)
+        """
+        with self.mutex:
+            count = _limit_value(count)
+            self.limiter.suspended = count == 0
+            self.limiter.global_limit = count
+            self._notify_waiters()
+
+    def release(self, task_id: int) -> None:
+        """작업의 자리 반납 (완료/실행하지 않고 버림) → 기다리던 작업을 꺼낼 수 있게 깨움"""
+        with self.mutex:
+            if self.limiter.release(task_id):
+                self._notify_waiters(1)
+
+    def holds(self, task_id: int) -> bool:
+        """작업이 동시 실행 자리를 잡고 있는지 (제한을 적용해 꺼낸 뒤 아직 반납하지 않음)"""
+        with self.mutex:
+            return self.limiter.holds(task_id)
+
+    def active_counts(self) -> Dict[str, int]:
+        with self.mutex:
+            return self.limiter.snapshot()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None, limited: bool = True) -> Any:
+        with self.not_empty:
+            if not block:
+                item = self._take(limited)
+                if item is _NOTHING:
+                    raise Empty
+            elif timeout is None:
+                item = self._take(limited)
+                while item is _NOTHING:
+                    self.not_empty.wait()
+                    item = self._take(limited)
+            else:
+                if timeout < 0:
+                    raise ValueError("'timeout' must be a non-negative number")
+                deadline = time.monotonic() + timeout
+                item = self._take(limited)
+                while item is _NOTHING:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0.0:
+                        raise Empty
+                    self.not_empty.wait(remaining)
+                    item = self._take(limited)
+            self.not_full.notify()
+            return item
+
+    def get_nowait(self, limited: bool = True) -> Any:
+        return self.get(False, limited=limited)
+
+    def _heaps(self) -> Tuple[_NodeHeap, ...]:
+        return (self._heap,) + tuple(self._groups.values())
+
+    def _heap_for(self, entry: Any) -> _NodeHeap:
+        if _is_sentinel(entry):
+            return self._heap
+        keys = self.limiter.keys_for(entry[2], entry[4]) if len(entry) >= 5 else ()
+        heap = self._groups.get(keys)
+        if heap is None:
+            heap = self._groups[keys] = _NodeHeap(keys)
+        return heap
+
+    def _first_heap(self, limited: bool = False) -> Optional[_NodeHeap]:
+        """
+        맨 앞 항목이 있는 힙 (limited면 자리가 남은 키의 힙 중에서, 없으면 None)
+        - 빈 키 힙은 여기서 정리
+        """
+        best = self._heap if self._heap else None
+        limiter = self.limiter
+        # 전체 제한에 걸렸으면 종료 신호만 꺼낼 수 있음
+        if limited and not limiter.can_start(()):
+            return best
+        for keys, heap in list(self._groups.items()):
+            if not heap:
+                del self._groups[keys]
+                continue
+            if (best is None or heap.top().key < best.top().key) and (not limited or limiter.can_start(keys)):
+                best = heap
+        return best
+
+    def _has_startable(self) -> bool:
+        return self._first_heap(limited=True) is not None
+
+    def _take(self, limited: bool) -> Any:
+        """꺼낼 수 있는 작업 중 우선순위가 가장 높은 항목 (없으면 _NOTHING)"""
+        heap = self._first_heap(limited)
+        if heap is None:
+            return _NOTHING
+        entry = self._pop_node(heap.top())
+        if not _is_sentinel(entry):
+            if limited:
+                self.limiter.acquire(entry[1], heap.keys)
+            self.policy.dispatched(entry)
+        return entry
+
+    def _put(self, item) -> None:
+        # 꺼냈던 작업을 되돌리면(묶음에서 제외, 이어받기 등) 잡고 있던 자리 반납
+        released = not _is_sentinel(item) and self.limiter.release(item[1])
+        super()._put(item)
+        # 되돌린 항목 자체는 put()이 대기자 하나를 깨움 → 반납한 자리 몫으로 하나 더
+        if released and self._has_startable():
+            self.not_empty.notify()
+
+    def _notify_waiters(self, slots: int = 0) -> None:
+        """
+        자리가 생겼으니 대기 중인 워커/엔진을 깨움 (큐 잠금 안에서 호출)
+        - slots: 새로 생긴 자리 수만큼만 깨움 (꺼낼 수 있는 작업이 없으면 깨우지 않음)
+        - 0이면 제한 설정이 바뀐 것이므로 모두 깨움
+        """
+        if slots:
+            if not self._has_startable():
+                return
+            self.not_empty.notify(slots)
+        else:
+            self.not_empty.notify_all()
+        self._notify_listeners()
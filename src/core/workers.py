@@ -1,97 +1,252 @@
 import queue
 import os
 import threading
+import time
 import unicodedata
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import yt_dlp
-from PyQt5.QtCore import QThread, pyqtSignal
 
 from core import download_handler
+from core.events import EngineThread, Signal
+from core.ytdlp_wrapper import ProcessSuspender
 from utils.logger import log
 from constants import (
     MSG_PAUSED_BY_USER, MEDIA_EXTENSIONS, QUEUE_TIMEOUT_SEC,
     BYTES_PER_KB, BYTES_PER_MB,
     STATUS_DOWNLOADING, STATUS_FINISHED, STATUS_POSTPROCESSING,
-    EXT_PART, EXT_YTDL
+    EXT_PART, EXT_YTDL, METADATA_LOOKUP_FAILED_KEY,
+    STATUS_AFTER_MOVE, STATUS_FORMAT_SELECTED, PARTIAL_SAVE_INTERVAL_SEC, FILE_SCAN_MAX_ENTRIES, FILE_SCAN_MTIME_SLACK_SEC,
+    MSG_DOWNLOAD_COMPLETE, AUDIO_FORMATS, DOWNLOAD_BATCH_MAX_DURATION_SEC, DOWNLOAD_BATCH_PEEK_LIMIT
 )
 from locales.strings import STR
 
-class PlaylistAnalysisWorker(QThread):
-    """플레이리스트 분석을 위한 별도 스레드 (UI 프리징 방지)"""
-    analysis_finished = pyqtSignal(str, list, bool, str)
+def _resolve_metadata(scheduler: Any, task_id: int, url: str, settings: Optional[Dict]) -> Tuple[Dict, bool, bool]:
+    """
+    작업 메타데이터 조회 (배치 선조회 결과 → 디스크 캐시 → yt-dlp 순)
     
-    def __init__(self, url: str, parent: Optional[QThread] = None):
+    Returns:
+        (메타데이터, 성공 여부, 이미 UI에 전달되었는지 여부) 튜플
+    """
+    if scheduler and hasattr(scheduler, 'take_prefetched_metadata'):
+        prefetched = scheduler.take_prefetched_metadata(task_id)
+        if prefetched:
+            return prefetched, True, True
+    
+    # 디스크 캐시 확인 (재시도/재시작 후 재개/품질 변경 시 재조회 방지)
+    cache = getattr(scheduler, 'metadata_cache', None)
+    format_selector = download_handler.get_format_selector(settings)
+    if cache:
+        cached = cache.get(url, format_selector)
+        if cached:
+            return cached, True, False
+    
+    meta, meta_success = download_handler.fetch_metadata(url, settings)
+    if not meta_success or not meta:
+        return {}, False, False
+    if cache:
+        cache.put(url, format_selector, meta)
+    return meta, True, False
+
+
+class MetadataBatchWorker(EngineThread):
+    """
+    여러 작업의 메타데이터를 배치로 미리 조회하는 스레드 (yt-dlp 실행 횟수 절감)
+    - 큐에서 (작업 묶음, 설정)을 하나씩 꺼내 순서대로 처리 (배치가 늘어도 yt-dlp는 한 번에 하나)
+    - 큐에 None이 들어오면 종료
+    """
+    metadata_fetched = Signal(int, dict)
+    
+    def __init__(
+        self, 
+        job_queue: queue.Queue, 
+        stop_event: threading.Event, 
+        metadata_cache: Optional[Any] = None,
+        parent: Optional[Any] = None
+    ):
         super().__init__(parent)
-        self.url = url
+        self.job_queue = job_queue
+        self.stop_event = stop_event
+        self.metadata_cache = metadata_cache
     
     def run(self) -> None:
-        """플레이리스트에서 비디오 ID 추출"""
-        video_ids, success, error_msg = download_handler.extract_playlist_video_ids(self.url)
-        self.analysis_finished.emit(self.url, video_ids, success, error_msg)
-
-
-class DownloadWorker(QThread):
-    """다운로드 작업을 처리하는 워커 스레드 (Queue 방식)"""
-    progress_updated = pyqtSignal(dict, int)
-    download_finished = pyqtSignal(bool, str, int, str)
-    task_started = pyqtSignal(int)
-    metadata_fetched = pyqtSignal(int, dict)
+        while not self.stop_event.is_set():
+            try:
+                job = self.job_queue.get(timeout=QUEUE_TIMEOUT_SEC)
+            except queue.Empty:
+                continue
+            if job is None:
+                break
+            
+            items, settings = job
+            try:
+                self._fetch_batch(items, settings)
+            except Exception as e:
+                log.error(f"메타데이터 배치 조회 오류: {e}", exc_info=True)
+    
+    def _fetch_batch(self, items: List[Tuple[int, str]], settings: Dict) -> None:
+        """묶음 하나를 조회하며 영상별 결과를 즉시 전달"""
+        format_selector = download_handler.get_format_selector(settings)
+        task_ids_by_url: Dict[str, List[int]] = {}
+        for task_id, url in items:
+            task_ids_by_url.setdefault(url, []).append(task_id)
+        
+        for url, meta, success in download_handler.fetch_metadata_many(list(task_ids_by_url), settings):
+            if not success or not meta:
+                continue
+            if self.metadata_cache:
+                self.metadata_cache.put(url, format_selector, meta)
+            for task_id in task_ids_by_url.get(url, ()):
+                self.metadata_fetched.emit(task_id, meta)
+
+
+class MetadataWorker(EngineThread):
+    """
+    메타데이터 선행 조회 워커 (다운로드 앞 단계)
+    - 대기 큐에서 작업을 꺼내 메타데이터를 채운 뒤 다운로드 큐로 넘김
+    - 준비된 작업 수가 선행 조회 깊이(look-ahead)에 도달하면 다운로드 워커가 가져갈 때까지 대기
+    """
+    metadata_fetched = Signal(int, dict)
+    download_finished = Signal(bool, str, int, str)  # 조회 단계에서 실패 처리된 작업
     
     def __init__(
         self, 
+        pending_queue: queue.PriorityQueue, 
         download_queue: queue.PriorityQueue, 
         stop_event: threading.Event, 
-        pause_event: threading.Event, 
-        parent: Optional[QThread] = None
+        parent: Optional[Any] = None
     ):
         super().__init__(parent)
+        self.pending_queue = pending_queue
         self.download_queue = download_queue
         self.stop_event = stop_event
-        self.pause_event = pause_event
+    
+    def run(self) -> None:
+        scheduler = self.parent()
+        while not self.stop_event.is_set():
+            if not scheduler.acquire_lookahead_slot(QUEUE_TIMEOUT_SEC):
+                continue
+            
+            try:
+                entry = self.pending_queue.get(timeout=QUEUE_TIMEOUT_SEC)
+            except queue.Empty:
+                scheduler.release_lookahead_slot()
+                continue
+            
+            # 조회 자리는 아래 중 한 곳에서 한 번만 넘기거나 반납 (emit/put이 예외를 던져도 두 번 반납하지 않음)
+            slot_held = True
+            try:
+                prepared = self._prepare(scheduler, entry)
+                if prepared is None:
+                    # 지원되지 않는 URL: 다운로드 큐에 넣지 않고 즉시 실패
+                    slot_held = False
+                    scheduler.release_lookahead_slot()
+                    self.download_finished.emit(False, STR.ERR_UNSUPPORTED_URL, entry[1], "")
+                    continue
+                
+                prepared_entry, ready = prepared
+                slot_held = False
+                if ready:
+                    # 자리는 다운로드 워커가 가져갈 때 반납
+                    scheduler.mark_lookahead_ready(entry[1])
+                else:
+                    scheduler.release_lookahead_slot()
+                self.download_queue.put(prepared_entry)
+            except Exception as e:
+                log.error(f"메타데이터 선행 조회 오류: {e}", exc_info=True)
+                if slot_held:
+                    # 조회 중 오류: 메타데이터 없이 넘김 (다운로드 워커가 다시 조회)
+                    scheduler.release_lookahead_slot()
+                    self.download_queue.put(entry)
+            finally:
+                self.pending_queue.task_done()
+    
+    def _prepare(self, scheduler: Any, entry: tuple) -> Optional[Tuple[tuple, bool]]:
+        """
+        작업 하나의 메타데이터 조회 (조회 자리와 큐는 run()이 처리)
+        
+        Returns:
+            (다운로드 큐에 넣을 항목, 조회 완료 여부), 지원되지 않는 URL이면 None
+        """
+        _, task_id, url, settings, metadata = entry
+        
+        # 일시정지된 작업은 조회하지 않고 넘김 (일시정지로 세대가 바뀌었으므로 다운로드 큐가 버림)
+        if scheduler.is_task_paused(task_id):
+            return entry, False
+        
+        meta, success, emitted = _resolve_metadata(scheduler, task_id, url, settings)
+        if success:
+            metadata = meta
+            if not emitted:
+                self.metadata_fetched.emit(task_id, metadata)
+        else:
+            log.warning(f"메타데이터 조회 실패 (task_id={task_id}): {url}")
+            from utils.utils import is_youtube_url
+            if not is_youtube_url(url):
+                return None
+            metadata = dict(metadata)
+            metadata[METADATA_LOOKUP_FAILED_KEY] = True
+        
+        from core.task_queue import replace_entry
+        # 세대 번호 유지 (조회하는 동안 일시정지/취소/다시 넣기가 있었으면 다운로드 큐가 버림)
+        return replace_entry(entry, metadata=metadata), True
+
+
+class DownloadTaskMixin:
+    """
+    작업 하나를 받는 동안의 공통 처리 (메타데이터 확인, 진행률 계산, 이어받기 기록, 결과 파일 찾기)
+    - DownloadWorker(작업마다 스레드)와 AsyncDownloadEngine의 작업 컨텍스트(작업마다 코루틴)가 함께 사용
+    - 사용하는 속성: stop_event, pause_event, progress_updated, metadata_fetched, parent()
+      및 _init_task_state()가 만드는 작업 상태
+    """
+
+    def _init_task_state(self) -> None:
+        """작업 진행 상태 초기화"""
         self.current_task_id: int = -1
         self.download_progress: Dict[int, Dict[str, Any]] = {}
         self.last_update_times: Dict[int, float] = {}
         self.current_output_path: str = ""
-        self.retire_flag: bool = False
+        self.final_output_path: str = ""  # yt-dlp가 알려준 최종 파일 경로 (after_move)
+        self.download_started_at: float = 0.0
+        # 묶음 다운로드 중 이벤트 분배용 (영상 ID -> task_id, task_id -> 경로)
+        self.batch_task_ids: Dict[str, int] = {}
+        self.batch_output_paths: Dict[int, str] = {}
+        self.batch_final_paths: Dict[int, str] = {}
+        # 일시정지 시 yt-dlp 프로세스를 종료하지 않고 멈춤 (POSIX subprocess 실행 시)
+        self.process_control = ProcessSuspender()
+        # 이어받기 기록용 (task_id -> 선택된 포맷, (task_id, 파일) -> 마지막 기록 시각)
+        self.requested_formats: Dict[int, str] = {}
+        self._partial_saved_at: Dict[Tuple[int, str], float] = {}
+
+    def _is_task_held(self, task_id: int) -> bool:
+        """개별 일시정지되었거나 취소된 작업인지 확인"""
+        return self._is_task_cancelled(task_id) or self._is_task_paused(task_id)
+
+    def _is_task_paused(self, task_id: int) -> bool:
+        scheduler = self.parent()
+        return bool(scheduler and hasattr(scheduler, 'is_task_paused') and scheduler.is_task_paused(task_id))
 
-    # ============================================================
-    # 헬퍼 메서드들
-    # ============================================================
-    
-    def _extract_task_data(self, task_wrapper: Any) -> Optional[Tuple[int, str, Dict, Dict]]:
-        """
-        Queue에서 가져온 데이터를 파싱하여 (task_id, url, settings, metadata) 튜플 반환.
-        종료 신호이거나 파싱 실패 시 None 반환.
-        """
-        if task_wrapper is None:
-            return None
-            
-        if isinstance(task_wrapper, tuple):
-            task = task_wrapper[1:]
-            if task[0] is None:
-                self.download_queue.task_done()
-                return None
-        else:
-            task = task_wrapper
+    def _is_task_cancelled(self, task_id: int) -> bool:
+        scheduler = self.parent()
+        return bool(scheduler and hasattr(scheduler, 'is_task_cancelled') and scheduler.is_task_cancelled(task_id))
 
-        if len(task) == 4:
-            task_id, url, task_settings, metadata = task
-        else:
-            task_id, url, task_settings = task
-            metadata = {}
-        
-        return task_id, url, task_settings, metadata
+    def _is_entry_stale(self, entry: Any) -> bool:
+        """꺼낸 뒤 취소/일시정지/다시 넣기로 세대가 바뀐 항목인지 (취소 상태가 이미 정리되었을 수 있음)"""
+        scheduler = self.parent()
+        return bool(scheduler and hasattr(scheduler, 'is_entry_current') and not scheduler.is_entry_current(entry))
 
-    def _should_skip_task(self, task_id: int) -> bool:
-        """개별 작업 일시정지 여부 확인. 스킵해야 하면 True 반환."""
+    def _notify_skipped(self, task_id: int) -> None:
+        """실행하지 않고 버린 작업 통지 (완료 통지가 없으므로 스케줄러가 취소 상태를 정리)"""
         scheduler = self.parent()
-        if scheduler and hasattr(scheduler, 'is_task_paused'):
-            if scheduler.is_task_paused(task_id):
-                self.download_queue.task_done()
-                return True
-        return False
+        if scheduler and hasattr(scheduler, 'on_task_skipped'):
+            scheduler.on_task_skipped(task_id)
+
+    def _cancel_deletes_files(self, task_id: int) -> bool:
+        scheduler = self.parent()
+        if scheduler and hasattr(scheduler, 'cancel_deletes_files'):
+            return scheduler.cancel_deletes_files(task_id)
+        return True
 
     def _process_metadata(self, task_id: int, url: str, metadata: Dict, settings: Dict = None) -> Tuple[Dict, bool]:
         """
@@ -100,16 +255,58 @@ class DownloadWorker(QThread):
         Returns:
             (메타데이터 딕셔너리, 성공 여부) 튜플
         """
-        if not metadata or not metadata.get('title'):
-            meta, meta_success = download_handler.fetch_metadata(url, settings)
-            if meta_success and meta:
+        # 선행 조회 단계에서 이미 실패한 작업은 다시 조회하지 않음
+        if metadata.pop(METADATA_LOOKUP_FAILED_KEY, False):
+            return metadata, False
+        
+        if not download_handler.is_metadata_complete(metadata):
+            meta, meta_success, emitted = _resolve_metadata(self.parent(), task_id, url, settings)
+            if meta_success:
                 metadata = meta
-                self.metadata_fetched.emit(task_id, metadata)
+                if not emitted:
+                    self.metadata_fetched.emit(task_id, metadata)
             else:
                 log.warning(f"메타데이터 조회 실패 (task_id={task_id}): {url}")
                 return metadata, False
         return metadata, True
 
+    def _partial_registry(self) -> Any:
+        scheduler = self.parent()
+        return getattr(scheduler, 'partial_registry', None) if scheduler else None
+
+    def _record_partial(self, task_id: int, d: Dict[str, Any]) -> None:
+        """
+        이어받기 기록 갱신 (스트림별)
+        - 받는 중에는 PARTIAL_SAVE_INTERVAL_SEC 간격으로, 스트림 완료 시에는 바로 기록
+        - 진행률 계산이 값을 누적치로 바꾸기 전의 스트림 단위 바이트를 사용
+        """
+        registry = self._partial_registry()
+        filename = d.get('filename')
+        status = d.get('status')
+        if registry is None or not filename or status not in (STATUS_DOWNLOADING, STATUS_FINISHED):
+            return
+        
+        key = (task_id, filename)
+        now = time.time()
+        completed = status == STATUS_FINISHED
+        if not completed and now - self._partial_saved_at.get(key, 0.0) < PARTIAL_SAVE_INTERVAL_SEC:
+            return
+        self._partial_saved_at[key] = now
+        registry.record(
+            task_id, filename, d.get('tmpfilename'), d.get('video_id'), d.get('format_id'),
+            d.get('downloaded_bytes'), d.get('total_bytes') or d.get('total_bytes_estimate'),
+            completed=completed, requested_format=self.requested_formats.get(task_id)
+        )
+
+    def _clear_partial(self, task_id: int, delete_files: bool = False) -> None:
+        """작업이 끝나거나 취소되면 이어받기 기록 정리"""
+        self.requested_formats.pop(task_id, None)
+        for key in [k for k in self._partial_saved_at if k[0] == task_id]:
+            del self._partial_saved_at[key]
+        registry = self._partial_registry()
+        if registry is not None:
+            registry.remove(task_id, delete_files=delete_files)
+
     def _init_progress_tracking(self, task_id: int, metadata: Dict) -> None:
         """진행률 추적 초기화 (비디오/오디오 구분)"""
         video_size_est = metadata.get('video_size', 0) or 0
@@ -128,49 +325,69 @@ class DownloadWorker(QThread):
     def _find_downloaded_file(self, task_id: int, metadata: Dict, settings: Dict) -> str:
         """
         다운로드 완료된 파일의 경로를 찾아서 반환.
+        - yt-dlp가 알려준 최종 경로(after_move)를 우선 사용
+        - 받지 못한 경우에만 다운로드 폴더를 제한적으로 탐색
         찾지 못하면 빈 문자열 반환.
         """
-        final_path = ""
-        
-        if self.current_output_path:
+        for candidate in (self.final_output_path, self.current_output_path):
+            if not candidate:
+                continue
             try:
-                captured_path = Path(self.current_output_path).resolve()
-                if captured_path.exists():
+                captured_path = Path(candidate).resolve()
+                if captured_path.is_file():
                     return str(captured_path)
             except Exception:
                 pass
         
         save_path = settings.get('download_folder') or settings.get('save_path') or os.getcwd()
-        save_dir = Path(save_path)
+        return self._scan_recent_media_file(task_id, save_path, metadata.get('title', ''))
+
+    def _scan_recent_media_file(self, task_id: int, save_path: str, video_title: str) -> str:
+        """
+        다운로드 폴더 폴백 탐색 (최대 FILE_SCAN_MAX_ENTRIES개 항목)
+        - 이번 다운로드 시작 이후 수정된 미디어 파일만 후보로 사용 (오래된 보관 파일 제외)
+        - 후보 중 제목이 일치하는 가장 최근 파일, 없으면 후보가 하나일 때만 그 파일
+        """
+        if not os.path.isdir(save_path):
+            return ""
         
-        if not save_dir.exists():
-            return final_path
-            
+        fullwidth_map = str.maketrans({
+            '<': '＜', '>': '＞', ':': '：', '"': '＂',
+            '/': '／', '\\': '＼', '|': '｜', '?': '？', '*': '＊'
+        })
+        safe_title = unicodedata.normalize('NFC', video_title).translate(fullwidth_map).lower() if video_title else ''
+        min_mtime = self.download_started_at - FILE_SCAN_MTIME_SLACK_SEC
+        
+        candidates = []  # (mtime, 경로, 제목 일치 여부)
         try:
-            video_title = metadata.get('title', '')
-            if video_title:
-                safe_title = unicodedata.normalize('NFC', video_title)
-                fullwidth_map = str.maketrans({
-                    '<': '＜', '>': '＞', ':': '：', '"': '＂',
-                    '/': '／', '\\': '＼', '|': '｜', '?': '？', '*': '＊'
-                })
-                safe_title = safe_title.translate(fullwidth_map)
-                
-                for file_path in save_dir.iterdir():
-                    if not file_path.is_file():
+            with os.scandir(save_path) as it:
+                for count, entry in enumerate(it):
+                    if count >= FILE_SCAN_MAX_ENTRIES:
+                        log.warning(f"다운로드 폴더 항목이 많아 탐색을 중단했습니다 (task_id={task_id})")
+                        break
+                    name = entry.name
+                    if not name.lower().endswith(MEDIA_EXTENSIONS):
                         continue
-                    
-                    f_stem = unicodedata.normalize('NFC', file_path.stem)
-                    
-                    if safe_title.lower() in f_stem.lower():
-                        if file_path.suffix.lower() in MEDIA_EXTENSIONS:
-                            final_path = str(file_path.resolve())
-                            break
-                            
-        except Exception as e:
+                    try:
+                        if not entry.is_file():
+                            continue
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    if mtime < min_mtime:
+                        continue
+                    stem = unicodedata.normalize('NFC', os.path.splitext(name)[0]).lower()
+                    candidates.append((mtime, entry.path, bool(safe_title) and safe_title in stem))
+        except OSError as e:
             log.warning(f"파일 경로 찾기 실패 (task_id={task_id}): {e}")
+            return ""
         
-        return final_path
+        matched = [c for c in candidates if c[2]]
+        if matched:
+            return str(Path(max(matched)[1]).resolve())
+        if len(candidates) == 1:
+            return str(Path(candidates[0][1]).resolve())
+        return ""
 
     def _format_speed(self, speed: float) -> str:
         """바이트/초를 읽기 쉬운 형식으로 변환"""
@@ -179,111 +396,49 @@ class DownloadWorker(QThread):
         else:
             return f"{speed / BYTES_PER_KB:.1f} KB/s"
 
-    # ============================================================
-    # 메인 실행 메서드
-    # ============================================================
-        
-    def run(self) -> None:
-        """Queue에서 다운로드 작업을 순차적으로 처리"""
-        while not self.stop_event.is_set():
-            if self.retire_flag:
-                break
-
-            self.pause_event.wait()
-            
-            if self.stop_event.is_set():
-                break
-
-            task_wrapper = None
-            try:
-                task_wrapper = self.download_queue.get(timeout=QUEUE_TIMEOUT_SEC)
-                
-                task_data = self._extract_task_data(task_wrapper)
-                if task_data is None:
-                    break
-                
-                task_id, url, current_settings, metadata = task_data
-
-                if self._should_skip_task(task_id):
-                    continue
-                
-                self.current_task_id = task_id
-                self.current_output_path = ""
-                
-                metadata, meta_ok = self._process_metadata(task_id, url, metadata, current_settings)
-                
-                # 메타데이터 조회 실패 시 다운로드 시도 없이 실패 처리
-                if not meta_ok:
-                    from utils.utils import is_youtube_url
-                    if not is_youtube_url(url):
-                        # 지원되지 않는 URL: 다운로드 시도 없이 즉시 실패
-                        error_msg = STR.ERR_UNSUPPORTED_URL
-                        log.error(f"지원되지 않는 URL (task_id={task_id}): {url}")
-                        self.download_finished.emit(False, error_msg, task_id, "")
-                        self.download_queue.task_done()
-                        continue
-                
-                self.task_started.emit(task_id)
-
-                self._init_progress_tracking(task_id, metadata)
-
-                success, message = download_handler.download_video(
-                    url, current_settings, self._progress_hook
-                )
-                
-                if not success and MSG_PAUSED_BY_USER in str(message):
-                    self.download_finished.emit(False, STR.STATUS_PAUSED, task_id, "")
-                    self.download_queue.task_done()
-                    continue
-
-                if task_id in self.download_progress:
-                    del self.download_progress[task_id]
-                
-                final_path = ""
-                if success:
-                    final_path = self._find_downloaded_file(task_id, metadata, current_settings)
-                
-                self.download_finished.emit(success, message, task_id, final_path)
-                self.download_queue.task_done()
-                
-                if self.retire_flag:
-                    break
-                
-            except queue.Empty:
-                continue
-            except Exception as e:
-                self._handle_unexpected_error(e, task_wrapper)
-
-    def _handle_unexpected_error(self, e: Exception, task_wrapper: Any) -> None:
-        """예상치 못한 오류 처리"""
-        error_task_id = -1
-        if task_wrapper is not None:
-            try:
-                if isinstance(task_wrapper, tuple) and len(task_wrapper) > 1:
-                    error_task_id = task_wrapper[1]
-                self.download_queue.task_done()
-            except Exception:
-                pass
-        error_msg = str(e)
-        log.error(f"다운로드 오류 (task_id={error_task_id}): {error_msg}", exc_info=True)
-        self.download_finished.emit(False, f"오류: {error_msg}", error_task_id, "")
-
     def _progress_hook(self, d: Dict[str, Any]) -> None:
         """진행률 훅 - concurrent_fragment_downloads 사용 시 정상 작동"""
+        # 묶음 다운로드 중이면 이벤트의 영상 ID로 해당 작업을 찾음
+        if self.batch_task_ids and d.get('video_id') in self.batch_task_ids:
+            self.current_task_id = self.batch_task_ids[d['video_id']]
+        task_id = self.current_task_id
+        
+        # 최종 경로 통지는 다운로드가 끝난 뒤이므로 일시정지 검사 없이 기록만
+        if d.get('status') == STATUS_AFTER_MOVE:
+            if d.get('filepath'):
+                self.final_output_path = d['filepath']
+                if self.batch_task_ids:
+                    self.batch_final_paths[task_id] = d['filepath']
+            return
+        
+        # 선택된 포맷은 이후 스트림별 이어받기 기록에 함께 저장
+        if d.get('status') == STATUS_FORMAT_SELECTED:
+            if d.get('format_id'):
+                self.requested_formats[task_id] = d['format_id']
+            return
+        
         if self.stop_event.is_set():
             raise yt_dlp.utils.DownloadError(STR.WORKER_MSG_STOPPED)
         
+        # 프로세스가 일시 중지된 상태: 멈추기 직전 출력된 줄이므로 종료하지 않고 무시
+        if self.process_control.suspended:
+            return
+        
         if not self.pause_event.is_set():
             raise yt_dlp.utils.DownloadError(MSG_PAUSED_BY_USER)
         
-        task_id = self.current_task_id
-        scheduler = self.parent()
-        if scheduler and hasattr(scheduler, 'is_task_paused'):
-            if scheduler.is_task_paused(task_id):
-                raise yt_dlp.utils.DownloadError(MSG_PAUSED_BY_USER)
+        # 취소된 작업 (프로세스 풀 등 프로세스를 직접 종료할 수 없는 실행기용)
+        if self._is_task_cancelled(task_id):
+            raise yt_dlp.utils.DownloadError(STR.MSG_DL_CANCELLED)
+        
+        if self._is_task_paused(task_id):
+            raise yt_dlp.utils.DownloadError(MSG_PAUSED_BY_USER)
 
         if d.get('filename'):
             self.current_output_path = d.get('filename')
+            if self.batch_task_ids:
+                self.batch_output_paths[task_id] = self.current_output_path
+            self._record_partial(task_id, d)
 
         try:
             status = d.get('status', '')
@@ -430,34 +585,366 @@ class DownloadWorker(QThread):
         self.progress_updated.emit(d, task_id)
 
 
-class StartupWorker(QThread):
-    """앱 시작 시 메인 스레드를 차단하지 않고 무거운 검사(업데이트 확인 등)를 수행하는 워커"""
-    status_updated = pyqtSignal(str)
-    finished_checks = pyqtSignal(dict, tuple) # bin_updates, app_update_info (avail, latest, url)
-    error_occurred = pyqtSignal(str)
+class DownloadWorker(DownloadTaskMixin, EngineThread):
+    """다운로드 작업을 처리하는 워커 스레드 (Queue 방식)"""
+    progress_updated = Signal(dict, int)
+    download_finished = Signal(bool, str, int, str)
+    task_started = Signal(int)
+    metadata_fetched = Signal(int, dict)
+    
+    def __init__(
+        self, 
+        download_queue: queue.PriorityQueue, 
+        stop_event: threading.Event, 
+        pause_event: threading.Event, 
+        parent: Optional[Any] = None
+    ):
+        super().__init__(parent)
+        self.download_queue = download_queue
+        self.stop_event = stop_event
+        self.pause_event = pause_event
+        self.retire_flag: bool = False
+        self._init_task_state()
 
-    def run(self):
-        try:
-            from utils.bin_manager import check_binaries_exist, check_updates_available
-            from utils.app_updater import check_for_updates
-            from locales.strings import STR
-            import time
+    # ============================================================
+    # 헬퍼 메서드들
+    # ============================================================
+    
+    def _extract_task_data(self, task_wrapper: Any) -> Optional[Tuple[int, str, Dict, Dict]]:
+        """
+        Queue에서 가져온 데이터를 파싱하여 (task_id, url, settings, metadata) 튜플 반환.
+        종료 신호이거나 파싱 실패 시 None 반환.
+        """
+        if task_wrapper is None:
+            return None
             
-            # 외부 구성 요소 확인
-            self.status_updated.emit(STR.MSG_STARTUP_CHECK_EXT)
-            time.sleep(0.1) # UI 업데이트 여유시간 (자율 조절)
+        if isinstance(task_wrapper, tuple):
+            task = task_wrapper[1:]
+            if task[0] is None:
+                self.download_queue.task_done()
+                return None
+        else:
+            task = task_wrapper
+
+        if len(task) == 4:
+            task_id, url, task_settings, metadata = task
+        else:
+            task_id, url, task_settings = task
+            metadata = {}
+        
+        return task_id, url, task_settings, metadata
+
+    def _release_slot(self, task_id: int) -> None:
+        """꺼냈지만 실행하지 않는 작업의 동시 실행 자리 반납 (완료 통지가 없으므로)"""
+        release = getattr(self.download_queue, 'release', None)
+        if release:
+            release(task_id)
+
+    def _should_skip_task(self, task_id: int, entry: Any = None) -> bool:
+        """개별 작업 일시정지/취소 여부 확인. 스킵해야 하면 True 반환."""
+        if self._is_task_held(task_id) or (entry is not None and self._is_entry_stale(entry)):
+            self._release_slot(task_id)
+            self._notify_skipped(task_id)
+            self.download_queue.task_done()
+            return True
+        return False
+
+    # ============================================================
+    # 프로세스 일시 중지/재개 (스케줄러가 메인 스레드에서 호출)
+    # ============================================================
+
+    def suspend_download(self, task_id: Optional[int] = None) -> bool:
+        """
+        받는 중인 yt-dlp 프로세스를 일시 중지
+        - task_id를 주면 그 작업을 단독으로 받는 중일 때만 (묶음 실행은 종료 후 이어받기로 처리)
+        - 지원되지 않거나 받는 중이 아니면 False → 진행률 훅의 예외로 종료하는 기존 방식 사용
+        """
+        if task_id is not None and (self.batch_task_ids or task_id != self.current_task_id):
+            return False
+        return self.process_control.suspend()
+
+    def running_task_ids(self) -> List[int]:
+        """묶음으로 함께 받는 작업 (단독 작업은 다운로드 큐의 동시 실행 자리로 확인)"""
+        return list(self.batch_task_ids.values())
+
+    def resume_download(self, task_id: Optional[int] = None) -> List[int]:
+        """일시 중지된 프로세스를 재개하고 다시 받기 시작한 작업 ID 목록 반환"""
+        if task_id is not None and task_id != self.current_task_id:
+            return []
+        if not self.process_control.resume():
+            return []
+        return list(self.batch_task_ids.values()) or [self.current_task_id]
+
+    # ============================================================
+    # 묶음 다운로드 (짧은 작업 여러 개를 yt-dlp 1회 실행으로)
+    # ============================================================
+
+    @staticmethod
+    def _is_batchable(settings: Dict, metadata: Dict) -> bool:
+        """
+        묶음 대상 여부: 메타데이터가 준비된 단일 영상 중 오디오 작업이거나 짧은 영상
+        - 이어받는 작업은 기록된 포맷/파일 이름을 고정해야 하므로 단독으로 받음
+        """
+        if settings.get('is_resume') or not download_handler.is_metadata_complete(metadata):
+            return False
+        if metadata.get('is_playlist') or not metadata.get('id'):
+            return False
+        if settings.get('format') in AUDIO_FORMATS:
+            return True
+        duration = metadata.get('duration') or 0
+        return 0 < duration <= DOWNLOAD_BATCH_MAX_DURATION_SEC
+
+    def _collect_batch(self, task_id: int, settings: Dict, metadata: Dict) -> List[Tuple[Any, int, str, Dict, Dict]]:
+        """
+        현재 작업과 함께 받을 작업을 큐에서 모음
+        - 설정이 같고 추출기가 같은 묶음 대상 작업만 (최대 download_batch_size - 1개)
+        - 조건이 맞지 않는 작업은 큐에 되돌림 (우선순위 순서 유지)
+        - 묶음은 yt-dlp 1회 실행(차례로 받음)이므로 동시 실행 자리는 현재 작업의 자리 하나만 사용
+          → 함께 받을 작업은 제한 없이 꺼냄 (자리를 따로 잡으면 묶음 하나가 전체/추출기 제한을 다 차지)
+        
+        Returns:
+            [(큐 항목, task_id, url, settings, metadata), ...] (묶지 않으면 빈 목록)
+        """
+        scheduler = self.parent()
+        batch_size = getattr(scheduler, 'download_batch_size', 1) if scheduler else 1
+        if batch_size <= 1 or not self._is_batchable(settings, metadata):
+            return []
+        if not download_handler.supports_batch_download():
+            return []
+        
+        extractor = metadata.get('extractor')
+        video_ids = {metadata['id']}
+        batch = []
+        put_back = []
+        for _ in range(DOWNLOAD_BATCH_PEEK_LIMIT):
+            if len(batch) >= batch_size - 1:
+                break
+            try:
+                entry = self.download_queue.get_nowait(limited=False)
+            except queue.Empty:
+                break
             
-            bin_updates = {}
-            if check_binaries_exist():
-                bin_updates = check_updates_available()
-                
-            # 앱 자체 업데이트 확인
-            self.status_updated.emit(STR.MSG_STARTUP_CHECK_APP)
-            app_update_info = check_for_updates()
+            # 종료 신호는 다른 워커를 위해 그대로 둠
+            if not isinstance(entry, tuple) or len(entry) < 5 or entry[1] is None:
+                put_back.append(entry)
+                break
             
-            self.finished_checks.emit(bin_updates, app_update_info)
+            _, other_id, other_url, other_settings, other_meta = entry[:5]
+            if self._is_task_held(other_id) or self._is_entry_stale(entry):
+                # 단일 작업과 동일하게 일시정지/취소된 작업은 큐에서 제거
+                if hasattr(scheduler, 'on_task_dequeued'):
+                    scheduler.on_task_dequeued(other_id)
+                self._notify_skipped(other_id)
+                self.download_queue.task_done()
+                continue
             
+            if (other_settings == settings and other_meta.get('extractor') == extractor
+                    and self._is_batchable(other_settings, other_meta)
+                    and other_meta['id'] not in video_ids):
+                video_ids.add(other_meta['id'])
+                batch.append((entry, other_id, other_url, other_settings, other_meta))
+                if hasattr(scheduler, 'on_task_dequeued'):
+                    scheduler.on_task_dequeued(other_id)
+            else:
+                put_back.append(entry)
+        
+        for entry in put_back:
+            self.download_queue.put(entry)
+            self.download_queue.task_done()
+        return batch
+
+    def _run_batch(self, tasks: List[Tuple[Any, int, str, Dict, Dict]]) -> None:
+        """
+        묶은 작업을 yt-dlp 1회 실행으로 다운로드하고 결과를 작업별로 통지
+        - 진행률/최종 경로는 이벤트의 영상 ID로 해당 작업에 분배
+        - 한 작업의 일시정지/취소로 실행이 중단되면 완료된 작업은 완료, 일시정지/취소한 작업은
+          해당 상태로, 나머지는 큐에 되돌려 다시 받음
+        """
+        settings = tasks[0][3]
+        self.batch_task_ids = {meta['id']: task_id for _, task_id, _, _, meta in tasks}
+        # 모으는 동안 취소/일시정지된 작업 제외 (묶음에 등록하기 전이라 스케줄러가 실행 중으로 보지 않았음)
+        stale = [t for t in tasks[1:] if self._is_entry_stale(t[0])]
+        if stale:
+            for _, task_id, _, _, _ in stale:
+                self._notify_skipped(task_id)
+                self.download_queue.task_done()
+            stale_ids = {t[1] for t in stale}
+            tasks = [t for t in tasks if t[1] not in stale_ids]
+            self.batch_task_ids = {meta['id']: task_id for _, task_id, _, _, meta in tasks}
+        self.batch_output_paths = {}
+        self.batch_final_paths = {}
+        
+        for _, task_id, _, _, meta in tasks:
+            self.task_started.emit(task_id)
+            self._init_progress_tracking(task_id, meta)
+        self.current_task_id = tasks[0][1]
+        self.download_started_at = time.time()
+        log.info(f"묶음 다운로드 시작: {len(tasks)}개 작업 ({[t[1] for t in tasks]})")
+        
+        try:
+            success, message, errors = download_handler.download_batch(
+                [url for _, _, url, _, _ in tasks], settings, self._progress_hook,
+                task_ids=[t[1] for t in tasks]
+            )
         except Exception as e:
-            from utils.logger import log
-            log.error(f"StartupWorker error: {e}", exc_info=True)
-            self.error_occurred.emit(str(e))
\ No newline at end of file
+            success, message, errors = False, f"오류: {e}", {}
+        
+        # 일시정지/취소는 묶음 전체 프로세스를 종료하므로 나머지 작업은 다시 받아야 함
+        interrupted = not success and (MSG_PAUSED_BY_USER in str(message)
+                                       or any(self._is_task_cancelled(t[1]) for t in tasks))
+        interrupted_all = not self.pause_event.is_set() or self.stop_event.is_set()
+        
+        for entry, task_id, url, task_settings, meta in tasks:
+            self.download_progress.pop(task_id, None)
+            try:
+                if self.stop_event.is_set():
+                    continue
+                if task_id in self.batch_final_paths or success:
+                    self._clear_partial(task_id)
+                    self.final_output_path = self.batch_final_paths.get(task_id, "")
+                    self.current_output_path = self.batch_output_paths.get(task_id, "")
+                    final_path = self._find_downloaded_file(task_id, meta, task_settings)
+                    self.download_finished.emit(True, MSG_DOWNLOAD_COMPLETE, task_id, final_path)
+                elif self._is_task_cancelled(task_id):
+                    self._clear_partial(task_id, delete_files=self._cancel_deletes_files(task_id))
+                    self.download_finished.emit(False, STR.MSG_DL_CANCELLED, task_id, "")
+                elif interrupted:
+                    if interrupted_all or self._is_task_paused(task_id):
+                        self.download_finished.emit(False, STR.STATUS_PAUSED, task_id, "")
+                    else:
+                        # 다른 작업의 일시정지/취소로 함께 중단됨 → 다시 대기
+                        self.download_queue.put(entry)
+                else:
+                    error_msg = errors.get(meta['id']) or message
+                    self.download_finished.emit(False, error_msg, task_id, "")
+            finally:
+                self.download_queue.task_done()
+        
+        self.batch_task_ids = {}
+        self.batch_output_paths = {}
+        self.batch_final_paths = {}
+
+    # ============================================================
+    # 메인 실행 메서드
+    # ============================================================
+        
+    def run(self) -> None:
+        """Queue에서 다운로드 작업을 순차적으로 처리"""
+        while not self.stop_event.is_set():
+            if self.retire_flag:
+                break
+
+            self.pause_event.wait()
+            
+            if self.stop_event.is_set():
+                break
+
+            task_wrapper = None
+            try:
+                task_wrapper = self.download_queue.get(timeout=QUEUE_TIMEOUT_SEC)
+                
+                task_data = self._extract_task_data(task_wrapper)
+                if task_data is None:
+                    break
+                
+                task_id, url, current_settings, metadata = task_data
+                
+                # 선행 조회 단계가 준비해 둔 작업이면 자리를 반납 (다음 작업 조회 시작)
+                scheduler = self.parent()
+                if scheduler and hasattr(scheduler, 'on_task_dequeued'):
+                    scheduler.on_task_dequeued(task_id)
+
+                if self._should_skip_task(task_id, task_wrapper):
+                    continue
+                
+                self.current_task_id = task_id
+                self.current_output_path = ""
+                self.final_output_path = ""
+                
+                metadata, meta_ok = self._process_metadata(task_id, url, metadata, current_settings)
+                
+                # 메타데이터 조회 실패 시 다운로드 시도 없이 실패 처리
+                if not meta_ok:
+                    from utils.utils import is_youtube_url
+                    if not is_youtube_url(url):
+                        # 지원되지 않는 URL: 다운로드 시도 없이 즉시 실패
+                        error_msg = STR.ERR_UNSUPPORTED_URL
+                        log.error(f"지원되지 않는 URL (task_id={task_id}): {url}")
+                        self.download_finished.emit(False, error_msg, task_id, "")
+                        self.download_queue.task_done()
+                        continue
+                
+                batch = self._collect_batch(task_id, current_settings, metadata)
+                if batch:
+                    self._run_batch([(task_wrapper, task_id, url, current_settings, metadata)] + batch)
+                    if self.retire_flag:
+                        break
+                    continue
+                
+                self.task_started.emit(task_id)
+
+                self._init_progress_tracking(task_id, metadata)
+                self.download_started_at = time.time()
+                
+                # 재시작 후 이어받기: 기록된 포맷/파일 이름으로 고정해 .part 파일을 그대로 이어받음
+                registry = self._partial_registry()
+                resume_state = None
+                if current_settings.get('is_resume') and registry is not None:
+                    resume_state = registry.get(task_id)
+
+                success, message = download_handler.download_video(
+                    url, current_settings, self._progress_hook,
+                    info_json_path=metadata.get('info_json_path'),
+                    process_control=self.process_control,
+                    task_id=task_id,
+                    resume_state=resume_state
+                )
+                
+                # 앱 종료로 프로세스가 정리된 경우 결과를 통지하지 않음
+                if self.stop_event.is_set():
+                    self.download_queue.task_done()
+                    break
+                
+                if not success and self._is_task_cancelled(task_id):
+                    self._clear_partial(task_id, delete_files=self._cancel_deletes_files(task_id))
+                    self.download_finished.emit(False, STR.MSG_DL_CANCELLED, task_id, "")
+                    self.download_queue.task_done()
+                    continue
+                
+                if not success and MSG_PAUSED_BY_USER in str(message):
+                    self.download_finished.emit(False, STR.STATUS_PAUSED, task_id, "")
+                    self.download_queue.task_done()
+                    continue
+
+                if task_id in self.download_progress:
+                    del self.download_progress[task_id]
+                
+                final_path = ""
+                if success:
+                    self._clear_partial(task_id)
+                    final_path = self._find_downloaded_file(task_id, metadata, current_settings)
+                
+                self.download_finished.emit(success, message, task_id, final_path)
+                self.download_queue.task_done()
+                
+                if self.retire_flag:
+                    break
+                
+            except queue.Empty:
+                continue
+            except Exception as e:
+                self._handle_unexpected_error(e, task_wrapper)
+
+    def _handle_unexpected_error(self, e: Exception, task_wrapper: Any) -> None:
+        """예상치 못한 오류 처리"""
+        error_task_id = -1
+        if task_wrapper is not None:
+            try:
+                if isinstance(task_wrapper, tuple) and len(task_wrapper) > 1:
+                    error_task_id = task_wrapper[1]
+                self.download_queue.task_done()
+            except Exception:
+                pass
+        error_msg = str(e)
+        log.error(f"다운로드 오류 (task_id={error_task_id}): {error_msg}", exc_info=True)
+        self.download_finished.emit(False, f"오류: {error_msg}", error_task_id, "")
@@ -8,8 +8,14 @@ from core.download_handler import (
     _sanitize_url,
     has_video_and_list,
     extract_playlist_video_ids,
+    iter_playlist_entries,
+    is_metadata_complete,
     fetch_metadata,
+    fetch_metadata_many,
+    get_format_selector,
     download_video,
+    supports_batch_download,
+    download_batch,
     _build_base_options,
     _build_format_options,
     _build_postprocess_options,
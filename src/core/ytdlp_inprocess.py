@@ -0,0 +1,131 @@
+"""
+프로세스 내 메타데이터 추출기
+- yt_dlp.YoutubeDL.extract_info를 제한된 스레드 풀에서 직접 호출 (조회마다 프로세스 기동 없음)
+- 스레드마다 YoutubeDL 인스턴스를 재사용하여 HTTP 연결과 추출기 캐시를 유지
+- YtDlpWrapper.extract_info와 동일한 인터페이스 제공
+"""
+import importlib.util
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from utils.logger import log
+from core.ytdlp_wrapper import build_api_options, project_fields, write_info_json
+from constants import INPROCESS_MAX_INSTANCES_PER_THREAD, INPROCESS_EXTRACT_TIMEOUT_SEC
+
+
+class InProcessExtractor:
+    """yt_dlp 모듈을 직접 사용하는 메타데이터 추출기 (스레드 풀 기반)"""
+
+    def __init__(self, max_workers: int):
+        """
+        Args:
+            max_workers: 동시에 실행할 추출 스레드 수
+        """
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='ytdlp-meta'
+        )
+        self._local = threading.local()
+        self._instances: List = []  # 종료 시 정리할 전체 인스턴스 목록
+        self._instances_lock = threading.Lock()
+        self._closed = False
+
+        # 모듈은 실제로 추출할 때 스레드 풀 안에서 import (여기서는 설치 여부만 확인)
+        self._available = importlib.util.find_spec('yt_dlp') is not None
+        if not self._available:
+            log.warning("yt_dlp 모듈을 찾을 수 없어 프로세스 내 메타데이터 추출을 사용하지 않습니다.")
+
+    def is_available(self) -> bool:
+        """추출기 사용 가능 여부"""
+        return self._available and not self._closed
+
+    def shutdown(self) -> None:
+        """스레드 풀 종료 및 YoutubeDL 인스턴스 정리"""
+        self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._instances_lock:
+            instances = list(self._instances)
+            self._instances.clear()
+        for ydl in instances:
+            try:
+                ydl.close()
+            except Exception:
+                pass
+
+    def _get_ydl(self, params: Dict):
+        """
+        현재 스레드의 YoutubeDL 인스턴스 반환 (옵션 조합별로 재사용)
+        - 옵션이 같으면 같은 인스턴스를 사용하여 연결/추출기 캐시 유지
+        - 스레드당 인스턴스 수가 상한을 넘으면 가장 오래된 것부터 정리
+        """
+        import yt_dlp
+
+        cache = getattr(self._local, 'instances', None)
+        if cache is None:
+            cache = self._local.instances = {}
+
+        key = json.dumps(params, sort_keys=True, default=str)
+        ydl = cache.get(key)
+        if ydl is not None:
+            return ydl
+
+        if len(cache) >= INPROCESS_MAX_INSTANCES_PER_THREAD:
+            oldest_key = next(iter(cache))
+            oldest = cache.pop(oldest_key)
+            with self._instances_lock:
+                if oldest in self._instances:
+                    self._instances.remove(oldest)
+            try:
+                oldest.close()
+            except Exception:
+                pass
+
+        ydl = yt_dlp.YoutubeDL(params)
+        cache[key] = ydl
+        with self._instances_lock:
+            self._instances.append(ydl)
+        return ydl
+
+    def _extract(self, url: str, params: Dict, process: bool, options: Dict) -> Optional[Dict]:
+        """스레드 풀 내부에서 실행되는 추출 함수 (info JSON 저장 및 필드 선택 포함)"""
+        ydl = self._get_ydl(params)
+        info = ydl.extract_info(url, download=False, process=process)
+        if not info:
+            return None
+        info = ydl.sanitize_info(info)
+        if options.get('info_json_dir'):
+            write_info_json(info, options['info_json_dir'])
+        if options.get('fields'):
+            info = project_fields(info, options['fields'])
+        return info
+
+    def extract_info(self, url: str, download: bool = False, options: Optional[Dict] = None) -> Tuple[Optional[Dict], bool]:
+        """
+        메타데이터 추출 (YtDlpWrapper.extract_info와 동일한 인터페이스)
+
+        포맷 선택(크기 추정)이나 플레이리스트 평탄화가 필요할 때만 process=True로 실행하고,
+        그 외에는 process=False로 포맷 선택 단계를 생략
+
+        Returns:
+            (메타데이터 딕셔너리, 성공 여부)
+        """
+        if not self.is_available():
+            return None, False
+
+        options = options or {}
+        params = build_api_options(options)
+        process = bool(options.get('format') or options.get('extract_flat'))
+
+        log.info(f"Extracting info (in-process): {url}")
+        try:
+            future = self._executor.submit(self._extract, url, params, process, options)
+            info = future.result(timeout=INPROCESS_EXTRACT_TIMEOUT_SEC)
+        except Exception as e:
+            log.error(f"extract_info (in-process) error: {e}")
+            return None, False
+
+        if not info:
+            return None, False
+        return info, True
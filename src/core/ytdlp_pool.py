@@ -0,0 +1,460 @@
+"""
+yt-dlp 상주 프로세스 풀
+- yt_dlp 파이썬 모듈을 미리 로드한 헬퍼 프로세스를 띄워두고 작업마다 재사용
+- 작업/진행률 이벤트는 multiprocessing Pipe로 주고받음 (작업당 프로세스 기동 비용 제거)
+- YtDlpWrapper와 동일한 download / extract_info 인터페이스 제공
+- 풀을 사용할 수 없으면 호출 측(download_handler)에서 YtDlpWrapper로 폴백
+- 헬퍼는 각자 새 세션(프로세스 그룹)으로 실행하고 감독자에 등록
+    → 작업 취소/앱 종료 시 헬퍼가 띄운 ffmpeg까지 그룹 단위로 즉시 종료
+"""
+import multiprocessing
+import os
+import queue
+import subprocess
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from utils.logger import log
+from core.process_supervisor import supervisor
+from core.ytdlp_wrapper import build_api_options, project_fields, write_info_json
+from constants import (
+    POOL_PROGRESS_INTERVAL_SEC, POOL_CANCEL_TIMEOUT_SEC, POOL_ACQUIRE_TIMEOUT_SEC, POOL_STOP_TIMEOUT_SEC,
+    PROCESS_SHUTDOWN_TIMEOUT_SEC, PROCESS_KILL_WAIT_SEC, STATUS_DOWNLOADING, STATUS_POSTPROCESSING, STATUS_AFTER_MOVE, STATUS_FORMAT_SELECTED
+)
+
+# 헬퍼 -> 부모로 전달할 진행률 필드 (info_dict 등 큰 객체는 제외)
+_PROGRESS_FIELDS = (
+    'status', 'downloaded_bytes', 'total_bytes', 'total_bytes_estimate',
+    'speed', 'eta', 'filename', 'tmpfilename', 'fragment_index', 'fragment_count',
+)
+
+# 메시지 종류 (튜플의 첫 번째 요소)
+_MSG_READY = 'ready'
+_MSG_FATAL = 'fatal'
+_MSG_PROGRESS = 'progress'
+_MSG_DONE = 'done'
+_JOB_DOWNLOAD = 'download'
+_JOB_EXTRACT = 'extract'
+_JOB_STOP = 'stop'
+
+
+class _JobCancelled(Exception):
+    """부모가 작업 취소를 요청했을 때 헬퍼 내부에서 사용하는 예외"""
+
+
+# =====================================================================
+# 헬퍼 프로세스 측 코드 (spawn으로 실행되므로 모듈 최상위 함수여야 함)
+# =====================================================================
+
+def _helper_main(conn, cancel_event, rate_value) -> None:
+    """헬퍼 프로세스 진입점: 작업을 받아 yt_dlp로 실행하고 결과를 돌려줌"""
+    # 새 세션의 리더가 되어 pgid == pid (ffmpeg 등 자식도 같은 그룹 → 감독자가 한 번에 종료)
+    if hasattr(os, 'setsid'):
+        os.setsid()
+    try:
+        import yt_dlp
+    except ImportError as e:
+        conn.send((_MSG_FATAL, f"yt_dlp import failed: {e}"))
+        return
+
+    conn.send((_MSG_READY,))
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+
+        kind = job[0]
+        if kind == _JOB_STOP:
+            break
+
+        cancel_event.clear()
+        try:
+            if kind == _JOB_DOWNLOAD:
+                result = _helper_download(yt_dlp, conn, cancel_event, rate_value, job[1], job[2], job[3])
+            elif kind == _JOB_EXTRACT:
+                result = _helper_extract(yt_dlp, *job[1:])
+            else:
+                result = (False, f"Unknown job: {kind}")
+        except _JobCancelled as e:
+            result = (False, str(e))
+        except Exception as e:
+            result = (False, str(e))
+
+        try:
+            conn.send((_MSG_DONE,) + result)
+        except (EOFError, OSError):
+            break
+
+
+def _helper_download(yt_dlp, conn, cancel_event, rate_value, url: str, params: Dict,
+                     info_json_path: Optional[str] = None) -> Tuple[bool, str]:
+    """
+    헬퍼 내부 다운로드 실행 (진행률은 Pipe로 전달, info JSON이 있으면 재추출 생략)
+    - rate_value가 0 이상이면 부모가 대역폭 예산에 따라 바꾸는 속도 제한 (0이면 제한 없음)
+      yt_dlp는 블록마다 params['ratelimit']을 다시 읽으므로 받는 도중에도 반영됨
+    """
+    last_sent = [0.0]
+    format_sent = set()
+
+    def progress_hook(d):
+        if cancel_event.is_set():
+            raise _JobCancelled('cancelled')
+
+        rate = rate_value.value
+        if rate >= 0:
+            ydl.params['ratelimit'] = int(rate) or None
+
+        # 영상별 첫 이벤트에서 선택된 포맷 전달 (CLI의 --print before_dl과 동일)
+        info = d.get('info_dict') or {}
+        if info.get('id') not in format_sent:
+            format_sent.add(info.get('id'))
+            requested = info.get('requested_formats')
+            format_id = '+'.join(f.get('format_id', '') for f in requested) if requested else info.get('format_id')
+            conn.send((_MSG_PROGRESS, {'status': STATUS_FORMAT_SELECTED, 'format_id': format_id,
+                                       'video_id': info.get('id')}))
+
+        status = d.get('status')
+        now = time.monotonic()
+        # 다운로드 중 이벤트는 간격 제한 (IPC 부하 감소), 상태 변화 이벤트는 항상 전달
+        if status == STATUS_DOWNLOADING and now - last_sent[0] < POOL_PROGRESS_INTERVAL_SEC:
+            return
+        last_sent[0] = now
+        event = {k: d.get(k) for k in _PROGRESS_FIELDS if k in d}
+        event['video_id'] = info.get('id')
+        event['format_id'] = info.get('format_id')  # 받는 중인 스트림 (이어받기 기록용)
+        conn.send((_MSG_PROGRESS, event))
+
+    def postprocessor_hook(d):
+        if cancel_event.is_set():
+            raise _JobCancelled('cancelled')
+        if d.get('status') == 'started':
+            conn.send((_MSG_PROGRESS, {'status': STATUS_POSTPROCESSING}))
+
+    def post_hook(filepath):
+        # 병합/변환/이동이 모두 끝난 최종 경로
+        conn.send((_MSG_PROGRESS, {'status': STATUS_AFTER_MOVE, 'filepath': filepath}))
+
+    params = dict(params)
+    params['progress_hooks'] = [progress_hook]
+    params['postprocessor_hooks'] = [postprocessor_hook]
+
+    with yt_dlp.YoutubeDL(params) as ydl:
+        ydl.add_post_hook(post_hook)
+        if info_json_path:
+            retcode = ydl.download_with_info_file(info_json_path)
+        else:
+            retcode = ydl.download([url])
+
+    if retcode != 0:
+        return False, f"yt-dlp exited with code {retcode}"
+    return True, "Download complete"
+
+
+def _helper_extract(yt_dlp, url: str, params: Dict, download: bool,
+                    fields=None, info_dir: Optional[str] = None) -> Tuple[bool, Any]:
+    """
+    헬퍼 내부 메타데이터 추출 (JSON 직렬화 가능한 dict로 정리하여 반환)
+    - info_dir: 전체 info JSON을 헬퍼에서 바로 파일로 기록
+    - fields: 부모로 보낼 필드 (Pipe 전송량 감소)
+    """
+    with yt_dlp.YoutubeDL(params) as ydl:
+        info = ydl.extract_info(url, download=download)
+        if not info:
+            return False, None
+        info = ydl.sanitize_info(info)
+    
+    if info_dir:
+        write_info_json(info, info_dir)
+    if fields:
+        info = project_fields(info, fields)
+    return True, info
+
+
+# =====================================================================
+# 부모 프로세스 측 코드
+# =====================================================================
+
+class _HelperHandle:
+    """헬퍼 프로세스를 Popen과 같은 pid/poll()/wait(timeout) 인터페이스로 감쌈 (감독자 등록용)"""
+
+    def __init__(self, process):
+        self.process = process
+        self.pid = process.pid
+
+    def poll(self) -> Optional[int]:
+        return self.process.exitcode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        self.process.join(timeout)
+        if self.process.exitcode is None:
+            raise subprocess.TimeoutExpired(str(self.pid), timeout)
+        return self.process.exitcode
+
+
+class _PoolHelper:
+    """헬퍼 프로세스 1개와 통신 채널"""
+
+    def __init__(self, ctx):
+        self.conn, child_conn = ctx.Pipe(duplex=True)
+        self.cancel_event = ctx.Event()
+        # 대역폭 예산의 몫 (바이트/초, 음수면 작업 옵션의 ratelimit 그대로)
+        self.rate = ctx.Value('d', -1.0, lock=False)
+        self.process = ctx.Process(
+            target=_helper_main, args=(child_conn, self.cancel_event, self.rate), daemon=True
+        )
+        self.process.start()
+        child_conn.close()  # 부모 쪽에서는 자식 끝을 닫아야 EOF 감지 가능
+        self.handle = supervisor.adopt(_HelperHandle(self.process))
+        self.ready = False
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def bind(self, task_ids: Iterable[int]) -> None:
+        """받는 동안 작업에 연결 (작업 취소 시 감독자가 헬퍼 그룹을 바로 종료)"""
+        supervisor.adopt(self.handle, task_ids)
+
+    def unbind(self, task_ids: Iterable[int]) -> None:
+        supervisor.detach(self.handle, task_ids)
+
+    def request_stop(self) -> None:
+        """정상 종료 요청 (받는 중이면 취소 후 다음 메시지에서 종료)"""
+        self.cancel_event.set()
+        try:
+            self.conn.send((_JOB_STOP,))
+        except Exception:
+            pass
+
+    def kill(self) -> None:
+        """헬퍼 그룹 강제 종료 (헬퍼가 띄운 ffmpeg 포함)"""
+        supervisor.kill(self.handle, wait=False)
+        # 세션을 만들기 전(기동 직후)이면 그룹이 없으므로 헬퍼만이라도 종료
+        if self.process.is_alive():
+            self.process.kill()
+
+    def close(self) -> None:
+        """종료된 헬퍼 회수 및 등록/채널 정리"""
+        self.process.join(timeout=PROCESS_KILL_WAIT_SEC)
+        supervisor.release(self.handle)
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+    def stop(self, graceful: bool = True) -> None:
+        """헬퍼 종료 (정상 종료 요청 후 응답 없으면 그룹 강제 종료)"""
+        if graceful:
+            self.request_stop()
+            self.process.join(timeout=POOL_STOP_TIMEOUT_SEC)
+        if self.process.is_alive():
+            self.kill()
+        self.close()
+
+
+class YtDlpProcessPool:
+    """yt_dlp 모듈을 로드한 상주 헬퍼 프로세스 풀 (YtDlpWrapper와 동일한 인터페이스)"""
+
+    def __init__(self, size: int, ffmpeg_path: Optional[str] = None):
+        """
+        Args:
+            size: 헬퍼 프로세스 수
+            ffmpeg_path: ffmpeg 경로 (옵션에 없을 때 사용)
+        """
+        self.size = max(1, size)
+        self.ffmpeg_path = ffmpeg_path
+        # Windows/PyInstaller 환경과 동작을 맞추기 위해 항상 spawn 사용
+        self._ctx = multiprocessing.get_context('spawn')
+        self._idle: "queue.Queue[_PoolHelper]" = queue.Queue()
+        self._helpers: List[_PoolHelper] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._available = True  # 헬퍼에서 yt_dlp를 로드하지 못하면 False (폴백 유도)
+
+    def start(self) -> None:
+        """헬퍼 프로세스 기동"""
+        with self._lock:
+            while len(self._helpers) < self.size:
+                self._spawn_locked()
+        log.info(f"yt-dlp 프로세스 풀 시작 (헬퍼 {self.size}개)")
+
+    def resize(self, size: int) -> None:
+        """헬퍼 수 조정 (줄일 때는 유휴 헬퍼부터 종료)"""
+        with self._lock:
+            self.size = max(1, size)
+            while len(self._helpers) < self.size:
+                self._spawn_locked()
+
+        while len(self._helpers) > self.size:
+            try:
+                helper = self._idle.get_nowait()
+            except queue.Empty:
+                break  # 나머지는 작업 종료 후 _release에서 정리
+            self._discard(helper)
+
+    def is_available(self) -> bool:
+        """풀 사용 가능 여부"""
+        return self._available and not self._closed
+
+    def shutdown(self, timeout: float = PROCESS_SHUTDOWN_TIMEOUT_SEC) -> None:
+        """
+        모든 헬퍼 종료
+        - 모든 헬퍼에 동시에 종료 요청 → 공통 제한 시간 안에 회수 → 남은 헬퍼 그룹은 한꺼번에 강제 종료
+        """
+        self._closed = True
+        with self._lock:
+            helpers = list(self._helpers)
+            self._helpers.clear()
+        for helper in helpers:
+            helper.request_stop()
+
+        deadline = time.monotonic() + timeout
+        for helper in helpers:
+            helper.process.join(max(0.0, deadline - time.monotonic()))
+        remaining = [helper for helper in helpers if helper.is_alive()]
+        if remaining:
+            log.warning(f"제한 시간 내 종료되지 않은 yt-dlp 헬퍼 {len(remaining)}개 강제 종료")
+        for helper in remaining:
+            helper.kill()
+        for helper in helpers:
+            helper.close()
+
+    # --- 헬퍼 관리 ---
+
+    def _spawn_locked(self) -> None:
+        helper = _PoolHelper(self._ctx)
+        self._helpers.append(helper)
+        self._idle.put(helper)
+
+    def _discard(self, helper: _PoolHelper, graceful: bool = True) -> None:
+        with self._lock:
+            if helper in self._helpers:
+                self._helpers.remove(helper)
+        helper.stop(graceful)
+
+    def _acquire(self) -> Optional[_PoolHelper]:
+        try:
+            return self._idle.get(timeout=POOL_ACQUIRE_TIMEOUT_SEC)
+        except queue.Empty:
+            return None
+
+    def _release(self, helper: _PoolHelper, healthy: bool = True) -> None:
+        """작업을 마친 헬퍼 반환 (비정상/초과 헬퍼는 폐기 후 필요 시 재생성)"""
+        if not healthy or self._closed or len(self._helpers) > self.size:
+            # 응답 없는 헬퍼는 기다리지 않고 그룹째 종료
+            self._discard(helper, graceful=healthy)
+            if not self._closed:
+                with self._lock:
+                    if len(self._helpers) < self.size:
+                        self._spawn_locked()
+            return
+        self._idle.put(helper)
+
+    def _wait_ready(self, helper: _PoolHelper) -> bool:
+        """첫 작업 전 헬퍼의 초기화(yt_dlp import) 완료 대기"""
+        if helper.ready:
+            return True
+        msg = helper.conn.recv()
+        if msg[0] == _MSG_FATAL:
+            log.error(f"yt-dlp 헬퍼 초기화 실패: {msg[1]}")
+            self._available = False
+            return False
+        helper.ready = True
+        return True
+
+    def _run_job(self, job: tuple, progress_hook: Optional[Callable] = None, share=None,
+                 task_ids: Iterable[int] = ()) -> Tuple[bool, Any]:
+        """
+        헬퍼 하나를 빌려 작업 실행
+        - progress_hook 예외(일시정지 등) 발생 시 헬퍼에 취소 요청 후 예외를 그대로 전파
+        - share(BandwidthShare)를 주면 몫이 바뀔 때마다 헬퍼의 속도 제한에 반영
+        - task_ids: 실행 중에만 헬퍼를 작업에 연결 (취소하면 감독자가 헬퍼 그룹을 종료 → 통신 오류로 끝남)
+        """
+        helper = self._acquire()
+        if helper is None:
+            return False, "Process pool busy"
+
+        healthy = True
+        hook_error = None
+        try:
+            if not self._wait_ready(helper):
+                healthy = False
+                return False, "Process pool unavailable"
+
+            helper.rate.value = -1.0
+            helper.bind(task_ids)
+            if share is not None:
+                share.bind(lambda rate: setattr(helper.rate, 'value', float(rate)))
+            helper.conn.send(job)
+            while True:
+                if hook_error is not None and not helper.conn.poll(POOL_CANCEL_TIMEOUT_SEC):
+                    # 취소 요청에 응답하지 않음 (후처리 중 등) → 헬퍼 교체
+                    healthy = False
+                    raise hook_error
+
+                msg = helper.conn.recv()
+                kind = msg[0]
+
+                if kind == _MSG_PROGRESS:
+                    if progress_hook and hook_error is None:
+                        try:
+                            progress_hook(msg[1])
+                        except Exception as e:
+                            hook_error = e
+                            helper.cancel_event.set()
+                elif kind == _MSG_DONE:
+                    if hook_error is not None:
+                        raise hook_error
+                    return msg[1], msg[2]
+        except (EOFError, OSError, BrokenPipeError) as e:
+            healthy = False
+            log.error(f"yt-dlp 헬퍼 통신 오류: {e}")
+            return False, f"Process pool error: {e}"
+        finally:
+            helper.unbind(task_ids)
+            if share is not None:
+                share.bind(None)
+            self._release(helper, healthy)
+
+    # --- YtDlpWrapper 호환 인터페이스 ---
+
+    def download(self, url: str, options: Dict, progress_hook: Callable) -> Tuple[bool, str]:
+        """
+        영상 다운로드 (YtDlpWrapper.download와 동일한 인터페이스)
+
+        Returns:
+            (성공 여부, 에러 메시지)
+        """
+        params = build_api_options(options, self.ffmpeg_path)
+        log.info(f"Running yt-dlp (pool): {url}")
+        try:
+            job = (_JOB_DOWNLOAD, url, params, options.get('load_info_json'))
+            success, message = self._run_job(job, progress_hook, options.get('bandwidth_share'),
+                                             options.get('task_ids', ()))
+        except Exception as e:
+            # progress_hook 예외 (일시정지 등) → YtDlpWrapper와 동일하게 메시지로 반환
+            return False, f"Unexpected error: {e}"
+
+        if not success:
+            log.error(f"yt-dlp (pool) failed: {message}")
+        return success, message
+
+    def extract_info(self, url: str, download: bool = False, options: Optional[Dict] = None) -> Tuple[Optional[Dict], bool]:
+        """
+        메타데이터 추출 (YtDlpWrapper.extract_info와 동일한 인터페이스)
+
+        Returns:
+            (메타데이터 딕셔너리, 성공 여부)
+        """
+        options = options or {}
+        params = build_api_options(options, self.ffmpeg_path)
+        job = (_JOB_EXTRACT, url, params, download, options.get('fields'), options.get('info_json_dir'))
+
+        log.info(f"Extracting info (pool): {url}")
+        success, info = self._run_job(job)
+        if not success or not info:
+            log.error(f"extract_info (pool) failed: {info}")
+            return None, False
+        return info, True
@@ -4,14 +4,308 @@ yt-dlp.exe subprocess 래퍼
 - Python API와 동일한 인터페이스 제공
 - stdout 파싱을 통한 진행률 모니터링
 """
+import asyncio
 import subprocess
 import threading
 import json
-import re
 import os
-from typing import Dict, Callable, Optional, Tuple, List
+import signal
+import time
+from typing import Dict, Callable, Optional, Tuple, List, Iterator
 from utils.logger import log
-from constants import YTDLP_TIMEOUT, YTDLP_RETRIES, DEFAULT_ENCODING
+from core.process_supervisor import supervisor
+from constants import (
+    YTDLP_TIMEOUT, YTDLP_RETRIES, DEFAULT_ENCODING, INFO_JSON_OUTPUT_TEMPLATE,
+    STATUS_POSTPROCESSING, STATUS_AFTER_MOVE, STATUS_FORMAT_SELECTED, MSG_PAUSED_BY_USER, SUSPEND_MAX_SEC,
+    PROCESS_KILL_WAIT_SEC
+)
+
+# 진행률 출력 규약 (--progress-template): 접두사 + 영상 ID + 탭 + JSON 한 줄
+# 사람이 읽는 진행률 문자열 대신 yt-dlp progress hook과 같은 필드를 그대로 받음
+# 영상 ID는 여러 URL을 한 번에 받을 때 이벤트를 작업별로 나누는 데 사용
+_PROGRESS_PREFIX = '[ytdl-progress]'
+_POSTPROCESS_PREFIX = '[ytdl-postprocess]'
+_FILEPATH_PREFIX = '[ytdl-filepath]'  # --print after_move: 최종 파일 경로 (병합/변환/이동 이후)
+_FORMAT_PREFIX = '[ytdl-format]'      # --print before_dl: 선택된 포맷 ID (병합 시 '137+140')
+_ID_SEPARATOR = '\t'
+_PROGRESS_FIELDS = (
+    'status', 'downloaded_bytes', 'total_bytes', 'total_bytes_estimate', 'speed', 'eta',
+    'filename', 'tmpfilename', 'fragment_index', 'fragment_count',
+)
+_PROGRESS_TEMPLATE = ('download:' + _PROGRESS_PREFIX + '%(info.id)s' + _ID_SEPARATOR
+                      + '%(info.format_id)s' + _ID_SEPARATOR  # 받는 중인 스트림의 포맷 ID (이어받기 기록용)
+                      + '%(progress.{' + ','.join(_PROGRESS_FIELDS) + '})j')
+_POSTPROCESS_TEMPLATE = ('postprocess:' + _POSTPROCESS_PREFIX + '%(info.id)s' + _ID_SEPARATOR
+                         + '%(progress.{status,postprocessor})j')
+_FILEPATH_TEMPLATE = 'after_move:' + _FILEPATH_PREFIX + '%(id)s' + _ID_SEPARATOR + '%(filepath)s'
+_FORMAT_TEMPLATE = 'before_dl:' + _FORMAT_PREFIX + '%(id)s' + _ID_SEPARATOR + '%(format_id)s'
+_json_decode = json.JSONDecoder().decode
+
+
+def build_api_options(options: Dict, ffmpeg_path: Optional[str] = None) -> Dict:
+    """
+    CLI용 옵션 딕셔너리를 yt_dlp.YoutubeDL 파라미터로 변환
+    (_build_command의 API 버전 - 상주 프로세스 풀 등 yt_dlp 모듈을 직접 사용할 때)
+    
+    progress_hooks처럼 프로세스 경계를 넘을 수 없는 항목은 제외하므로
+    호출 측에서 훅을 별도로 등록해야 함
+    
+    Args:
+        options: yt-dlp 옵션 딕셔너리 (_build_all_options 결과 등)
+        ffmpeg_path: ffmpeg 경로 (옵션에 없을 때 사용)
+    
+    Returns:
+        YoutubeDL 생성자에 전달할 파라미터 딕셔너리
+    """
+    params = {
+        'quiet': True,
+        'no_warnings': True,
+        'noprogress': True,
+        'continuedl': True,  # 이어받기 (.part 파일 사용)
+        'fragment_retries': int(YTDLP_RETRIES),
+    }
+    
+    # 이름이 그대로 대응되는 옵션
+    for key in ('outtmpl', 'format', 'merge_output_format', 'noplaylist', 'extract_flat',
+                'cookiefile', 'concurrent_fragment_downloads', 'overwrites', 'keepvideo', 'ratelimit'):
+        if key in options:
+            params[key] = options[key]
+    
+    # FFmpeg 경로
+    if 'ffmpeg_location' in options:
+        params['ffmpeg_location'] = options['ffmpeg_location']
+    elif ffmpeg_path:
+        params['ffmpeg_location'] = ffmpeg_path
+    
+    # 오디오 추출 (--extract-audio --audio-format)
+    if options.get('extract_audio'):
+        extract_pp = {'key': 'FFmpegExtractAudio'}
+        if 'audio_format' in options:
+            extract_pp['preferredcodec'] = options['audio_format']
+        params['postprocessors'] = [extract_pp]
+    
+    # 후처리 인자 ({'ffmpeg': ['-af', ...]} 형식은 API와 동일)
+    if 'postprocessor_args' in options:
+        params['postprocessor_args'] = {
+            name: list(pp_args) for name, pp_args in options['postprocessor_args'].items()
+        }
+    
+    # JS 런타임 ('quickjs:경로' -> {'quickjs': {'path': 경로}})
+    if 'js_runtimes' in options:
+        runtime, _, runtime_path = options['js_runtimes'].partition(':')
+        params['js_runtimes'] = {runtime: {'path': runtime_path} if runtime_path else {}}
+    
+    return params
+
+
+def _split_video_id(payload: str) -> Tuple[Optional[str], str]:
+    """'ID<탭>내용' 형식을 (ID, 내용)으로 분리 (ID가 없는 형식이면 (None, 원문))"""
+    video_id, sep, rest = payload.partition(_ID_SEPARATOR)
+    if not sep:
+        return None, payload
+    return video_id or None, rest
+
+
+def parse_progress_line(line: str) -> Optional[Dict]:
+    """
+    --progress-template로 출력된 한 줄을 progress hook 형식 dict로 변환
+    (접두사 비교 + JSON 디코딩 1회, 진행률 줄이 아니면 None)
+    
+    Returns:
+        다운로드 진행률: yt-dlp progress hook과 같은 필드 (downloaded_bytes 등 정확한 바이트 값)
+                        + 받는 중인 스트림의 'format_id'
+        후처리 시작: {'status': 'postprocessing'}
+        포맷 선택: {'status': 'format_selected', 'format_id': '137+140'}
+        최종 경로: {'status': 'after_move', 'filepath': 경로}
+        모든 이벤트에 해당 영상 ID가 'video_id'로 포함됨 (알 수 있는 경우)
+    """
+    if line.startswith(_PROGRESS_PREFIX):
+        video_id, payload = _split_video_id(line[len(_PROGRESS_PREFIX):])
+        format_id, payload = _split_video_id(payload)
+        try:
+            event = _json_decode(payload)
+        except ValueError:
+            return None
+        event['video_id'] = video_id
+        event['format_id'] = format_id
+        return event
+    
+    if line.startswith(_POSTPROCESS_PREFIX):
+        video_id, payload = _split_video_id(line[len(_POSTPROCESS_PREFIX):])
+        try:
+            pp = _json_decode(payload)
+        except ValueError:
+            return None
+        if pp.get('status') == 'started':
+            return {'status': STATUS_POSTPROCESSING, 'postprocessor': pp.get('postprocessor'),
+                    'video_id': video_id}
+        return None
+    
+    if line.startswith(_FORMAT_PREFIX):
+        video_id, format_id = _split_video_id(line[len(_FORMAT_PREFIX):].rstrip('\r\n'))
+        return {'status': STATUS_FORMAT_SELECTED, 'format_id': format_id, 'video_id': video_id}
+    
+    if line.startswith(_FILEPATH_PREFIX):
+        video_id, filepath = _split_video_id(line[len(_FILEPATH_PREFIX):].rstrip('\r\n'))
+        return {'status': STATUS_AFTER_MOVE, 'filepath': filepath, 'video_id': video_id}
+    return None
+
+
+def project_fields(info: Dict, fields) -> Dict:
+    """
+    info dict에서 지정한 필드만 남김 (--print '%(.{...})j'와 같은 결과)
+    플레이리스트 entries가 있으면 각 항목에도 적용
+    """
+    projected = {k: info[k] for k in fields if k in info}
+    if info.get('entries'):
+        projected['entries'] = [project_fields(e, fields) for e in info['entries'] if e]
+    return projected
+
+
+def info_json_path(info_dir: str, info: Dict) -> Optional[str]:
+    """INFO_JSON_OUTPUT_TEMPLATE으로 저장되는 info JSON 경로 (extractor_key/id가 없으면 None)"""
+    extractor_key = info.get('extractor_key')
+    video_id = info.get('id')
+    if not extractor_key or not video_id:
+        return None
+    return os.path.join(info_dir, f"{extractor_key}_{video_id}.info.json")
+
+
+def write_info_json(info: Dict, info_dir: str) -> Optional[str]:
+    """
+    포맷 목록이 포함된 info dict를 --write-info-json과 같은 경로에 저장 (API 실행기용)
+    - flat 항목처럼 formats가 없으면 다운로드에 재사용할 수 없으므로 저장하지 않음
+    """
+    path = info_json_path(info_dir, info)
+    if not path or not info.get('formats'):
+        return None
+    try:
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(info, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return path
+    except Exception as e:
+        log.warning(f"info JSON 저장 실패 ({path}): {e}")
+        return None
+
+
+class ProcessSuspender:
+    """
+    실행 중인 yt-dlp 프로세스 그룹을 일시 중지/재개 (POSIX 전용, SIGSTOP/SIGCONT)
+    (프로세스는 supervisor가 새 세션으로 실행하므로 pgid == pid)
+    - 종료 후 재시작과 달리 추출/포맷 협상을 다시 하지 않고 받던 연결 그대로 이어감
+    - ffmpeg 등 자식 프로세스도 함께 멈추도록 프로세스 그룹 단위로 신호 전송
+    - max_suspend_sec 동안 재개되지 않으면 연결 만료로 보고 프로세스를 종료 (escalated)
+    
+    다운로드 옵션의 'process_control'로 전달하면 YtDlpWrapper가 실행 중인 프로세스를 연결함
+    """
+    
+    supported = os.name == 'posix' and hasattr(signal, 'SIGSTOP')
+    
+    def __init__(self, max_suspend_sec: float = SUSPEND_MAX_SEC):
+        self.max_suspend_sec = max_suspend_sec
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._timer: Optional[threading.Timer] = None
+        self.suspended = False
+        self.escalated = False
+    
+    def attach(self, process: subprocess.Popen) -> None:
+        """새로 시작한 프로세스 연결 (이전 상태 초기화)"""
+        with self._lock:
+            self._process = process
+            self.suspended = False
+            self.escalated = False
+    
+    def detach(self) -> None:
+        """프로세스 종료 후 연결 해제"""
+        with self._lock:
+            self._cancel_timer()
+            self._process = None
+            self.suspended = False
+    
+    def suspend(self) -> bool:
+        """프로세스 그룹 일시 중지 (지원되지 않거나 실행 중이 아니면 False)"""
+        with self._lock:
+            if self.suspended:
+                return True
+            if not self.supported or not self._signal(signal.SIGSTOP):
+                return False
+            self.suspended = True
+            self._timer = threading.Timer(self.max_suspend_sec, self._escalate)
+            self._timer.daemon = True
+            self._timer.start()
+            log.info(f"yt-dlp 프로세스 일시 중지 (pid={self._process.pid})")
+            return True
+    
+    def resume(self) -> bool:
+        """일시 중지된 프로세스 그룹 재개 (중지 상태가 아니었으면 False)"""
+        with self._lock:
+            if not self.suspended:
+                return False
+            self._cancel_timer()
+            self.suspended = False
+            if not self._signal(signal.SIGCONT):
+                return False
+            log.info(f"yt-dlp 프로세스 재개 (pid={self._process.pid})")
+            return True
+    
+    def _escalate(self) -> None:
+        """제한 시간 초과: 멈춘 프로세스를 종료 (호출 측에서는 일시정지로 처리됨)"""
+        with self._lock:
+            if not self.suspended:
+                return
+            log.warning(f"일시 중지가 {self.max_suspend_sec}초를 넘어 yt-dlp 프로세스 종료")
+            self.escalated = True
+            self.suspended = False
+            self._signal(signal.SIGKILL)
+            self._signal(signal.SIGCONT)
+    
+    def _cancel_timer(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+    
+    def _signal(self, sig: int) -> bool:
+        """프로세스 그룹에 신호 전송"""
+        process = self._process
+        if process is None or process.poll() is not None:
+            return False
+        try:
+            os.killpg(process.pid, sig)
+            return True
+        except OSError as e:
+            log.warning(f"프로세스 신호 전송 실패 ({sig}): {e}")
+            return False
+
+
+class AsyncProcessHandle:
+    """
+    asyncio 프로세스를 Popen과 같은 pid/poll()/wait(timeout) 인터페이스로 감쌈
+    (감독자/ProcessSuspender가 subprocess 실행과 동일하게 다룰 수 있도록)
+    
+    returncode는 이벤트 루프가 갱신하므로 wait()는 루프 스레드가 아닌 곳에서만 호출해야 함
+    """
+    
+    def __init__(self, process: 'asyncio.subprocess.Process'):
+        self.process = process
+        self.pid = process.pid
+    
+    @property
+    def returncode(self) -> Optional[int]:
+        return self.process.returncode
+    
+    def poll(self) -> Optional[int]:
+        return self.process.returncode
+    
+    def wait(self, timeout: Optional[float] = None) -> int:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.process.returncode is None:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise subprocess.TimeoutExpired(str(self.pid), timeout)
+            time.sleep(0.05)
+        return self.process.returncode
 
 
 class YtDlpWrapper:
@@ -26,29 +320,11 @@ class YtDlpWrapper:
         self.ytdlp_path = ytdlp_path
         self.ffmpeg_path = ffmpeg_path
         self.current_process: Optional[subprocess.Popen] = None  # 외부에서 kill 가능하도록 참조 보관
-        
-        # 진행률 파싱용 정규식 패턴
-        # [download]  45.2% of 10.5MiB at 2.3MiB/s ETA 00:03
-        self.progress_pattern = re.compile(
-            r'\[download\]\s+(?P<percent>[\d.]+)%\s+of\s+(?P<total>[\d.]+)(?P<total_unit>\w+)'
-            r'(?:\s+at\s+(?P<speed>[\d.]+)(?P<speed_unit>\w+)/s)?'
-            r'(?:\s+ETA\s+(?P<eta>[\d:]+))?'
-        )
-        
-        # [download] Destination: filename.mp4
-        self.destination_pattern = re.compile(r'\[download\] Destination: (.+)')
-        
-        # [download] 100% of 10.5MiB in 00:04
-        self.complete_pattern = re.compile(r'\[download\] 100%')
     
     def _kill_process(self, process: subprocess.Popen) -> None:
-        """프로세스를 안전하게 종료"""
+        """프로세스를 안전하게 종료 (ffmpeg 등 자식 프로세스 포함)"""
         try:
-            if process and process.poll() is None:
-                process.kill()
-                process.wait(timeout=5)
-        except Exception:
-            pass
+            supervisor.kill(process)
         finally:
             self.current_process = None
     
@@ -64,25 +340,53 @@ class YtDlpWrapper:
         Returns:
             (성공 여부, 에러 메시지)
         """
+        # 옵션을 CLI 인자로 변환
+        return self._run_download(self._build_command(url, options), progress_hook,
+                                  options.get('process_control'), options.get('task_ids', ()))
+    
+    def download_many(self, urls: List[str], options: Dict, progress_hook: Callable) -> Tuple[bool, str]:
+        """
+        여러 URL을 yt-dlp 1회 실행으로 다운로드 (짧은 영상/오디오 묶음용)
+        - 프로세스 기동/추출기 초기화 비용을 묶음당 1회로 줄임
+        - --ignore-errors로 실패한 항목은 건너뛰고 나머지를 계속 받음
+        - 진행률/최종 경로 이벤트의 'video_id'로 어느 항목의 이벤트인지 구분
+        
+        Args:
+            urls: 다운로드 URL 목록
+            options: yt-dlp 옵션 딕셔너리 (모든 URL에 동일하게 적용)
+            progress_hook: 진행률 콜백 함수
+        
+        Returns:
+            (모두 성공 여부, 에러 메시지 - 항목별 'ERROR: [추출기] ID: 사유' 줄 포함)
+        """
+        return self._run_download(self._build_command(list(urls), options), progress_hook,
+                                  options.get('process_control'), options.get('task_ids', ()))
+    
+    def _run_download(self, args: List[str], progress_hook: Callable,
+                      control: Optional[ProcessSuspender] = None, task_ids=()) -> Tuple[bool, str]:
+        """
+        yt-dlp 다운로드 프로세스를 실행하고 stdout 진행률을 progress_hook으로 전달
+        - 프로세스는 감독자(supervisor)에 task_ids로 등록 (작업 취소/앱 종료 시 즉시 종료)
+        - control이 있으면 실행 중인 프로세스를 연결하여 외부에서 일시 중지/재개 가능
+        """
         process = None
         stderr_output = []
         try:
-            # 옵션을 CLI 인자로 변환
-            args = self._build_command(url, options)
-            
             log.info(f"Running yt-dlp: {' '.join(args)}")
             
-            # subprocess 실행
-            process = subprocess.Popen(
+            # subprocess 실행 (별도 프로세스 그룹 → 자식 프로세스까지 그룹 단위로 제어)
+            process = supervisor.spawn(
                 args,
+                task_ids=task_ids,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
                 encoding=DEFAULT_ENCODING,
-                errors='replace',
-                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+                errors='replace'
             )
             self.current_process = process
+            if control is not None:
+                control.attach(process)
             
             # stderr를 별도 스레드에서 읽어 파이프 버퍼 데드락 방지
             def _drain_stderr(proc, output_list):
@@ -98,66 +402,22 @@ class YtDlpWrapper:
             )
             stderr_thread.start()
             
-            # 진행률 추적을 위한 변수
-            current_file = None
-            fragments = []  # [{'type': 'video', 'total': 1000, 'downloaded': 500}, ...]
-            current_fragment = None
-            last_progress = {}
-            
-            # stdout 실시간 파싱
+            # stdout 실시간 파싱 (--newline: 진행률 갱신마다 한 줄)
+            last_line = None
             try:
                 for line in iter(process.stdout.readline, ''):
-                    if not line:
-                        break
-                    
-                    line = line.strip()
+                    # 같은 내용의 진행률 줄은 훅 호출 생략
+                    if line == last_line:
+                        continue
+                    last_line = line
                     
-                    # Destination 파싱 (새 fragment 시작)
-                    dest_match = self.destination_pattern.search(line)
-                    if dest_match:
-                        current_file = dest_match.group(1)
-                        log.info(f"Downloading to: {current_file}")
-                        
-                        # 새 fragment 준비
-                        current_fragment = {
-                            'type': 'video' if 'f' in current_file and 'mp4' in current_file else 'audio',
-                            'total': 0,
-                            'downloaded': 0
-                        }
+                    event = parse_progress_line(line)
+                    if event is None:
+                        continue
                     
-                    # 진행률 파싱
-                    progress_data = self._parse_progress(line)
-                    if progress_data and current_fragment is not None:
-                        # 현재 fragment 정보 업데이트
-                        if current_fragment['total'] == 0:
-                            current_fragment['total'] = progress_data['total_bytes']
-                            fragments.append(current_fragment)
-                        
-                        current_fragment['downloaded'] = progress_data['downloaded_bytes']
-                        
-                        # 전체 진행률 계산
-                        total_bytes = sum(f['total'] for f in fragments)
-                        downloaded_bytes = sum(f['downloaded'] for f in fragments)
-                        
-                        if total_bytes > 0:
-                            combined_progress = {
-                                'status': 'downloading',
-                                'downloaded_bytes': downloaded_bytes,
-                                'total_bytes': total_bytes,
-                                'speed': progress_data.get('speed'),
-                                'eta': progress_data.get('eta'),
-                                '_percent_str': f'{downloaded_bytes * 100 / total_bytes:.1f}%',
-                            }
-                            
-                            # 중복 진행률 호출 방지
-                            if combined_progress != last_progress:
-                                progress_hook(combined_progress)
-                                last_progress = combined_progress
-                    
-                    # 완료 감지
-                    if self.complete_pattern.search(line):
-                        log.info("Download complete")
-                        progress_hook({'status': 'finished', 'filename': current_file})
+                    if event.get('status') == 'finished':
+                        log.info(f"Download complete: {event.get('filename')}")
+                    progress_hook(event)
             except Exception as hook_error:
                 # progress_hook 예외 (일시정지 등) → 프로세스 즉시 종료
                 self._kill_process(process)
@@ -172,10 +432,15 @@ class YtDlpWrapper:
                 return False, "Download timeout"
             
             self.current_process = None
+            supervisor.release(process)
             
             # stderr 스레드 종료 대기
             stderr_thread.join(timeout=5)
             
+            # 일시 중지 제한 시간 초과로 종료된 경우 → 일시정지로 처리 (이어받기)
+            if control is not None and control.escalated:
+                return False, MSG_PAUSED_BY_USER
+            
             # stderr 확인
             stderr = ''.join(stderr_output).strip()
             if stderr:
@@ -200,6 +465,109 @@ class YtDlpWrapper:
             error_msg = f"Unexpected error: {e}"
             log.error(error_msg)
             return False, error_msg
+        finally:
+            if control is not None:
+                control.detach()
+    
+    async def download_async(self, url: str, options: Dict, progress_hook: Callable) -> Tuple[bool, str]:
+        """download()의 asyncio 버전 (AsyncDownloadEngine의 이벤트 루프에서 실행)"""
+        return await self._run_download_async(self._build_command(url, options), progress_hook,
+                                              options.get('process_control'), options.get('task_ids', ()))
+    
+    async def _run_download_async(self, args: List[str], progress_hook: Callable,
+                                  control: Optional[ProcessSuspender] = None, task_ids=()) -> Tuple[bool, str]:
+        """
+        _run_download의 asyncio 버전
+        - stdout/stderr를 논블로킹 스트림으로 읽음 (작업당 stderr 읽기 스레드 없음)
+        - 훅 예외(일시정지/취소), 타임아웃, 코루틴 취소 시 프로세스 그룹을 종료하고 루프에서 회수
+        """
+        process = None
+        handle = None
+        stderr_task = None
+        try:
+            log.info(f"Running yt-dlp: {' '.join(args)}")
+            
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                **supervisor.group_options()
+            )
+            handle = supervisor.adopt(AsyncProcessHandle(process), task_ids, wait=False)
+            if control is not None:
+                control.attach(handle)
+            
+            # stderr는 별도 코루틴에서 끝까지 읽어 파이프 버퍼 데드락 방지
+            stderr_task = asyncio.ensure_future(process.stderr.read())
+            
+            last_line = None
+            try:
+                async for raw_line in process.stdout:
+                    line = raw_line.decode(DEFAULT_ENCODING, errors='replace')
+                    if line == last_line:
+                        continue
+                    last_line = line
+                    
+                    event = parse_progress_line(line)
+                    if event is None:
+                        continue
+                    
+                    if event.get('status') == 'finished':
+                        log.info(f"Download complete: {event.get('filename')}")
+                    progress_hook(event)
+            except Exception:
+                await self._kill_process_async(process, handle)
+                raise
+            
+            try:
+                await asyncio.wait_for(process.wait(), timeout=60)
+            except asyncio.TimeoutError:
+                log.warning("yt-dlp process timeout, killing...")
+                await self._kill_process_async(process, handle)
+                return False, "Download timeout"
+            supervisor.release(handle)
+            
+            stderr = (await stderr_task).decode(DEFAULT_ENCODING, errors='replace').strip()
+            
+            if control is not None and control.escalated:
+                return False, MSG_PAUSED_BY_USER
+            
+            if stderr:
+                log.warning(f"yt-dlp stderr: {stderr}")
+            
+            if process.returncode != 0:
+                error_msg = f"yt-dlp exited with code {process.returncode}"
+                if stderr:
+                    error_msg += f": {stderr}"
+                log.error(error_msg)
+                return False, error_msg
+            
+            return True, "Download complete"
+        
+        except asyncio.CancelledError:
+            await self._kill_process_async(process, handle)
+            raise
+        except Exception as e:
+            await self._kill_process_async(process, handle)
+            error_msg = f"Unexpected error: {e}"
+            log.error(error_msg)
+            return False, error_msg
+        finally:
+            if stderr_task is not None and not stderr_task.done():
+                stderr_task.cancel()
+            if control is not None:
+                control.detach()
+    
+    @staticmethod
+    async def _kill_process_async(process, handle: Optional[AsyncProcessHandle]) -> None:
+        """프로세스 그룹 강제 종료 후 루프에서 회수 (_kill_process의 asyncio 버전)"""
+        if handle is not None:
+            supervisor.kill(handle, wait=False)
+        if process is not None and process.returncode is None:
+            try:
+                await asyncio.wait_for(process.wait(), timeout=PROCESS_KILL_WAIT_SEC)
+            except (asyncio.TimeoutError, ProcessLookupError):
+                pass
     
     def extract_info(self, url: str, download: bool = False, options: Optional[Dict] = None) -> Tuple[Optional[Dict], bool]:
         """
@@ -208,56 +576,41 @@ class YtDlpWrapper:
         Args:
             url: YouTube URL
             download: 다운로드 여부 (False면 메타데이터만)
-            options: 추가 옵션
+            options: 추가 옵션 (fields 지정 시 해당 필드만 반환)
         
         Returns:
             (메타데이터 딕셔너리, 성공 여부)
         """
         try:
-            # --dump-json으로 메타데이터 추출
-            args = [self.ytdlp_path, '--dump-json', '--no-warnings']
-            
-            # 옵션 적용
-            if options:
-                if options.get('extract_flat'):
-                    args.append('--flat-playlist')
-                
-                if options.get('noplaylist'):
-                    args.append('--no-playlist')
-                
-                # format 옵션 추가 (크기 추정을 위해)
-                if 'format' in options:
-                    args.extend(['--format', options['format']])
-                
-                # 쿠키 파일 (연령 제한 영상 등 인증 필요 시)
-                if 'cookiefile' in options:
-                    args.extend(['--cookies', options['cookiefile']])
-                
-                # JS 런타임 (YouTube 서명 풀기용)
-                if 'js_runtimes' in options:
-                    args.extend(['--js-runtimes', options['js_runtimes']])
-            
+            # --dump-json (또는 필드 지정 시 --print)으로 메타데이터 추출
+            args = self._build_extract_command(options)
             args.append(url)
             
             log.info(f"Extracting info: {' '.join(args)}")
             
-            result = subprocess.run(
+            process = supervisor.spawn(
                 args,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
                 encoding=DEFAULT_ENCODING,
-                errors='replace',
-                timeout=YTDLP_TIMEOUT,
-                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+                errors='replace'
             )
+            try:
+                stdout, stderr = process.communicate(timeout=YTDLP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                self._kill_process(process)
+                raise
+            finally:
+                supervisor.release(process)
             
-            if result.returncode != 0:
-                log.error(f"extract_info failed: {result.stderr}")
+            if process.returncode != 0:
+                log.error(f"extract_info failed: {stderr}")
                 return None, False
             
             # JSON 파싱
             # --dump-json은 여러 줄의 JSON을 출력할 수 있음 (플레이리스트)
-            lines = result.stdout.strip().split('\n')
+            lines = stdout.strip().split('\n')
             
             if len(lines) == 1:
                 # 단일 영상
@@ -293,119 +646,193 @@ class YtDlpWrapper:
             log.error(f"extract_info error: {e}")
             return None, False
     
-    def _parse_progress(self, line: str) -> Optional[Dict]:
+    def iter_extract_info(self, url: str, options: Optional[Dict] = None) -> Iterator[Dict]:
         """
-        yt-dlp stdout에서 진행률 파싱
+        메타데이터를 스트리밍으로 추출 (--flat-playlist 대형 채널/플레이리스트용)
+        - 전체 목록을 기다리지 않고 yt-dlp가 출력하는 JSON 한 줄마다 즉시 반환
+        - 전체 실행 시간 제한 대신 무응답 시간 제한(YTDLP_TIMEOUT)만 적용
+        - 제너레이터를 중간에 닫으면 yt-dlp 프로세스도 종료
         
         Args:
-            line: stdout 라인
+            url: 플레이리스트/채널 URL
+            options: 추가 옵션 (extract_info와 동일)
         
-        Returns:
-            진행률 딕셔너리 (기존 progress_hook 형식)
-            {
-                'status': 'downloading',
-                'downloaded_bytes': 4744806,
-                'total_bytes': 11010048,
-                'speed': 2411724.8,
-                'eta': 3,
-                '_percent_str': '45.2%',
-                '_total_bytes_str': '10.5MiB',
-                '_speed_str': '2.3MiB/s'
-            }
+        Yields:
+            항목별 메타데이터 딕셔너리
         """
-        match = self.progress_pattern.search(line)
-        
-        if not match:
-            return None
-        
-        percent = float(match.group('percent'))
-        total_size = float(match.group('total'))
-        total_unit = match.group('total_unit')
-        speed_str = match.group('speed')
-        speed_unit = match.group('speed_unit')
-        eta_str = match.group('eta')
-        
-        # 단위 변환 (MiB, GiB 등 -> bytes)
-        total_bytes = self._convert_to_bytes(total_size, total_unit)
-        downloaded_bytes = int(total_bytes * percent / 100)
-        
-        # 속도 변환
-        speed = None
-        if speed_str and speed_unit:
-            speed = self._convert_to_bytes(float(speed_str), speed_unit)
-        
-        # ETA 변환 (00:03 -> 3초)
-        eta = None
-        if eta_str:
-            eta = self._parse_eta(eta_str)
-        
-        return {
-            'status': 'downloading',
-            'downloaded_bytes': downloaded_bytes,
-            'total_bytes': total_bytes,
-            'speed': speed,
-            'eta': eta,
-            '_percent_str': f'{percent}%',
-            '_total_bytes_str': f'{total_size}{total_unit}',
-            '_speed_str': f'{speed_str}{speed_unit}/s' if speed_str else None
-        }
+        args = self._build_extract_command(options)
+        args.append(url)
+        log.info(f"Extracting info (streaming): {' '.join(args)}")
+        yield from self._stream_json_lines(args)
     
-    def _convert_to_bytes(self, size: float, unit: str) -> int:
+    def extract_info_many(self, urls: List[str], options: Optional[Dict] = None) -> Iterator[Tuple[str, Optional[Dict]]]:
         """
-        크기 단위를 bytes로 변환
+        여러 URL의 메타데이터를 yt-dlp 1회 실행으로 추출 (프로세스 기동 비용을 배치당 1회로)
+        - URL 목록은 --batch-file로 stdin에 전달 (명령줄 길이 제한 회피)
+        - 영상마다 출력되는 JSON 한 줄을 즉시 파싱하여 순서대로 반환
+        - 실패한 URL은 --ignore-errors로 건너뛰고 마지막에 (url, None)으로 반환
         
         Args:
-            size: 크기 (숫자)
-            unit: 단위 (KiB, MiB, GiB, KB, MB, GB 등)
+            urls: URL 목록
+            options: 추가 옵션 (extract_info와 동일)
         
-        Returns:
-            bytes
+        Yields:
+            (요청한 URL, 메타데이터 딕셔너리 또는 None)
         """
-        # Binary units (KiB, MiB, GiB)
-        if 'iB' in unit:
-            unit = unit.replace('iB', '')
-            multiplier = 1024
-        # Decimal units (KB, MB, GB)
-        else:
-            unit = unit.replace('B', '')
-            multiplier = 1000
-        
-        unit_map = {
-            'K': multiplier,
-            'M': multiplier ** 2,
-            'G': multiplier ** 3,
-            'T': multiplier ** 4,
-        }
+        pending = list(dict.fromkeys(urls))  # 중복 제거 (순서 유지)
+        if not pending:
+            return
         
-        return int(size * unit_map.get(unit, 1))
+        args = self._build_extract_command(options)
+        args.extend(['--ignore-errors', '--batch-file', '-'])
+        log.info(f"Extracting info (batch of {len(pending)}): {' '.join(args)}")
+        
+        remaining = set(pending)
+        try:
+            for info in self._stream_json_lines(args, stdin_data='\n'.join(pending) + '\n'):
+                # original_url: yt-dlp에 전달된 URL 그대로 (배치 결과를 요청 URL에 매핑)
+                url = info.get('original_url') or info.get('webpage_url')
+                if url not in remaining:
+                    continue
+                remaining.discard(url)
+                yield url, info
+        except Exception as e:
+            log.error(f"extract_info_many error: {e}")
+        
+        for url in pending:
+            if url in remaining:
+                yield url, None
     
-    def _parse_eta(self, eta_str: str) -> int:
+    def _stream_json_lines(self, args: List[str], stdin_data: Optional[str] = None,
+                           inactivity_timeout: float = YTDLP_TIMEOUT) -> Iterator[Dict]:
+        """
+        yt-dlp를 실행하고 stdout의 JSON 줄을 하나씩 파싱하여 반환
+        - 출력이 inactivity_timeout초 동안 없으면 프로세스 종료 (전체 시간 제한 없음)
+        - 제너레이터가 중간에 닫혀도 프로세스를 정리함
         """
-        ETA 문자열을 초로 변환
+        process = supervisor.spawn(
+            args,
+            stdin=subprocess.PIPE if stdin_data is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding=DEFAULT_ENCODING,
+            errors='replace'
+        )
+        
+        stderr_output = []
+        last_activity = [time.monotonic()]
+        timed_out = threading.Event()
+        finished = threading.Event()
+        
+        def _drain_stderr():
+            try:
+                for line in iter(process.stderr.readline, ''):
+                    last_activity[0] = time.monotonic()
+                    stderr_output.append(line)
+            except Exception:
+                pass
+        
+        def _watchdog():
+            # 무응답 감시: 마지막 출력 이후 제한 시간이 지나면 종료
+            while not finished.wait(1.0):
+                if time.monotonic() - last_activity[0] > inactivity_timeout:
+                    timed_out.set()
+                    self._kill_process(process)
+                    break
+        
+        threading.Thread(target=_drain_stderr, daemon=True).start()
+        threading.Thread(target=_watchdog, daemon=True).start()
+        
+        try:
+            if stdin_data is not None:
+                try:
+                    process.stdin.write(stdin_data)
+                    process.stdin.close()
+                except OSError:
+                    pass
+            
+            for line in iter(process.stdout.readline, ''):
+                last_activity[0] = time.monotonic()
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+            
+            process.wait()
+            if timed_out.is_set():
+                log.error(f"yt-dlp produced no output for {inactivity_timeout}s, killed")
+            elif process.returncode != 0:
+                stderr = ''.join(stderr_output).strip()
+                if stderr:
+                    log.warning(f"yt-dlp stderr: {stderr}")
+        finally:
+            finished.set()
+            if process.poll() is None:
+                self._kill_process(process)
+            supervisor.release(process)
+    
+    def _build_extract_command(self, options: Optional[Dict] = None) -> List[str]:
+        """
+        메타데이터 추출용 CLI 인자 생성 (URL 제외)
         
         Args:
-            eta_str: "00:03" 또는 "01:23:45"
+            options: 추가 옵션
+                - fields: 출력할 필드 목록 (--print '%(.{...})j' 사용)
+                - info_json_dir: 전체 info JSON을 저장할 폴더 (--write-info-json)
         
         Returns:
-            초
+            CLI 인자 리스트
         """
-        parts = eta_str.split(':')
-        
-        if len(parts) == 2:
-            # MM:SS
-            return int(parts[0]) * 60 + int(parts[1])
-        elif len(parts) == 3:
-            # HH:MM:SS
-            return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
+        options = options or {}
+        
+        # 필드 지정 시 전체 JSON 대신 해당 필드만 출력 (stdout/파싱 비용 감소)
+        fields = options.get('fields')
+        if fields:
+            args = [self.ytdlp_path, '--print', '%(.{' + ','.join(fields) + '})j', '--no-warnings']
         else:
-            return 0
+            args = [self.ytdlp_path, '--dump-json', '--no-warnings']
+        
+        # 다운로드 재사용용 info JSON은 yt-dlp가 직접 파일로 기록 (stdout으로 받지 않음)
+        info_dir = options.get('info_json_dir')
+        if info_dir:
+            template = os.path.join(info_dir.replace('%', '%%'), INFO_JSON_OUTPUT_TEMPLATE)
+            args.extend([
+                '--no-simulate', '--skip-download', '--write-info-json',
+                '--output', f'infojson:{template}'
+            ])
+        
+        # 옵션 적용
+        if options:
+            if options.get('extract_flat'):
+                args.append('--flat-playlist')
+            
+            if options.get('noplaylist'):
+                args.append('--no-playlist')
+            
+            # format 옵션 추가 (크기 추정을 위해)
+            if 'format' in options:
+                args.extend(['--format', options['format']])
+            
+            # 쿠키 파일 (연령 제한 영상 등 인증 필요 시)
+            if 'cookiefile' in options:
+                args.extend(['--cookies', options['cookiefile']])
+            
+            # JS 런타임 (YouTube 서명 풀기용)
+            if 'js_runtimes' in options:
+                args.extend(['--js-runtimes', options['js_runtimes']])
+        
+        return args
     
-    def _build_command(self, url: str, options: Dict) -> List[str]:
+    def _build_command(self, url, options: Dict) -> List[str]:
         """
         Python dict 옵션을 CLI 인자로 변환
         
         Args:
-            url: 다운로드 URL
+            url: 다운로드 URL (목록이면 묶음 다운로드)
             options: yt-dlp 옵션 딕셔너리
         
         Returns:
@@ -475,15 +902,40 @@ class YtDlpWrapper:
         if options.get('overwrites'):
             args.append('--force-overwrites')
         
+        # 속도 제한 (대역폭 예산에서 받은 몫, 바이트/초)
+        if options.get('ratelimit'):
+            args.extend(['--limit-rate', str(int(options['ratelimit']))])
+        
         # 기타 기본 옵션
         args.append('--no-warnings')
         
+        # 진행률: 갱신마다 한 줄씩, JSON 형식으로 출력 (parse_progress_line으로 파싱)
+        args.extend([
+            '--newline',
+            '--progress-template', _PROGRESS_TEMPLATE,
+            '--progress-template', _POSTPROCESS_TEMPLATE,
+        ])
+        
+        # 선택된 포맷 ID와 최종 파일 경로 출력 (--print는 시뮬레이션/quiet를 켜므로 다시 해제)
+        args.extend([
+            '--print', _FORMAT_TEMPLATE,
+            '--print', _FILEPATH_TEMPLATE,
+            '--no-simulate', '--progress',
+        ])
+        
         # 이어받기 관련 옵션
         args.append('--continue')  # 이어받기 기능 (.part 파일 사용)
         args.append('--fragment-retries')  # fragment 재시도
         args.append(YTDLP_RETRIES)  # 최대 10회 재시도
         
-        # URL 추가
-        args.append(url)
+        # URL 추가 (메타데이터 단계의 info JSON이 있으면 재추출 없이 사용)
+        if isinstance(url, (list, tuple)):
+            # 묶음: 한 항목이 실패해도 나머지는 계속 받음
+            args.append('--ignore-errors')
+            args.extend(url)
+        elif options.get('load_info_json'):
+            args.extend(['--load-info-json', options['load_info_json']])
+        else:
+            args.append(url)
         
         return args
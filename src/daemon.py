@@ -0,0 +1,87 @@
+"""
+로컬 다운로드 데몬 (PyQt5 / 디스플레이 없이 실행)
+
+사용법 (src 폴더에서):
+    python -m daemon [--host 127.0.0.1] [--port 8765] [--token 비밀값]
+                     [--settings 프로필.json] [--output 폴더] [--format mp3] [--jobs 4] [--engine async]
+                     [--agents-port 8766] [--agents-host 0.0.0.0] [--coordinator-only]
+
+- 다른 도구가 HTTP로 작업을 등록/제어/조회 (엔드포인트는 core.api_server 참고)
+    curl -s localhost:8765/rpc -d '{"jsonrpc":"2.0","id":1,"method":"enqueue","params":{"url":"..."}}'
+    curl -N localhost:8765/events
+- 작업 목록은 데몬 전용 파일(daemon_tasks.json)에 저장되어 재시작 후 일시정지 상태로 복원
+- --agents-port를 지정하면 원격 에이전트(python -m agent)의 접속을 받아 작업을 나누어 배정
+  (--token은 에이전트 접속에도 사용, --coordinator-only면 이 노드에서는 직접 받지 않음)
+- SIGINT/SIGTERM을 받으면 실행 중인 다운로드를 정리하고 종료
+"""
+import argparse
+import signal
+import sys
+import threading
+
+from cli import add_settings_arguments, settings_from_args
+from core.api_server import ApiServer
+from core.download_service import DownloadService
+from utils.logger import log
+from constants import API_DEFAULT_HOST, API_DEFAULT_PORT, REMOTE_DEFAULT_PORT
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m daemon',
+        description='로컬 HTTP(JSON-RPC/SSE) API로 다운로드 작업을 받는 데몬을 실행합니다.'
+    )
+    parser.add_argument('--host', default=API_DEFAULT_HOST, help=f'수신 주소 (기본: {API_DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=API_DEFAULT_PORT, help=f'수신 포트 (기본: {API_DEFAULT_PORT})')
+    parser.add_argument('--token', help='지정하면 Authorization: Bearer <token> 헤더가 있는 요청만 처리')
+    parser.add_argument('--agents-port', type=int, nargs='?', const=REMOTE_DEFAULT_PORT,
+                        help=f'원격 에이전트 접속 포트 (값 없이 지정하면 {REMOTE_DEFAULT_PORT})')
+    parser.add_argument('--agents-host', default=API_DEFAULT_HOST,
+                        help=f'원격 에이전트 수신 주소 (기본: {API_DEFAULT_HOST}, 다른 노드에서 접속하려면 0.0.0.0)')
+    parser.add_argument('--coordinator-only', action='store_true',
+                        help='이 노드에서는 다운로드하지 않고 에이전트에만 배정 (--agents-port 필요)')
+    add_settings_arguments(parser)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    settings, jobs = settings_from_args(args)
+    if settings is None:
+        return 2
+    if args.coordinator_only:
+        if args.agents_port is None:
+            log.error("--coordinator-only는 --agents-port와 함께 지정해야 합니다.")
+            return 2
+        jobs = 0
+
+    service = DownloadService(settings)
+    server = ApiServer(service, args.host, args.port, args.token)
+    server.start()
+    server.started.wait()
+    if server.error is not None or not server.is_alive():
+        log.error(f"API 서버를 시작할 수 없습니다: {server.error}")
+        return 1
+    if args.agents_port is not None:
+        if service.scheduler.start_remote_coordinator(args.agents_host, args.agents_port, args.token) is None:
+            server.stop()
+            server.join()
+            return 1
+    service.start(jobs)
+
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+    # 메인 스레드는 신호를 받을 수 있도록 짧게 나누어 대기
+    while not stop.wait(0.5) and server.is_alive():
+        pass
+
+    log.info("데몬 종료 중...")
+    server.stop()
+    service.shutdown()
+    server.join()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,16 +3,23 @@
 히스토리 및 작업 목록 관리
 """
 import os
+import re
 import json
 import sqlite3
 import datetime
-from PyQt5.QtWidgets import QDialog
+import time
+import unicodedata
+from typing import Dict, List, Optional
 
 from utils.utils import get_user_data_path
 from utils.logger import log
 from constants import (
     TaskStatus, DEFAULT_FORMAT,
-    HISTORY_DB_FILENAME, TASKS_JSON_FILENAME, HISTORY_TABLE_NAME, DATE_FORMAT
+    HISTORY_DB_FILENAME, TASKS_JSON_FILENAME, HISTORY_TABLE_NAME, DATE_FORMAT,
+    METADATA_CACHE_DB_FILENAME, METADATA_CACHE_TABLE_NAME,
+    METADATA_CACHE_TTL_SEC, METADATA_CACHE_MAX_ENTRIES,
+    PARTIAL_DB_FILENAME, PARTIAL_TABLE_NAME, PARTIAL_ORPHAN_MAX_AGE_SEC,
+    EXT_PART, EXT_YTDL, FILE_SCAN_MAX_ENTRIES
 )
 from locales.strings import STR
 from data.models import DownloadTask
@@ -163,11 +170,441 @@ class HistoryManager:
             return False
 
 
+class MetadataCache:
+    """
+    SQLite 기반 메타데이터 캐시 (fetch_metadata 결과 재사용)
+    - extractor + ID + 포맷 선택자를 복합 키로 저장 (포맷이 바뀌면 크기 추정도 달라지므로)
+    - 조회는 작업 URL로 수행 (메타데이터 조회 전에는 ID를 모르기 때문)
+    - TTL이 지난 항목은 무시/삭제, 최대 개수를 넘으면 마지막 사용 시각이 오래된 항목부터 삭제
+    """
+    
+    def __init__(self, ttl_sec: int = METADATA_CACHE_TTL_SEC, max_entries: int = METADATA_CACHE_MAX_ENTRIES):
+        self.db_path = os.path.join(get_user_data_path(), METADATA_CACHE_DB_FILENAME)
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self._init_db()
+    
+    def _init_db(self):
+        """DB 테이블 초기화 및 만료 항목 정리"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(f'''
+                    CREATE TABLE IF NOT EXISTS {METADATA_CACHE_TABLE_NAME} (
+                        extractor TEXT,
+                        video_id TEXT,
+                        format_selector TEXT,
+                        url TEXT,
+                        data TEXT,
+                        created_at REAL,
+                        last_access REAL,
+                        PRIMARY KEY (extractor, video_id, format_selector)
+                    )
+                ''')
+                cursor.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{METADATA_CACHE_TABLE_NAME}_url "
+                    f"ON {METADATA_CACHE_TABLE_NAME} (url, format_selector)"
+                )
+                cursor.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{METADATA_CACHE_TABLE_NAME}_access "
+                    f"ON {METADATA_CACHE_TABLE_NAME} (last_access)"
+                )
+                cursor.execute(
+                    f"DELETE FROM {METADATA_CACHE_TABLE_NAME} WHERE created_at < ?",
+                    (time.time() - self.ttl_sec,)
+                )
+                conn.commit()
+        except Exception as e:
+            log.error(f"메타데이터 캐시 초기화 오류: {e}", exc_info=True)
+    
+    def get(self, url: str, format_selector: str) -> Optional[dict]:
+        """URL + 포맷 선택자로 캐시 조회 (만료되었거나 없으면 None)"""
+        if not url:
+            return None
+        
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"SELECT rowid, data, created_at FROM {METADATA_CACHE_TABLE_NAME} "
+                    f"WHERE url = ? AND format_selector = ? ORDER BY created_at DESC LIMIT 1",
+                    (url, format_selector)
+                )
+                row = cursor.fetchone()
+                if row is None:
+                    return None
+                
+                rowid, data, created_at = row
+                now = time.time()
+                if now - created_at > self.ttl_sec:
+                    cursor.execute(f"DELETE FROM {METADATA_CACHE_TABLE_NAME} WHERE rowid = ?", (rowid,))
+                    conn.commit()
+                    return None
+                
+                cursor.execute(
+                    f"UPDATE {METADATA_CACHE_TABLE_NAME} SET last_access = ? WHERE rowid = ?",
+                    (now, rowid)
+                )
+                conn.commit()
+                return json.loads(data)
+        except Exception as e:
+            log.error(f"메타데이터 캐시 조회 오류 (url={url}): {e}", exc_info=True)
+            return None
+    
+    def put(self, url: str, format_selector: str, metadata: dict):
+        """메타데이터 저장 (ID가 없거나 플레이리스트 메타데이터는 저장하지 않음)"""
+        video_id = metadata.get('id') if metadata else None
+        if not url or not video_id or metadata.get('is_playlist'):
+            return
+        
+        try:
+            now = time.time()
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"INSERT OR REPLACE INTO {METADATA_CACHE_TABLE_NAME} VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        metadata.get('extractor') or 'unknown',
+                        video_id,
+                        format_selector,
+                        url,
+                        json.dumps(metadata, ensure_ascii=False),
+                        now,
+                        now
+                    )
+                )
+                self._evict(cursor)
+                conn.commit()
+        except Exception as e:
+            log.error(f"메타데이터 캐시 저장 오류 (url={url}): {e}", exc_info=True)
+    
+    def _evict(self, cursor):
+        """최대 개수 초과분을 LRU 순서로 삭제"""
+        cursor.execute(f"SELECT COUNT(*) FROM {METADATA_CACHE_TABLE_NAME}")
+        overflow = cursor.fetchone()[0] - self.max_entries
+        if overflow > 0:
+            cursor.execute(
+                f"DELETE FROM {METADATA_CACHE_TABLE_NAME} WHERE rowid IN ("
+                f"SELECT rowid FROM {METADATA_CACHE_TABLE_NAME} ORDER BY last_access ASC LIMIT ?)",
+                (overflow,)
+            )
+
+
+# yt-dlp 임시 파일 이름: <제목>[.f<포맷ID>].<확장자>.part
+_PARTIAL_NAME_PATTERN = re.compile(
+    r'^(?P<stem>.+?)(?:\.f(?P<format_id>\d+(?:-\w+)?|[a-z]+-[\w-]+))?\.(?P<ext>\w+)$'
+)
+# yt-dlp가 파일 이름에서 바꾸는 문자 (제목과 파일 이름 비교용)
+_FILENAME_FULLWIDTH_MAP = str.maketrans({
+    '<': '＜', '>': '＞', ':': '：', '"': '＂',
+    '/': '／', '\\': '＼', '|': '｜', '?': '？', '*': '＊'
+})
+
+
+def _title_key(text: str) -> str:
+    """제목/파일 이름 비교 키 (유니코드 정규화 + 파일 이름 치환 문자 반영 + 소문자)"""
+    return unicodedata.normalize('NFC', text or '').translate(_FILENAME_FULLWIDTH_MAP).lower()
+
+
+def output_stem(filename: str, format_id: Optional[str] = None) -> str:
+    """
+    스트림 파일 경로에서 출력 템플릿이 만든 공통 부분(확장자 제외 경로)을 추출
+    예) /dl/제목.f137.mp4 -> /dl/제목, /dl/제목.webm -> /dl/제목
+    """
+    base = os.path.splitext(filename)[0]
+    suffix = f'.f{format_id}' if format_id else ''
+    if suffix and base.endswith(suffix):
+        base = base[:-len(suffix)]
+    return base
+
+
+class PartialDownloadRegistry:
+    """
+    SQLite 기반 이어받기 기록 (작업별 임시 파일)
+    - 다운로드 중인 스트림마다 선택된 포맷 ID, 최종/임시 파일 경로, 받은 바이트를 기록
+    - 재시작 후 이어받을 때 같은 포맷과 같은 파일 이름을 강제하여 .part 파일에서 정확히 이어받음
+    - 시작 시 scan()으로 기록을 실제 파일과 맞추고, 주인 없는 임시 파일은 작업에 다시 연결하거나 정리
+    """
+    
+    def __init__(self):
+        self.db_path = os.path.join(get_user_data_path(), PARTIAL_DB_FILENAME)
+        self._init_db()
+    
+    def _init_db(self):
+        """DB 테이블 초기화"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(f'''
+                    CREATE TABLE IF NOT EXISTS {PARTIAL_TABLE_NAME} (
+                        task_id INTEGER,
+                        filename TEXT,
+                        tmpfilename TEXT,
+                        video_id TEXT,
+                        format_id TEXT,
+                        requested_format TEXT,
+                        downloaded_bytes INTEGER,
+                        total_bytes INTEGER,
+                        completed INTEGER,
+                        updated_at REAL,
+                        PRIMARY KEY (task_id, filename)
+                    )
+                ''')
+                conn.commit()
+        except Exception as e:
+            log.error(f"이어받기 기록 DB 초기화 오류: {e}", exc_info=True)
+    
+    def record(self, task_id: int, filename: str, tmpfilename: Optional[str], video_id: Optional[str],
+               format_id: Optional[str], downloaded_bytes: int, total_bytes: int, completed: bool = False,
+               requested_format: Optional[str] = None):
+        """
+        스트림 하나의 진행 위치 기록 (같은 작업/파일이면 갱신, 처음 기록한 순서는 유지)
+        - format_id: 이 스트림의 포맷 ID ('137')
+        - requested_format: 작업 전체에 선택된 포맷 ID ('137+140', 병합 전 스트림이 일부만 기록돼도 전체를 고정)
+        """
+        if not filename:
+            return
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute(
+                    f"UPDATE {PARTIAL_TABLE_NAME} SET tmpfilename = COALESCE(?, tmpfilename), "
+                    f"video_id = COALESCE(?, video_id), format_id = COALESCE(?, format_id), "
+                    f"requested_format = COALESCE(?, requested_format), "
+                    f"downloaded_bytes = ?, total_bytes = ?, completed = ?, updated_at = ? "
+                    f"WHERE task_id = ? AND filename = ?",
+                    (tmpfilename, video_id, format_id, requested_format, int(downloaded_bytes or 0), int(total_bytes or 0),
+                     int(completed), time.time(), task_id, filename)
+                )
+                if cursor.rowcount == 0:
+                    conn.execute(
+                        f"INSERT INTO {PARTIAL_TABLE_NAME} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (task_id, filename, tmpfilename or filename + EXT_PART, video_id, format_id, requested_format,
+                         int(downloaded_bytes or 0), int(total_bytes or 0), int(completed), time.time())
+                    )
+                conn.commit()
+        except Exception as e:
+            log.error(f"이어받기 기록 저장 오류 (task_id={task_id}): {e}", exc_info=True)
+    
+    def get(self, task_id: int) -> Optional[Dict]:
+        """
+        작업의 이어받기 정보 조회 (기록이 없으면 None)
+        - 포맷은 다운로드 시작 시 선택된 전체 포맷이 기록된 경우에만 고정
+          (다시 연결한 임시 파일처럼 일부 스트림만 알면 출력 파일 이름만 고정)
+        
+        Returns:
+            {'format_id': '137+140', 'output_stem': 확장자 제외 출력 경로,
+             'files': [{'filename', 'tmpfilename', 'format_id', 'downloaded_bytes', 'total_bytes', 'completed'}]}
+        """
+        rows = self._rows(task_id)
+        if not rows:
+            return None
+        requested = next((r['requested_format'] for r in rows if r['requested_format']), None)
+        return {
+            'format_id': requested,
+            'output_stem': output_stem(rows[0]['filename'], rows[0]['format_id']),
+            'files': rows,
+        }
+    
+    def remove(self, task_id: int, delete_files: bool = False):
+        """작업 기록 삭제 (delete_files면 남은 임시 파일도 삭제)"""
+        if delete_files:
+            for row in self._rows(task_id):
+                self._delete_row_files(row)
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(f"DELETE FROM {PARTIAL_TABLE_NAME} WHERE task_id = ?", (task_id,))
+                conn.commit()
+        except Exception as e:
+            log.error(f"이어받기 기록 삭제 오류 (task_id={task_id}): {e}", exc_info=True)
+    
+    def scan(self, tasks: List[DownloadTask], default_folder: Optional[str] = None) -> Dict[str, int]:
+        """
+        시작 시 기록과 실제 파일 정리
+        - 이어받을 작업(대기/일시정지)의 기록: 파일이 남아 있으면 크기를 다시 읽어 유지
+          (임시 파일은 없고 최종 파일만 있으면 완료된 스트림으로 갱신, 둘 다 없는 스트림이 있으면 작업 기록 전체 삭제)
+        - 목록에 없거나 완료/실패한 작업의 기록: 임시 파일과 함께 삭제
+        - 기록이 없는 이어받을 작업: 다운로드 폴더의 yt-dlp 임시 파일 중 제목이 같은 파일을 다시 연결
+        - 어느 작업에도 연결되지 않은 오래된 yt-dlp 임시 파일은 삭제
+        
+        Returns:
+            {'kept': 유지한 작업 수, 'rebound': 다시 연결한 작업 수, 'collected': 삭제한 파일 수}
+        """
+        resumable = {t.id: t for t in tasks if t.is_active()}
+        stats = {'kept': 0, 'rebound': 0, 'collected': 0}
+        known_paths = set()
+        
+        for task_id in self._task_ids():
+            rows = self._rows(task_id)
+            if task_id not in resumable:
+                for row in rows:
+                    stats['collected'] += self._delete_row_files(row)
+                self.remove(task_id)
+                continue
+            
+            consistent = True
+            for row in rows:
+                if not row['completed'] and row['tmpfilename'] and os.path.isfile(row['tmpfilename']):
+                    self.record(task_id, row['filename'], row['tmpfilename'], None, None,
+                                os.path.getsize(row['tmpfilename']), row['total_bytes'])
+                elif os.path.isfile(row['filename']):
+                    # 완료 이벤트 전에 중단된 스트림 (임시 파일이 이미 최종 이름으로 바뀜)
+                    if not row['completed']:
+                        size = os.path.getsize(row['filename'])
+                        self.record(task_id, row['filename'], row['tmpfilename'], None, None,
+                                    size, row['total_bytes'] or size, completed=True)
+                else:
+                    consistent = False
+                    break
+            if consistent:
+                stats['kept'] += 1
+                for row in rows:
+                    known_paths.update(p for p in (row['filename'], row['tmpfilename']) if p)
+            else:
+                # 일부 스트림을 잃은 기록으로 포맷을 고정하면 잘못된 결과가 나오므로 처음부터 다시 받음
+                for row in rows:
+                    stats['collected'] += self._delete_row_files(row)
+                self.remove(task_id)
+        
+        # 기록이 없는 작업에 임시 파일 다시 연결 / 주인 없는 임시 파일 정리 (폴더별 1회 탐색)
+        unbound = {tid: t for tid, t in resumable.items() if not self._rows(tid)}
+        folders = {self._task_folder(t) for t in tasks}
+        if default_folder:
+            folders.add(default_folder)
+        for folder in filter(None, folders):
+            partials = self._list_partials(folder, known_paths)
+            for task_id, task in unbound.items():
+                if self._task_folder(task) != folder or not task.meta.get('title'):
+                    continue
+                title_key = _title_key(task.meta['title'])
+                bound = [p for p in partials if p['stem_key'] == title_key]
+                for p in bound:
+                    self.record(task_id, p['filename'], p['tmpfilename'], task.video_id, p['format_id'],
+                                p['size'], 0, completed=p['completed'])
+                    partials.remove(p)
+                if bound:
+                    stats['rebound'] += 1
+                    log.info(f"임시 파일 {len(bound)}개를 작업에 다시 연결 (task_id={task_id})")
+            
+            expire_before = time.time() - PARTIAL_ORPHAN_MAX_AGE_SEC
+            for p in partials:
+                if not p['completed'] and p['mtime'] < expire_before:
+                    stats['collected'] += self._delete_row_files(p)
+        
+        if any(stats.values()):
+            log.info(f"이어받기 기록 정리: 유지 {stats['kept']}, 재연결 {stats['rebound']}, 삭제 {stats['collected']}개 파일")
+        return stats
+    
+    # --- 내부 헬퍼 ---
+    
+    @staticmethod
+    def _task_folder(task: DownloadTask) -> Optional[str]:
+        return task.settings.get('download_folder') or task.settings.get('save_path')
+    
+    def _task_ids(self) -> List[int]:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                return [r[0] for r in conn.execute(f"SELECT DISTINCT task_id FROM {PARTIAL_TABLE_NAME}")]
+        except Exception as e:
+            log.error(f"이어받기 기록 조회 오류: {e}", exc_info=True)
+            return []
+    
+    def _rows(self, task_id: int) -> List[Dict]:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.execute(
+                    f"SELECT filename, tmpfilename, format_id, requested_format, downloaded_bytes, total_bytes, completed "
+                    f"FROM {PARTIAL_TABLE_NAME} WHERE task_id = ? ORDER BY rowid",
+                    (task_id,)
+                )
+                return [dict(r) for r in cursor]
+        except Exception as e:
+            log.error(f"이어받기 기록 조회 오류 (task_id={task_id}): {e}", exc_info=True)
+            return []
+    
+    @staticmethod
+    def _delete_row_files(row: Dict) -> int:
+        """
+        임시 파일(.part/.ytdl) 삭제, 삭제한 파일 수 반환
+        - 완료된 스트림 파일은 병합 전 중간 파일(.f<포맷ID>.)일 때만 삭제 (최종 결과물 보호)
+        """
+        paths = []
+        tmpfilename = row.get('tmpfilename')
+        if tmpfilename:
+            paths += [tmpfilename, tmpfilename + EXT_YTDL]
+            if tmpfilename.endswith(EXT_PART):
+                paths.append(tmpfilename[:-len(EXT_PART)] + EXT_YTDL)
+        filename = row.get('filename')
+        if row.get('completed') and filename and row.get('format_id') and f".f{row['format_id']}." in os.path.basename(filename):
+            paths.append(filename)
+        
+        deleted = 0
+        for path in dict.fromkeys(paths):
+            try:
+                if os.path.isfile(path):
+                    os.remove(path)
+                    deleted += 1
+            except OSError as e:
+                log.warning(f"임시 파일 삭제 실패 ({path}): {e}")
+        return deleted
+    
+    @staticmethod
+    def _list_partials(folder: str, known_paths: set) -> List[Dict]:
+        """
+        폴더에서 기록에 없는 yt-dlp 임시 파일 목록 (최대 FILE_SCAN_MAX_ENTRIES개 항목 탐색)
+        - .part 파일 중 포맷 ID 표시(.f<ID>.)가 있거나 .ytdl 파일이 함께 있는 것만 (다른 프로그램의 .part 제외)
+        - 병합 전 중간 파일(.f<ID>.<확장자>)은 완료된 스트림으로 포함
+        """
+        if not os.path.isdir(folder):
+            return []
+        entries = {}
+        try:
+            with os.scandir(folder) as it:
+                for count, entry in enumerate(it):
+                    if count >= FILE_SCAN_MAX_ENTRIES:
+                        log.warning(f"다운로드 폴더 항목이 많아 임시 파일 탐색을 중단했습니다 ({folder})")
+                        break
+                    entries[entry.name] = entry
+        except OSError as e:
+            log.warning(f"임시 파일 탐색 실패 ({folder}): {e}")
+            return []
+        
+        partials = []
+        for name, entry in entries.items():
+            completed = not name.endswith(EXT_PART)
+            base = name if completed else name[:-len(EXT_PART)]
+            match = _PARTIAL_NAME_PATTERN.match(base)
+            if not match or entry.path in known_paths:
+                continue
+            has_ytdl = (base + EXT_YTDL) in entries
+            if completed and not match.group('format_id'):
+                continue
+            if not completed and not (match.group('format_id') or has_ytdl):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            filename = os.path.join(folder, base)
+            partials.append({
+                'filename': filename,
+                'tmpfilename': None if completed else entry.path,
+                'format_id': match.group('format_id'),
+                'stem_key': _title_key(match.group('stem')),
+                'size': stat.st_size,
+                'mtime': stat.st_mtime,
+                'completed': completed,
+            })
+        return partials
+
+
 class TaskManager:
     """작업 목록 관리"""
     
-    def __init__(self):
-        self.tasks_file = os.path.join(get_user_data_path(), TASKS_JSON_FILENAME)
+    def __init__(self, filename: str = TASKS_JSON_FILENAME):
+        # 데몬은 GUI의 tasks.json을 덮어쓰지 않도록 별도 파일 이름 사용
+        self.tasks_file = os.path.join(get_user_data_path(), filename)
     
     def save_tasks(self, tasks: list[DownloadTask]):
         """현재 작업 목록을 JSON 파일로 저장"""
@@ -289,7 +726,8 @@ class DuplicateChecker:
         if not is_dup:
             return False
         
-        # 확인 대화상자 표시
+        # 확인 대화상자 표시 (GUI 전용 경로이므로 Qt는 여기서만 import)
+        from PyQt5.QtWidgets import QDialog
         from gui.widgets.message_dialog import MessageDialog
         
         dialog = MessageDialog(STR.MSG_DUPLICATE_CHECK, message, 
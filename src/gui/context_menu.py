@@ -41,6 +41,8 @@ class ContextMenuBuilder:
                 - 'pause': 일시정지
                 - 'resume': 이어받기
                 - 'retry': 재시도
+                - 'move_top': 대기열 맨 위로 이동
+                - 'move_bottom': 대기열 맨 아래로 이동
                 - 'delete_file': 파일 삭제
                 - 'remove': 목록에서 제거
         
@@ -89,6 +91,11 @@ class ContextMenuBuilder:
         if status_flags['failed']:
             self._add_action(menu, f"{STR.MENU_RETRY}{suffix}", lambda: _log_and_call('retry', callbacks.get('retry')))
         
+        # 대기열 순서 변경 (대기 중인 작업)
+        if status_flags['waiting']:
+            self._add_action(menu, f"{STR.MENU_MOVE_TOP}{suffix}", lambda: _log_and_call('move_top', callbacks.get('move_top')))
+            self._add_action(menu, f"{STR.MENU_MOVE_BOTTOM}{suffix}", lambda: _log_and_call('move_bottom', callbacks.get('move_bottom')))
+        
         menu.addSeparator()
         
         # 파일 삭제
@@ -0,0 +1,32 @@
+"""
+다운로드 스케줄러 Qt 어댑터
+- core.scheduler.DownloadScheduler는 Qt 없이 워커 스레드에서 이벤트를 호출함
+- 이 어댑터가 이벤트를 pyqtSignal로 다시 내보내므로 연결된 슬롯은 메인 스레드에서 실행됨
+- 그 외 메서드/속성(add_task, pause_all, partial_registry 등)은 스케줄러에 그대로 위임
+"""
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from core.scheduler import DownloadScheduler
+
+
+class QtDownloadScheduler(QObject):
+    """DownloadScheduler를 감싸 이벤트를 Qt 시그널로 전달"""
+
+    progress_updated = pyqtSignal(dict, int)  # 진행률, task_id
+    download_finished = pyqtSignal(bool, str, int, str)  # 성공여부, 메시지, task_id, 파일경로
+    task_started = pyqtSignal(int)  # task_id
+    metadata_fetched = pyqtSignal(int, dict)  # task_id, metadata
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.engine = DownloadScheduler()
+        # 워커 스레드에서 emit → 수신 객체가 메인 스레드에 있으므로 Qt가 큐에 넣어 전달
+        self.engine.progress_updated.connect(self.progress_updated.emit)
+        self.engine.download_finished.connect(self.download_finished.emit)
+        self.engine.task_started.connect(self.task_started.emit)
+        self.engine.metadata_fetched.connect(self.metadata_fetched.emit)
+
+    def __getattr__(self, name):
+        if name == 'engine':
+            raise AttributeError(name)
+        return getattr(self.engine, name)
@@ -0,0 +1,134 @@
+"""
+단일 인스턴스 처리 (QLocalServer / QLocalSocket)
+- 첫 번째 실행: 로컬 서버를 열고 다른 실행에서 넘어온 URL을 메인 윈도우로 전달
+- 두 번째 실행: GUI 스택(QtWidgets, QtWebEngine, 스타트업 점검)을 불러오기 전에
+  실행 중인 인스턴스로 URL을 넘기고 바로 종료 (history.db / tasks.json을 두 스케줄러가 함께 쓰지 않도록)
+- 메시지는 JSON 한 줄: {"urls": [...]} (URL이 없으면 기존 창만 앞으로 가져옴)
+"""
+import getpass
+import hashlib
+import json
+from typing import Callable, List, Optional
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+from utils.logger import log
+from utils.utils import validate_url
+from constants import (
+    APPDATA_DIR_NAME, SINGLE_INSTANCE_CONNECT_TIMEOUT_MS, SINGLE_INSTANCE_WRITE_TIMEOUT_MS,
+    SINGLE_INSTANCE_MAX_MESSAGE_BYTES
+)
+
+
+def server_name() -> str:
+    """사용자별 로컬 서버 이름 (다른 사용자 세션의 인스턴스와 섞이지 않도록)"""
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = ''
+    suffix = hashlib.sha1(user.encode('utf-8')).hexdigest()[:12]
+    return f"{APPDATA_DIR_NAME}-{suffix}"
+
+
+def urls_from_args(args: List[str]) -> List[str]:
+    """명령줄 인자 중 URL만 추림 (옵션 인자 등은 무시)"""
+    return [arg for arg in args if validate_url(arg)]
+
+
+def forward_to_running_instance(urls: List[str]) -> bool:
+    """
+    실행 중인 인스턴스에 URL 전달 (QApplication 없이 동작)
+
+    Returns:
+        실행 중인 인스턴스가 받았으면 True (호출 측은 바로 종료), 없으면 False
+    """
+    socket = QLocalSocket()
+    socket.connectToServer(server_name())
+    if not socket.waitForConnected(SINGLE_INSTANCE_CONNECT_TIMEOUT_MS):
+        return False
+
+    message = json.dumps({'urls': urls}, ensure_ascii=False).encode('utf-8') + b'\n'
+    socket.write(message)
+    delivered = socket.waitForBytesWritten(SINGLE_INSTANCE_WRITE_TIMEOUT_MS)
+    socket.disconnectFromServer()
+    if socket.state() != QLocalSocket.UnconnectedState:
+        socket.waitForDisconnected(SINGLE_INSTANCE_WRITE_TIMEOUT_MS)
+    if delivered:
+        log.info(f"실행 중인 인스턴스로 URL 전달: {len(urls)}개")
+    return delivered
+
+
+class SingleInstanceServer(QObject):
+    """
+    다른 실행에서 넘어온 URL을 받는 로컬 서버
+    - 스타트업 점검 중에도 연결을 받을 수 있도록 메인 윈도우보다 먼저 열고,
+      attach() 전에 받은 메시지는 모아 두었다가 한꺼번에 전달
+    """
+    urls_received = pyqtSignal(list)  # URL 목록 (빈 목록이면 창 활성화만)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._server = QLocalServer(self)
+        self._server.newConnection.connect(self._on_new_connection)
+        self._buffers = {}
+        self._pending: List[List[str]] = []
+        self._attached = False
+
+    def listen(self) -> bool:
+        """서버 열기 (비정상 종료로 남은 소켓 파일이 있으면 지우고 다시 시도)"""
+        name = server_name()
+        if self._server.listen(name):
+            return True
+        if self._server.serverError() == QAbstractSocket.AddressInUseError:
+            QLocalServer.removeServer(name)
+            if self._server.listen(name):
+                return True
+        log.warning(f"단일 인스턴스 서버를 열 수 없습니다: {self._server.errorString()}")
+        return False
+
+    def attach(self, handler: Callable[[list], None]) -> None:
+        """수신 처리기 연결 후 그동안 모아 둔 메시지 전달"""
+        self.urls_received.connect(handler)
+        self._attached = True
+        pending, self._pending = self._pending, []
+        for urls in pending:
+            self.urls_received.emit(urls)
+
+    def _on_new_connection(self) -> None:
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            self._buffers[socket] = b''
+            socket.readyRead.connect(lambda s=socket: self._on_ready_read(s))
+            socket.disconnected.connect(lambda s=socket: self._on_disconnected(s))
+
+    def _on_ready_read(self, socket: QLocalSocket) -> None:
+        data = self._buffers.get(socket, b'') + bytes(socket.readAll())
+        if len(data) > SINGLE_INSTANCE_MAX_MESSAGE_BYTES:
+            log.warning("단일 인스턴스 메시지가 너무 커서 무시합니다.")
+            self._buffers[socket] = b''
+            socket.abort()
+            return
+        while b'\n' in data:
+            line, data = data.split(b'\n', 1)
+            self._dispatch(line)
+        self._buffers[socket] = data
+
+    def _on_disconnected(self, socket: QLocalSocket) -> None:
+        # 줄바꿈 없이 끊긴 마지막 메시지 처리
+        remaining = self._buffers.pop(socket, b'')
+        if remaining.strip():
+            self._dispatch(remaining)
+        socket.deleteLater()
+
+    def _dispatch(self, line: bytes) -> None:
+        try:
+            message = json.loads(line.decode('utf-8'))
+            urls = [u for u in message.get('urls', []) if isinstance(u, str) and validate_url(u)]
+        except (UnicodeDecodeError, ValueError, AttributeError):
+            log.warning("잘못된 단일 인스턴스 메시지를 무시합니다.")
+            return
+        if self._attached:
+            self.urls_received.emit(urls)
+        else:
+            self._pending.append(urls)
@@ -1,6 +1,6 @@
 """
 작업 액션 클래스
-개별 작업에 대한 액션(일시정지, 재개, 재시도, 파일 작업 등)을 담당
+개별 작업에 대한 액션(일시정지, 재개, 재시도, 대기열 순서 변경, 파일 작업 등)을 담당
 """
 import os
 import subprocess
@@ -67,7 +67,7 @@ class TaskActions:
                 widget.set_paused()
             
         elif task.status == TaskStatus.WAITING:
-            # 대기 중인 작업: 플래그만 설정
+            # 대기 중인 작업: 플래그 설정 후 큐에서 빠짐 (재개 시 다시 추가)
             self._scheduler.pause_task(task_id)
             task.status = TaskStatus.PAUSED
             
@@ -84,7 +84,10 @@ class TaskActions:
             return
         
         # 스케줄러에서 일시정지 플래그 제거
-        self._scheduler.resume_task(task_id)
+        # 프로세스가 멈춰 있던 작업은 그 자리에서 재개되므로 큐에 다시 넣지 않음
+        if self._scheduler.resume_task(task_id):
+            self.main_window.on_task_started(task_id)
+            return
         
         # 1. 상태 업데이트
         widget = self._get_widget(task_id)
@@ -112,6 +115,35 @@ class TaskActions:
         self._scheduler.add_task(1, task_id, url, settings, meta)
         self.main_window.update_progress_ui()
 
+    def cancel_task(self, task_id: int, delete_files: bool = True) -> None:
+        """
+        받는 중/대기 중인 작업 즉시 취소 (yt-dlp/ffmpeg 프로세스 종료)
+        - delete_files=False: 받던 파일(.part 등)은 남김 (목록에서만 제거할 때)
+        """
+        task = self._get_task(task_id)
+        if not task:
+            return
+        
+        if task.status in [TaskStatus.DOWNLOADING, TaskStatus.WAITING, TaskStatus.PAUSED]:
+            self._scheduler.cancel_task(task_id, delete_files=delete_files)
+            log.info(f"작업 취소 (task_id={task_id})")
+
+    def move_to_top(self, task_id: int) -> None:
+        """대기 중인 작업을 대기열 맨 위로 (다음에 받을 작업)"""
+        self._move_task(task_id, to_top=True)
+
+    def move_to_bottom(self, task_id: int) -> None:
+        """대기 중인 작업을 대기열 맨 아래로"""
+        self._move_task(task_id, to_top=False)
+
+    def _move_task(self, task_id: int, to_top: bool) -> None:
+        task = self._get_task(task_id)
+        if not task or task.status != TaskStatus.WAITING:
+            return
+        priority = self._scheduler.move_task(task_id, to_top)
+        if priority is not None:
+            log.info(f"대기열 {'맨 위' if to_top else '맨 아래'}로 이동 (task_id={task_id}, 우선순위 {priority})")
+
     def retry_task(self, task_id: int) -> None:
         """다운로드 재시도"""
         task = self._get_task(task_id)
@@ -273,6 +305,16 @@ class TaskActions:
             if task and task.status == TaskStatus.PAUSED:
                 self.resume_task(task_id)
     
+    def move_selected(self, selected_ids: List[int], to_top: bool) -> None:
+        """
+        선택된 대기 작업들을 대기열 맨 위/아래로 이동 (목록에 보이는 순서 유지)
+        - 맨 위로는 아래쪽 작업부터 옮겨야 목록 순서대로 맨 앞에 모임
+        """
+        selected = set(selected_ids)
+        ordered = [t.id for t in self.main_window.tasks if t.id in selected]
+        for task_id in (reversed(ordered) if to_top else ordered):
+            self._move_task(task_id, to_top)
+
     def retry_selected(self, selected_ids: List[int]) -> None:
         """선택된 작업들 재시도"""
         for task_id in selected_ids:
@@ -8,7 +8,7 @@ from gui.widgets.base_dialog import BaseDialog
 from locales import SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE, set_language
 from locales.strings import STR
 from constants import BTN_TEXT_CLOSE_X, KEY_LANGUAGE
-from gui.windows.settings_dialog import save_settings, load_settings
+from utils.settings import save_settings, load_settings
 from resources.styles import (
     SETTINGS_SAVE_BUTTON_STYLE,
     SETTINGS_FONT_FAMILY, 
@@ -5,7 +5,7 @@ from gui.widgets.base_dialog import BaseDialog
 from resources.styles import STARTUP_DIALOG_WIDTH, STARTUP_DIALOG_HEIGHT, STARTUP_LABEL_STYLE, STARTUP_PROGRESS_STYLE
 from constants import APP_TITLE
 from locales.strings import STR
-from core.workers import StartupWorker
+from gui.workers import StartupWorker
 
 
 class StartupDialog(BaseDialog):
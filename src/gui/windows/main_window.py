@@ -8,8 +8,9 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
 from PyQt5.QtCore import Qt, pyqtSlot, QPoint, QEvent
 from PyQt5.QtGui import QFont, QKeySequence
 
-from gui.windows.settings_dialog import SettingsDialog, load_settings, save_settings
-from core.workers import PlaylistAnalysisWorker
+from gui.windows.settings_dialog import SettingsDialog
+from utils.settings import load_settings, save_settings
+from gui.workers import PlaylistAnalysisWorker
 from utils.utils import validate_url
 from core.url_processor import UrlProcessor
 from data.managers import HistoryManager, TaskManager, DuplicateChecker
@@ -33,7 +34,7 @@ from constants import (
     BTN_MINIMIZE, BTN_TEXT_CLOSE_X
 )
 from data.models import DownloadTask
-from core.scheduler import DownloadScheduler
+from gui.scheduler_adapter import QtDownloadScheduler
 from resources.styles import (
     MAIN_WINDOW_STYLE, CENTRAL_WIDGET_STYLE, TITLE_BAR_STYLE,
     MINIMIZE_BUTTON_STYLE, CLOSE_BUTTON_STYLE, URL_INPUT_CONTAINER_STYLE, URL_INPUT_STYLE,
@@ -78,6 +79,8 @@ class YTDownloaderPyQt5(QMainWindow):
         self.task_widgets = {}  # task_id -> TaskWidget 매핑
         self.total_tasks_in_queue = 0
         self.playlist_worker = None  # 플레이리스트 분석 워커
+        self._playlist_registered_count = 0  # 현재 분석에서 등록된 영상 수
+        self._playlist_duplicate_entries = []  # 현재 분석에서 보류된 중복 항목
         self.settings = load_settings()
         self.toggle_enabled = True
         
@@ -93,7 +96,7 @@ class YTDownloaderPyQt5(QMainWindow):
         self.duplicate_checker = DuplicateChecker(self.history_manager, self)
         
         # 다운로드 스케줄러 초기화
-        self.scheduler = DownloadScheduler(self)
+        self.scheduler = QtDownloadScheduler(self)
         self.scheduler.progress_updated.connect(self.on_progress_updated)
         self.scheduler.download_finished.connect(self.on_download_finished)
         self.scheduler.task_started.connect(self.on_task_started)
@@ -459,6 +462,8 @@ class YTDownloaderPyQt5(QMainWindow):
             'pause': self._pause_selected_tasks,
             'resume': self._resume_selected_tasks,
             'retry': self._retry_selected_tasks,
+            'move_top': self._move_selected_to_top,
+            'move_bottom': self._move_selected_to_bottom,
             'delete_file': self._delete_files_for_selected,
             'remove': self._remove_selected_from_list,
         }
@@ -481,6 +486,14 @@ class YTDownloaderPyQt5(QMainWindow):
         self.selection_manager.clear(self.task_widgets)
         self.task_actions.retry_selected(task_ids)
     
+    def _move_selected_to_top(self):
+        """선택된 대기 작업들을 대기열 맨 위로"""
+        self.task_actions.move_selected(self.selection_manager.get_selected_ids(), to_top=True)
+    
+    def _move_selected_to_bottom(self):
+        """선택된 대기 작업들을 대기열 맨 아래로"""
+        self.task_actions.move_selected(self.selection_manager.get_selected_ids(), to_top=False)
+    
     def _open_folders_for_selected(self):
         """선택된 작업들의 폴더 열기"""
         self.task_actions.open_folders_for_selected(self.selection_manager.get_selected_ids())
@@ -498,10 +511,12 @@ class YTDownloaderPyQt5(QMainWindow):
         self.task_actions.remove_selected_from_list(task_ids)
 
     def remove_task_from_list(self, task_id):
-        """목록에서 항목 제거 (파일 유지)"""
+        """목록에서 항목 제거 (파일 유지, 받는 중이면 즉시 취소)"""
         widget = self.task_widgets.get(task_id)
         if not widget: return
         
+        self.task_actions.cancel_task(task_id, delete_files=False)
+        
         # 선택 목록에서도 제거
         self.selection_manager.remove_from_selection(task_id)
 
@@ -529,7 +544,7 @@ class YTDownloaderPyQt5(QMainWindow):
         
         if self.toggle_enabled:
             self.status_label.setText(STR.MSG_DL_ENABLED)
-            self.scheduler.resume_all()  # 워커 재개
+            resumed_ids = self.scheduler.resume_all()  # 워커 재개 (멈춰 둔 프로세스는 그대로 재개)
             
             # 전체 일시정지로 인해 일시정지된 작업들을 큐에 다시 추가
             for task in self.tasks:
@@ -538,6 +553,11 @@ class YTDownloaderPyQt5(QMainWindow):
                     if self.scheduler.is_task_paused(task.id):
                         continue
                     
+                    # 프로세스가 멈춰 있던 작업은 이미 다시 받는 중
+                    if task.id in resumed_ids:
+                        self.on_task_started(task.id)
+                        continue
+                    
                     # 작업을 다시 큐에 추가
                     widget = self.task_widgets.get(task.id)
                     if widget:
@@ -584,7 +604,9 @@ class YTDownloaderPyQt5(QMainWindow):
         url: str, 
         video_id: Optional[str] = None,
         extractor: str = 'unknown',
-        title_override: Optional[str] = None
+        title_override: Optional[str] = None,
+        metadata: Optional[dict] = None,
+        group: Optional[str] = None
     ) -> DownloadTask:
         """
         TaskWidget 생성 및 작업 등록 (중복 코드 제거)
@@ -595,6 +617,8 @@ class YTDownloaderPyQt5(QMainWindow):
             video_id: 비디오 ID (선택적)
             extractor: 추출기(사이트) 식별자
             title_override: 제목 오버라이드 (선택적, 플레이리스트용)
+            metadata: 초기 메타데이터 (선택적, 플레이리스트 항목의 경량 메타데이터)
+            group: 작업 묶음 (선택적, 플레이리스트 URL - fair 스케줄링 정책에서 묶음끼리 번갈아 받음)
             
         Returns:
             생성된 DownloadTask 객체
@@ -608,6 +632,9 @@ class YTDownloaderPyQt5(QMainWindow):
             fmt = current_settings.get('format', 'mp4').upper()
             task_widget.title_label.setText(f"[{fmt}] {title_override}")
             
+        if metadata:
+            task_widget.update_metadata(metadata)
+            
         self._connect_task_widget_signals(task_widget)
         
         self.task_layout.insertWidget(0, task_widget)
@@ -620,10 +647,12 @@ class YTDownloaderPyQt5(QMainWindow):
             extractor=extractor,
             settings=current_settings
         )
+        if metadata:
+            task.meta = dict(metadata)
         self.tasks.append(task)
         
         # 스케줄러에 추가 (우선순위 3: 일반 작업)
-        self.scheduler.add_task(3, task_id, url, current_settings)
+        self.scheduler.add_task(3, task_id, url, current_settings, dict(metadata) if metadata else None, group=group)
         
         return task
 
@@ -637,8 +666,14 @@ class YTDownloaderPyQt5(QMainWindow):
         """플레이리스트 다운로드 처리"""
         # 기존 플레이리스트 워커가 실행 중이면 종료
         if self.playlist_worker and self.playlist_worker.isRunning():
-            self.playlist_worker.terminate()
-            self.playlist_worker.wait(WORKER_TERMINATE_WAIT_MS)
+            self.playlist_worker.stop()
+            if not self.playlist_worker.wait(WORKER_TERMINATE_WAIT_MS):
+                self.playlist_worker.terminate()
+                self.playlist_worker.wait(WORKER_TERMINATE_WAIT_MS)
+        
+        # 스트리밍 분석 상태 (묶음 단위로 등록, 중복 항목은 분석 완료 후 한 번에 확인)
+        self._playlist_registered_count = 0
+        self._playlist_duplicate_entries = []
         
         self.status_label.setText(STR.MSG_ANALYZING_PLAYLIST)
         self.url_input.setEnabled(False)  # 분석 중 입력 비활성화
@@ -646,6 +681,7 @@ class YTDownloaderPyQt5(QMainWindow):
         
         # 플레이리스트 분석 워커 생성 및 시작 (정제된 URL 사용)
         self.playlist_worker = PlaylistAnalysisWorker(clean_url, self)
+        self.playlist_worker.entries_found.connect(self.on_playlist_entries_found)
         self.playlist_worker.analysis_finished.connect(self.on_playlist_analysis_finished)
         self.playlist_worker.start()
 
@@ -673,13 +709,31 @@ class YTDownloaderPyQt5(QMainWindow):
     def start_download(self):
         """다운로드 시작 - 오케스트레이션"""
         url = self.url_input.text().strip()
+        if self.enqueue_url(url):
+            self.url_input.clear()
+
+    @pyqtSlot(list)
+    def handle_external_urls(self, urls):
+        """다른 실행(브라우저 '연결 프로그램', 스크립트 등)에서 넘어온 URL 처리 - 창을 앞으로 가져온 뒤 차례로 등록"""
+        if self.isMinimized():
+            self.showNormal()
+        self.raise_()
+        self.activateWindow()
+        for url in urls:
+            self.enqueue_url(url)
+
+    def enqueue_url(self, url: str) -> bool:
+        """
+        URL 하나를 작업으로 등록 (입력창과 외부 실행 공용)
         
+        Returns:
+            URL이 유효해 등록 처리를 시작했으면 True
+        """
         # URL 처리 (검증, 정제, 사용자 선택)
         result = UrlProcessor.process_url(url, self)
         if not result:
-            return
+            return False
         
-        self.url_input.clear()
         self._show_task_list()
         
         # 플레이리스트 vs 단일 영상 분기
@@ -687,6 +741,7 @@ class YTDownloaderPyQt5(QMainWindow):
             self._handle_playlist_download(result.clean_url)
         else:
             self._handle_single_video_download(result.clean_url, result.video_id, result.extractor or 'unknown')
+        return True
 
     # --- 스케줄러 시그널 핸들러 ---
         
@@ -802,6 +857,9 @@ class YTDownloaderPyQt5(QMainWindow):
             
             self.settings = new_settings
             save_settings(self.settings)
+            
+            # 실행 엔진 설정 반영
+            self.scheduler.configure(self.settings)
 
             # 언어 변경 반영
             lang = self.settings.get(KEY_LANGUAGE, DEFAULT_LANGUAGE)
@@ -817,6 +875,7 @@ class YTDownloaderPyQt5(QMainWindow):
         """스케줄러 초기화 (워커 시작)"""
         use_acceleration = self.settings.get('use_acceleration', False)
         max_workers = 1 if use_acceleration else int(self.settings.get('max_downloads', 3))
+        self.scheduler.configure(self.settings)
         self.scheduler.initialize(max_workers)
     
     @pyqtSlot(int, dict)
@@ -913,18 +972,19 @@ class YTDownloaderPyQt5(QMainWindow):
         # Yes -> Accepted (중복 제외)
         return dialog.exec_() == QDialog.Accepted
 
-    def _register_playlist_tasks(self, video_ids: list):
-        """플레이리스트 작업들을 등록"""
+    def _register_playlist_tasks(self, entries: list, playlist_url: str):
+        """플레이리스트 작업들을 등록 (항목의 경량 메타데이터로 카드를 바로 표시)"""
         # UI 표시 업데이트
         self._show_task_list()
         
-        # 각 비디오 ID로 카드 생성 (메타데이터 없이)
-        self.status_label.setText(STR.MSG_REGISTERING_PLAYLIST.format(count=len(video_ids)))
+        self.status_label.setText(STR.MSG_REGISTERING_PLAYLIST.format(count=len(entries)))
         QApplication.processEvents()
         
-        for video_id in video_ids:
+        prefetch_items = []
+        for entry in entries:
             self.total_tasks_in_queue += 1
             task_id = self.total_tasks_in_queue
+            video_id = entry['id']
             
             # 비디오 URL 구성
             video_url = PLAYLIST_VIDEO_URL_TEMPLATE.format(video_id=video_id)
@@ -935,42 +995,69 @@ class YTDownloaderPyQt5(QMainWindow):
                 video_url, 
                 video_id,
                 extractor='youtube',
-                title_override=STR.TPL_VIDEO_TITLE.format(video_id=video_id)
+                title_override=STR.TPL_VIDEO_TITLE.format(video_id=video_id),
+                metadata=entry,
+                group=f"playlist:{playlist_url}"
             )
+            prefetch_items.append((task_id, video_url))
+        
+        # 크기 추정용 전체 메타데이터는 배치로 미리 조회 (영상마다 yt-dlp를 실행하지 않도록)
+        self.scheduler.prefetch_metadata(prefetch_items, self.settings.copy())
         
-        self.status_label.setText(STR.MSG_ADDED_PLAYLIST.format(count=len(video_ids)))
+        self.status_label.setText(STR.MSG_ADDED_PLAYLIST.format(count=len(entries)))
         self.update_progress_ui()
 
-    @pyqtSlot(str, list, bool, str)
-    def on_playlist_analysis_finished(self, url, video_ids, success, error_msg):
+    @pyqtSlot(str, list)
+    def on_playlist_entries_found(self, url, entries):
+        """플레이리스트 분석 중 항목 묶음 수신 - 중복이 아닌 항목은 즉시 등록"""
+        if self.sender() is not self.playlist_worker:
+            return  # 중단된 이전 분석의 늦은 시그널
+        
+        filtered_ids, _ = self._filter_duplicate_videos([entry['id'] for entry in entries])
+        kept = set(filtered_ids)
+        new_entries = [entry for entry in entries if entry['id'] in kept]
+        if len(new_entries) < len(entries):
+            # 중복 항목은 보류 (분석 완료 후 사용자에게 한 번만 확인)
+            self._playlist_duplicate_entries.extend(e for e in entries if e['id'] not in kept)
+        
+        if new_entries:
+            self._playlist_registered_count += len(new_entries)
+            self._register_playlist_tasks(new_entries, url)
+            self.status_label.setText(
+                STR.MSG_REGISTERING_PLAYLIST.format(count=self._playlist_registered_count)
+            )
+
+    @pyqtSlot(str, int, bool, str)
+    def on_playlist_analysis_finished(self, url, total_count, success, error_msg):
         """플레이리스트 분석 완료 처리 - 오케스트레이션"""
+        if self.sender() is not self.playlist_worker:
+            return
         self._enable_url_input()
         
-        if not success or not video_ids:
-            self._handle_playlist_error(error_msg)
-            return
+        duplicate_entries = self._playlist_duplicate_entries
+        self._playlist_duplicate_entries = []
         
-        # 중복 필터링
-        filtered_ids, duplicate_count = self._filter_duplicate_videos(video_ids)
+        if not success or not total_count:
+            if not self._playlist_registered_count and not duplicate_entries:
+                self._handle_playlist_error(error_msg)
+                return
+            # 일부 항목을 받은 뒤 중단된 경우: 받은 항목까지만 처리
+            log.warning(f"플레이리스트 분석 중단 ({total_count}개 수신): {error_msg}")
         
-        # 중복 발견 시 사용자 확인
-        if duplicate_count > 0:
-            if self._ask_duplicate_confirmation(len(video_ids), duplicate_count):
-                # 중복 제외 (filtered_ids 그대로 사용)
-                pass
-            else:
-                # 모두 포함
-                filtered_ids = video_ids
+        # 중복 발견 시 사용자 확인 (아니오 → 보류했던 중복 항목도 등록)
+        if duplicate_entries:
+            if not self._ask_duplicate_confirmation(total_count, len(duplicate_entries)):
+                self._playlist_registered_count += len(duplicate_entries)
+                self._register_playlist_tasks(duplicate_entries, url)
         
-        if not filtered_ids:
+        if not self._playlist_registered_count:
             from gui.widgets.message_dialog import MessageDialog
             MessageDialog(STR.TITLE_NO_NEW_VIDEOS, STR.MSG_NO_NEW_ITEMS, 
                           MessageDialog.INFO, self).exec_()
             self.status_label.setText(STR.MSG_READY)
             return
         
-        # 작업 등록
-        self._register_playlist_tasks(filtered_ids)
+        self.status_label.setText(STR.MSG_ADDED_PLAYLIST.format(count=self._playlist_registered_count))
 
     # --- 작업 저장/로드 및 종료 처리 ---
 
@@ -979,6 +1066,8 @@ class YTDownloaderPyQt5(QMainWindow):
         loaded_tasks = self.task_manager.load_tasks()
         
         if not loaded_tasks:
+            # 목록이 비었으면 남은 이어받기 기록/임시 파일만 정리
+            self.scheduler.partial_registry.scan([], self.settings.get('download_folder'))
             return
             
         if self.scroll_area.isHidden():
@@ -1024,6 +1113,9 @@ class YTDownloaderPyQt5(QMainWindow):
             self.total_tasks_in_queue = max_id
         self.update_progress_ui()
         
+        # 이어받기 기록을 실제 임시 파일과 맞춤 (재연결/정리) → 재개 시 같은 파일에서 이어받음
+        self.scheduler.partial_registry.scan(self.tasks, self.settings.get('download_folder'))
+        
         # 일시정지된 작업이 있는지 확인
         paused_tasks = [task for task in self.tasks if task.status == TaskStatus.PAUSED]
         if paused_tasks:
@@ -1050,7 +1142,9 @@ class YTDownloaderPyQt5(QMainWindow):
         
         # 플레이리스트 분석 워커 종료
         if self.playlist_worker and self.playlist_worker.isRunning():
-            self.playlist_worker.terminate()  # 먼저 종료 신호 전송
+            self.playlist_worker.stop()  # 먼저 종료 요청 (yt-dlp 프로세스 정리)
+            if not self.playlist_worker.wait(WORKER_TERMINATE_WAIT_MS):
+                self.playlist_worker.terminate()
             if not self.playlist_worker.wait(WORKER_SHUTDOWN_WAIT_MS):
                 log.warning("플레이리스트 워커가 시간 내에 종료되지 않았습니다.")
         
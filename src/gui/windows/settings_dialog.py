@@ -1,92 +1,42 @@
 import os
-import json
 import sys
-import subprocess
-import shutil
 from PyQt5.QtWidgets import (QVBoxLayout, QHBoxLayout, QLineEdit, 
                              QPushButton, QLabel, QFormLayout, QSpinBox,
-                             QComboBox, QFileDialog, QCheckBox, QTabWidget, QWidget)
+                             QComboBox, QFileDialog, QCheckBox, QTabWidget, QWidget, QDialog)
 from PyQt5.QtCore import Qt, QPoint
 from PyQt5.QtGui import QFont, QColor, QStandardItem
 
-from utils.utils import get_user_data_path, get_base_path
 from constants import (
     KEY_DOWNLOAD_FOLDER, KEY_VIDEO_QUALITY, KEY_AUDIO_QUALITY, KEY_FORMAT,
     KEY_MAX_DOWNLOADS, KEY_NORMALIZE_AUDIO, KEY_USE_ACCELERATION, KEY_LANGUAGE,
-    DEFAULT_VIDEO_QUALITY, DEFAULT_AUDIO_QUALITY, DEFAULT_FORMAT,
+    KEY_ENGINE_MODE, KEY_BANDWIDTH_LIMIT,
+    DEFAULT_FORMAT,
     DEFAULT_MAX_DOWNLOADS, DEFAULT_ACCELERATION, DEFAULT_NORMALIZE,
+    DEFAULT_ENGINE_MODE, DEFAULT_BANDWIDTH_LIMIT,
     FORMAT_OPTIONS, VIDEO_FORMATS, AUDIO_FORMATS,
     VIDEO_QUALITY_OPTIONS, AUDIO_QUALITY_OPTIONS,
-    MAX_DOWNLOADS_RANGE,
-    APP_VERSION,
-    BTN_TEXT_CLOSE_X
+    MAX_DOWNLOADS_RANGE, ASYNC_MAX_DOWNLOADS_RANGE, ENGINE_ASYNC, BANDWIDTH_LIMIT_RANGE,
+    APP_VERSION
 )
 from locales import DEFAULT_LANGUAGE, SUPPORTED_LANGUAGES
 from locales.strings import STR
 from gui.widgets.base_dialog import BaseDialog
 from gui.widgets.message_dialog import MessageDialog
 from resources.styles import (
-    SETTINGS_CONTAINER_STYLE, SETTINGS_TITLE_LABEL_STYLE, SETTINGS_CLOSE_BUTTON_STYLE,
+    SETTINGS_TITLE_LABEL_STYLE,
     SETTINGS_SECTION_LABEL_STYLE, SETTINGS_LABEL_STYLE, SETTINGS_BROWSE_BUTTON_STYLE,
     SETTINGS_INPUT_STYLE, SETTINGS_COMBO_STYLE, SETTINGS_CHECKBOX_STYLE,
     SETTINGS_CANCEL_BUTTON_STYLE, SETTINGS_SAVE_BUTTON_STYLE,
     SETTINGS_TAB_STYLE, SETTINGS_HELP_ICON_STYLE,
     SETTINGS_UPDATE_BUTTON_STYLE, SETTINGS_UNINSTALL_BUTTON_STYLE,
     # Moved Constants
-    SETTINGS_DIALOG_WIDTH, SETTINGS_DIALOG_HEIGHT, SETTINGS_CONTAINER_MARGIN,
-    SETTINGS_CONTENT_MARGIN, SETTINGS_CONTENT_SPACING, SETTINGS_INPUT_HEIGHT,
-    SETTINGS_BUTTON_HEIGHT, SETTINGS_BUTTON_WIDTH, SETTINGS_TITLE_BAR_HEIGHT,
-    SETTINGS_CLOSE_BUTTON_SIZE, SETTINGS_SHADOW_BLUR_RADIUS, SETTINGS_SHADOW_ALPHA,
+    SETTINGS_DIALOG_WIDTH, SETTINGS_DIALOG_HEIGHT, SETTINGS_INPUT_HEIGHT,
+    SETTINGS_BUTTON_HEIGHT, SETTINGS_BUTTON_WIDTH,
     SETTINGS_FONT_FAMILY, SETTINGS_TITLE_FONT_SIZE, SETTINGS_SECTION_FONT_SIZE,
     COLOR_DIVIDER
 )
 from utils.logger import log
-
-
-# ===== 설정 로드/저장 함수 =====
-
-def load_settings():
-    """JSON 파일에서 설정 로드"""
-    settings_file = os.path.join(get_user_data_path(), 'settings.json')
-    
-    # 기본 설정값
-    default_settings = {
-        KEY_DOWNLOAD_FOLDER: os.path.join(get_base_path(), 'youtube_downloads'),
-        KEY_VIDEO_QUALITY: DEFAULT_VIDEO_QUALITY,
-        KEY_AUDIO_QUALITY: DEFAULT_AUDIO_QUALITY,
-        KEY_FORMAT: DEFAULT_FORMAT,
-        KEY_MAX_DOWNLOADS: DEFAULT_MAX_DOWNLOADS,
-        KEY_NORMALIZE_AUDIO: DEFAULT_NORMALIZE,
-        KEY_USE_ACCELERATION: DEFAULT_ACCELERATION,
-        KEY_LANGUAGE: DEFAULT_LANGUAGE
-    }
-    
-    try:
-        if os.path.exists(settings_file):
-            with open(settings_file, 'r', encoding='utf-8') as f:
-                loaded_settings = json.load(f)
-                default_settings.update(loaded_settings)
-    except Exception as e:
-        log.error(f"설정 로드 실패: {e}", exc_info=True)
-    
-    # 다운로드 폴더가 없으면 생성
-    if not os.path.exists(default_settings[KEY_DOWNLOAD_FOLDER]):
-        try:
-            os.makedirs(default_settings[KEY_DOWNLOAD_FOLDER], exist_ok=True)
-        except Exception as e:
-            log.warning(f"다운로드 폴더 생성 실패: {e}")
-            
-    return default_settings
-
-
-def save_settings(settings):
-    """설정을 JSON 파일에 저장"""
-    settings_file = os.path.join(get_user_data_path(), 'settings.json')
-    try:
-        with open(settings_file, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, ensure_ascii=False, indent=2)
-    except Exception as e:
-        log.error(f"설정 저장 실패: {e}", exc_info=True)
+from utils.settings import save_settings
 
 
 # ===== 설정 다이얼로그 클래스 =====
@@ -274,7 +224,10 @@ class SettingsDialog(BaseDialog):
         
         # 최대 동시 다운로드 수
         self.max_downloads_spin = QSpinBox()
-        self.max_downloads_spin.setRange(*MAX_DOWNLOADS_RANGE)
+        if self.settings.get(KEY_ENGINE_MODE, DEFAULT_ENGINE_MODE) == ENGINE_ASYNC:
+            self.max_downloads_spin.setRange(*ASYNC_MAX_DOWNLOADS_RANGE)
+        else:
+            self.max_downloads_spin.setRange(*MAX_DOWNLOADS_RANGE)
         self.max_downloads_spin.setValue(
             int(self.settings.get(KEY_MAX_DOWNLOADS, DEFAULT_MAX_DOWNLOADS))
         )
@@ -307,10 +260,22 @@ class SettingsDialog(BaseDialog):
         # 초기 상태 반영
         self._on_acceleration_changed(self.accel_check.isChecked())
         
+        # 전체 속도 제한 (엔진에 따라 받는 도중 다시 나누는지 다르므로 도움말로 안내)
+        self.bandwidth_spin = QSpinBox()
+        self.bandwidth_spin.setRange(*BANDWIDTH_LIMIT_RANGE)
+        try:
+            self.bandwidth_spin.setValue(int(self.settings.get(KEY_BANDWIDTH_LIMIT, DEFAULT_BANDWIDTH_LIMIT) or 0))
+        except (TypeError, ValueError):
+            self.bandwidth_spin.setValue(DEFAULT_BANDWIDTH_LIMIT)
+        self.bandwidth_spin.setFixedHeight(SETTINGS_INPUT_HEIGHT)
+        self.bandwidth_spin.setStyleSheet(SETTINGS_INPUT_STYLE)
+        
+        self._create_option_row(layout, STR.SETTINGS_LABEL_BANDWIDTH, STR.TOOLTIP_BANDWIDTH, self.bandwidth_spin)
+        
         layout.addStretch()
 
     def _create_option_row(self, parent_layout, text, tooltip, checkbox):
-        """옵션 행 생성 (❔ 아이콘 / 텍스트 / 체크박스)"""
+        """옵션 행 생성 (❔ 아이콘 / 텍스트 / 체크박스 등 입력 위젯)"""
         row_layout = QHBoxLayout()
         row_layout.setSpacing(8)
         
@@ -501,11 +466,11 @@ class SettingsDialog(BaseDialog):
         self.settings[KEY_NORMALIZE_AUDIO] = self.norm_check.isChecked()
         self.settings[KEY_USE_ACCELERATION] = self.accel_check.isChecked()
         self.settings[KEY_MAX_DOWNLOADS] = self.max_downloads_spin.value()
+        self.settings[KEY_BANDWIDTH_LIMIT] = self.bandwidth_spin.value()
         
         # 언어 설정 저장
         selected_lang_index = self.language_combo.currentIndex()
         selected_lang = list(SUPPORTED_LANGUAGES.keys())[selected_lang_index]
-        old_lang = self.settings.get(KEY_LANGUAGE, DEFAULT_LANGUAGE)
         self.settings[KEY_LANGUAGE] = selected_lang
         
         save_settings(self.settings)
@@ -0,0 +1,103 @@
+"""
+GUI 전용 백그라운드 워커 (Qt 시그널로 결과를 메인 스레드에 전달)
+- 다운로드 엔진 워커는 Qt 없이 동작하도록 core.workers에 있음
+"""
+import time
+from typing import Dict, List, Optional
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core import download_handler
+from utils.logger import log
+from constants import PLAYLIST_STREAM_CHUNK_SIZE, PLAYLIST_STREAM_FLUSH_SEC
+from locales.strings import STR
+
+
+class PlaylistAnalysisWorker(QThread):
+    """
+    플레이리스트 분석을 위한 별도 스레드 (UI 프리징 방지)
+    - 항목을 스트리밍으로 받아 묶음 단위로 전달 (카드/큐가 점진적으로 생성됨)
+    - 항목은 제목/길이/썸네일이 포함된 경량 메타데이터 (카드를 추가 조회 없이 표시)
+    """
+    entries_found = pyqtSignal(str, list)  # url, 항목 메타데이터 묶음
+    analysis_finished = pyqtSignal(str, int, bool, str)  # url, 전체 개수, 성공여부, 에러 메시지
+    
+    def __init__(self, url: str, parent: Optional[QThread] = None):
+        super().__init__(parent)
+        self.url = url
+        self._stop_requested = False
+    
+    def stop(self) -> None:
+        """분석 중단 요청 (다음 항목 수신 시 yt-dlp 프로세스까지 정리)"""
+        self._stop_requested = True
+    
+    def run(self) -> None:
+        """플레이리스트 항목을 추출하여 묶음 단위로 전달"""
+        total = 0
+        try:
+            entries, error_msg = download_handler.iter_playlist_entries(self.url)
+            if entries is None:
+                self.analysis_finished.emit(self.url, 0, False, error_msg)
+                return
+            
+            chunk: List[Dict] = []
+            last_flush = time.monotonic()
+            try:
+                for entry in entries:
+                    if self._stop_requested:
+                        break
+                    chunk.append(entry)
+                    now = time.monotonic()
+                    if len(chunk) >= PLAYLIST_STREAM_CHUNK_SIZE or now - last_flush >= PLAYLIST_STREAM_FLUSH_SEC:
+                        total += len(chunk)
+                        self.entries_found.emit(self.url, chunk)
+                        chunk = []
+                        last_flush = now
+            finally:
+                entries.close()
+            
+            if chunk and not self._stop_requested:
+                total += len(chunk)
+                self.entries_found.emit(self.url, chunk)
+        except Exception as e:
+            log.error(f"Playlist Error: {e}")
+            self.analysis_finished.emit(self.url, total, False, str(e))
+            return
+        
+        if total == 0:
+            self.analysis_finished.emit(self.url, 0, False, STR.ERR_CANNOT_FETCH_INFO)
+        else:
+            self.analysis_finished.emit(self.url, total, True, "")
+
+
+class StartupWorker(QThread):
+    """앱 시작 시 메인 스레드를 차단하지 않고 무거운 검사(업데이트 확인 등)를 수행하는 워커"""
+    status_updated = pyqtSignal(str)
+    finished_checks = pyqtSignal(dict, tuple) # bin_updates, app_update_info (avail, latest, url)
+    error_occurred = pyqtSignal(str)
+
+    def run(self):
+        try:
+            from utils.bin_manager import check_binaries_exist, check_updates_available
+            from utils.app_updater import check_for_updates
+            from locales.strings import STR
+            import time
+            
+            # 외부 구성 요소 확인
+            self.status_updated.emit(STR.MSG_STARTUP_CHECK_EXT)
+            time.sleep(0.1) # UI 업데이트 여유시간 (자율 조절)
+            
+            bin_updates = {}
+            if check_binaries_exist():
+                bin_updates = check_updates_available()
+                
+            # 앱 자체 업데이트 확인
+            self.status_updated.emit(STR.MSG_STARTUP_CHECK_APP)
+            app_update_info = check_for_updates()
+            
+            self.finished_checks.emit(bin_updates, app_update_info)
+            
+        except Exception as e:
+            from utils.logger import log
+            log.error(f"StartupWorker error: {e}", exc_info=True)
+            self.error_occurred.emit(str(e))
@@ -52,6 +52,7 @@ STRINGS = {
     'SETTINGS_SEC_ADVANCED': "高度な機能",
     'SETTINGS_CHK_NORMALIZE': "音量正規化",
     'SETTINGS_CHK_ACCEL': "ダウンロード加速 (マルチスレッド)",
+    'SETTINGS_LABEL_BANDWIDTH': "全体速度制限 (KB/s, 0 = 無制限)",
     'SETTINGS_LABEL_COOKIES': "クッキー (アプリ内ログイン):",
     'BTN_LOGIN': "ログイン",
     'BTN_SAVE_CLOSE': "保存して閉じる",
@@ -193,6 +194,7 @@ STRINGS = {
     'ERR_PLAYLIST_FETCH': "プレイリストから動画を取得できませんでした。",
     'ERR_NOT_PLAYLIST': "プレイリストURLではありません。",
     'ERR_CANNOT_FETCH_INFO': "情報を取得できませんでした。",
+    'ERR_REMOTE_AGENT_LOST': "リモートエージェントとの接続が切れたため、ダウンロードできませんでした。",
     'ERR_INVALID_URL': "有効な動画URLを入力してください。",
 
     # Loading / Analysis
@@ -233,6 +235,7 @@ STRINGS = {
     'TOOLTIP_RETRY': "再試行",
     'TOOLTIP_NORMALIZE': "音量を放送基準(-14 LUFS)に正規化します。\n変換に時間がかかります。",
     'TOOLTIP_ACCEL': "ファイルを分割して並行ダウンロードします。\n速度が向上します。\n(選択時は最大ダウンロード数が1に固定されます)",
+    'TOOLTIP_BANDWIDTH': "ダウンロード中の項目でこの速度を分け合います。\n常駐プロセスプールエンジンはダウンロード中も再配分します。\n標準/asyncioエンジンは開始時に決まった配分を最後まで維持します\n(完了したダウンロードの分は次のダウンロードに割り当てられます)。",
 
     'MENU_PLAY': "▶ 再生",
     'MENU_OPEN_FOLDER': "📂 フォルダを開く",
@@ -240,6 +243,8 @@ STRINGS = {
     'MENU_PAUSE': "⏸ 一時停止",
     'MENU_RESUME': "▶ 再開",
     'MENU_RETRY': "↻ 再試行",
+    'MENU_MOVE_TOP': "⤒ 先頭へ移動",
+    'MENU_MOVE_BOTTOM': "⤓ 末尾へ移動",
     'MENU_DELETE_FILE': "🗑️ ファイルを削除",
     'MENU_REMOVE': "❌ リストから削除",
 
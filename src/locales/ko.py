@@ -52,6 +52,7 @@ STRINGS = {
     'SETTINGS_SEC_ADVANCED': "고급 기능",
     'SETTINGS_CHK_NORMALIZE': "음량 평준화",
     'SETTINGS_CHK_ACCEL': "다운로드 가속 (멀티 스레드)",
+    'SETTINGS_LABEL_BANDWIDTH': "전체 속도 제한 (KB/s, 0 = 제한 없음)",
     'SETTINGS_LABEL_COOKIES': "쿠키 (인앱 로그인):",
     'BTN_LOGIN': "로그인하기",
     'BTN_SAVE_CLOSE': "저장 및 닫기",
@@ -193,6 +194,7 @@ STRINGS = {
     'ERR_PLAYLIST_FETCH': "플레이리스트에서 영상을 가져올 수 없습니다.",
     'ERR_NOT_PLAYLIST': "플레이리스트 URL이 아닙니다.",
     'ERR_CANNOT_FETCH_INFO': "정보를 가져올 수 없습니다.",
+    'ERR_REMOTE_AGENT_LOST': "원격 에이전트와 연결이 끊겨 다운로드하지 못했습니다.",
     'ERR_INVALID_URL': "유효한 영상 URL을 입력해주세요.",
     'ERR_UNSUPPORTED_URL': "이 URL은 다운로드를 지원하지 않는 사이트입니다.",
 
@@ -234,6 +236,7 @@ STRINGS = {
     'TOOLTIP_RETRY': "재시도",
     'TOOLTIP_NORMALIZE': "음량을 방송 표준(-14 LUFS)으로 평준화합니다.\n변환에 시간이 더 소요됩니다.",
     'TOOLTIP_ACCEL': "파일을 여러 파트로 나누어 동시에 다운로드합니다.\n다운로드 속도가 향상됩니다.\n(선택 시 최대 다운로드 수는 1로 고정)",
+    'TOOLTIP_BANDWIDTH': "받는 중인 다운로드끼리 이 속도를 나누어 씁니다.\n상주 프로세스 풀 엔진은 받는 도중에도 다시 나눕니다.\n기본/asyncio 엔진은 다운로드가 시작될 때 정해진 몫을 끝까지 유지합니다\n(끝난 다운로드의 몫은 다음 다운로드가 받습니다).",
 
     'MENU_PLAY': "▶ 재생",
     'MENU_OPEN_FOLDER': "📂 폴더 열기",
@@ -241,6 +244,8 @@ STRINGS = {
     'MENU_PAUSE': "⏸ 일시정지",
     'MENU_RESUME': "▶ 재개",
     'MENU_RETRY': "↻ 재시도",
+    'MENU_MOVE_TOP': "⤒ 맨 위로 이동",
+    'MENU_MOVE_BOTTOM': "⤓ 맨 아래로 이동",
     'MENU_DELETE_FILE': "🗑️ 파일 삭제",
     'MENU_REMOVE': "❌ 목록에서 제거",
 
@@ -87,6 +87,8 @@ class Strings:
     @property
     def SETTINGS_CHK_ACCEL(self):       return get_string('SETTINGS_CHK_ACCEL', "Download Acceleration (Multi-thread)")
     @property
+    def SETTINGS_LABEL_BANDWIDTH(self): return get_string('SETTINGS_LABEL_BANDWIDTH', "Total Speed Limit (KB/s, 0 = unlimited)")
+    @property
     def SETTINGS_LABEL_COOKIES(self):   return get_string('SETTINGS_LABEL_COOKIES', "Cookie (In-App Login):")
     @property
     def BTN_LOGIN(self):                return get_string('BTN_LOGIN', "Login")
@@ -305,6 +307,8 @@ class Strings:
     def ERR_INVALID_URL(self):         return get_string('ERR_INVALID_URL', "Please enter a valid URL.")
     @property
     def ERR_UNSUPPORTED_URL(self):    return get_string('ERR_UNSUPPORTED_URL', "This URL is not supported for downloading.")
+    @property
+    def ERR_REMOTE_AGENT_LOST(self):  return get_string('ERR_REMOTE_AGENT_LOST', "Download failed: lost contact with the remote agent.")
 
     # Loading / Analysis
     @property
@@ -373,6 +377,8 @@ class Strings:
     def TOOLTIP_NORMALIZE(self):    return get_string('TOOLTIP_NORMALIZE', "Standardize volume to broadcast standard (-14 LUFS).\nConversion takes a bit longer.")
     @property
     def TOOLTIP_ACCEL(self):        return get_string('TOOLTIP_ACCEL', "Download file in multiple parts concurrently.\nIncreases download speed.\n(Max downloads fixed to 1 when selected)")
+    @property
+    def TOOLTIP_BANDWIDTH(self):    return get_string('TOOLTIP_BANDWIDTH', "Running downloads share this speed.\nWith the process pool engine, shares are rebalanced while downloading.\nWith the default and asyncio engines, each download keeps the share it got when it started\n(speed freed by finished downloads goes to the next downloads).")
 
     # Context Menus (Translated Defaults)
     @property
@@ -388,6 +394,10 @@ class Strings:
     @property
     def MENU_RETRY(self):        return get_string('MENU_RETRY', "↻ Retry")
     @property
+    def MENU_MOVE_TOP(self):     return get_string('MENU_MOVE_TOP', "⤒ Move to Top")
+    @property
+    def MENU_MOVE_BOTTOM(self):  return get_string('MENU_MOVE_BOTTOM', "⤓ Move to Bottom")
+    @property
     def MENU_DELETE_FILE(self):  return get_string('MENU_DELETE_FILE', "🗑️ Delete File")
     @property
     def MENU_REMOVE(self):       return get_string('MENU_REMOVE', "❌ Remove from List")
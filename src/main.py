@@ -20,7 +20,7 @@
 
 import sys
 import os
-from PyQt5.QtWidgets import QApplication, QMessageBox, QDialog
+import multiprocessing
 
 # 로거를 먼저 초기화 (다른 모듈보다 먼저)
 try:
@@ -62,6 +62,8 @@ def show_error_message(title, text, informative_text=""):
     """
     오류 메시지를 표시합니다. QApplication이 있으면 MessageDialog를, 없으면 print를 사용합니다.
     """
+    from PyQt5.QtWidgets import QApplication
+    
     if QApplication.instance():
         try:
             from gui.widgets.message_dialog import MessageDialog
@@ -111,6 +113,15 @@ def main():
         if application_path not in sys.path:
             sys.path.insert(0, application_path)
         
+        # 이미 실행 중인 인스턴스가 있으면 URL만 넘기고 종료
+        # (QtWidgets/QtWebEngine import, 스타트업 점검, 두 번째 스케줄러를 모두 건너뜀)
+        from gui.single_instance import SingleInstanceServer, forward_to_running_instance, urls_from_args
+        launch_urls = urls_from_args(sys.argv[1:])
+        if forward_to_running_instance(launch_urls):
+            sys.exit(0)
+        
+        from PyQt5.QtWidgets import QApplication, QDialog
+        
         # QtWebEngineWidgets는 QApplication 생성 전에 import 해야 함 (OpenGL 컨텍스트 공유 오류 방지)
         try:
             from PyQt5 import QtWebEngineWidgets  # noqa: F401
@@ -122,6 +133,10 @@ def main():
         app.setApplicationName(APP_TITLE)
         app.setOrganizationName(ORGANIZATION_NAME)
         
+        # 스타트업 점검 중에 실행된 다른 인스턴스의 URL도 받도록 먼저 서버를 염 (창 생성 후 전달)
+        instance_server = SingleInstanceServer(app)
+        instance_server.listen()
+        
         # 의존성 확인 (QApplication 생성 후)
         deps_ok, missing_module = check_dependencies()
         if not deps_ok:
@@ -140,7 +155,7 @@ def main():
             
             # 설정 로드 및 언어 초기화
             try:
-                from gui.windows.settings_dialog import load_settings
+                from utils.settings import load_settings
                 from constants import change_language, KEY_LANGUAGE
                 from locales import DEFAULT_LANGUAGE
                 
@@ -298,6 +313,9 @@ def main():
         try:
             window = YTDownloaderPyQt5()
             window.show()
+            instance_server.attach(window.handle_external_urls)
+            if launch_urls:
+                window.handle_external_urls(launch_urls)
         except Exception as e:
             show_error_message(
                 STR.TITLE_ERROR,
@@ -321,4 +339,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # PyInstaller 환경에서 프로세스 풀 헬퍼(spawn)가 main()을 다시 실행하지 않도록 처리
+    multiprocessing.freeze_support()
     main()
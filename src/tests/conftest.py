@@ -0,0 +1,31 @@
+"""
+테스트 공통 설정
+- src 폴더를 import 경로에 추가 (앱과 같은 방식으로 core/utils 등을 import)
+- 테스트마다 사용자 데이터 경로(HOME/APPDATA)를 임시 폴더로 바꿔 실제 기록/캐시를 건드리지 않음
+"""
+import os
+import sys
+
+import pytest
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+
+@pytest.fixture(autouse=True)
+def isolated_user_data(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.setenv('APPDATA', str(tmp_path))
+    return tmp_path
+
+
+def wait_until(predicate, timeout=5.0, interval=0.01):
+    """조건이 참이 될 때까지 대기 (스레드를 쓰는 테스트용)"""
+    import time
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(interval)
+    return predicate()
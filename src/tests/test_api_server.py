@@ -0,0 +1,145 @@
+"""로컬 데몬 API 서버 테스트 (JSON-RPC/HTTP/SSE, 다운로드 워커 없이 등록/제어 단계만 실행)"""
+import http.client
+import json
+import socket
+import time
+
+import pytest
+
+from core.api_server import ApiServer, RPC_METHOD_NOT_FOUND, RPC_INVALID_PARAMS, RPC_PARSE_ERROR
+from core.download_service import DownloadService
+from core.process_supervisor import supervisor
+from tests.conftest import wait_until
+
+TOKEN = 'secret'
+
+
+def _video_url(n):
+    return f'https://www.youtube.com/watch?v=vid{n:08d}'
+
+
+@pytest.fixture
+def api(isolated_user_data):
+    # 스케줄러를 시작하지 않으므로 등록된 작업은 대기 상태로 남음
+    service = DownloadService({'format': 'mp3', 'download_folder': str(isolated_user_data)})
+    server = ApiServer(service, '127.0.0.1', 0, TOKEN)
+    server.start()
+    assert server.started.wait(5) and server.error is None
+    yield server
+    server.stop()
+    service.shutdown()
+    server.join(5)
+    # 스케줄러 종료가 공유 감독자를 닫으므로 다음 테스트를 위해 다시 열어 둠
+    supervisor.reopen()
+
+
+def _connect(server):
+    return http.client.HTTPConnection(server.host, server.port, timeout=5)
+
+
+def _request(conn, method, path, payload=None, token=TOKEN):
+    headers = {'Content-Type': 'application/json'}
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+    body = None if payload is None else (payload if isinstance(payload, bytes) else json.dumps(payload))
+    conn.request(method, path, body=body, headers=headers)
+    response = conn.getresponse()
+    data = response.read()
+    return response.status, json.loads(data) if data else None
+
+
+def _rpc(conn, method, params=None, request_id=1):
+    request = {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params or {}}
+    status, response = _request(conn, 'POST', '/rpc', request)
+    assert status == 200
+    return response
+
+
+def test_enqueue_status_and_cancel(api):
+    conn = _connect(api)
+    assert _rpc(conn, 'enqueue', {'url': _video_url(1)})['result'] == {'task_id': 1}
+    # 같은 영상은 건너뜀
+    assert _rpc(conn, 'enqueue', [_video_url(1)])['result'] == {'skipped': 1}
+
+    status, task = _request(conn, 'GET', '/tasks/1')
+    assert status == 200 and task['status'] == 'waiting'
+    assert api.service.scheduler.is_task_queued(1)
+
+    assert _rpc(conn, 'set_priority', {'task_id': 1, 'priority': 1})['result']['requeued'] is True
+    assert _rpc(conn, 'cancel', {'task_id': 1})['result'] == {'cancelled': True}
+    assert not api.service.scheduler.is_task_queued(1)
+
+    status, listing = _request(conn, 'GET', '/tasks?state=failed')
+    assert status == 200 and [t['task_id'] for t in listing['tasks']] == [1]
+    assert _request(conn, 'GET', '/tasks/99')[0] == 404
+
+
+def test_rpc_errors_batches_and_notifications(api):
+    conn = _connect(api)
+    assert _rpc(conn, 'nope')['error']['code'] == RPC_METHOD_NOT_FOUND
+    assert _rpc(conn, 'enqueue', {'url': 'not a url'})['error']['code'] == RPC_INVALID_PARAMS
+    assert _rpc(conn, 'set_priority', {'task_id': 1, 'priority': 'high'})['error']['code'] == RPC_INVALID_PARAMS
+    assert _request(conn, 'POST', '/rpc', b'{broken')[1]['error']['code'] == RPC_PARSE_ERROR
+
+    batch = [
+        {'jsonrpc': '2.0', 'id': 1, 'method': 'enqueue', 'params': {'url': _video_url(1)}},
+        {'jsonrpc': '2.0', 'method': 'enqueue', 'params': {'url': _video_url(2)}},  # 알림: 응답 없음
+        {'jsonrpc': '2.0', 'id': 3, 'method': 'status', 'params': {'task_id': 2}},
+    ]
+    status, responses = _request(conn, 'POST', '/rpc', batch)
+    assert status == 200
+    assert [r['id'] for r in responses] == [1, 3]
+    assert responses[1]['result']['status'] == 'waiting'
+
+    notification = {'jsonrpc': '2.0', 'method': 'pause', 'params': {}}
+    assert _request(conn, 'POST', '/rpc', notification) == (204, None)
+    assert api.service.scheduler.is_paused()
+
+
+def test_requires_token(api):
+    conn = _connect(api)
+    assert _request(conn, 'GET', '/tasks', token=None)[0] == 401
+    assert _request(conn, 'GET', '/tasks', token='wrong')[0] == 401
+    assert _request(conn, 'GET', '/tasks')[0] == 200
+
+
+def test_event_stream_receives_task_events(api):
+    sock = socket.create_connection((api.host, api.port), timeout=5)
+    sock.sendall(f'GET /events HTTP/1.1\r\nHost: x\r\nAuthorization: Bearer {TOKEN}\r\n\r\n'.encode())
+    received = b''
+    while b'\r\n\r\n' not in received:
+        received += sock.recv(4096)
+    assert received.startswith(b'HTTP/1.1 200') and b'text/event-stream' in received
+    assert wait_until(lambda: api._subscribers)
+
+    conn = _connect(api)
+    _rpc(conn, 'enqueue', {'url': _video_url(1)})
+    _rpc(conn, 'cancel', {'task_id': 1})
+
+    events = []
+    while len(events) < 2:
+        received += sock.recv(4096)
+        events = [json.loads(line[len(b'data: '):]) for line in received.split(b'\n')
+                  if line.startswith(b'data: ')]
+    sock.close()
+    assert [(e['event'], e['task_id']) for e in events] == [('added', 1), ('failed', 1)]
+
+
+def test_enqueue_load(api):
+    """keep-alive 연결 하나로 대량 등록 (초당 수천 건 목표, 느린 CI를 감안해 하한은 낮게)"""
+    count = 2000
+    conn = _connect(api)
+    started = time.perf_counter()
+    for n in range(count):
+        assert 'task_id' in _rpc(conn, 'enqueue', {'url': _video_url(n)}, request_id=n)['result']
+    single_rate = count / (time.perf_counter() - started)
+
+    # JSON-RPC 배치 하나로 대량 등록
+    urls = [_video_url(n) for n in range(count, count * 3)]
+    started = time.perf_counter()
+    results = _rpc(conn, 'enqueue_many', {'items': urls})['result']
+    batch_rate = len(urls) / (time.perf_counter() - started)
+
+    assert all('task_id' in r for r in results)
+    assert api.service.scheduler.pending_queue.qsize() == count * 3
+    assert single_rate > 200 and batch_rate > 1000, (single_rate, batch_rate)
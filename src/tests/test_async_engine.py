@@ -0,0 +1,130 @@
+"""asyncio 다운로드 엔진 테스트 (가짜 yt-dlp 실행 파일로 진행률/완료/일시정지/취소)"""
+import os
+import sys
+import textwrap
+import threading
+
+import pytest
+
+from constants import MSG_DOWNLOAD_COMPLETE, STATUS_DOWNLOADING, STATUS_FINISHED
+from core import download_handler
+from core.async_engine import AsyncDownloadEngine
+from core.process_supervisor import supervisor
+from core.task_queue import LimitedPriorityQueue
+from locales.strings import STR
+from tests.conftest import wait_until
+from tests.test_workers import _FakeScheduler
+
+pytestmark = pytest.mark.skipif(os.name == 'nt', reason='shebang 실행 파일 필요')
+
+OUT_DIR_ENV = 'ASYNC_ENGINE_TEST_OUT_DIR'
+
+# URL 마지막 부분에 따라 --progress-template/--print 형식의 줄을 출력
+# (ok: 진행률 → 완료 → 최종 경로, slow: 1초 동안 진행률 뒤 완료, hang: 종료될 때까지 진행률)
+FAKE_YTDLP = textwrap.dedent('''\
+    import json, os, sys, time
+    mode = sys.argv[-1].rsplit('/', 1)[-1]
+    path = os.path.join(os.environ['{env}'], mode + '.mp4')
+
+    def emit(line):
+        sys.stdout.write(line + '\\n')
+        sys.stdout.flush()
+
+    def progress(status, downloaded, filename):
+        event = {{'status': status, 'downloaded_bytes': downloaded, 'total_bytes': 100, 'filename': filename}}
+        emit('[ytdl-progress]' + mode + '\\t18\\t' + json.dumps(event))
+
+    emit('[ytdl-format]' + mode + '\\t18')
+    progress('downloading', 50, path + '.part')
+    if mode in ('slow', 'hang'):
+        for downloaded in range(51, 71 if mode == 'slow' else 100):
+            time.sleep(0.05)
+            progress('downloading', downloaded, path + '.part')
+    if mode == 'hang':
+        time.sleep(60)
+    with open(path, 'wb') as f:
+        f.write(b'x' * 100)
+    progress('finished', 100, path)
+    emit('[ytdl-filepath]' + mode + '\\t' + path)
+''').format(env=OUT_DIR_ENV)
+
+
+class _AsyncEngine:
+    """asyncio 엔진 구성 (동시 실행 2개, 가짜 yt-dlp)"""
+
+    def __init__(self, out_dir):
+        self.out_dir = out_dir
+        self.queue = LimitedPriorityQueue()
+        self.scheduler = _FakeScheduler(1)
+        self.engine = AsyncDownloadEngine(self.queue, threading.Event(), threading.Event(), 2, self.scheduler)
+        self.engine.pause_event.set()
+        self.progress = []
+        self.finished = {}
+        self.engine.progress_updated.connect(lambda d, task_id: self.progress.append((task_id, dict(d))))
+        self.engine.download_finished.connect(lambda *args: self.finished.setdefault(args[2], args))
+
+    def submit(self, task_id, mode):
+        metadata = {'title': mode, 'id': mode, 'extractor': 'generic', 'duration': 1}
+        self.queue.put((3, task_id, f'https://example.com/{mode}', {'download_folder': str(self.out_dir)}, metadata))
+
+    def statuses(self, task_id):
+        return [d.get('status') for progress_task_id, d in self.progress if progress_task_id == task_id]
+
+
+def install_fake_ytdlp(tmp_path, monkeypatch):
+    """가짜 yt-dlp 실행 파일을 만들어 download_handler가 사용하게 함 (결과 파일 폴더 반환)"""
+    out_dir = tmp_path / 'out'
+    out_dir.mkdir()
+    script = tmp_path / 'yt-dlp'
+    script.write_text(f'#!{sys.executable}\n' + FAKE_YTDLP, encoding='utf-8')
+    script.chmod(0o755)
+    monkeypatch.setenv(OUT_DIR_ENV, str(out_dir))
+    monkeypatch.setattr(download_handler, 'get_ytdlp_path', lambda: str(script))
+    monkeypatch.setattr(download_handler, '_process_pool', None)
+    return out_dir
+
+
+@pytest.fixture
+def async_engine(tmp_path, monkeypatch):
+    engine = _AsyncEngine(install_fake_ytdlp(tmp_path, monkeypatch))
+    engine.engine.start()
+    yield engine
+    engine.engine.stop_event.set()
+    engine.engine.wake()
+    engine.engine.join(5)
+    assert not engine.engine.is_alive()
+
+
+def test_async_engine_reports_progress_and_final_path(async_engine):
+    async_engine.submit(1, 'ok')
+    assert wait_until(lambda: 1 in async_engine.finished)
+    success, message, _, final_path = async_engine.finished[1]
+    assert (success, message) == (True, MSG_DOWNLOAD_COMPLETE)
+    assert final_path == str((async_engine.out_dir / 'ok.mp4').resolve())
+    assert async_engine.statuses(1) == [STATUS_DOWNLOADING, STATUS_FINISHED]
+    assert async_engine.progress[0][1]['_percent_str'] == '50.0%'
+    assert async_engine.queue.unfinished_tasks == 0
+
+
+def test_async_engine_pauses_through_progress_hook(async_engine):
+    async_engine.submit(2, 'hang')
+    assert wait_until(lambda: async_engine.progress)
+    async_engine.scheduler.paused.add(2)
+    assert wait_until(lambda: 2 in async_engine.finished)
+    assert async_engine.finished[2][:2] == (False, STR.STATUS_PAUSED)
+    # 훅 예외로 끝난 프로세스는 루프에서 회수하고 등록 해제
+    assert 2 not in supervisor._task_pids
+    assert not async_engine.engine.running_task_ids()
+
+
+def test_async_engine_cancel_kills_process_while_other_task_runs(async_engine):
+    async_engine.submit(3, 'hang')
+    assert wait_until(lambda: async_engine.statuses(3))
+    async_engine.submit(4, 'ok')
+
+    async_engine.scheduler.cancelled.add(3)
+    assert supervisor.cancel_task(3)
+    assert wait_until(lambda: 3 in async_engine.finished and 4 in async_engine.finished)
+    assert async_engine.finished[3][:2] == (False, STR.MSG_DL_CANCELLED)
+    assert sorted(async_engine.scheduler.partial_registry.removed) == [(3, True), (4, False)]
+    assert async_engine.finished[4][0] is True
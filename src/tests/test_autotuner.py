@@ -0,0 +1,145 @@
+"""ConcurrencyAutotuner 판단 테스트 (가짜 스케줄러/시계로 측정 간격마다 _tick 실행)"""
+from constants import (
+    AUTOTUNE_INTERVAL_SEC, AUTOTUNE_THROTTLE_CEILING_SEC, ENGINE_SUBPROCESS
+)
+from core.autotuner import ConcurrencyAutotuner
+
+MB = 1024 * 1024
+
+
+class _FakeQueue:
+    def __init__(self):
+        self.size = 0
+        self.active = 0
+
+    def qsize(self):
+        return self.size
+
+    def active_counts(self):
+        return {'total': self.active}
+
+
+class _FakeScheduler:
+    engine_mode = ENGINE_SUBPROCESS
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.download_queue = _FakeQueue()
+        self.pending_queue = _FakeQueue()
+
+    def get_worker_count(self):
+        return self.workers
+
+    def adjust_worker_count(self, target_count):
+        self.workers = target_count
+
+    def is_paused(self):
+        return False
+
+    def is_task_cancelled(self, task_id):
+        return False
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Harness:
+    """측정 간격마다 워커 수에 따른 처리량(바이트/초)을 흘려 넣고 판단 실행"""
+
+    def __init__(self, workers, rate):
+        self.clock = _Clock()
+        self.scheduler = _FakeScheduler(workers)
+        self.tuner = ConcurrencyAutotuner(self.scheduler, clock=self.clock)
+        self.rate = rate
+        self.queued = 5
+        self.received = 0
+        self.history = []  # (시각, 워커 수)
+        self.tuner._on_progress({'status': 'downloading', 'downloaded_bytes': 0}, 1)
+
+    def run(self, seconds):
+        until = self.clock.now + seconds
+        while self.clock.now < until:
+            self.clock.now += AUTOTUNE_INTERVAL_SEC
+            workers = self.scheduler.workers
+            self.scheduler.download_queue.size = self.queued
+            # 대기 작업이 있으면 자리가 모두 참
+            self.scheduler.download_queue.active = workers if self.queued else 0
+            self.received += int(self.rate(workers) * AUTOTUNE_INTERVAL_SEC) if self.queued else 0
+            self.tuner._on_progress({'status': 'downloading', 'downloaded_bytes': self.received}, 1)
+            self.tuner._tick(self.clock.now)
+            if self.scheduler.workers != workers:
+                self.history.append((self.clock.now, self.scheduler.workers))
+
+
+def test_flat_throughput_rolls_back_probe_and_doubles_hold():
+    # 회선이 포화되어 워커를 늘려도 처리량이 그대로
+    h = _Harness(2, lambda workers: 10 * MB)
+    h.run(460)
+    assert h.history == [(30, 3), (60, 2), (180, 3), (210, 2), (450, 3)]
+    assert '이득 없음' in h.tuner.decisions[1]['reason']
+
+
+def test_growing_throughput_keeps_probing_up_to_max():
+    h = _Harness(2, lambda workers: workers * MB)
+    h.run(600)
+    levels = [workers for _, workers in h.history]
+    assert levels == list(range(3, h.tuner.max_workers + 1))
+
+
+def test_throttling_halves_workers_and_caps_until_ceiling_expires():
+    h = _Harness(4, lambda workers: workers * MB)
+    h.run(5)
+    h.tuner._on_finished(False, 'HTTP Error 429: Too Many Requests', 2, '')
+    h.run(15)
+    assert h.history == [(20, 2)]
+    assert h.tuner.snapshot()['ceiling'] == 3
+
+    # 한동안 늘리지 않고, 그 뒤에도 429를 받은 수 미만까지만
+    h.run(AUTOTUNE_THROTTLE_CEILING_SEC - AUTOTUNE_INTERVAL_SEC)
+    assert h.history[1:] == [(200, 3)]
+    h.run(5)
+    assert h.history[-1] == (20 + AUTOTUNE_THROTTLE_CEILING_SEC, 4)
+
+
+def test_error_rate_steps_down_ignoring_cancelled_tasks():
+    h = _Harness(3, lambda workers: 10 * MB)
+    h.scheduler.is_task_cancelled = lambda task_id: task_id == 2
+    # 취소된 작업의 실패는 세지 않으므로 429로 절반이 되지 않고 실패율로 하나만 줄임
+    h.tuner._on_finished(False, 'HTTP Error 429: Too Many Requests', 2, '')
+    h.tuner._on_finished(False, 'HTTP Error 503', 3, '')
+    h.tuner._on_finished(True, '', 4, '')
+    h.run(20)
+    assert h.history == [(20, 2)]
+    assert h.tuner.decisions[-1]['metrics']['throttled'] == 0
+
+
+def test_idle_queue_scales_to_zero_and_restores_on_work():
+    h = _Harness(3, lambda workers: 10 * MB)
+    h.queued = 0
+    h.run(15)
+    assert h.history == [(15, 0)]
+    h.run(30)
+    assert h.scheduler.workers == 0
+
+    # 작업이 들어오면 측정을 기다리지 않고 이전 수로 복구
+    h.queued = 5
+    h.run(5)
+    assert h.history[-1] == (50, 3)
+
+
+def test_idle_during_probe_restores_stable_level():
+    h = _Harness(2, lambda workers: 10 * MB)
+    h.run(30)
+    assert h.history == [(30, 3)]
+    h.queued = 0
+    h.run(15)
+    assert h.history[-1] == (45, 0)
+    h.queued = 5
+    h.run(5)
+    # 검증되지 않은 증가분은 버리고 이전 수로
+    assert h.history[-1] == (50, 2)
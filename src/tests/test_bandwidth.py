@@ -0,0 +1,105 @@
+"""BandwidthBudget 테스트 (몫 배정/반납, 다시 분배, 우선순위 가중치, 고정 몫의 예산 한도)"""
+from constants import BANDWIDTH_MIN_RATE
+from core.bandwidth import BandwidthBudget
+
+KB = 1024
+
+
+def _budget(total, slots=0, weighted=True):
+    budget = BandwidthBudget()
+    budget.configure(total, weighted)
+    budget.set_slots(slots)
+    return budget
+
+
+def test_unlimited_budget_gives_no_limit():
+    budget = _budget(0)
+    assert not budget.is_limited()
+    assert budget.acquire(1, adjustable=True).rate == 0
+    assert budget.acquire(2, adjustable=False).rate == 0
+
+
+def test_adjustable_shares_rebalance_on_acquire_and_release():
+    budget = _budget(900 * KB)
+    first = budget.acquire(1, adjustable=True)
+    rates = []
+    first.bind(rates.append)
+    assert rates == [900 * KB]
+
+    second = budget.acquire(2, adjustable=True)
+    assert first.rate == second.rate == 450 * KB
+    assert rates == [900 * KB, 450 * KB]
+
+    # 끝난 작업의 몫은 남은 작업이 바로 받음
+    budget.release(2)
+    assert first.rate == 900 * KB
+    assert budget.snapshot() == {1: 900 * KB}
+
+    # 반납한 몫은 더 이상 통지하지 않음
+    budget.release(1)
+    assert rates[-1] == 900 * KB
+    assert budget.snapshot() == {}
+
+
+def test_priority_weights_split_shares():
+    budget = _budget(800 * KB)
+    budget.set_priority(1, 1)  # 이어받기 (일반 3의 3배)
+    resume = budget.acquire(1, adjustable=True)
+    normal = budget.acquire(2, adjustable=True)
+    assert (resume.rate, normal.rate) == (600 * KB, 200 * KB)
+
+    # 받는 중에 우선순위가 바뀌면 바로 다시 분배
+    budget.set_priority(2, 1)
+    assert resume.rate == normal.rate == 400 * KB
+
+    unweighted = _budget(800 * KB, weighted=False)
+    unweighted.set_priority(1, 1)
+    unweighted.acquire(1, adjustable=True)
+    unweighted.acquire(2, adjustable=True)
+    assert set(unweighted.snapshot().values()) == {400 * KB}
+
+
+def test_fixed_shares_reserve_idle_slots_and_stay_within_total():
+    budget = _budget(900 * KB, slots=3)
+    # 빈 자리 둘도 곧 찰 것으로 보고 나눔
+    first = budget.acquire(1, adjustable=False)
+    assert first.rate == 300 * KB
+    second = budget.acquire(2, adjustable=False)
+    third = budget.acquire(3, adjustable=False)
+    assert (second.rate, third.rate) == (300 * KB, 300 * KB)
+
+    # 고정 몫은 다른 작업이 끝나도 그대로 (받는 도중 --limit-rate를 바꿀 수 없음)
+    budget.release(2)
+    assert first.rate == 300 * KB
+    # 반납된 몫은 다음에 시작하는 작업이 받음
+    assert budget.acquire(4, adjustable=False).rate == 300 * KB
+    assert sum(budget.snapshot().values()) <= 900 * KB
+
+
+def test_minimum_share_is_clamped_to_remaining_budget():
+    budget = _budget(100 * KB, slots=1)
+    # 자리보다 많이 실행 중이어도 (묶음, 동시 실행 수 변경 중) 총량을 넘지 않음
+    assert budget.acquire(1, adjustable=False).rate == 100 * KB
+    starved = budget.acquire(2, adjustable=False)
+    assert starved.rate == 1  # 0은 제한 없음이므로 최소 1바이트/초
+    assert sum(budget.snapshot().values()) <= 100 * KB + 1
+
+    # 남은 예산이 최소 몫보다 적으면 남은 만큼만
+    budget = _budget(BANDWIDTH_MIN_RATE * 3, slots=2)
+    budget.set_priority(1, 1)
+    assert budget.acquire(1, adjustable=False).rate == BANDWIDTH_MIN_RATE * 9 // 4
+    assert budget.acquire(2, adjustable=False).rate == BANDWIDTH_MIN_RATE * 3 // 4
+
+    # 조절 가능한 몫도 고정 몫을 뺀 나머지 이내
+    budget = _budget(BANDWIDTH_MIN_RATE)
+    budget.acquire(1, adjustable=False)
+    assert budget.acquire(2, adjustable=True).rate == 1
+
+
+def test_reconfigure_rebalances_adjustable_shares():
+    budget = _budget(400 * KB)
+    share = budget.acquire(1, adjustable=True)
+    budget.configure(200 * KB)
+    assert share.rate == 200 * KB
+    budget.configure(0)
+    assert share.rate == 0
@@ -0,0 +1,122 @@
+"""헤드리스 CLI/스케줄러 테스트 (Qt 없이 가짜 yt-dlp로 받기, 기록 중복 건너뛰기, 중단, 일시정지/취소)"""
+import io
+import json
+import sys
+import time
+
+import pytest
+
+import cli
+from core import download_handler
+from core.process_supervisor import supervisor
+from core.scheduler import DownloadScheduler
+from locales.strings import STR
+from tests.conftest import wait_until
+from tests.test_async_engine import install_fake_ytdlp
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason='shebang 실행 파일과 SIGSTOP 필요')
+
+
+def _meta(url):
+    mode = url.rsplit('/', 1)[-1]
+    return {'title': mode, 'id': mode, 'extractor': 'generic', 'duration': 1}
+
+
+def _events(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+@pytest.fixture
+def headless(tmp_path, monkeypatch):
+    out_dir = install_fake_ytdlp(tmp_path, monkeypatch)
+    monkeypatch.setattr(download_handler, 'fetch_metadata_many',
+                        lambda urls, settings=None: ((url, _meta(url), True) for url in urls))
+    yield out_dir
+    # 스케줄러 shutdown이 감독자를 닫으므로 다음 테스트를 위해 다시 허용
+    supervisor.reopen()
+
+
+class _InterruptOnProgress:
+    """BatchRunner.done 대신 사용: 진행률이 출력되면 Ctrl+C처럼 KeyboardInterrupt"""
+
+    def __init__(self, out):
+        self.out = out
+
+    def wait(self, timeout):
+        if '"progress"' in self.out.getvalue():
+            raise KeyboardInterrupt
+        time.sleep(0.02)
+        return False
+
+    def set(self):
+        pass
+
+
+def test_cli_downloads_url_list_and_skips_history(headless, tmp_path, capsys):
+    url_file = tmp_path / 'urls.txt'
+    url_file.write_text('# 주석\nhttps://example.com/ok\n\nhttps://example.com/slow\nhttps://example.com/ok\n',
+                        encoding='utf-8')
+    argv = [str(url_file), '--output', str(headless), '--jobs', '2']
+
+    assert cli.main(argv) == 0
+    events = _events(capsys.readouterr().out)
+    finished = {event['id']: event for event in events if event['event'] == 'finished'}
+    assert set(finished) == {'ok', 'slow'}
+    assert finished['ok']['path'] == str((headless / 'ok.mp4').resolve())
+    progress = [event for event in events if event['event'] == 'progress']
+    assert {'downloaded_bytes', 'total_bytes', 'percent'} <= set(progress[0])
+    assert [event['event'] for event in events].count('started') == 2
+    # 다운로드 코어는 Qt 없이 동작
+    assert 'PyQt5' not in sys.modules
+
+    # 다시 실행하면 history.db 기록으로 건너뜀
+    assert cli.main(argv) == 0
+    assert [event['event'] for event in _events(capsys.readouterr().out)] == ['skipped', 'skipped']
+
+
+def test_cli_interrupt_stops_running_downloads(headless):
+    args = cli.build_parser().parse_args(['--output', str(headless)])
+    settings, jobs = cli.settings_from_args(args)
+    out = io.StringIO()
+    runner = cli.BatchRunner(settings, jobs, out=out)
+    runner.done = _InterruptOnProgress(out)
+
+    assert runner.run(['https://example.com/hang']) == 1
+    events = _events(out.getvalue())
+    assert events[-1]['event'] == 'error' and events[-1]['message'] == 'interrupted'
+    assert 'finished' not in [event['event'] for event in events]
+    assert not supervisor._processes
+
+
+def test_headless_scheduler_pauses_resumes_and_cancels(headless):
+    sched = DownloadScheduler()
+    settings = {'download_folder': str(headless)}
+    sched.configure(settings)
+    progress = []
+    finished = {}
+    sched.progress_updated.connect(lambda d, task_id: progress.append(task_id))
+    sched.download_finished.connect(lambda *args: finished.setdefault(args[2], args))
+    for task_id, mode in ((1, 'slow'), (2, 'hang')):
+        url = f'https://example.com/{mode}'
+        sched.add_task(3, task_id, url, dict(settings), _meta(url))
+    sched.initialize(2)
+    try:
+        assert wait_until(lambda: 1 in progress and 2 in progress)
+
+        # 받는 중인 프로세스는 종료하지 않고 멈춤 → 진행률이 더 오지 않음
+        sched.pause_task(1)
+        time.sleep(0.1)
+        count = progress.count(1)
+        time.sleep(0.3)
+        assert progress.count(1) == count
+        assert 1 not in finished
+
+        # 재개하면 같은 프로세스가 이어서 끝냄
+        assert sched.resume_task(1)
+        assert sched.cancel_task(2)
+        assert wait_until(lambda: 1 in finished and 2 in finished, timeout=10)
+        assert finished[1][0] is True
+        assert finished[2][:2] == (False, STR.MSG_DL_CANCELLED)
+        assert not sched.cancelled_task_ids
+    finally:
+        sched.shutdown()
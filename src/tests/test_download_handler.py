@@ -0,0 +1,54 @@
+"""download_handler 테스트 (info JSON 재사용 실패 시 URL로 다시 시도할지 판단, flat-playlist 항목 ID)"""
+import pytest
+
+from core import download_handler
+from core.process_supervisor import supervisor
+from constants import MSG_PAUSED_BY_USER
+
+
+@pytest.fixture
+def info_json(tmp_path):
+    path = tmp_path / 'youtube_abc.info.json'
+    path.write_text('{}', encoding='utf-8')
+    return str(path)
+
+
+def test_success_returns_result_and_discards_info_json(info_json):
+    assert download_handler._info_json_attempt_done(info_json, True, 'ok')
+    assert not download_handler.os.path.exists(info_json)
+
+
+@pytest.mark.parametrize('message', [
+    MSG_PAUSED_BY_USER,
+    'yt-dlp exited with code -9',   # 취소로 프로세스 그룹 강제 종료
+    'yt-dlp exited with code -15',  # 앱 종료 시 정상 종료 요청
+    'Download timeout',
+])
+def test_cancel_pause_and_other_failures_are_not_retried(info_json, message):
+    assert download_handler._info_json_attempt_done(info_json, False, message)
+
+
+@pytest.mark.parametrize('message', [
+    'yt-dlp exited with code 1: ERROR: unable to download video data: HTTP Error 403: Forbidden',
+    'yt-dlp exited with code 1: ERROR: [youtube] abc: Requested format is not available',
+    'yt-dlp exited with code 1: ERROR: Unable to extract player response',
+])
+def test_extraction_and_expired_url_errors_retry_by_url(info_json, message):
+    assert not download_handler._info_json_attempt_done(info_json, False, message)
+    assert not download_handler.os.path.exists(info_json)
+
+
+def test_no_retry_while_shutting_down(info_json, monkeypatch):
+    monkeypatch.setattr(supervisor, '_closing', True)
+    assert download_handler._info_json_attempt_done(info_json, False, 'HTTP Error 403: Forbidden')
+
+
+@pytest.mark.parametrize('entry, video_id', [
+    ({'id': 'abc', 'url': 'https://www.youtube.com/watch?v=xyz'}, 'abc'),
+    ({'url': 'https://www.youtube.com/watch?v=xyz'}, 'xyz'),
+    ({'id': None, 'url': None}, None),  # 삭제/비공개 영상 항목
+    ({'title': '[Private video]'}, None),
+    (None, None),
+])
+def test_entry_video_id(entry, video_id):
+    assert download_handler._entry_video_id(entry) == video_id
@@ -0,0 +1,125 @@
+"""PartialDownloadRegistry.scan 테스트 (기록 유지/삭제, 제목으로 다시 연결, 주인 없는 임시 파일 정리)"""
+import os
+import time
+
+import pytest
+
+from constants import PARTIAL_ORPHAN_MAX_AGE_SEC, TaskStatus
+from data.managers import PartialDownloadRegistry
+from data.models import DownloadTask
+
+
+@pytest.fixture
+def folder(tmp_path):
+    path = tmp_path / 'downloads'
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def registry():
+    return PartialDownloadRegistry()
+
+
+def _task(task_id, folder, status=TaskStatus.PAUSED, title=None):
+    return DownloadTask(id=task_id, url=f'https://www.youtube.com/watch?v=v{task_id}', status=status,
+                        video_id=f'v{task_id}', settings={'download_folder': str(folder)},
+                        meta={'title': title} if title else {})
+
+
+def _write(path, size=10, age=0.0):
+    path.write_bytes(b'x' * size)
+    if age:
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+def test_kept_record_rereads_sizes(registry, folder):
+    video = _write(folder / 'Title.f137.mp4.part', size=300)
+    audio = _write(folder / 'Title.f140.m4a', size=50)
+    registry.record(1, str(folder / 'Title.f137.mp4'), video, 'v1', '137', 100, 1000,
+                    requested_format='137+140')
+    # 완료 이벤트 전에 중단된 스트림 (임시 파일이 이미 최종 이름으로 바뀜)
+    registry.record(1, str(folder / 'Title.f140.m4a'), audio + '.part', 'v1', '140', 10, 0)
+
+    stats = registry.scan([_task(1, folder)])
+    assert stats == {'kept': 1, 'rebound': 0, 'collected': 0}
+    state = registry.get(1)
+    assert state['format_id'] == '137+140'
+    assert state['output_stem'] == str(folder / 'Title')
+    assert [(f['downloaded_bytes'], f['completed']) for f in state['files']] == [(300, 0), (50, 1)]
+    assert os.path.isfile(video) and os.path.isfile(audio)
+
+
+def test_record_with_missing_stream_is_dropped(registry, folder):
+    video = _write(folder / 'Title.f137.mp4.part')
+    registry.record(1, str(folder / 'Title.f137.mp4'), video, 'v1', '137', 10, 100)
+    registry.record(1, str(folder / 'Title.f140.m4a'), str(folder / 'Title.f140.m4a.part'), 'v1', '140', 5, 50)
+
+    # 스트림 하나를 잃었으면 포맷을 고정하지 않고 처음부터 다시 받음
+    stats = registry.scan([_task(1, folder)])
+    assert stats == {'kept': 0, 'rebound': 0, 'collected': 1}
+    assert registry.get(1) is None
+    assert not os.path.exists(video)
+
+
+def test_finished_task_records_are_removed_with_temp_files(registry, folder):
+    part = _write(folder / 'Done.f137.mp4.part')
+    registry.record(2, str(folder / 'Done.f137.mp4'), part, 'v2', '137', 10, 100)
+
+    stats = registry.scan([_task(2, folder, status=TaskStatus.FINISHED)])
+    assert stats['collected'] == 1
+    assert registry.get(2) is None
+    assert not os.path.exists(part)
+
+
+def test_unbound_task_is_rebound_by_title_with_fullwidth_characters(registry, folder):
+    # yt-dlp는 파일 이름에 쓸 수 없는 문자를 전각 문자로 바꿈
+    part = _write(folder / 'AC／DC： Live？.f137.mp4.part', size=42)
+    _write(folder / 'AC／DC： Live？.f137.mp4.ytdl')
+    merged = _write(folder / 'AC／DC： Live？.f140.m4a', size=7)
+    other = _write(folder / 'Other.f137.mp4.part')
+
+    stats = registry.scan([_task(3, folder, title='AC/DC: Live?')])
+    assert stats == {'kept': 0, 'rebound': 1, 'collected': 0}
+    state = registry.get(3)
+    assert state['format_id'] is None  # 일부 스트림만 알면 출력 파일 이름만 고정
+    assert state['output_stem'] == str(folder / 'AC／DC： Live？')
+    files = {f['format_id']: f for f in state['files']}
+    assert files['137']['tmpfilename'] == part and files['137']['downloaded_bytes'] == 42
+    assert files['140']['filename'] == merged and files['140']['completed']
+    assert os.path.isfile(other)
+
+
+def test_orphan_temp_files_are_collected_only_after_max_age(registry, folder):
+    old_age = PARTIAL_ORPHAN_MAX_AGE_SEC + 60
+    old_part = _write(folder / 'Old.f137.mp4.part', age=old_age)
+    old_ytdl_part = _write(folder / 'Legacy.mp4.part', age=old_age)
+    old_ytdl = _write(folder / 'Legacy.mp4.ytdl', age=old_age)
+    fresh_part = _write(folder / 'Fresh.f137.mp4.part', age=60)
+    # 다른 프로그램의 .part (포맷 ID도 .ytdl도 없음)는 건드리지 않음
+    foreign = _write(folder / 'browser.zip.part', age=old_age)
+
+    stats = registry.scan([], default_folder=str(folder))
+    assert stats == {'kept': 0, 'rebound': 0, 'collected': 3}
+    assert not any(os.path.exists(p) for p in (old_part, old_ytdl_part, old_ytdl))
+    assert os.path.isfile(fresh_part)
+    assert os.path.isfile(foreign)
+
+
+def test_completed_final_output_is_never_deleted(registry, folder):
+    final = _write(folder / 'Song.mp3', age=PARTIAL_ORPHAN_MAX_AGE_SEC + 60)
+    intermediate = _write(folder / 'Song.f251.webm')
+    # 최종 파일 이름으로 기록된 완료 스트림 (포맷 ID가 있어도 .f<ID>. 표시가 없으면 결과물)
+    registry.record(4, final, final + '.part', 'v4', '251', 10, 10, completed=True)
+    registry.record(4, intermediate, intermediate + '.part', 'v4', '251', 10, 10, completed=True)
+
+    registry.scan([_task(4, folder, status=TaskStatus.FAILED)], default_folder=str(folder))
+    registry.remove(4, delete_files=True)
+    assert os.path.isfile(final)
+    assert not os.path.exists(intermediate)
+
+    # 주인 없는 파일 정리에서도 결과물은 대상이 아님
+    assert registry.scan([], default_folder=str(folder))['collected'] == 0
+    assert os.path.isfile(final)
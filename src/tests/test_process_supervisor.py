@@ -0,0 +1,86 @@
+"""ProcessSupervisor 테스트 (작업별 취소, 회수된 프로세스에 신호 보내지 않기, 종료 후 재시작)"""
+import os
+import sys
+
+import pytest
+
+from core import process_supervisor
+from core.process_supervisor import ProcessSupervisor
+
+pytestmark = pytest.mark.skipif(os.name == 'nt', reason='POSIX 프로세스 그룹 동작')
+
+SLEEP = [sys.executable, '-c', 'import time; time.sleep(30)']
+EXIT = [sys.executable, '-c', 'pass']
+
+
+@pytest.fixture
+def supervisor():
+    sup = ProcessSupervisor()
+    yield sup
+    sup.shutdown(timeout=1)
+
+
+@pytest.fixture
+def killpg_calls(monkeypatch):
+    calls = []
+    real_killpg = os.killpg
+
+    def recording_killpg(pgid, sig):
+        calls.append((pgid, sig))
+        real_killpg(pgid, sig)
+
+    monkeypatch.setattr(process_supervisor.os, 'killpg', recording_killpg)
+    return calls
+
+
+def test_cancel_task_kills_group_and_stops_tracking(supervisor):
+    process = supervisor.spawn(SLEEP, task_ids=(1,))
+    assert supervisor.cancel_task(1)
+    assert process.poll() is not None
+    assert not supervisor._processes and not supervisor._task_pids
+    assert not supervisor.cancel_task(1)
+
+
+def test_reaped_process_is_not_signalled(supervisor, killpg_calls):
+    process = supervisor.spawn(EXIT, task_ids=(2,))
+    process.wait(timeout=10)
+    supervisor.kill(process)
+    assert killpg_calls == []
+    assert process.pid not in supervisor._processes
+
+
+def test_shutdown_signals_only_live_processes(supervisor, killpg_calls):
+    done = supervisor.spawn(EXIT)
+    done.wait(timeout=10)
+    live = supervisor.spawn(SLEEP)
+    supervisor.shutdown(timeout=5)
+    assert live.poll() is not None
+    assert {pgid for pgid, _ in killpg_calls} == {live.pid}
+    assert not supervisor._processes
+
+
+def test_shutdown_rejects_spawn_until_reopen(supervisor):
+    supervisor.shutdown(timeout=1)
+    assert supervisor.closing
+    with pytest.raises(RuntimeError):
+        supervisor.spawn(EXIT)
+
+    supervisor.reopen()
+    process = supervisor.spawn(EXIT)
+    process.wait(timeout=10)
+    supervisor.release(process)
+    assert not supervisor._processes
+
+
+def test_signal_to_vanished_group_is_ignored(supervisor, monkeypatch):
+    process = supervisor.spawn(SLEEP)
+
+    def missing(pgid, sig):
+        raise ProcessLookupError
+
+    monkeypatch.setattr(process_supervisor.os, 'killpg', missing)
+    assert not supervisor._signal_group(process, force=True)
+    assert process.pid not in supervisor._processes
+    monkeypatch.undo()
+    process.kill()
+    process.wait(timeout=10)
@@ -0,0 +1,158 @@
+"""원격 에이전트 테스트 (가짜 코디네이터 소켓으로 연결 끊김 시 취소/재접속, 개별 취소 확인)"""
+import json
+import socket
+
+import pytest
+
+from core import remote_agent
+from core.events import Signal
+from core.remote_agent import RemoteAgent
+from core.remote_protocol import encode, STATE_FAILED
+from tests.conftest import wait_until
+
+
+class _FakeScheduler:
+    """로컬 다운로드 없이 에이전트가 호출한 스케줄러 메서드만 기록"""
+    task_started = Signal(int)
+    progress_updated = Signal(dict, int)
+    metadata_fetched = Signal(int, dict)
+    download_finished = Signal(bool, str, int, str)
+
+    def __init__(self):
+        self.added = []
+        self.cancelled = []
+
+    def configure(self, settings):
+        pass
+
+    def initialize(self, jobs):
+        pass
+
+    def shutdown(self):
+        pass
+
+    def add_task(self, priority, task_id, url, settings, metadata=None):
+        self.added.append((task_id, url))
+
+    def cancel_task(self, task_id, delete_files=True):
+        self.cancelled.append(task_id)
+
+
+class _Coordinator:
+    """블로킹 소켓으로 만든 코디네이터 (테스트 스레드에서 한 줄씩 주고받음)"""
+
+    def __init__(self):
+        self.listener = socket.create_server(('127.0.0.1', 0))
+        self.listener.settimeout(5)
+        self.port = self.listener.getsockname()[1]
+        self.conn = None
+        self.buffer = b''
+
+    def accept(self):
+        self.conn, _ = self.listener.accept()
+        self.conn.settimeout(5)
+        self.buffer = b''
+        hello = self.receive()
+        assert hello['type'] == 'hello'
+        return hello
+
+    def send(self, message):
+        self.conn.sendall(encode(message))
+
+    def receive(self, skip=('heartbeat',)):
+        while True:
+            while b'\n' not in self.buffer:
+                chunk = self.conn.recv(65536)
+                assert chunk, 'agent closed the connection'
+                self.buffer += chunk
+            line, self.buffer = self.buffer.split(b'\n', 1)
+            message = json.loads(line)
+            if message['type'] not in skip:
+                return message
+
+    def drop(self):
+        self.conn.close()
+        self.conn = None
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+        self.listener.close()
+
+
+@pytest.fixture
+def coordinator():
+    coordinator = _Coordinator()
+    yield coordinator
+    coordinator.close()
+
+
+@pytest.fixture
+def agent(coordinator, monkeypatch):
+    monkeypatch.setattr(remote_agent, 'REMOTE_RECONNECT_MIN_SEC', 0.05)
+    monkeypatch.setattr(remote_agent, 'DownloadScheduler', _FakeScheduler)
+    agent = RemoteAgent('127.0.0.1', coordinator.port, {'download_folder': '/agent'}, jobs=2, name='node')
+    agent.start()
+    yield agent
+    agent.stop()
+    agent.join(5)
+
+
+def _job(lease, video):
+    return {'type': 'job', 'lease': lease, 'priority': 3,
+            'task': {'id': lease, 'url': f'https://www.youtube.com/watch?v={video}', 'settings': {}}}
+
+
+def test_disconnect_cancels_jobs_and_reconnects(agent, coordinator):
+    hello = coordinator.accept()
+    assert (hello['agent'], hello['slots']) == ('node', 2)
+    coordinator.send({'type': 'welcome', 'heartbeat_sec': 60})
+    coordinator.send(_job(10, 'a'))
+    coordinator.send(_job(11, 'b'))
+    assert wait_until(lambda: len(agent.scheduler.added) == 2)
+    local_ids = [task_id for task_id, _ in agent.scheduler.added]
+
+    # 연결이 끊기면 받던 작업을 모두 취소 (코디네이터가 다른 에이전트에 다시 배정)
+    coordinator.drop()
+    assert wait_until(lambda: sorted(agent.scheduler.cancelled) == sorted(local_ids))
+
+    # 재접속 후에는 이전 작업의 늦은 완료 통지를 보내지 않음
+    coordinator.accept()
+    coordinator.send({'type': 'welcome', 'heartbeat_sec': 60})
+    agent.scheduler.download_finished.emit(True, 'done', local_ids[0], '/agent/a.mp3')
+    coordinator.send(_job(12, 'c'))
+    assert wait_until(lambda: len(agent.scheduler.added) == 3)
+    new_id = agent.scheduler.added[-1][0]
+    assert new_id not in local_ids
+
+    agent.scheduler.download_finished.emit(True, 'done', new_id, '/agent/c.mp3')
+    finished = coordinator.receive()
+    assert (finished['type'], finished['lease'], finished['state']) == ('finished', 12, 'finished')
+
+
+def test_cancel_message_cancels_local_task(agent, coordinator):
+    coordinator.accept()
+    coordinator.send({'type': 'welcome', 'heartbeat_sec': 60})
+    coordinator.send(_job(20, 'a'))
+    assert wait_until(lambda: agent.scheduler.added)
+    local_id = agent.scheduler.added[0][0]
+
+    coordinator.send({'type': 'cancel', 'lease': 20})
+    finished = coordinator.receive()
+    assert (finished['type'], finished['lease'], finished['state']) == ('finished', 20, STATE_FAILED)
+    assert agent.scheduler.cancelled == [local_id]
+
+    # 취소된 작업의 늦은 완료 통지는 무시
+    agent.scheduler.download_finished.emit(False, 'killed', local_id, '')
+    coordinator.send(_job(21, 'b'))
+    assert wait_until(lambda: len(agent.scheduler.added) == 2)
+    agent.scheduler.download_finished.emit(True, 'done', agent.scheduler.added[1][0], '')
+    assert coordinator.receive()['lease'] == 21
+
+
+def test_rejected_agent_does_not_reconnect(agent, coordinator):
+    coordinator.accept()
+    coordinator.send({'type': 'error', 'message': 'bad token'})
+    agent.join(5)
+    assert not agent.is_alive()
+    assert agent.error == 'bad token'
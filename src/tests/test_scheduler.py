@@ -0,0 +1,169 @@
+"""DownloadScheduler 대기열/선행 조회 테스트 (다운로드 워커 없이 큐 단계만 실행)"""
+import time
+from queue import Empty
+
+import pytest
+
+from core import workers
+from core.scheduler import DownloadScheduler
+from locales.strings import STR
+from tests.conftest import wait_until
+
+LOOKAHEAD = 4
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    # 메타데이터 조회는 yt-dlp 없이 바로 성공
+    monkeypatch.setattr(
+        workers, '_resolve_metadata',
+        lambda scheduler, task_id, url, settings: ({'title': url, 'id': str(task_id)}, True, False)
+    )
+    sched = DownloadScheduler()
+    sched.metadata_lookahead = LOOKAHEAD
+    sched._start_metadata_pipeline()
+    yield sched
+    sched.stop_event.set()
+    for worker in sched.metadata_pipeline_workers:
+        worker.join(5)
+
+
+def _add(sched, task_id):
+    sched.add_task(3, task_id, f'https://example.com/{task_id}', {}, None)
+
+
+def test_cancelling_ready_tasks_releases_lookahead_slots(scheduler):
+    for task_id in range(1, LOOKAHEAD + 1):
+        _add(scheduler, task_id)
+    assert wait_until(lambda: scheduler.download_queue.qsize() == LOOKAHEAD)
+    assert scheduler._lookahead_in_use == LOOKAHEAD
+
+    for task_id in range(1, LOOKAHEAD + 1):
+        scheduler.cancel_task(task_id)
+    assert not scheduler._lookahead_ready_ids
+    assert scheduler.download_queue.qsize() == 0
+
+    # 자리가 모두 반납되어 새 작업도 선행 조회 깊이만큼 준비됨
+    for task_id in range(10, 10 + LOOKAHEAD):
+        _add(scheduler, task_id)
+    assert wait_until(lambda: scheduler.download_queue.qsize() == LOOKAHEAD)
+    assert scheduler.pending_queue.qsize() == 0
+
+
+def test_pausing_ready_tasks_keeps_pipeline_going(scheduler):
+    for task_id in range(1, LOOKAHEAD + 1):
+        _add(scheduler, task_id)
+    assert wait_until(lambda: scheduler.download_queue.qsize() == LOOKAHEAD)
+
+    for task_id in range(1, LOOKAHEAD + 1):
+        scheduler.pause_task(task_id)
+    assert not any(scheduler.is_task_queued(task_id) for task_id in range(1, LOOKAHEAD + 1))
+    assert not scheduler._lookahead_ready_ids
+
+    # 재개하면 다시 준비됨 (중복 항목 없음)
+    for task_id in range(1, LOOKAHEAD + 1):
+        scheduler.resume_task(task_id)
+        _add(scheduler, task_id)
+    assert wait_until(lambda: scheduler.download_queue.qsize() == LOOKAHEAD)
+
+
+def _raise(*args):
+    raise RuntimeError('slot failed')
+
+
+def _assert_lookahead_depth(sched, first_task_id):
+    """자리를 두 번 반납했으면 선행 조회 깊이보다 많이 준비됨"""
+    for task_id in range(first_task_id, first_task_id + LOOKAHEAD + 2):
+        _add(sched, task_id)
+    assert wait_until(lambda: sched.download_queue.qsize() >= LOOKAHEAD)
+    time.sleep(0.2)
+    assert len(sched._lookahead_ready_ids) == LOOKAHEAD
+
+
+def test_unsupported_url_releases_slot_once_when_emit_raises(scheduler, monkeypatch):
+    monkeypatch.setattr(workers, '_resolve_metadata', lambda *args: ({}, False, False))
+    for worker in scheduler.metadata_pipeline_workers:
+        worker.download_finished.connect(_raise)
+    _add(scheduler, 1)
+    assert wait_until(lambda: scheduler.pending_queue.unfinished_tasks == 0)
+    # 실패 통지가 예외를 던져도 다운로드 큐에 다시 넣지 않음
+    assert scheduler.download_queue.qsize() == 0
+
+    monkeypatch.setattr(
+        workers, '_resolve_metadata',
+        lambda scheduler, task_id, url, settings: ({'title': url, 'id': str(task_id)}, True, True)
+    )
+    _assert_lookahead_depth(scheduler, 10)
+
+
+def test_lookup_error_hands_off_entry_once(scheduler):
+    for worker in scheduler.metadata_pipeline_workers:
+        worker.metadata_fetched.connect(_raise)
+    _add(scheduler, 1)
+    assert wait_until(lambda: scheduler.pending_queue.unfinished_tasks == 0)
+    # 조회 중 오류는 메타데이터 없이 한 번만 넘기고 자리 반납
+    assert scheduler.download_queue.qsize() == 1
+    assert not scheduler._lookahead_ready_ids
+    scheduler.cancel_task(1)
+
+    for worker in scheduler.metadata_pipeline_workers:
+        worker.metadata_fetched.disconnect(_raise)
+    _assert_lookahead_depth(scheduler, 10)
+
+
+def test_invalidate_drops_prefetched_metadata(scheduler):
+    scheduler._on_metadata_prefetched(7, {'title': 'x'})
+    scheduler.cancel_task(7)
+    assert scheduler.take_prefetched_metadata(7) is None
+
+
+def _take_running(sched, count):
+    """다운로드 워커처럼 동시 실행 자리를 잡고 꺼냄"""
+    assert wait_until(lambda: sched.download_queue.qsize() == count)
+    return [sched.download_queue.get(timeout=1)[1] for _ in range(count)]
+
+
+def test_cancel_can_keep_partial_files(scheduler):
+    _add(scheduler, 1)
+    _add(scheduler, 2)
+    assert sorted(_take_running(scheduler, 2)) == [1, 2]
+    scheduler.cancel_task(1, delete_files=False)
+    scheduler.cancel_task(2)
+    assert scheduler.is_task_cancelled(1) and scheduler.is_task_cancelled(2)
+    assert not scheduler.cancel_deletes_files(1)
+    assert scheduler.cancel_deletes_files(2)
+
+
+def test_finished_task_state_is_pruned(scheduler):
+    _add(scheduler, 1)
+    _take_running(scheduler, 1)
+    scheduler.cancel_task(1, delete_files=False)
+    assert scheduler.is_task_cancelled(1)
+    scheduler.pause_task(2)
+    scheduler.pause_task(3)
+    scheduler._on_download_finished(False, 'cancelled', 1, '')
+    scheduler._on_download_finished(True, 'done', 2, '/tmp/x')
+    assert not scheduler.cancelled_task_ids
+    assert not scheduler._keep_files_task_ids
+    assert scheduler.task_paused_flags == {3: True}
+
+    # 대기 중에 취소된 작업은 완료 통지가 없으므로 취소할 때 바로 정리
+    _add(scheduler, 4)
+    assert wait_until(lambda: scheduler.is_task_queued(4) and 4 in scheduler.download_queue)
+    scheduler.cancel_task(4, delete_files=False)
+    assert not scheduler.is_task_queued(4)
+    assert not scheduler.cancelled_task_ids
+    assert not scheduler._keep_files_task_ids
+    assert scheduler.task_paused_flags == {3: True}
+
+    # 일시정지로 끝난 작업은 전체 재개 시 건너뛰도록 플래그 유지
+    scheduler._on_download_finished(False, STR.STATUS_PAUSED, 3, '')
+    assert scheduler.is_task_paused(3)
+
+
+def test_zero_workers_stop_taking_downloads():
+    sched = DownloadScheduler()
+    sched.adjust_worker_count(0)
+    sched.download_queue.put((3, 1, 'https://example.com/1', {}, {'title': '1'}))
+    with pytest.raises(Empty):
+        sched.download_queue.get_nowait()
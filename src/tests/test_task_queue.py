@@ -0,0 +1,246 @@
+"""ConcurrencyLimiter / LimitedPriorityQueue 테스트 (동시 실행 제한, 자리 반납)"""
+from queue import Empty
+
+import pytest
+
+from core.scheduling_sim import SimJob, simulate
+from core.task_queue import ConcurrencyLimiter, LimitedPriorityQueue, QueueEntry, TaskGenerations
+
+
+def _entry(task_id, url, priority=3, extractor=None):
+    metadata = {'extractor': extractor} if extractor else {}
+    return (priority, task_id, url, {}, metadata)
+
+
+def _drain(q):
+    taken = []
+    while True:
+        try:
+            taken.append(q.get_nowait()[1])
+        except Empty:
+            return taken
+
+
+# --- ConcurrencyLimiter ---
+
+def test_limiter_acquire_and_release_counts():
+    limiter = ConcurrencyLimiter()
+    limiter.configure({'youtube': 2}, {'vimeo.com': 1})
+    keys = limiter.keys_for('https://www.youtube.com/watch?v=a', {'extractor': 'youtube'})
+    assert keys == (('extractor', 'youtube'),)
+
+    limiter.acquire(1, keys)
+    limiter.acquire(2, keys)
+    assert limiter.snapshot() == {'extractor:youtube': 2, 'total': 2}
+    assert not limiter.can_start(keys)
+
+    assert limiter.release(1)
+    assert not limiter.release(1)  # 이미 반납한 자리
+    assert limiter.can_start(keys)
+    assert limiter.snapshot() == {'extractor:youtube': 1, 'total': 1}
+
+
+def test_limiter_host_keys_and_per_host_default():
+    limiter = ConcurrencyLimiter()
+    limiter.configure({}, {'www.Vimeo.com': 1}, per_host_limit=2)
+    assert limiter.keys_for('https://vimeo.com/1', {}) == (('host', 'vimeo.com'),)
+    assert limiter.limit_for(('host', 'vimeo.com')) == 1
+    assert limiter.limit_for(('host', 'example.com')) == 2
+
+    limiter.configure({}, {}, per_host_limit=0)
+    assert limiter.keys_for('https://example.com/a', {}) == ()
+
+
+def test_limiter_ignores_invalid_limits():
+    limiter = ConcurrencyLimiter()
+    limiter.configure({'youtube': 0, 'vimeo': 'x'}, {'a.com': -1})
+    assert limiter.extractor_limits == {}
+    assert limiter.host_limits == {}
+
+
+def test_youtube_url_uses_extractor_slot_before_metadata():
+    limiter = ConcurrencyLimiter()
+    limiter.configure({'youtube': 1})
+    assert limiter.keys_for('https://youtu.be/abc', None) == (('extractor', 'youtube'),)
+
+
+# --- LimitedPriorityQueue ---
+
+def test_global_limit():
+    q = LimitedPriorityQueue()
+    q.set_global_limit(2)
+    for task_id in range(5):
+        q.put(_entry(task_id, f'https://a.com/{task_id}'))
+    assert _drain(q) == [0, 1]
+    q.release(0)
+    assert _drain(q) == [2]
+    assert q.active_counts()['total'] == 2
+
+
+def test_extractor_limit_skips_to_other_sites():
+    q = LimitedPriorityQueue()
+    q.configure_limits({'youtube': 1})
+    q.put(_entry(1, 'https://youtube.com/watch?v=1', extractor='youtube'))
+    q.put(_entry(2, 'https://youtube.com/watch?v=2', extractor='youtube'))
+    q.put(_entry(3, 'https://vimeo.com/3', extractor='vimeo'))
+    # 자리가 찬 youtube 작업은 건너뛰고 다른 사이트 작업을 꺼냄
+    assert _drain(q) == [1, 3]
+    assert 2 in q
+    q.release(1)
+    assert _drain(q) == [2]
+
+
+def test_host_limit():
+    q = LimitedPriorityQueue()
+    q.configure_limits({}, {'a.test': 1})
+    for task_id, host in enumerate(['a.test', 'a.test', 'b.test', 'www.a.test']):
+        q.put(_entry(task_id, f'https://{host}/{task_id}'))
+    assert _drain(q) == [0, 2]
+    q.release(0)
+    assert _drain(q) == [1]
+
+
+def test_requeue_releases_slot():
+    q = LimitedPriorityQueue()
+    q.set_global_limit(1)
+    q.put(_entry(1, 'https://a.com/1'))
+    q.put(_entry(2, 'https://a.com/2'))
+    entry = q.get_nowait()
+    assert entry[1] == 1
+    with pytest.raises(Empty):
+        q.get_nowait()
+
+    # 꺼낸 작업을 되돌리면 잡고 있던 자리 반납
+    q.put(entry)
+    q.task_done()
+    assert q.active_counts()['total'] == 0
+    assert _drain(q) == [1]
+
+
+def test_unlimited_take_does_not_hold_slots():
+    q = LimitedPriorityQueue()
+    q.set_global_limit(1)
+    for task_id in range(3):
+        q.put(_entry(task_id, f'https://a.com/{task_id}'))
+    assert [q.get_nowait(limited=False)[1] for _ in range(2)] == [0, 1]
+    assert q.active_counts()['total'] == 0
+    assert _drain(q) == [2]
+
+
+def test_saturated_site_entries_are_not_rescanned():
+    q = LimitedPriorityQueue()
+    q.configure_limits({'youtube': 1})
+    for task_id in range(500):
+        q.put(_entry(task_id, f'https://youtube.com/watch?v={task_id}', extractor='youtube'))
+    for task_id in range(500, 505):
+        q.put(_entry(task_id, f'https://vimeo.com/{task_id}', extractor='vimeo'))
+    assert q.get_nowait()[1] == 0
+
+    checks = []
+    can_start = q.limiter.can_start
+    q.limiter.can_start = lambda keys: checks.append(keys) or can_start(keys)
+    # 자리가 찬 youtube 항목 499개를 꺼냈다 되돌리지 않고 키 힙 맨 앞만 비교
+    assert _drain(q) == list(range(500, 505))
+    assert len(checks) < 30
+
+
+def test_release_wakes_one_waiter_only_when_work_can_start():
+    q = LimitedPriorityQueue()
+    q.configure_limits({'youtube': 1})
+    q.put(_entry(1, 'https://youtube.com/watch?v=1', extractor='youtube'))
+    q.put(_entry(2, 'https://youtube.com/watch?v=2', extractor='youtube'))
+    assert q.get_nowait()[1] == 1
+
+    wakeups = []
+    q.not_empty.notify = lambda n=1: wakeups.append(n)
+    q.not_empty.notify_all = lambda: wakeups.append('all')
+    q.release(1)
+    assert wakeups == [1]
+
+    assert q.get_nowait()[1] == 2
+    wakeups.clear()
+    q.release(2)  # 기다리는 작업이 없음
+    assert wakeups == []
+
+
+def test_reconfigured_limits_regroup_waiting_entries():
+    q = LimitedPriorityQueue()
+    for task_id in range(3):
+        q.put(_entry(task_id, f'https://youtube.com/watch?v={task_id}', extractor='youtube'))
+    q.configure_limits({'youtube': 1})
+    assert _drain(q) == [0]
+    q.configure_limits({})
+    assert _drain(q) == [1, 2]
+
+
+def test_sentinel_ignores_limits():
+    q = LimitedPriorityQueue()
+    q.set_global_limit(1)
+    q.put(_entry(1, 'https://a.com/1'))
+    assert q.get_nowait()[1] == 1
+    q.put((0, None))
+    assert q.get_nowait()[1] is None
+
+
+# --- IndexedPriorityQueue (task_id로 조작) ---
+
+def test_reprioritize_remove_and_move():
+    q = LimitedPriorityQueue()
+    for task_id in range(1, 5):
+        q.put(_entry(task_id, f'https://a.com/{task_id}'))
+    assert q.reprioritize(3, 1)
+    assert q.remove(2)
+    assert not q.remove(2)
+    assert q.move_to_bottom(3) == 3
+    assert q.move_to_top(4) == 3
+    assert _drain(q) == [4, 1, 3]
+
+
+def test_duplicate_put_replaces_entry():
+    q = LimitedPriorityQueue()
+    q.put(_entry(1, 'https://a.com/old'))
+    q.put(_entry(1, 'https://a.com/new', priority=1))
+    assert q.qsize() == 1
+    assert q.unfinished_tasks == 1
+    assert q.get_nowait()[2] == 'https://a.com/new'
+
+
+def test_stale_generation_is_dropped():
+    generations = TaskGenerations()
+    dropped = []
+    q = LimitedPriorityQueue(generations=generations, on_drop=dropped.append)
+    stale = QueueEntry(_entry(1, 'https://a.com/1'), generations.bump(1))
+    generations.bump(1)  # 일시정지/취소로 세대가 바뀜
+    q.put(stale)
+    assert 1 not in q
+    assert dropped == [1]
+    assert q.unfinished_tasks == 0
+
+
+# --- 처리량 (scheduling_sim으로 여러 사이트가 섞인 작업 실행) ---
+
+def test_per_site_limit_beats_head_of_line_blocking():
+    """느린 사이트 작업이 대기열 앞에 몰려 있어도 사이트 자리를 제한하면 다른 사이트 작업이 먼저 끝남"""
+    mb = 1024 * 1024
+    jobs = [SimJob(0.0, 10 * mb, site='slow') for _ in range(20)]
+    jobs += [SimJob(0.0, 10 * mb, site='fast') for _ in range(20)]
+    # 느린 사이트는 동시에 받는 작업끼리 전체 1MB/s를 나눠 씀
+    options = dict(jobs=jobs, workers=4, throughput=4 * mb, site_throughput={'slow': mb})
+
+    uncapped = simulate('fifo', **options)
+    capped = simulate('fifo', site_limits={'slow': 1}, **options)
+    # 제한이 없으면 모든 자리가 느린 사이트에 묶임 (빠른 사이트 작업은 뒤에서 대기)
+    assert capped['mean_completion'] < uncapped['mean_completion'] / 2
+    assert capped['mean_wait'] < uncapped['mean_wait'] / 2
+    assert capped['makespan'] <= uncapped['makespan']
+
+
+def test_zero_worker_limit_suspends_takes():
+    q = LimitedPriorityQueue()
+    q.put(_entry(1, 'https://a.com/1'))
+    # 워커 0명은 제한 없음이 아니라 멈춤 (자동 조절의 유휴 상태)
+    q.set_worker_limit(0)
+    with pytest.raises(Empty):
+        q.get_nowait()
+    q.set_worker_limit(1)
+    assert _drain(q) == [1]
@@ -0,0 +1,160 @@
+"""다운로드 워커 테스트 (묶음 다운로드 수집, 취소 시 받던 파일 정리)"""
+import threading
+from queue import Empty
+
+import pytest
+
+from core import download_handler
+from core.task_queue import LimitedPriorityQueue
+from core.workers import DownloadWorker
+
+
+class _FakeScheduler:
+    def __init__(self, batch_size):
+        self.download_batch_size = batch_size
+        self.dequeued = []
+        self.cancelled = set()
+        self.paused = set()
+        self.keep_files = set()
+        self.partial_registry = _FakeRegistry()
+        self.stale = set()
+        self.skipped = []
+
+    def on_task_dequeued(self, task_id):
+        self.dequeued.append(task_id)
+
+    def on_task_skipped(self, task_id):
+        self.skipped.append(task_id)
+
+    def is_entry_current(self, entry):
+        return entry[1] not in self.stale
+
+    def is_task_paused(self, task_id):
+        return task_id in self.paused
+
+    def is_task_cancelled(self, task_id):
+        return task_id in self.cancelled
+
+    def cancel_deletes_files(self, task_id):
+        return task_id not in self.keep_files
+
+
+class _FakeRegistry:
+    def __init__(self):
+        self.recorded = []
+        self.removed = []
+
+    def get(self, task_id):
+        return None
+
+    def record(self, task_id, filename, *args, **kwargs):
+        self.recorded.append((task_id, filename))
+
+    def remove(self, task_id, delete_files=False):
+        self.removed.append((task_id, delete_files))
+
+
+SETTINGS = {'format': 'mp3'}
+
+
+def _meta(task_id):
+    return {'title': f't{task_id}', 'id': f'v{task_id}', 'extractor': 'youtube', 'duration': 60}
+
+
+@pytest.fixture
+def batching(monkeypatch):
+    monkeypatch.setattr(download_handler, 'supports_batch_download', lambda: True)
+
+
+def _worker(q, batch_size):
+    return DownloadWorker(q, threading.Event(), threading.Event(), _FakeScheduler(batch_size))
+
+
+def test_batch_counts_as_one_slot_under_global_limit(batching):
+    q = LimitedPriorityQueue()
+    q.set_global_limit(3)
+    for task_id in range(8):
+        q.put((3, task_id, f'https://www.youtube.com/watch?v=v{task_id}', dict(SETTINGS), _meta(task_id)))
+
+    lead = q.get_nowait()
+    batch = _worker(q, 4)._collect_batch(lead[1], lead[3], lead[4])
+    assert [item[1] for item in batch] == [1, 2, 3]
+    # 묶음 전체가 자리 하나만 사용 → 다른 워커도 계속 꺼낼 수 있음
+    assert q.active_counts()['total'] == 1
+    assert q.get_nowait()[1] == 4
+    assert q.get_nowait()[1] == 5
+
+
+def test_batch_respects_extractor_limit_as_single_slot(batching):
+    q = LimitedPriorityQueue()
+    q.configure_limits({'youtube': 2})
+    for task_id in range(6):
+        q.put((3, task_id, f'https://www.youtube.com/watch?v=v{task_id}', dict(SETTINGS), _meta(task_id)))
+
+    lead = q.get_nowait()
+    batch = _worker(q, 3)._collect_batch(lead[1], lead[3], lead[4])
+    assert len(batch) == 2
+    assert q.active_counts() == {'extractor:youtube': 1, 'total': 1}
+
+    # 두 번째 자리는 다른 워커가 사용, 그 뒤로는 제한에 걸림
+    assert q.get_nowait()[1] == 3
+    assert q.active_counts()['extractor:youtube'] == 2
+    with pytest.raises(Empty):
+        q.get_nowait()
+
+
+def test_batch_drops_members_invalidated_while_collecting(batching, monkeypatch):
+    q = LimitedPriorityQueue()
+    for task_id in range(3):
+        q.put((3, task_id, f'https://www.youtube.com/watch?v=v{task_id}', dict(SETTINGS), _meta(task_id)))
+    downloaded = []
+    monkeypatch.setattr(download_handler, 'download_batch',
+                        lambda urls, settings, hook, task_ids: (downloaded.append(task_ids), (False, 'x', {}))[1])
+
+    worker = _worker(q, 4)
+    lead = q.get_nowait()
+    batch = worker._collect_batch(lead[1], lead[3], lead[4])
+    # 묶음에 등록하기 전에 취소됨 → 스케줄러는 대기 중인 작업으로 보고 취소 상태를 이미 정리
+    worker.parent().stale.add(1)
+    worker._run_batch([(lead, lead[1], lead[2], lead[3], lead[4])] + batch)
+    assert downloaded == [[0, 2]]
+    assert worker.parent().skipped == [1]
+
+
+def test_unmatched_entries_are_put_back(batching):
+    q = LimitedPriorityQueue()
+    q.set_global_limit(2)
+    q.put((3, 0, 'https://www.youtube.com/watch?v=v0', dict(SETTINGS), _meta(0)))
+    q.put((3, 1, 'https://www.youtube.com/watch?v=v1', {'format': 'mp4'}, _meta(1)))
+    q.put((3, 2, 'https://www.youtube.com/watch?v=v2', dict(SETTINGS), _meta(2)))
+
+    lead = q.get_nowait()
+    batch = _worker(q, 4)._collect_batch(lead[1], lead[3], lead[4])
+    assert [item[1] for item in batch] == [2]
+    assert 1 in q
+    assert q.get_nowait()[1] == 1
+
+
+@pytest.mark.parametrize('keep_files', [False, True])
+def test_cancel_deletes_partial_files_unless_kept(monkeypatch, keep_files):
+    q = LimitedPriorityQueue()
+    worker = _worker(q, 1)
+    worker.pause_event.set()
+    scheduler = worker.parent()
+    if keep_files:
+        scheduler.keep_files.add(1)
+
+    def cancelled_download(url, settings, hook, **kwargs):
+        scheduler.cancelled.add(kwargs['task_id'])
+        worker.retire_flag = True  # 이 작업만 처리하고 종료
+        return False, 'killed'
+
+    monkeypatch.setattr(download_handler, 'download_video', cancelled_download)
+    finished = []
+    worker.download_finished.connect(lambda *args: finished.append(args))
+
+    q.put((3, 1, 'https://www.youtube.com/watch?v=v1', dict(SETTINGS), _meta(1)))
+    worker.run()
+
+    assert scheduler.partial_registry.removed == [(1, not keep_files)]
+    assert [args[2] for args in finished] == [1]
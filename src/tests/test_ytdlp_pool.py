@@ -0,0 +1,232 @@
+"""yt-dlp 프로세스 풀 테스트 (헬퍼 프로세스 그룹, 작업 취소/종료 시 손자 프로세스까지 정리, 풀 엔진으로 받기)"""
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from constants import (
+    MSG_DOWNLOAD_COMPLETE, STATUS_AFTER_MOVE, STATUS_DOWNLOADING, STATUS_FINISHED, STATUS_FORMAT_SELECTED
+)
+from core import download_handler, ytdlp_pool
+from core.process_supervisor import supervisor
+from core.task_queue import LimitedPriorityQueue
+from core.workers import DownloadWorker
+from core.ytdlp_pool import YtDlpProcessPool
+from locales.strings import STR
+from tests.conftest import wait_until
+from tests.test_workers import _FakeScheduler
+
+pytestmark = pytest.mark.skipif(not os.path.isdir('/proc'), reason='POSIX /proc 필요')
+
+PID_DIR_ENV = 'YTDLP_POOL_TEST_PID_DIR'
+OUT_DIR_ENV = 'YTDLP_POOL_TEST_OUT_DIR'
+
+
+def _stuck_helper(conn, cancel_event, rate_value):
+    """
+    ffmpeg 후처리 중처럼 응답하지 않는 헬퍼 (spawn으로 실행되므로 모듈 최상위 함수)
+    - 실제 헬퍼처럼 새 세션을 만들고 자식(ffmpeg 대신 sleep)을 띄운 뒤 종료 요청을 무시
+    """
+    os.setsid()
+    child = subprocess.Popen(['sleep', '60'])
+    with open(os.path.join(os.environ[PID_DIR_ENV], str(os.getpid())), 'w') as f:
+        f.write(str(child.pid))
+    conn.send((ytdlp_pool._MSG_READY,))
+    time.sleep(60)
+
+
+def _scripted_helper(conn, cancel_event, rate_value):
+    """
+    yt_dlp 대신 URL 마지막 부분에 따라 정해진 이벤트를 보내는 헬퍼
+    - ok: 진행률 → 완료 → 최종 경로, pause: 취소 요청이 올 때까지 진행률, hang: 진행률 뒤 응답 없음
+    """
+    os.setsid()
+    conn.send((ytdlp_pool._MSG_READY,))
+    while True:
+        job = conn.recv()
+        if job[0] == ytdlp_pool._JOB_STOP:
+            return
+        cancel_event.clear()
+        mode = job[1].rsplit('/', 1)[-1]
+        path = os.path.join(os.environ[OUT_DIR_ENV], f'{mode}.mp4')
+        downloading = {'status': STATUS_DOWNLOADING, 'downloaded_bytes': 50, 'total_bytes': 100,
+                       'filename': path + '.part', 'video_id': mode, 'format_id': '18'}
+        conn.send((ytdlp_pool._MSG_PROGRESS, {'status': STATUS_FORMAT_SELECTED, 'format_id': '18', 'video_id': mode}))
+        conn.send((ytdlp_pool._MSG_PROGRESS, downloading))
+        if mode == 'hang':
+            time.sleep(60)
+        if mode == 'pause':
+            while not cancel_event.wait(0.05):
+                conn.send((ytdlp_pool._MSG_PROGRESS, downloading))
+            conn.send((ytdlp_pool._MSG_DONE, False, 'cancelled'))
+            continue
+        with open(path, 'wb') as f:
+            f.write(b'x' * 100)
+        conn.send((ytdlp_pool._MSG_PROGRESS, {'status': STATUS_FINISHED, 'downloaded_bytes': 100, 'total_bytes': 100,
+                                              'filename': path, 'video_id': mode}))
+        conn.send((ytdlp_pool._MSG_PROGRESS, {'status': STATUS_AFTER_MOVE, 'filepath': path}))
+        conn.send((ytdlp_pool._MSG_DONE, True, 'Download complete'))
+
+
+def _gone(pid):
+    """프로세스가 종료되었는지 (부모가 없어진 좀비도 종료로 간주)"""
+    try:
+        with open(f'/proc/{pid}/stat') as f:
+            return f.read().rsplit(')', 1)[1].split()[0] in ('Z', 'X')
+    except FileNotFoundError:
+        return True
+
+
+@pytest.fixture
+def stuck_pool(tmp_path, monkeypatch):
+    pid_dir = tmp_path / 'pids'
+    pid_dir.mkdir()
+    monkeypatch.setenv(PID_DIR_ENV, str(pid_dir))
+    monkeypatch.setattr(ytdlp_pool, '_helper_main', _stuck_helper)
+    pools = []
+
+    def make(size):
+        pool = YtDlpProcessPool(size)
+        pool.start()
+        pools.append(pool)
+        helpers = list(pool._helpers)
+        for helper in helpers:
+            assert pool._wait_ready(helper)
+        assert wait_until(lambda: len(os.listdir(pid_dir)) == size)
+        children = [int((pid_dir / name).read_text()) for name in os.listdir(pid_dir)]
+        return pool, helpers, children
+
+    yield make
+    for pool in pools:
+        pool.shutdown(timeout=0.1)
+
+
+def test_helpers_run_in_their_own_process_group():
+    pool = YtDlpProcessPool(1)
+    pool.start()
+    try:
+        helper = pool._helpers[0]
+        assert pool._wait_ready(helper)
+        assert os.getpgid(helper.process.pid) == helper.process.pid
+    finally:
+        pool.shutdown()
+    assert not helper.is_alive()
+
+
+def test_cancel_kills_busy_helper_and_its_children(stuck_pool):
+    pool, [helper], [child] = stuck_pool(1)
+    result = []
+    runner = threading.Thread(
+        target=lambda: result.append(pool._run_job(('download', 'u', {}, None), task_ids=(7,)))
+    )
+    runner.start()
+    assert wait_until(lambda: helper.process.pid in supervisor._task_pids.get(7, ()))
+
+    # 헬퍼가 응답하지 않아도 작업 취소는 그룹째 바로 종료
+    started = time.monotonic()
+    assert supervisor.cancel_task(7)
+    runner.join(5)
+    assert time.monotonic() - started < 2
+    assert result and result[0][0] is False
+    assert wait_until(lambda: _gone(child))
+    assert 7 not in supervisor._task_pids
+    # 죽은 헬퍼는 새 헬퍼로 교체
+    assert wait_until(lambda: len(pool._helpers) == 1 and pool._helpers[0] is not helper)
+
+
+def test_shutdown_stops_unresponsive_helpers_in_parallel(stuck_pool):
+    pool, helpers, children = stuck_pool(4)
+    started = time.monotonic()
+    pool.shutdown(timeout=0.5)
+    # 헬퍼별로 기다리지 않고 공통 제한 시간 한 번
+    assert time.monotonic() - started < 2
+    assert not any(helper.is_alive() for helper in helpers)
+    assert wait_until(lambda: all(_gone(pid) for pid in children))
+    assert not any(helper.handle.pid in supervisor._processes for helper in helpers)
+
+
+class _PoolEngine:
+    """풀 엔진 구성 (스크립트 헬퍼 1개 + 다운로드 워커 1개)"""
+
+    def __init__(self, out_dir):
+        self.out_dir = out_dir
+        self.pool = YtDlpProcessPool(1)
+        self.pool.start()
+        self.queue = LimitedPriorityQueue()
+        self.scheduler = _FakeScheduler(1)
+        self.worker = DownloadWorker(self.queue, threading.Event(), threading.Event(), self.scheduler)
+        self.worker.pause_event.set()
+        self.progress = []
+        self.finished = []
+        self.worker.progress_updated.connect(lambda d, task_id: self.progress.append((task_id, dict(d))))
+        self.worker.download_finished.connect(lambda *args: self.finished.append(args))
+
+    def submit(self, task_id, mode):
+        metadata = {'title': mode, 'id': mode, 'extractor': 'generic', 'duration': 1}
+        self.queue.put((3, task_id, f'https://example.com/{mode}', {'download_folder': str(self.out_dir)}, metadata))
+
+    def statuses(self, task_id):
+        return [d.get('status') for progress_task_id, d in self.progress if progress_task_id == task_id]
+
+
+@pytest.fixture
+def pool_engine(tmp_path, monkeypatch):
+    out_dir = tmp_path / 'out'
+    out_dir.mkdir()
+    monkeypatch.setenv(OUT_DIR_ENV, str(out_dir))
+    monkeypatch.setattr(ytdlp_pool, '_helper_main', _scripted_helper)
+    monkeypatch.setattr(download_handler, 'get_ytdlp_path', lambda: sys.executable)
+    engine = _PoolEngine(out_dir)
+    download_handler.set_process_pool(engine.pool)
+    engine.worker.start()
+    yield engine
+    engine.worker.stop_event.set()
+    engine.worker.join(5)
+    download_handler.set_process_pool(None)
+    engine.pool.shutdown(timeout=0.5)
+
+
+def test_pool_engine_reports_progress_and_final_path(pool_engine):
+    pool_engine.submit(1, 'ok')
+    assert wait_until(lambda: pool_engine.finished)
+    success, _, task_id, final_path = pool_engine.finished[0]
+    assert (success, task_id) == (True, 1)
+    assert final_path == str((pool_engine.out_dir / 'ok.mp4').resolve())
+    assert pool_engine.statuses(1) == [STATUS_DOWNLOADING, STATUS_FINISHED]
+    assert pool_engine.progress[0][1]['_percent_str'] == '50.0%'
+    # 헬퍼는 다음 작업에 재사용
+    assert pool_engine.pool._idle.qsize() == 1
+
+
+def test_pool_engine_pauses_through_progress_hook(pool_engine):
+    pool_engine.submit(2, 'pause')
+    assert wait_until(lambda: pool_engine.progress)
+    pool_engine.scheduler.paused.add(2)
+    assert wait_until(lambda: pool_engine.finished)
+    assert pool_engine.finished[0][:3] == (False, STR.STATUS_PAUSED, 2)
+    # 취소 요청에 응답한 헬퍼는 교체하지 않음
+    assert len(pool_engine.pool._helpers) == 1
+
+    pool_engine.scheduler.paused.discard(2)
+    pool_engine.submit(3, 'ok')
+    assert wait_until(lambda: len(pool_engine.finished) == 2)
+    assert pool_engine.finished[1][:3] == (True, MSG_DOWNLOAD_COMPLETE, 3)
+
+
+def test_pool_engine_cancel_kills_unresponsive_helper(pool_engine):
+    pool_engine.submit(4, 'hang')
+    assert wait_until(lambda: pool_engine.progress)
+    helper = pool_engine.pool._helpers[0]
+    pool_engine.scheduler.cancelled.add(4)
+    assert supervisor.cancel_task(4)
+    assert wait_until(lambda: pool_engine.finished)
+    assert pool_engine.finished[0][:3] == (False, STR.MSG_DL_CANCELLED, 4)
+    assert pool_engine.scheduler.partial_registry.removed == [(4, True)]
+    # 죽은 헬퍼는 새 헬퍼로 교체되어 다음 작업을 받음
+    assert wait_until(lambda: pool_engine.pool._helpers and pool_engine.pool._helpers[0] is not helper)
+    pool_engine.submit(5, 'ok')
+    assert wait_until(lambda: len(pool_engine.finished) == 2)
+    assert pool_engine.finished[1][0] is True
@@ -0,0 +1,88 @@
+"""
+설정 로드/저장 (Qt 없음 - GUI와 헤드리스 CLI가 함께 사용)
+"""
+import os
+import json
+
+from utils.utils import get_user_data_path, get_base_path
+from utils.logger import log
+from constants import (
+    SETTINGS_FILENAME,
+    KEY_DOWNLOAD_FOLDER, KEY_VIDEO_QUALITY, KEY_AUDIO_QUALITY, KEY_FORMAT,
+    KEY_MAX_DOWNLOADS, KEY_NORMALIZE_AUDIO, KEY_USE_ACCELERATION, KEY_LANGUAGE,
+    KEY_ENGINE_MODE, KEY_METADATA_BACKEND, KEY_METADATA_LOOKAHEAD, KEY_DOWNLOAD_BATCH_SIZE,
+    KEY_EXTRACTOR_LIMITS, KEY_HOST_LIMITS, KEY_PER_HOST_LIMIT, KEY_BANDWIDTH_LIMIT, KEY_BANDWIDTH_WEIGHTED,
+    KEY_AUTOTUNE_WORKERS, KEY_AUTOTUNE_MIN_WORKERS, KEY_AUTOTUNE_MAX_WORKERS, KEY_SCHEDULING_POLICY,
+    DEFAULT_VIDEO_QUALITY, DEFAULT_AUDIO_QUALITY, DEFAULT_FORMAT,
+    DEFAULT_MAX_DOWNLOADS, DEFAULT_ACCELERATION, DEFAULT_NORMALIZE,
+    DEFAULT_ENGINE_MODE, DEFAULT_METADATA_BACKEND, DEFAULT_METADATA_LOOKAHEAD, DEFAULT_DOWNLOAD_BATCH_SIZE,
+    DEFAULT_EXTRACTOR_LIMITS, DEFAULT_HOST_LIMITS, DEFAULT_PER_HOST_LIMIT,
+    DEFAULT_BANDWIDTH_LIMIT, DEFAULT_BANDWIDTH_WEIGHTED,
+    DEFAULT_AUTOTUNE_WORKERS, DEFAULT_AUTOTUNE_MIN_WORKERS, DEFAULT_AUTOTUNE_MAX_WORKERS,
+    DEFAULT_SCHEDULING_POLICY
+)
+from locales import DEFAULT_LANGUAGE
+
+
+def load_settings(settings_file=None):
+    """
+    JSON 파일에서 설정 로드 (기본값 위에 파일 내용을 덮어씀)
+    
+    Args:
+        settings_file: 설정 파일 경로 (없으면 사용자 데이터 폴더의 settings.json,
+                       CLI에서는 서버별 설정 프로필 파일을 지정)
+    """
+    if settings_file is None:
+        settings_file = os.path.join(get_user_data_path(), SETTINGS_FILENAME)
+    
+    # 기본 설정값
+    default_settings = {
+        KEY_DOWNLOAD_FOLDER: os.path.join(get_base_path(), 'youtube_downloads'),
+        KEY_VIDEO_QUALITY: DEFAULT_VIDEO_QUALITY,
+        KEY_AUDIO_QUALITY: DEFAULT_AUDIO_QUALITY,
+        KEY_FORMAT: DEFAULT_FORMAT,
+        KEY_MAX_DOWNLOADS: DEFAULT_MAX_DOWNLOADS,
+        KEY_NORMALIZE_AUDIO: DEFAULT_NORMALIZE,
+        KEY_USE_ACCELERATION: DEFAULT_ACCELERATION,
+        KEY_LANGUAGE: DEFAULT_LANGUAGE,
+        KEY_ENGINE_MODE: DEFAULT_ENGINE_MODE,
+        KEY_METADATA_BACKEND: DEFAULT_METADATA_BACKEND,
+        KEY_METADATA_LOOKAHEAD: DEFAULT_METADATA_LOOKAHEAD,
+        KEY_DOWNLOAD_BATCH_SIZE: DEFAULT_DOWNLOAD_BATCH_SIZE,
+        KEY_EXTRACTOR_LIMITS: dict(DEFAULT_EXTRACTOR_LIMITS),
+        KEY_HOST_LIMITS: dict(DEFAULT_HOST_LIMITS),
+        KEY_PER_HOST_LIMIT: DEFAULT_PER_HOST_LIMIT,
+        KEY_BANDWIDTH_LIMIT: DEFAULT_BANDWIDTH_LIMIT,
+        KEY_BANDWIDTH_WEIGHTED: DEFAULT_BANDWIDTH_WEIGHTED,
+        KEY_AUTOTUNE_WORKERS: DEFAULT_AUTOTUNE_WORKERS,
+        KEY_AUTOTUNE_MIN_WORKERS: DEFAULT_AUTOTUNE_MIN_WORKERS,
+        KEY_AUTOTUNE_MAX_WORKERS: DEFAULT_AUTOTUNE_MAX_WORKERS,
+        KEY_SCHEDULING_POLICY: DEFAULT_SCHEDULING_POLICY
+    }
+    
+    try:
+        if os.path.exists(settings_file):
+            with open(settings_file, 'r', encoding='utf-8') as f:
+                loaded_settings = json.load(f)
+                default_settings.update(loaded_settings)
+    except Exception as e:
+        log.error(f"설정 로드 실패: {e}", exc_info=True)
+    
+    # 다운로드 폴더가 없으면 생성
+    if not os.path.exists(default_settings[KEY_DOWNLOAD_FOLDER]):
+        try:
+            os.makedirs(default_settings[KEY_DOWNLOAD_FOLDER], exist_ok=True)
+        except Exception as e:
+            log.warning(f"다운로드 폴더 생성 실패: {e}")
+            
+    return default_settings
+
+
+def save_settings(settings):
+    """설정을 JSON 파일에 저장"""
+    settings_file = os.path.join(get_user_data_path(), SETTINGS_FILENAME)
+    try:
+        with open(settings_file, 'w', encoding='utf-8') as f:
+            json.dump(settings, f, ensure_ascii=False, indent=2)
+    except Exception as e:
+        log.error(f"설정 저장 실패: {e}", exc_info=True)